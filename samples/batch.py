@@ -0,0 +1,81 @@
+#  A Python programming example of solving many small models with
+#  lindo.solve_batch.
+#
+#  The problem (one instance per right-hand side scaling factor):
+#
+#      Minimize x1 + x2 + x3 + x4
+#      s.t.
+#              3x1              + 2x4   = 20*s
+#                    6x2        + 9x4  >= 20*s
+#              4x1 + 5x2 + 8x3          = 40*s
+#                    7x2 + 1x3         >= 10*s
+#
+#               2 <= x1 <= 5
+#               1 <= x2 <= +inf
+#            -inf <= x3 <= 10
+#            -inf <= x4 <= +inf
+
+import lindo
+import numpy as np
+import os
+#model data
+nCons = 4
+nVars = 4
+nDir = 1
+dObjConst = 0.0
+adC = np.array([1.,1.,1.,1.],dtype=np.double)
+adB = np.array([20.0,20.0,40.0,10.0],dtype=np.double)
+acConTypes = np.array(['E','G','E','G'],dtype='|S1')
+nNZ = 9
+anBegCol = np.array([0,2,5,7,9],dtype=np.int32)
+pnLenCol = np.asarray(None)
+adA = np.array([3.0,4.0,6.0,5.0,7.0,8.0,1.0,2.0,9.0],dtype=np.double)
+anRowX = np.array([0,2,1,2,3,2,3,0,1],dtype=np.int32)
+pdLower = np.array([2,1,-lindo.LS_INFINITY,-lindo.LS_INFINITY],dtype=np.double)
+pdUpper = np.array([5,lindo.LS_INFINITY,10,lindo.LS_INFINITY],dtype=np.double)
+
+nModels = 200
+nThreads = os.cpu_count() or 1
+
+# The first try block is for catching errors rasied while creating an environment
+try:
+    #create LINDO environment and model objects
+    LicenseKey = np.array('',dtype='S1024')
+    lindo.pyLSloadLicenseString(os.getenv('LINDOAPI_HOME')+'/license/lndapi160.lic',LicenseKey)
+    pnErrorCode = np.array([-1],dtype=np.int32)
+    pEnv = lindo.pyLScreateEnv(pnErrorCode,LicenseKey)
+except lindo.LINDO_Exception as e:
+    print(e.args[0])
+    exit(1)
+
+# The Second try block is to catch errors rasied for the allocated LINDO enviroment
+try:
+    models = []
+    for s in np.linspace(0.5, 1.5, nModels):
+        pModel = lindo.pyLScreateModel(pEnv,pnErrorCode)
+        lindo.pyLSloadLPData(pModel,nCons,nVars,nDir,
+                                        dObjConst,adC,adB*s,acConTypes,nNZ,anBegCol,
+                                        pnLenCol,adA,anRowX,pdLower,pdUpper)
+        models.append(pModel)
+
+    #solve all models on native worker threads
+    print("Solving %d models on %d threads..." % (nModels, nThreads))
+    res = lindo.solve_batch(models, lindo.LS_METHOD_FREE, nThreads)
+
+    for k in range(0, nModels, nModels // 10):
+        print("model %3d: error %d status %d obj %10.5f time %.6fs x=%s" % (
+            k, res["errorcode"][k], res["status"][k], res["objective"][k],
+            res["walltime"][k], np.array2string(res["primal"][k], precision=3)))
+    print("Total solver time: %.4fs" % res["walltime"].sum())
+
+    #delete LINDO model pointers
+    for pModel in models:
+        lindo.pyLSdeleteModel(pModel)
+
+    #delete LINDO environment pointer
+    lindo.pyLSdeleteEnv(pEnv)
+
+except lindo.LINDO_Exception as e:
+    lindo.geterrormessage(pEnv, e.args[1])
+except Exception as e:
+    print(f"Other Error => {e}")
@@ -0,0 +1,78 @@
+#  Micro-benchmark of the Python -> LINDO API call overhead.
+#
+#  Loads the small LP of samples/lp.py and times cheap entry points whose
+#  cost is dominated by argument handling in the extension (info queries,
+#  parameter access, single bound tweaks, solution queries).
+#
+#  Run it once against each build to compare, e.g.
+#
+#      > python samples/benchmarks/calls.py
+#
+#  and compare the calls/s column.
+
+import lindo
+import numpy as np
+import os
+import timeit
+
+#model data
+nCons = 4
+nVars = 4
+nDir = 1
+dObjConst = 0.0
+adC = np.array([1.,1.,1.,1.],dtype=np.double)
+adB = np.array([20.0,20.0,40.0,10.0],dtype=np.double)
+acConTypes = np.array(['E','G','E','G'],dtype='|S1')
+nNZ = 9
+anBegCol = np.array([0,2,5,7,9],dtype=np.int32)
+pnLenCol = np.asarray(None)
+adA = np.array([3.0,4.0,6.0,5.0,7.0,8.0,1.0,2.0,9.0],dtype=np.double)
+anRowX = np.array([0,2,1,2,3,2,3,0,1],dtype=np.int32)
+pdLower = np.array([2,1,-lindo.LS_INFINITY,-lindo.LS_INFINITY],dtype=np.double)
+pdUpper = np.array([5,lindo.LS_INFINITY,10,lindo.LS_INFINITY],dtype=np.double)
+
+nCalls = 200000
+nRepeat = 5
+
+try:
+    LicenseKey = np.array('',dtype='S1024')
+    lindo.pyLSloadLicenseString(os.getenv('LINDOAPI_HOME')+'/license/lndapi160.lic',LicenseKey)
+    pnErrorCode = np.array([-1],dtype=np.int32)
+    pEnv = lindo.pyLScreateEnv(pnErrorCode,LicenseKey)
+except lindo.LINDO_Exception as e:
+    print(e.args[0])
+    exit(1)
+
+try:
+    pModel = lindo.pyLScreateModel(pEnv,pnErrorCode)
+    lindo.pyLSloadLPData(pModel,nCons,nVars,nDir,
+                                    dObjConst,adC,adB,acConTypes,nNZ,anBegCol,
+                                    pnLenCol,adA,anRowX,pdLower,pdUpper)
+    pnStatus = np.array([-1],dtype=np.int32)
+    lindo.pyLSoptimize(pModel,lindo.LS_METHOD_FREE,pnStatus)
+
+    ibuf = np.array([-1],dtype=np.int32)
+    dbuf = np.array([-1.0],dtype=np.double)
+    aiVar = np.array([1],dtype=np.int32)
+    adVal = np.array([100.0],dtype=np.double)
+    padPrimal = np.empty((nVars),dtype=np.double)
+
+    cases = [
+        ("pyLSgetInfo", lambda: lindo.pyLSgetInfo(pModel,lindo.LS_IINFO_NUM_VARS,ibuf)),
+        ("pyLSgetModelIntParameter", lambda: lindo.pyLSgetModelIntParameter(pModel,lindo.LS_IPARAM_SPLEX_ITRLMT,ibuf)),
+        ("pyLSgetModelDouParameter", lambda: lindo.pyLSgetModelDouParameter(pModel,lindo.LS_DPARAM_SOLVER_TIMLMT,dbuf)),
+        ("pyLSmodifyUpperBounds", lambda: lindo.pyLSmodifyUpperBounds(pModel,1,aiVar,adVal)),
+        ("pyLSgetPrimalSolution", lambda: lindo.pyLSgetPrimalSolution(pModel,padPrimal)),
+    ]
+    print("%-28s %14s %10s" % ("entry point", "calls/s", "ns/call"))
+    for name, f in cases:
+        t = min(timeit.repeat(f, number=nCalls, repeat=nRepeat))
+        print("%-28s %14.0f %10.1f" % (name, nCalls / t, 1e9 * t / nCalls))
+
+    lindo.pyLSdeleteModel(pModel)
+    lindo.pyLSdeleteEnv(pEnv)
+
+except lindo.LINDO_Exception as e:
+    lindo.geterrormessage(pEnv, e.args[1])
+except Exception as e:
+    print(f"Other Error => {e}")
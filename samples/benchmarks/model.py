@@ -0,0 +1,88 @@
+#  Model building time: lindo.model against per-constraint calls.
+#
+#  Builds a dense transportation problem
+#
+#      Minimize  sum_ij cost_ij x_ij
+#      s.t.      sum_j x_ij <= supply_i     for every i
+#                sum_i x_ij >= demand_j     for every j
+#                x_ij >= 0
+#
+#  in two ways:
+#
+#    lindo.model      variable block, vectorized expressions, one
+#                     LSloadLPData call
+#    addConstraints   variables with pyLSaddVariables, then one
+#                     pyLSaddConstraints call per constraint, with the row
+#                     built in Python
+#
+#  and reports the wall time of each for a few sizes, e.g.
+#
+#      > python samples/benchmarks/model.py
+
+import lindo
+from lindo.model import Model
+import numpy as np
+import os
+import time
+
+sizes = [(50, 50), (200, 200), (500, 500)]
+
+def build_vectorized(pModel, cost, supply, demand):
+    m = Model()
+    x = m.add_vars(cost.shape, lb=0.0)
+    m.add_constraints(x.sum(axis=1) <= supply)
+    m.add_constraints(x.sum(axis=0) >= demand)
+    m.minimize((cost * x).sum())
+    m.load(pModel)
+
+def build_per_constraint(pModel, cost, supply, demand):
+    nI, nJ = cost.shape
+    nVars = nI * nJ
+    lindo.pyLSaddVariables(pModel, nVars, np.full(nVars, 'C', dtype='S1'), None,
+                           np.zeros(nVars + 1, dtype=np.int32), None,
+                           np.empty(0), np.empty(0, dtype=np.int32),
+                           cost.ravel(), np.zeros(nVars),
+                           np.full(nVars, lindo.LS_INFINITY))
+    anBeg = np.array([0, 0], dtype=np.int32)
+    for i in range(nI):
+        aiCols = np.array([i * nJ + j for j in range(nJ)], dtype=np.int32)
+        anBeg[1] = nJ
+        lindo.pyLSaddConstraints(pModel, 1, np.array(['L'], dtype='S1'), None,
+                                 anBeg, np.ones(nJ), aiCols, supply[i:i+1])
+    for j in range(nJ):
+        aiCols = np.array([i * nJ + j for i in range(nI)], dtype=np.int32)
+        anBeg[1] = nI
+        lindo.pyLSaddConstraints(pModel, 1, np.array(['G'], dtype='S1'), None,
+                                 anBeg, np.ones(nI), aiCols, demand[j:j+1])
+
+try:
+    LicenseKey = np.array('',dtype='S1024')
+    lindo.pyLSloadLicenseString(os.getenv('LINDOAPI_HOME')+'/license/lndapi160.lic',LicenseKey)
+    pnErrorCode = np.array([-1],dtype=np.int32)
+    pEnv = lindo.pyLScreateEnv(pnErrorCode,LicenseKey)
+except lindo.LINDO_Exception as e:
+    print(e.args[0])
+    exit(1)
+
+try:
+    rng = np.random.default_rng(0)
+    print("%-12s %16s %16s" % ("vars", "lindo.model s", "addConstraints s"))
+    for nI, nJ in sizes:
+        cost = rng.random((nI, nJ))
+        supply = rng.random(nI) * nJ
+        demand = rng.random(nJ) * nI * 0.5
+        times = []
+        for build in (build_vectorized, build_per_constraint):
+            pModel = lindo.pyLScreateModel(pEnv,pnErrorCode)
+            t = time.perf_counter()
+            build(pModel, cost, supply, demand)
+            times.append(time.perf_counter() - t)
+            lindo.pyLSdeleteModel(pModel)
+        print("%-12d %16.4f %16.4f" % (nI * nJ, times[0], times[1]))
+
+    lindo.pyLSdeleteEnv(pEnv)
+
+except lindo.LINDO_Exception as e:
+    lindo.geterrormessage(pEnv, e.args[1])
+except Exception as e:
+    print(f"Other Error => {e}")
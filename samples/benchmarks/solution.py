@@ -0,0 +1,115 @@
+#  Allocation churn of solution queries in a re-solve loop.
+#
+#  Loads the small LP of samples/lp.py, then repeatedly perturbs a bound,
+#  re-solves and fetches the primal, dual, slack and reduced cost vectors
+#  in three ways:
+#
+#    presized  pyLSgetInfo for n/m, np.empty per vector, then query
+#    out=None  let the extension allocate correctly sized arrays
+#    out=buf   reuse buffers allocated once before the loop
+#
+#  and reports loop iterations/s together with the transient memory peak
+#  of the loop body (tracemalloc), e.g.
+#
+#      > python samples/benchmarks/solution.py
+
+import lindo
+import numpy as np
+import os
+import timeit
+import tracemalloc
+
+#model data
+nCons = 4
+nVars = 4
+nDir = 1
+dObjConst = 0.0
+adC = np.array([1.,1.,1.,1.],dtype=np.double)
+adB = np.array([20.0,20.0,40.0,10.0],dtype=np.double)
+acConTypes = np.array(['E','G','E','G'],dtype='|S1')
+nNZ = 9
+anBegCol = np.array([0,2,5,7,9],dtype=np.int32)
+pnLenCol = np.asarray(None)
+adA = np.array([3.0,4.0,6.0,5.0,7.0,8.0,1.0,2.0,9.0],dtype=np.double)
+anRowX = np.array([0,2,1,2,3,2,3,0,1],dtype=np.int32)
+pdLower = np.array([2,1,-lindo.LS_INFINITY,-lindo.LS_INFINITY],dtype=np.double)
+pdUpper = np.array([5,lindo.LS_INFINITY,10,lindo.LS_INFINITY],dtype=np.double)
+
+nLoops = 20000
+nRepeat = 5
+
+try:
+    LicenseKey = np.array('',dtype='S1024')
+    lindo.pyLSloadLicenseString(os.getenv('LINDOAPI_HOME')+'/license/lndapi160.lic',LicenseKey)
+    pnErrorCode = np.array([-1],dtype=np.int32)
+    pEnv = lindo.pyLScreateEnv(pnErrorCode,LicenseKey)
+except lindo.LINDO_Exception as e:
+    print(e.args[0])
+    exit(1)
+
+try:
+    pModel = lindo.pyLScreateModel(pEnv,pnErrorCode)
+    lindo.pyLSloadLPData(pModel,nCons,nVars,nDir,
+                                    dObjConst,adC,adB,acConTypes,nNZ,anBegCol,
+                                    pnLenCol,adA,anRowX,pdLower,pdUpper)
+
+    pnStatus = np.array([-1],dtype=np.int32)
+    aiVar = np.array([0],dtype=np.int32)
+    adVal = np.array([5.0],dtype=np.double)
+    ibuf = np.array([-1],dtype=np.int32)
+
+    def resolve():
+        adVal[0] = 10.0 - adVal[0]
+        lindo.pyLSmodifyUpperBounds(pModel,1,aiVar,adVal)
+        lindo.pyLSoptimize(pModel,lindo.LS_METHOD_FREE,pnStatus)
+
+    def presized():
+        resolve()
+        lindo.pyLSgetInfo(pModel,lindo.LS_IINFO_NUM_VARS,ibuf)
+        n = ibuf[0]
+        lindo.pyLSgetInfo(pModel,lindo.LS_IINFO_NUM_CONS,ibuf)
+        m = ibuf[0]
+        x, y, s, d = np.empty(n), np.empty(m), np.empty(m), np.empty(n)
+        lindo.pyLSgetPrimalSolution(pModel,x)
+        lindo.pyLSgetDualSolution(pModel,y)
+        lindo.pyLSgetSlacks(pModel,s)
+        lindo.pyLSgetReducedCosts(pModel,d)
+
+    def allocating():
+        resolve()
+        x = lindo.pyLSgetPrimalSolution(pModel)
+        y = lindo.pyLSgetDualSolution(pModel)
+        s = lindo.pyLSgetSlacks(pModel)
+        d = lindo.pyLSgetReducedCosts(pModel)
+
+    x, y, s, d = np.empty(nVars), np.empty(nCons), np.empty(nCons), np.empty(nVars)
+    def reusing():
+        resolve()
+        lindo.pyLSgetPrimalSolution(pModel,x)
+        lindo.pyLSgetDualSolution(pModel,y)
+        lindo.pyLSgetSlacks(pModel,s)
+        lindo.pyLSgetReducedCosts(pModel,d)
+
+    def peak_bytes(f, n=1000):
+        f()
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        for _ in range(n):
+            f()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak - base
+
+    print("%-12s %12s %12s" % ("mode", "loops/s", "peak bytes"))
+    for name, f in [("presized", presized), ("out=None", allocating), ("out=buf", reusing)]:
+        t = min(timeit.repeat(f, number=nLoops, repeat=nRepeat))
+        print("%-12s %12.0f %12d" % (name, nLoops / t, peak_bytes(f)))
+
+    lindo.pyLSdeleteModel(pModel)
+    lindo.pyLSdeleteEnv(pEnv)
+
+except lindo.LINDO_Exception as e:
+    lindo.geterrormessage(pEnv, e.args[1])
+except Exception as e:
+    print(f"Other Error => {e}")
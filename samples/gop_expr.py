@@ -0,0 +1,69 @@
+# Solve the multi-extremal model of gop.py, with the instruction list
+# compiled from Python expressions by lindo.model.
+#
+#           MINIMIZE      x * sin(x * pi)
+#           subject to    0 <= x <= 10
+
+
+import lindo
+from lindo.model import InstructModel, sin
+import numpy as np
+import os
+
+#Build the model
+m = InstructModel()
+x = m.add_vars(lb=0.0, ub=10.0)
+y = m.add_vars(lb=-2.0, ub=2.0)
+m.minimize(x * sin(x * np.pi))
+m.add_constraints(y == 0.0)
+
+# The first try block is for catching errors rasied while creating an environment
+try:
+    #create LINDO environment and model objects
+    LicenseKey = np.array('',dtype='S1024')
+    lindo.pyLSloadLicenseString(os.getenv('LINDOAPI_HOME')+'/license/lndapi160.lic',LicenseKey)
+    pnErrorCode = np.array([-1],dtype=np.int32)
+    pEnv = lindo.pyLScreateEnv(pnErrorCode,LicenseKey)
+except lindo.LINDO_Exception as e:
+    print(e.args[0])
+    exit(1)
+
+# The Second try block is to catch errors rasied for the allocated LINDO enviroment
+try:
+    pModel = lindo.pyLScreateModel(pEnv,pnErrorCode)
+
+    #Set linearization level, before a call to LSloadNLPCode.
+    lindo.pyLSsetModelIntParameter(pModel, lindo.LS_IPARAM_NLP_LINEARZ, 1)
+
+    #Set up automatic differentiation, before a call to LSloadNLPCode.
+    lindo.pyLSsetModelIntParameter(pModel, lindo.LS_IPARAM_NLP_AUTODERIV, 1)
+
+    #Load instruction list
+    print("Loading instruction list...")
+    m.load(pModel)
+
+    #solve the model
+    print("Solving the model...")
+    pnStatus = np.array([-1],dtype=np.int32)
+    lindo.pyLSsolveGOP(pModel, pnStatus)
+    print(f"Solution status: {pnStatus[0]}\n")
+
+    #retrieve the objective value
+    dObj = np.array([-1.0],dtype=np.double)
+    lindo.pyLSgetInfo(pModel,lindo.LS_DINFO_POBJ,dObj)
+    print(f"Objective is: {dObj[0]:.5f}\n")
+
+    #retrieve the primal solution
+    padPrimal = lindo.pyLSgetPrimalSolution(pModel)
+    print(f"x = {x.value(padPrimal):.5f}, y = {y.value(padPrimal):.5f}")
+
+    #delete LINDO model pointer
+    lindo.pyLSdeleteModel(pModel)
+
+    #delete LINDO environment pointer
+    lindo.pyLSdeleteEnv(pEnv)
+
+except lindo.LINDO_Exception as e:
+    lindo.geterrormessage(pEnv, e.args[1])
+except Exception as e:
+    print(f"Other Error => {e}")
@@ -3,10 +3,8 @@
 
     This script is for building the lindo python package.
 """
-from distutils import extension
 from ntpath import join
 from setuptools import setup, Extension, find_packages
-from distutils.sysconfig import get_python_lib
 import os
 import sys
 import platform
@@ -66,6 +64,7 @@ if bd.platform == 'Windows':
         BinPath = os.path.join(bd.API_HOME, 'bin/win32')
     extra_link_args = '-Wl,--enable-stdcall-fixup'
     macros = [('_LINDO_DLL_', '')]
+    extra_libs = []
 
 # For Linux
 elif bd.platform == 'Linux':
@@ -79,6 +78,7 @@ elif bd.platform == 'Linux':
         BinPath = os.path.join(bd.API_HOME, 'bin/linux64arm')
     extra_link_args = '-Wl,-rpath='+BinPath
     macros = []
+    extra_libs = ['pthread']
 
 # For Mac OS X
 elif bd.platform == 'Darwin':
@@ -94,6 +94,7 @@ elif bd.platform == 'Darwin':
         lib = os.path.join('bin/osx64arm', LindoLib + ".dylib")
     extra_link_args = '-Wl,-rpath,' + BinPath
     macros = [('_LINDO_DLL_', '')]
+    extra_libs = []
 else:
     print("System not supported!")
     exit(0)
@@ -105,7 +106,7 @@ extension = Extension(
                 define_macros=macros,
                 library_dirs=[LibPath, BinPath],
                 depends=[BinPath],
-                libraries=[LindoLib],
+                libraries=[LindoLib] + extra_libs,
                 include_dirs=[bd.IncludePath, numpyinclude],
                 extra_link_args=[extra_link_args],
                 )
@@ -130,7 +131,7 @@ kwargs = {
         "python_requires": ">=3.7",
         "install_requires": ["numpy"],
         "ext_modules": [extension],
-        "packages": ["lindo", "lindo_test"],
+        "packages": ["lindo", "lindo.model", "lindo_test"],
         "package_dir": {"": "src"},
         "package_data": {"lindo": ["*.txt"]},
 }
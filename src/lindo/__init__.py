@@ -2,3 +2,32 @@ from .loadLibs import *
 from .LSconst import *
 from .wrappers import *
 from .lindo import *
+from . import enums as _enums
+
+# loaded on first access through __getattr__
+_LAZY = {
+    'aio': ('.aio', None),
+    'model': ('.model', None),
+    'apply_delta': ('.delta', 'apply_delta'),
+    'EnvPool': ('.pool', 'EnvPool'),
+    'ModelPool': ('.pool', 'ModelPool'),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        module, attr = _LAZY[name]
+        value = importlib.import_module(module, __name__)
+        if attr:
+            value = getattr(value, attr)
+    elif name in _enums.PREFIXES:
+        value = _enums.family(name)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_enums.PREFIXES))
@@ -0,0 +1,72 @@
+"""
+    aio.py
+
+    asyncio front end for the LINDO API solvers.
+
+    Each coroutine runs the native solve on an executor thread (the
+    extension releases the GIL while solving) and resolves to a
+    (status, objective) tuple. Cancelling the awaiting task asks the
+    solver to stop at its next progress callback and waits for it to
+    return before the CancelledError is propagated, so the model is never
+    left with a solve still running on it.
+
+        status, obj = await lindo.aio.solve_mip(pModel)
+"""
+import asyncio
+import numpy as N
+from .LSconst import *
+from .lindo import *
+
+
+def _solve(model, solve, objInfo):
+    pnStatus = N.array([-1], dtype=N.int32)
+    dObj = N.array([N.nan], dtype=N.double)
+    try:
+        solve(model, pnStatus)
+    except LINDO_Exception as e:
+        if e.args[1] != LSERR_USER_INTERRUPT:
+            raise
+    else:
+        pyLSgetInfo(model, objInfo, dObj)
+    return int(pnStatus[0]), float(dObj[0])
+
+
+async def _run(model, solve, objInfo, executor):
+    loop = asyncio.get_running_loop()
+    # installs the relay before the solve starts; cancelling only flips its flag
+    set_interrupt(model, 0)
+    fut = loop.run_in_executor(executor, _solve, model, solve, objInfo)
+    try:
+        return await asyncio.shield(fut)
+    except asyncio.CancelledError:
+        set_interrupt(model, 1)
+        try:
+            await fut
+        except Exception:
+            pass
+        raise
+    finally:
+        if fut.done():
+            set_interrupt(model, 0)
+
+
+async def solve_lp(model, method=LS_METHOD_FREE, executor=None):
+    """Solve a continuous model with LSoptimize(method)."""
+    def solve(pModel, pnStatus):
+        pyLSoptimize(pModel, method, pnStatus)
+    return await _run(model, solve, LS_DINFO_POBJ, executor)
+
+
+async def solve_mip(model, executor=None):
+    """Solve a mixed-integer model with LSsolveMIP."""
+    return await _run(model, pyLSsolveMIP, LS_DINFO_MIP_OBJ, executor)
+
+
+async def solve_gop(model, executor=None):
+    """Solve a nonconvex model to global optimality with LSsolveGOP."""
+    return await _run(model, pyLSsolveGOP, LS_DINFO_GOP_OBJ, executor)
+
+
+async def solve_sp(model, executor=None):
+    """Solve a stochastic program with LSsolveSP."""
+    return await _run(model, pyLSsolveSP, LS_DINFO_STOC_EVOBJ, executor)
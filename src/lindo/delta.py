@@ -0,0 +1,153 @@
+"""
+    delta.py
+
+    Re-optimization on changed data without reloading the model.
+
+    apply_delta compares new LP data with the data the model holds and
+    issues only the pyLSmodify* calls for the entries that differ, so the
+    model keeps its basis for a warm re-solve. The loaded data is read
+    with a single lindo.get_lp call and kept in lindo.model_cache(model),
+    where it is replaced by the new data after each apply_delta and
+    dropped whenever the model is changed through any other wrapper.
+
+        lindo.apply_delta(pModel, c=cost_today, b=demand_today)
+        lindo.pyLSoptimize(pModel, lindo.LS_METHOD_FREE, pnStatus)
+"""
+import numpy as N
+from .LSconst import *
+from .lindo import *
+
+
+def _read(model):
+    """The LP data of model as a snapshot dict."""
+    lp = get_lp(model, raw=True)
+    data, indices, indptr = lp.pop('A')
+    cols = N.repeat(N.arange(len(indptr) - 1), N.diff(indptr))
+    lp['akeys'], lp['avals'] = _keyed(cols, indices, data, len(lp['b']))
+    # detach the vectors from the buffer that also holds A
+    for key in ('c', 'b', 'lb', 'ub', 'contypes'):
+        lp[key] = lp[key].copy()
+    return lp
+
+
+def _keyed(cols, rows, vals, nCons):
+    """Nonzeros of a matrix as sorted col * nCons + row keys, duplicates summed."""
+    keys = N.asarray(cols, dtype=N.int64) * max(nCons, 1) + rows
+    if len(keys) > 1 and N.any(keys[1:] <= keys[:-1]):
+        keys, inv = N.unique(keys, return_inverse=True)
+        vals = N.bincount(inv.ravel(), weights=vals, minlength=len(keys))
+    nz = vals != 0
+    return keys[nz], vals[nz]
+
+
+def _vector(x, n, name):
+    x = N.asarray(x, dtype=N.double)
+    if x.shape != (n,):
+        raise ValueError("%s must have shape (%d,), not %s" % (name, n, x.shape))
+    return N.clip(x, -LS_INFINITY, LS_INFINITY)
+
+
+def _matrix(A, nCons, nVars):
+    """Column, row and value arrays of a dense or scipy.sparse A."""
+    if not hasattr(A, 'tocoo'):
+        A = N.asarray(A, dtype=N.double)
+    if A.shape != (nCons, nVars):
+        raise ValueError("A must have shape %s, not %s" % ((nCons, nVars), A.shape))
+    if hasattr(A, 'tocoo'):
+        A = A.tocoo()
+        return (N.asarray(A.col, dtype=N.int64), N.asarray(A.row, dtype=N.int64),
+                N.asarray(A.data, dtype=N.double))
+    cols, rows = N.nonzero(A.T)
+    return cols, rows, A[rows, cols]
+
+
+def _changed(old, new):
+    idx = N.flatnonzero(old != new).astype(N.int32)
+    return idx, new[idx]
+
+
+def apply_delta(model, c=None, b=None, A=None, lb=None, ub=None, contypes=None,
+                objconst=None):
+    """
+    apply_delta(model, c=None, b=None, A=None, lb=None, ub=None,
+                contypes=None, objconst=None) -> dict
+
+    Bring the LP data of an already loaded model to the given values with
+    the fewest modification calls: one pyLSmodifyObjective, pyLSmodifyRHS,
+    pyLSmodifyLowerBounds, pyLSmodifyUpperBounds and
+    pyLSmodifyConstraintType call for the entries that changed, and one
+    pyLSmodifyAj (or pyLSdeleteAj for coefficients that became zero) per
+    column of A that changed. Arguments left as None are not compared.
+    A is a dense array or a scipy.sparse matrix of the loaded shape; the
+    number of rows and columns cannot change. Returns the number of
+    changed entries per argument.
+    """
+    cache = model_cache(model)
+    lp = cache.get('lp')
+    if lp is None:
+        lp = _read(model)
+    nVars, nCons = len(lp['c']), len(lp['b'])
+
+    new = dict(lp)
+    if c is not None:
+        new['c'] = _vector(c, nVars, 'c')
+    if b is not None:
+        new['b'] = _vector(b, nCons, 'b')
+    if lb is not None:
+        new['lb'] = _vector(lb, nVars, 'lb')
+    if ub is not None:
+        new['ub'] = _vector(ub, nVars, 'ub')
+    if contypes is not None:
+        if isinstance(contypes, str):
+            contypes = contypes.encode()
+        if isinstance(contypes, bytes):
+            contypes = N.frombuffer(contypes, dtype='S1')
+        new['contypes'] = N.asarray(contypes, dtype='S1')
+        if new['contypes'].shape != (nCons,):
+            raise ValueError("contypes must have %d entries" % nCons)
+    if objconst is not None:
+        new['objconst'] = float(objconst)
+    if A is not None:
+        new['akeys'], new['avals'] = _keyed(*_matrix(A, nCons, nVars), nCons)
+
+    # compute every change before the first call
+    counts = {}
+    calls = []
+    for name, modify in (('c', pyLSmodifyObjective), ('b', pyLSmodifyRHS),
+                         ('lb', pyLSmodifyLowerBounds), ('ub', pyLSmodifyUpperBounds)):
+        idx, val = _changed(lp[name], new[name])
+        counts[name] = len(idx)
+        if len(idx):
+            calls.append((modify, (model, len(idx), idx, val)))
+    idx, val = _changed(lp['contypes'], new['contypes'])
+    counts['contypes'] = len(idx)
+    if len(idx):
+        calls.append((pyLSmodifyConstraintType, (model, len(idx), idx, val)))
+    counts['objconst'] = int(lp['objconst'] != new['objconst'])
+    if counts['objconst']:
+        calls.append((pyLSmodifyObjConstant, (model, new['objconst'])))
+
+    okeys, ovals, nkeys, nvals = lp['akeys'], lp['avals'], new['akeys'], new['avals']
+    pos = N.searchsorted(okeys, nkeys)
+    found = N.zeros(len(nkeys), dtype=bool)
+    inside = pos < len(okeys)
+    found[inside] = okeys[pos[inside]] == nkeys[inside]
+    setmask = ~found
+    setmask[found] = ovals[pos[found]] != nvals[found]
+    dropped = okeys[~N.isin(okeys, nkeys, assume_unique=True)]
+    counts['A'] = int(N.count_nonzero(setmask)) + len(dropped)
+    for keys, vals, drop in ((nkeys[setmask], nvals[setmask], False), (dropped, None, True)):
+        cols, rows = N.divmod(keys, max(nCons, 1))
+        bounds = N.flatnonzero(N.diff(cols, prepend=-1, append=-1))
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            aiRows = rows[lo:hi].astype(N.int32)
+            if drop:
+                calls.append((pyLSdeleteAj, (model, int(cols[lo]), int(hi - lo), aiRows)))
+            else:
+                calls.append((pyLSmodifyAj, (model, int(cols[lo]), int(hi - lo), aiRows, vals[lo:hi])))
+
+    for modify, args in calls:
+        modify(*args)
+    # the wrappers dropped the old snapshot
+    cache['lp'] = new
+    return counts
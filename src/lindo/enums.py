@@ -0,0 +1,38 @@
+"""
+    enums.py
+
+    IntEnum families over the constants of LSconst, built on first use.
+
+    Each family holds the constants that share a prefix, named without
+    it, so a code returned by LINDO maps back to its name with one dict
+    lookup. The members compare equal to the plain constants.
+
+        lindo.Error(2001).name                  # 'OUT_OF_MEMORY'
+        lindo.IParam.LP_SCALE == lindo.LS_IPARAM_LP_SCALE
+"""
+import enum
+from . import LSconst
+
+PREFIXES = {
+    'Status': 'LS_STATUS_',
+    'IParam': 'LS_IPARAM_',
+    'DParam': 'LS_DPARAM_',
+    'IInfo': 'LS_IINFO_',
+    'DInfo': 'LS_DINFO_',
+    'Error': 'LSERR_',
+    'EP': 'EP_',
+}
+
+_families = {}
+
+
+def family(name):
+    """The IntEnum of the given family, created on the first call."""
+    cls = _families.get(name)
+    if cls is None:
+        prefix = PREFIXES[name]
+        # constants defined later under another name become aliases
+        members = [(key[len(prefix):], value) for key, value in vars(LSconst).items()
+                   if key.startswith(prefix)]
+        cls = _families.setdefault(name, enum.IntEnum(name, members, module='lindo'))
+    return cls
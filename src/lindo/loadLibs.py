@@ -1,9 +1,20 @@
-from distutils.sysconfig import get_python_lib
+"""
+    loadLibs.py
+
+    Makes the LINDO API shared library loadable before the extension is
+    imported.
+
+    The version check and the macOS library scan run once per LINDO API
+    installation. Their result is kept in a location file in the user
+    cache directory, keyed by LINDOAPI_HOME, the package directory and
+    the mtime of lsversion.sh. Later imports only stat lsversion.sh, and
+    fall back to the full scan if the extension then fails to load.
+"""
 import os
 import sys
-import subprocess
 import platform
-import glob
+
+CACHE_VERSION = "1"
 
 class BuildData():
     """
@@ -17,11 +28,10 @@ class BuildData():
         self.MAJOR = "16"
         self.MINOR = "0"
         self.API_HOME = os.environ.get('LINDOAPI_HOME')
-        self.IncludePath = os.path.join(self.API_HOME , "include")
+        self.IncludePath = os.path.join(self.API_HOME or "", "include")
         self.platform = platform.system()
         self.is_64bits = sys.maxsize > 2**32
-        self.pylindoPath = os.path.join(get_python_lib(
-             plat_specific=1), 'lindo')
+        self.pylindoPath = os.path.dirname(os.path.abspath(__file__))
 
 def setSymLink(src, dest):
      try:
@@ -30,11 +40,11 @@ def setSymLink(src, dest):
          pass
 #
 # mac(bd:BuildData)
-# This function adds the Lindo API bin path to the 
-# environment variable DYLD_LIBRARY_PATH if it is
-# not already included.
+# This function links the Lindo API dylibs into the
+# package directory, where the extension finds them.
 #
 def mac(bd:BuildData):
+    import glob
     if platform.machine() == 'x86_64':
         binPath= os.path.join(bd.API_HOME,"bin/osx64x86")
     else:
@@ -42,20 +52,21 @@ def mac(bd:BuildData):
 
     dylibList = glob.glob(os.path.join(binPath, "*.dylib"))
     for dylibPath in dylibList:
-        dylibName = str.split(dylibPath, sep="/")[-1]
+        dylibName = os.path.basename(dylibPath)
         linkPath = os.path.join(bd.pylindoPath, dylibName)
-        setSymLink(dylibPath, linkPath)
-        
+        if not os.path.lexists(linkPath):
+            setSymLink(dylibPath, linkPath)
+
 #
 # windows()
-# This function adds the dll directory at 
+# This function adds the dll directory at
 # runtime
 def windows(bd:BuildData):
     if bd.is_64bits:
-        LibPath = bd.API_HOME + '/bin/win64'        
+        LibPath = bd.API_HOME + '/bin/win64'
     else:
         LibPath = bd.API_HOME + '/bin/win32'
-    if (sys.version_info[0] == 3) and (sys.version_info[1] != 7):
+    if hasattr(os, 'add_dll_directory'):
         os.add_dll_directory(LibPath)
 
 
@@ -67,29 +78,104 @@ def checkVersion(bd:BuildData):
         with open(fn, "r") as f:
             majorLine = f.readline()
             minorLine = f.readline()
-            f.close()
     except FileNotFoundError:
         No_lsversion_FileFound = f"Could not locate {fn}\n Create file and add \nLS_MAJOR={bd.MAJOR}\nLS_MINOR={bd.MINOR}"
         raise Exception(No_lsversion_FileFound)
-    # LS_MAJOR=15 the number starts at 9
-    endOfDef = 9 
-    majorNum = majorLine[endOfDef:]
-    minorNum = majorLine[endOfDef:]
+    # LS_MAJOR=15
+    majorNum = majorLine.split("=", 1)[-1].strip()
     if(int(bd.MAJOR) != int(majorNum)):
         WrongLindoPyVersion = f"Lindo API Version does not match Lindo/Python version\n Try pip install lindo=={majorNum}"
         raise Exception(WrongLindoPyVersion)
-        
+
+#
+# cacheFile(bd:BuildData)
+# Location file of this Lindo/Python version in the
+# user cache directory.
+#
+def cacheFile(bd:BuildData):
+    if bd.platform == 'Windows':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~/AppData/Local')
+    elif bd.platform == 'Darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'lindo', f"location-{bd.MAJOR}.{bd.MINOR}.txt")
+
+#
+# cacheKey(bd:BuildData)
+# What a location file is valid for; None if lsversion.sh
+# is missing, in which case checkVersion reports it.
+#
+def cacheKey(bd:BuildData):
+    try:
+        mtime = os.stat(os.path.join(bd.API_HOME, 'include', 'lsversion.sh')).st_mtime_ns
+    except OSError:
+        return None
+    return "\n".join([CACHE_VERSION, bd.API_HOME, bd.pylindoPath, str(mtime)]) + "\n"
+
+def readCache(bd:BuildData, key):
+    try:
+        with open(cacheFile(bd), "r") as f:
+            return f.read() == key
+    except OSError:
+        return False
+
+def writeCache(bd:BuildData, key):
+    # a read-only or missing home directory only costs the next import a scan
+    fn = cacheFile(bd)
+    tmp = f"{fn}.{os.getpid()}"
+    try:
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        with open(tmp, "w") as f:
+            f.write(key)
+        os.replace(tmp, fn)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+def dropCache(bd:BuildData):
+    try:
+        os.remove(cacheFile(bd))
+    except OSError:
+        pass
+
+#
+# locate(bd:BuildData)
+# The full discovery: version check and library setup.
+#
+def locate(bd:BuildData):
+    checkVersion(bd)
+    if bd.platform == 'Darwin':
+        mac(bd)
+
+def loadExtension():
+    import importlib
+    importlib.import_module('.lindo', __package__)
+
 def main():
     bd = BuildData()
-    checkVersion(bd)
     #Environment variable LINDOAPI_HOME must be set
     if bd.API_HOME == None:
         print("Environment variable LINDOAPI_HOME should be set!")
         exit(0)
     if bd.platform == 'Windows' or bd.platform == "CYGWIN_NT-6.3":
         windows(bd)
-    elif bd.platform == 'Linux':
-        pass
-    else:
-        mac(bd)
-main()
\ No newline at end of file
+
+    key = cacheKey(bd)
+    cached = key is not None and readCache(bd, key)
+    if not cached:
+        locate(bd)
+    try:
+        loadExtension()
+    except ImportError:
+        if not cached:
+            raise
+        # the installation changed under an unchanged lsversion.sh
+        dropCache(bd)
+        locate(bd)
+        loadExtension()
+    if not cached and key is not None:
+        writeCache(bd, key)
+main()
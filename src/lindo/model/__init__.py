@@ -0,0 +1,11 @@
+"""
+    lindo.model
+
+    Vectorized algebraic modeling on top of LSloadLPData. Variables come in
+    array-shaped blocks, expressions broadcast like NumPy arrays, and the
+    whole constraint matrix is assembled in compressed-column form at once.
+"""
+from .expr import LinExpr, Var, Constraint, dot
+from .builder import Model, CooMatrix
+from .instruct import (InstructModel, Expr, NVar, sin, cos, tan, exp, log, log10,
+                       sqrt, maximum, minimum)
@@ -0,0 +1,143 @@
+"""
+    builder.py
+
+    Model: collects variable and constraint blocks and loads them with a
+    single LSloadLPData call.
+"""
+import numpy as N
+from ..LSconst import LS_MIN, LS_MAX, LS_INFINITY
+from ..lindo import load_lp, pyLSloadVarType
+from .expr import Var, Constraint, _as_expr
+
+_VTYPES = ('C', 'B', 'I')
+
+
+class CooMatrix:
+    """
+    Minimal coordinate-format matrix, with the attributes of a
+    scipy.sparse coo_matrix that lindo.load_lp reads.
+    """
+
+    format = 'coo'
+
+    def __init__(self, shape, row, col, data):
+        self.shape = shape
+        self.row = row
+        self.col = col
+        self.data = data
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+
+class Model:
+    """
+    Model()
+
+    A linear (or mixed-integer linear) model built from array-shaped
+    blocks and loaded into a LINDO model with a single LSloadLPData call.
+
+        m = Model()
+        x = m.add_vars((nI, nJ), lb=0.0)
+        m.add_constraints(x.sum(axis=1) <= supply)
+        m.add_constraints(x.sum(axis=0) >= demand)
+        m.minimize((cost * x).sum())
+        m.load(pModel)
+    """
+
+    def __init__(self):
+        self.nVars = 0
+        self.nCons = 0
+        self.vars = []
+        self.constraints = []
+        self.objective = _as_expr(0.0)
+        self.sense = LS_MIN
+
+    def add_vars(self, shape=(), lb=0.0, ub=LS_INFINITY, vtype='C', name=None):
+        """Add a block of variables; lb, ub and vtype broadcast to shape."""
+        shape = (shape,) if N.ndim(shape) == 0 else tuple(shape)
+        if vtype not in _VTYPES:
+            raise ValueError("vtype must be one of %s" % (_VTYPES,))
+        var = Var(shape, self.nVars, name)
+        var.lb = N.broadcast_to(N.asarray(lb, dtype=N.double), shape)
+        var.ub = N.broadcast_to(N.asarray(ub, dtype=N.double), shape)
+        var.vtype = vtype
+        self.vars.append(var)
+        self.nVars += var.size
+        return var
+
+    def add_constraints(self, con, name=None):
+        """Add a block of constraints built with <=, >= or == on expressions."""
+        if not isinstance(con, Constraint):
+            raise TypeError("expected a constraint, e.g. expr <= rhs")
+        if con.start is not None:
+            raise ValueError("constraint has already been added to a model")
+        if con.expr.nnz and con.expr.cols.max() >= self.nVars:
+            raise ValueError("constraint refers to variables of another model")
+        con.start = self.nCons
+        con.name = name
+        self.constraints.append(con)
+        self.nCons += con.size
+        return con
+
+    def _set_objective(self, expr, sense):
+        expr = _as_expr(expr)
+        if expr is NotImplemented or expr.size != 1:
+            raise ValueError("the objective must be a scalar expression")
+        self.objective = expr
+        self.sense = sense
+
+    def minimize(self, expr):
+        self._set_objective(expr, LS_MIN)
+
+    def maximize(self, expr):
+        self._set_objective(expr, LS_MAX)
+
+    def to_arrays(self):
+        """
+        The model as keyword arguments of lindo.load_lp: A (coordinate
+        form, duplicates not yet summed), c, b, contypes, lb, ub, sense
+        and objconst.
+        """
+        nCons, nVars = self.nCons, self.nVars
+        cons = self.constraints
+        if cons:
+            rows = N.concatenate([con.start + con.expr.rows for con in cons])
+            cols = N.concatenate([con.expr.cols for con in cons])
+            coefs = N.concatenate([con.expr.coefs for con in cons])
+            b = -N.concatenate([con.expr.const.ravel() for con in cons])
+            contypes = N.concatenate([N.full(con.size, con.sense, dtype='S1') for con in cons])
+        else:
+            rows = cols = N.empty(0, dtype=N.intp)
+            coefs = b = N.empty(0)
+            contypes = N.empty(0, dtype='S1')
+        obj = self.objective
+        if obj.nnz and obj.cols.max() >= nVars:
+            raise ValueError("objective refers to variables of another model")
+        if self.vars:
+            lb = N.concatenate([var.lb.ravel() for var in self.vars])
+            ub = N.concatenate([var.ub.ravel() for var in self.vars])
+        else:
+            lb = ub = N.empty(0)
+        return dict(A=CooMatrix((nCons, nVars), rows, cols, coefs),
+                    c=N.bincount(obj.cols, weights=obj.coefs, minlength=nVars),
+                    b=b, contypes=contypes, lb=lb, ub=ub,
+                    sense=self.sense, objconst=float(obj.const.sum()))
+
+    def vartypes(self):
+        """Per-column C/B/I types, or None for a purely continuous model."""
+        if all(var.vtype == 'C' for var in self.vars):
+            return None
+        return N.concatenate([N.full(var.size, var.vtype, dtype='S1') for var in self.vars])
+
+    def load(self, model):
+        """
+        Load the model into a LINDO model (pModel). The coordinate matrix
+        is compressed to columns natively by lindo.load_lp and passed to
+        LSloadLPData in a single call.
+        """
+        load_lp(model, **self.to_arrays())
+        vtypes = self.vartypes()
+        if vtypes is not None:
+            pyLSloadVarType(model, vtypes)
@@ -0,0 +1,291 @@
+"""
+    expr.py
+
+    Array-shaped linear expressions for lindo.model.
+
+    A LinExpr is an ndarray-like block of affine functions of the model
+    variables. Its linear part is kept as coordinate triplets
+    (rows, cols, coefs), where rows are flat (C order) positions in the
+    block and cols are model column indices, next to a constant array of
+    the block's shape. Every operation works on whole triplet arrays, so
+    building a million-term expression costs a few NumPy calls rather
+    than a million Python objects. Operands broadcast like ndarrays.
+"""
+import numpy as N
+
+
+def _as_expr(obj):
+    if isinstance(obj, LinExpr):
+        return obj
+    if hasattr(obj, 'tocoo') or isinstance(obj, Constraint):
+        return NotImplemented
+    const = N.asarray(obj, dtype=N.double)
+    empty = N.empty(0, dtype=N.intp)
+    return LinExpr(const.shape, empty, empty, N.empty(0), const)
+
+
+def _coo(A):
+    """Row, column and value arrays of a dense or scipy.sparse matrix."""
+    if hasattr(A, 'tocoo'):
+        A = A.tocoo()
+        return (N.asarray(A.row, dtype=N.intp), N.asarray(A.col, dtype=N.intp),
+                N.asarray(A.data, dtype=N.double), A.shape)
+    A = N.asarray(A, dtype=N.double)
+    if A.ndim != 2:
+        raise ValueError("matrix operand must be 1-D or 2-D")
+    ai, aj = N.nonzero(A)
+    return ai, aj, A[ai, aj], A.shape
+
+
+def dot(A, e):
+    """
+    A @ e for a constant A and a 1-D expression e. Same as the @ operator,
+    which scipy.sparse matrices do not hand over to expressions.
+    """
+    return _as_expr(e)._lmatmul(A)
+
+
+class LinExpr:
+    """Block of linear expressions with an ndarray shape."""
+
+    __slots__ = ('shape', 'rows', 'cols', 'coefs', 'const')
+    __array_ufunc__ = None  # make ndarray operators defer to ours
+
+    def __init__(self, shape, rows, cols, coefs, const):
+        self.shape = tuple(shape)
+        self.rows = rows
+        self.cols = cols
+        self.coefs = coefs
+        self.const = const
+
+    @property
+    def size(self):
+        return int(N.prod(self.shape, dtype=N.intp))
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def nnz(self):
+        return len(self.coefs)
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of a 0-d expression")
+        return self.shape[0]
+
+    def __repr__(self):
+        return "<%s shape=%s nnz=%d>" % (type(self).__name__, self.shape, self.nnz)
+
+    def __bool__(self):
+        raise TypeError("the truth value of a linear expression is ambiguous")
+
+    def _take(self, pos):
+        """Expression whose entry at each position of pos is self.flat[pos]."""
+        pos = N.asarray(pos, dtype=N.intp)
+        flat = pos.ravel()
+        size = self.size
+        if pos.shape == self.shape and N.array_equal(flat, N.arange(size)):
+            return self
+        rows, cols, coefs = self.rows, self.cols, self.coefs
+        if len(rows) > 1 and N.any(rows[1:] < rows[:-1]):
+            order = N.argsort(rows, kind='stable')
+            rows, cols, coefs = rows[order], cols[order], coefs[order]
+        cnt = N.bincount(rows, minlength=size)
+        ptr = N.zeros(size + 1, dtype=N.intp)
+        N.cumsum(cnt, out=ptr[1:])
+        lens = cnt[flat]
+        newptr = N.zeros(len(flat) + 1, dtype=N.intp)
+        N.cumsum(lens, out=newptr[1:])
+        # position k of the result reads ptr[flat[q]] + (k - newptr[q])
+        src = N.repeat(ptr[flat] - newptr[:-1], lens) + N.arange(newptr[-1])
+        return LinExpr(pos.shape, N.repeat(N.arange(len(flat)), lens),
+                       cols[src], coefs[src], self.const.ravel()[flat].reshape(pos.shape))
+
+    def _positions(self):
+        return N.arange(self.size).reshape(self.shape)
+
+    def __getitem__(self, key):
+        if isinstance(key, LinExpr):
+            raise TypeError("expressions cannot be used as indices")
+        return self._take(self._positions()[key])
+
+    def broadcast_to(self, shape):
+        shape = tuple(shape)
+        if shape == self.shape:
+            return self
+        return self._take(N.broadcast_to(self._positions(), shape))
+
+    def reshape(self, *shape):
+        if len(shape) == 1 and not isinstance(shape[0], (int, N.integer)):
+            shape = shape[0]
+        const = self.const.reshape(shape)
+        return LinExpr(const.shape, self.rows, self.cols, self.coefs, const)
+
+    def ravel(self):
+        return self.reshape(-1)
+
+    def transpose(self, *axes):
+        return self._take(self._positions().transpose(*axes))
+
+    def sum(self, axis=None):
+        """Sum over the given axes (all of them by default)."""
+        const = N.asarray(self.const.sum(axis=axis))
+        if axis is None:
+            rows = N.zeros(self.nnz, dtype=N.intp)
+        else:
+            axes = tuple(a % self.ndim for a in N.atleast_1d(axis))
+            target = N.arange(const.size).reshape(const.shape)
+            target = N.broadcast_to(N.expand_dims(target, axes), self.shape)
+            rows = target.ravel()[self.rows]
+        return LinExpr(const.shape, rows, self.cols, self.coefs, const)
+
+    def __neg__(self):
+        return LinExpr(self.shape, self.rows, self.cols, -self.coefs, -self.const)
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        other = _as_expr(other)
+        if other is NotImplemented:
+            return NotImplemented
+        shape = N.broadcast_shapes(self.shape, other.shape)
+        a, b = self.broadcast_to(shape), other.broadcast_to(shape)
+        if not b.nnz:
+            return LinExpr(shape, a.rows, a.cols, a.coefs, a.const + b.const)
+        if not a.nnz:
+            return LinExpr(shape, b.rows, b.cols, b.coefs, a.const + b.const)
+        return LinExpr(shape, N.concatenate((a.rows, b.rows)),
+                       N.concatenate((a.cols, b.cols)),
+                       N.concatenate((a.coefs, b.coefs)), a.const + b.const)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _as_expr(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, (LinExpr, Constraint)):
+            raise TypeError("product of two linear expressions is not linear")
+        if hasattr(other, 'tocoo'):
+            return NotImplemented
+        a = N.asarray(other, dtype=N.double)
+        if a.ndim == 0:
+            return LinExpr(self.shape, self.rows, self.cols, self.coefs * a, self.const * a)
+        shape = N.broadcast_shapes(self.shape, a.shape)
+        e = self.broadcast_to(shape)
+        a = N.broadcast_to(a, shape)
+        return LinExpr(shape, e.rows, e.cols, e.coefs * a.ravel()[e.rows], e.const * a)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, (LinExpr, Constraint)):
+            raise TypeError("division by a linear expression is not linear")
+        return self * (1.0 / N.asarray(other, dtype=N.double))
+
+    def _lmatmul(self, A):
+        """A @ self for a constant matrix or vector A and a 1-D self."""
+        if self.ndim != 1:
+            raise ValueError("matrix products need a 1-D expression")
+        vector = not hasattr(A, 'tocoo') and N.ndim(A) == 1
+        ai, aj, av, shape = _coo(N.atleast_2d(A) if vector else A)
+        if shape[1] != self.shape[0]:
+            raise ValueError("matmul: dimension mismatch, %s @ %s" % (shape, self.shape))
+        # one gathered copy of row aj[q] of self per nonzero q of A
+        g = self._take(aj)
+        const = N.bincount(ai, weights=av * self.const[aj], minlength=shape[0])
+        e = LinExpr((shape[0],), ai[g.rows], g.cols, g.coefs * av[g.rows], const)
+        return e.reshape(()) if vector else e
+
+    def __rmatmul__(self, other):
+        if isinstance(other, (LinExpr, Constraint)):
+            raise TypeError("product of two linear expressions is not linear")
+        return self._lmatmul(other)
+
+    def __matmul__(self, other):
+        if isinstance(other, (LinExpr, Constraint)):
+            raise TypeError("product of two linear expressions is not linear")
+        return self._lmatmul(other.T if hasattr(other, 'tocoo') or N.ndim(other) == 2 else other)
+
+    def __le__(self, other):
+        return Constraint(self - other, 'L')
+
+    def __ge__(self, other):
+        return Constraint(self - other, 'G')
+
+    def __eq__(self, other):
+        return Constraint(self - other, 'E')
+
+    __hash__ = None
+
+
+class Var(LinExpr):
+    """Block of model variables, columns start .. start+size-1 in C order."""
+
+    __slots__ = ('start', 'name', 'lb', 'ub', 'vtype')
+
+    def __init__(self, shape, start, name=None):
+        size = int(N.prod(shape, dtype=N.intp))
+        pos = N.arange(size)
+        LinExpr.__init__(self, shape, pos, start + pos, N.ones(size), N.zeros(shape))
+        self.start = start
+        self.name = name
+
+    def index(self):
+        """Model column index of each variable of the block."""
+        return self.start + self._positions()
+
+    def value(self, x):
+        """The block's entries of a full column vector, e.g. the primal solution."""
+        return N.asarray(x)[self.start:self.start + self.size].reshape(self.shape)
+
+
+class Constraint:
+    """Block of linear constraints expr <sense> 0, sense one of L, G, E."""
+
+    __slots__ = ('expr', 'sense', 'start', 'name')
+
+    def __init__(self, expr, sense):
+        self.expr = expr
+        self.sense = sense
+        self.start = None
+        self.name = None
+
+    @property
+    def shape(self):
+        return self.expr.shape
+
+    @property
+    def size(self):
+        return self.expr.size
+
+    def __repr__(self):
+        return "<Constraint %s shape=%s>" % (self.sense, self.shape)
+
+    def __bool__(self):
+        raise TypeError("the truth value of a constraint is ambiguous")
+
+    def index(self):
+        """Model row index of each constraint of the block."""
+        if self.start is None:
+            raise ValueError("constraint has not been added to a model")
+        return self.start + N.arange(self.size).reshape(self.shape)
+
+    def value(self, y):
+        """The block's entries of a full row vector, e.g. the duals or slacks."""
+        if self.start is None:
+            raise ValueError("constraint has not been added to a model")
+        return N.asarray(y)[self.start:self.start + self.size].reshape(self.shape)
@@ -0,0 +1,464 @@
+"""
+    instruct.py
+
+    Compiles operator-overloaded nonlinear expressions into the postfix
+    instruction lists (EP_* codes) of LSloadInstruct, so LINDO can use its
+    own automatic differentiation instead of Python callbacks.
+
+    An Expr is an array-shaped family of expressions that share one
+    structure, e.g. sin(x) * c for a variable block x and a constant
+    array c. Every entry of a family compiles to a code of the same
+    length, so a whole family is emitted as one 2-D integer array built
+    from its operands' arrays with a few NumPy calls. Nodes are
+    hash-consed: building the same subexpression twice yields the same
+    node, which is compiled once per load, and numeric constants are
+    deduplicated into the numval table.
+
+        m = InstructModel()
+        x = m.add_vars(n, lb=-10.0, ub=10.0)
+        m.add_constraints((x[:-1] * exp(x[1:])).sum() <= 5.0)
+        m.minimize((sin(x) ** 2 + x).sum())
+        m.load(pModel)
+"""
+import weakref
+import numpy as N
+from .. import LSconst as C
+from ..lindo import pyLSloadInstruct
+from .expr import Constraint
+
+_VAR, _NUM, _TAKE, _STACK = -1, -2, -3, -4
+_REDUCE = frozenset((C.EP_SUM, C.EP_MAX, C.EP_MIN))
+
+_interned = weakref.WeakValueDictionary()
+
+
+def _node(op, args, shape, data=None, key=None):
+    """The unique node for (op, args, shape, key), created on first use."""
+    k = (op, tuple(id(a) for a in args), shape, key)
+    e = _interned.get(k)
+    if e is None:
+        e = Expr(op, args, shape, data)
+        _interned[k] = e
+    return e
+
+
+def _leaf(op, data):
+    data = N.asarray(data, order='C')
+    return _node(op, (), data.shape, data, data.tobytes())
+
+
+def _as_node(obj):
+    if isinstance(obj, Expr):
+        return obj
+    if isinstance(obj, Constraint):
+        raise TypeError("constraints cannot be used as operands")
+    return _leaf(_NUM, N.asarray(obj, dtype=N.double))
+
+
+def _is_scalar(e, value):
+    return e.op == _NUM and e.data.ndim == 0 and e.data == value
+
+
+def _take(e, pos):
+    """Family whose entries are e.flat[pos]; gathers leaves directly."""
+    pos = N.asarray(pos, dtype=N.intp, order='C')
+    if pos.shape == e.shape and N.array_equal(pos.ravel(), N.arange(e.size)):
+        return e
+    if e.op in (_VAR, _NUM):
+        return _leaf(e.op, e.data.ravel()[pos])
+    if e.op == _TAKE:
+        pos, e = e.data.ravel()[pos], e.args[0]
+    return _node(_TAKE, (e,), pos.shape, pos, pos.tobytes())
+
+
+def _broadcast(e, shape):
+    if e.shape == shape:
+        return e
+    return _take(e, N.broadcast_to(N.arange(e.size).reshape(e.shape), shape))
+
+
+def _apply(op, *args):
+    """Entrywise op over operands broadcast to a common shape."""
+    args = [_as_node(a) for a in args]
+    shape = N.broadcast_shapes(*(a.shape for a in args))
+    return _node(op, tuple(_broadcast(a, shape) for a in args), shape)
+
+
+class Expr:
+    """Array-shaped family of nonlinear expressions."""
+
+    __slots__ = ('op', 'args', 'shape', 'data', '__weakref__')
+    __array_ufunc__ = None  # make ndarray operators defer to ours
+
+    def __init__(self, op, args, shape, data=None):
+        self.op = op
+        self.args = args
+        self.shape = tuple(shape)
+        self.data = data
+
+    @property
+    def size(self):
+        return int(N.prod(self.shape, dtype=N.intp))
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of a 0-d expression")
+        return self.shape[0]
+
+    def __repr__(self):
+        return "<Expr shape=%s>" % (self.shape,)
+
+    def __bool__(self):
+        raise TypeError("the truth value of an expression is ambiguous")
+
+    def _positions(self):
+        return N.arange(self.size).reshape(self.shape)
+
+    def __getitem__(self, key):
+        if isinstance(key, Expr):
+            raise TypeError("expressions cannot be used as indices")
+        return _take(self, self._positions()[key])
+
+    def reshape(self, *shape):
+        if len(shape) == 1 and not isinstance(shape[0], (int, N.integer)):
+            shape = shape[0]
+        return _take(self, self._positions().reshape(shape))
+
+    def ravel(self):
+        return self.reshape(-1)
+
+    def transpose(self, *axes):
+        return _take(self, self._positions().transpose(*axes))
+
+    def _reduce(self, op, axis):
+        if axis is None:
+            e = self.reshape(1, -1)
+        else:
+            axes = tuple(a % self.ndim for a in N.atleast_1d(axis))
+            keep = [a for a in range(self.ndim) if a not in axes]
+            pos = self._positions().transpose(keep + list(axes))
+            e = _take(self, pos.reshape(pos.shape[:len(keep)] + (-1,)))
+        shape = () if axis is None else e.shape[:-1]
+        if e.shape[-1] == 1:
+            return e.reshape(shape)
+        return _node(op, (e,), shape)
+
+    def sum(self, axis=None):
+        """Sum over the given axes (all of them by default), as EP_SUM."""
+        return self._reduce(C.EP_SUM, axis)
+
+    def max(self, axis=None):
+        return self._reduce(C.EP_MAX, axis)
+
+    def min(self, axis=None):
+        return self._reduce(C.EP_MIN, axis)
+
+    def __add__(self, other):
+        other = _as_node(other)
+        if _is_scalar(other, 0.0):
+            return self
+        return _apply(C.EP_PLUS, self, other)
+
+    def __radd__(self, other):
+        return _apply(C.EP_PLUS, other, self)
+
+    def __sub__(self, other):
+        other = _as_node(other)
+        if _is_scalar(other, 0.0):
+            return self
+        return _apply(C.EP_MINUS, self, other)
+
+    def __rsub__(self, other):
+        return _apply(C.EP_MINUS, other, self)
+
+    def __mul__(self, other):
+        other = _as_node(other)
+        if _is_scalar(other, 1.0):
+            return self
+        return _apply(C.EP_MULTIPLY, self, other)
+
+    def __rmul__(self, other):
+        other = _as_node(other)
+        if _is_scalar(other, 1.0):
+            return self
+        return _apply(C.EP_MULTIPLY, other, self)
+
+    def __truediv__(self, other):
+        return _apply(C.EP_DIVIDE, self, other)
+
+    def __rtruediv__(self, other):
+        return _apply(C.EP_DIVIDE, other, self)
+
+    def __pow__(self, other):
+        other = _as_node(other)
+        if _is_scalar(other, 1.0):
+            return self
+        if _is_scalar(other, 2.0):
+            return _apply(C.EP_SQR, self)
+        return _apply(C.EP_POWER, self, other)
+
+    def __rpow__(self, other):
+        return _apply(C.EP_POWER, other, self)
+
+    def __neg__(self):
+        return _apply(C.EP_NEGATE, self)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return _apply(C.EP_ABS, self)
+
+    def __matmul__(self, other):
+        other = _as_node(other)
+        if self.ndim != 1 or other.ndim not in (1, 2):
+            raise ValueError("matmul needs a 1-D left operand and a 1-D or 2-D right operand")
+        if other.ndim == 1:
+            return (self * other).sum()
+        return (self[:, None] * other).sum(axis=0)
+
+    def __rmatmul__(self, other):
+        other = _as_node(other)
+        if self.ndim != 1 or other.ndim not in (1, 2):
+            raise ValueError("matmul needs a 1-D or 2-D left operand and a 1-D right operand")
+        if other.ndim == 1:
+            return (other * self).sum()
+        return (other * self).sum(axis=1)
+
+    def __le__(self, other):
+        return Constraint(self - other, 'L')
+
+    def __ge__(self, other):
+        return Constraint(self - other, 'G')
+
+    def __eq__(self, other):
+        return Constraint(self - other, 'E')
+
+    __hash__ = object.__hash__
+
+
+class NVar(Expr):
+    """Block of model variables, indices start .. start+size-1 in C order."""
+
+    __slots__ = ('start', 'name', 'lb', 'ub', 'vtype', 'x0')
+
+    def __init__(self, shape, start, name=None):
+        size = int(N.prod(shape, dtype=N.intp))
+        Expr.__init__(self, _VAR, (), shape, (start + N.arange(size)).reshape(shape))
+        self.start = start
+        self.name = name
+
+    def index(self):
+        """Model variable index of each variable of the block."""
+        return self.data
+
+    def value(self, x):
+        """The block's entries of a full variable vector, e.g. the primal solution."""
+        return N.asarray(x)[self.start:self.start + self.size].reshape(self.shape)
+
+
+def sin(e):
+    return _apply(C.EP_SIN, e)
+
+
+def cos(e):
+    return _apply(C.EP_COS, e)
+
+
+def tan(e):
+    return _apply(C.EP_TAN, e)
+
+
+def exp(e):
+    return _apply(C.EP_EXP, e)
+
+
+def log(e):
+    """Natural logarithm (EP_LN)."""
+    return _apply(C.EP_LN, e)
+
+
+def log10(e):
+    """Base 10 logarithm (EP_LOG)."""
+    return _apply(C.EP_LOG, e)
+
+
+def sqrt(e):
+    return _apply(C.EP_SQRT, e)
+
+
+def maximum(a, b):
+    """Entrywise max(a, b), as EP_MAX over two operands."""
+    return _node(C.EP_MAX, (_stack(a, b),), N.broadcast_shapes(N.shape(a), N.shape(b)))
+
+
+def minimum(a, b):
+    """Entrywise min(a, b), as EP_MIN over two operands."""
+    return _node(C.EP_MIN, (_stack(a, b),), N.broadcast_shapes(N.shape(a), N.shape(b)))
+
+
+def _stack(a, b):
+    """Family of shape (..., 2) holding a and b side by side."""
+    a, b = _as_node(a), _as_node(b)
+    shape = N.broadcast_shapes(a.shape, b.shape)
+    a, b = _broadcast(a, shape), _broadcast(b, shape)
+    return _node(_STACK, (a, b), shape + (2,))
+
+
+def _compile(e, memo, nums):
+    """
+    Code of every entry of e as a (size, length) int array. PUSH_NUM
+    operands are emitted as -(k+1), k indexing the values in nums.
+    """
+    code = memo.get(id(e))
+    if code is not None:
+        return code
+    size = e.size
+    if e.op == _VAR:
+        code = N.empty((size, 2), dtype=N.int32)
+        code[:, 0] = C.EP_PUSH_VAR
+        code[:, 1] = e.data.ravel()
+    elif e.op == _NUM:
+        base = nums[-1][0] + len(nums[-1][1]) if nums else 0
+        nums.append((base, e.data.ravel()))
+        code = N.empty((size, 2), dtype=N.int32)
+        code[:, 0] = C.EP_PUSH_NUM
+        code[:, 1] = -1 - base - N.arange(size)
+    elif e.op == _TAKE:
+        code = _compile(e.args[0], memo, nums)[e.data.ravel()]
+    elif e.op == _STACK:
+        # operands side by side, only ever consumed whole by a reduction
+        code = N.hstack([_compile(a, memo, nums) for a in e.args])
+    elif e.op in _REDUCE:
+        arg = _compile(e.args[0], memo, nums).reshape(size, -1)
+        code = N.empty((size, arg.shape[1] + 2), dtype=N.int32)
+        code[:, :-2] = arg
+        code[:, -2] = e.op
+        code[:, -1] = e.args[0].shape[-1]
+    else:
+        parts = [_compile(a, memo, nums) for a in e.args]
+        code = N.empty((size, sum(p.shape[1] for p in parts) + 1), dtype=N.int32)
+        k = 0
+        for p in parts:
+            code[:, k:k + p.shape[1]] = p
+            k += p.shape[1]
+        code[:, -1] = e.op
+    memo[id(e)] = code
+    return code
+
+
+class InstructModel:
+    """
+    InstructModel()
+
+    A nonlinear model compiled to an instruction list and loaded with a
+    single LSloadInstruct call.
+    """
+
+    def __init__(self):
+        self.nVars = 0
+        self.nCons = 0
+        self.vars = []
+        self.constraints = []
+        self.objectives = []
+
+    def add_vars(self, shape=(), lb=0.0, ub=C.LS_INFINITY, vtype='C', x0=0.0, name=None):
+        """Add a block of variables; lb, ub, vtype and x0 broadcast to shape."""
+        shape = (shape,) if N.ndim(shape) == 0 else tuple(shape)
+        if vtype not in ('C', 'B', 'I'):
+            raise ValueError("vtype must be one of C, B, I")
+        var = NVar(shape, self.nVars, name)
+        var.lb = N.broadcast_to(N.asarray(lb, dtype=N.double), shape)
+        var.ub = N.broadcast_to(N.asarray(ub, dtype=N.double), shape)
+        var.x0 = N.broadcast_to(N.asarray(x0, dtype=N.double), shape)
+        var.vtype = vtype
+        self.vars.append(var)
+        self.nVars += var.size
+        return var
+
+    def add_constraints(self, con, name=None):
+        """Add a block of constraints built with <=, >= or == on expressions."""
+        if not isinstance(con, Constraint) or not isinstance(con.expr, Expr):
+            raise TypeError("expected a constraint on expressions, e.g. expr <= rhs")
+        if con.start is not None:
+            raise ValueError("constraint has already been added to a model")
+        con.start = self.nCons
+        con.name = name
+        self.constraints.append(con)
+        self.nCons += con.size
+        return con
+
+    def _add_objective(self, expr, sense):
+        expr = _as_node(expr)
+        if expr.size != 1:
+            raise ValueError("the objective must be a scalar expression")
+        self.objectives = [(expr.reshape(()), sense)]
+
+    def minimize(self, expr):
+        self._add_objective(expr, C.LS_MIN)
+
+    def maximize(self, expr):
+        self._add_objective(expr, C.LS_MAX)
+
+    def to_arrays(self):
+        """
+        The instruction list and its tables, as a dict keyed by the
+        argument names of pyLSloadInstruct.
+        """
+        memo, nums, blocks = {}, [], []
+        objsBeg, objsLen, consBeg, consLen = [], [], [], []
+        nInstruct = 0
+        for expr, sense in self.objectives:
+            code = _compile(expr, memo, nums)
+            objsBeg.append(nInstruct)
+            objsLen.append(code.shape[1])
+            blocks.append(code.ravel())
+            nInstruct += code.size
+        for con in self.constraints:
+            code = _compile(con.expr, memo, nums)
+            consBeg.append(nInstruct + code.shape[1] * N.arange(con.size))
+            consLen.append(N.full(con.size, code.shape[1]))
+            blocks.append(code.ravel())
+            nInstruct += code.size
+        if nInstruct > N.iinfo(N.int32).max:
+            raise OverflowError("instruction list is longer than a 32-bit index can address")
+        code = N.concatenate(blocks) if blocks else N.empty(0, dtype=N.int32)
+
+        # deduplicate the numbers and point PUSH_NUM operands at them
+        values = N.concatenate([v for _, v in nums]) if nums else N.empty(0)
+        numval, inv = N.unique(values, return_inverse=True)
+        isNum = code < 0
+        code[isNum] = inv.ravel()[-1 - code[isNum]]
+
+        def cat(parts, dtype):
+            return N.concatenate(parts).astype(dtype) if parts else N.empty(0, dtype=dtype)
+
+        return dict(nCons=self.nCons, nObjs=len(self.objectives), nVars=self.nVars,
+                    nNumbers=len(numval),
+                    objsense=N.array([s for _, s in self.objectives], dtype=N.int32),
+                    ctype=cat([N.full(con.size, con.sense, dtype='S1') for con in self.constraints], 'S1'),
+                    vtype=cat([N.full(v.size, v.vtype, dtype='S1') for v in self.vars], 'S1'),
+                    code=code, lsize=len(code), varindex=None, numval=numval,
+                    varval=cat([v.x0.ravel() for v in self.vars], N.double),
+                    objs_beg=N.array(objsBeg, dtype=N.int32),
+                    objs_length=N.array(objsLen, dtype=N.int32),
+                    cons_beg=cat(consBeg, N.int32), cons_length=cat(consLen, N.int32),
+                    lwrbnd=cat([v.lb.ravel() for v in self.vars], N.double),
+                    uprbnd=cat([v.ub.ravel() for v in self.vars], N.double))
+
+    def load(self, model):
+        """Load the model into a LINDO model (pModel) with one LSloadInstruct call."""
+        d = self.to_arrays()
+        pyLSloadInstruct(model, d['nCons'], d['nObjs'], d['nVars'], d['nNumbers'],
+                         d['objsense'], d['ctype'], d['vtype'], d['code'], d['lsize'],
+                         d['varindex'], d['numval'], d['varval'],
+                         d['objs_beg'], d['objs_length'], d['cons_beg'], d['cons_length'],
+                         d['lwrbnd'], d['uprbnd'])
@@ -0,0 +1,361 @@
+"""
+    pool.py
+
+    Pools of LINDO environments and models shared by short-lived jobs.
+
+    EnvPool reads the license file once and keeps up to `size` validated
+    environments. lease() hands one out to the calling thread, or to the
+    calling asyncio task when one is running, so coroutines sharing an
+    event loop never share an environment. A thread or task that leases
+    again while holding one gets the same environment back. When its
+    outermost lease ends, the parameters of the environment are brought
+    back to the values they had when it was created, so a job never sees
+    the settings of the previous one.
+
+        pool = lindo.EnvPool(size=8)
+        with pool.lease() as env, lindo.Model(env) as model:
+            ...
+
+    ModelPool keeps returned models per (env, template) key and hands
+    them out again after reset_model(), so repeated solves of same-shaped
+    models skip model creation and the reallocation of its arrays.
+
+        models = lindo.ModelPool()
+        with models.lease(env, 'schedule', sizes=(n, m, 0, nnz, 0, 0)) as model:
+            ...
+"""
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+import numpy as N
+from . import LSconst
+from .LSconst import *
+from .lindo import *
+
+_params = None
+
+
+def _param_ids():
+    """Integer and double parameter ids defined in LSconst, each once."""
+    global _params
+    if _params is None:
+        ids = {'LS_IPARAM_': set(), 'LS_DPARAM_': set()}
+        for name, value in vars(LSconst).items():
+            if name[:10] in ids and isinstance(value, int):
+                ids[name[:10]].add(value)
+        _params = sorted(ids['LS_IPARAM_']), sorted(ids['LS_DPARAM_'])
+    return _params
+
+
+def _owner():
+    """The asyncio task running in this thread, None outside of one."""
+    aio = sys.modules.get('asyncio')
+    if aio is None:
+        return None
+    try:
+        return aio.current_task()
+    except RuntimeError:
+        return None
+
+
+def _license_file():
+    home = os.getenv('LINDOAPI_HOME')
+    if not home:
+        raise RuntimeError("Environment variable LINDOAPI_HOME should be set")
+    return os.path.join(home, 'license', 'lndapi%d%d.lic' % (LS_MAJOR_VER_NUMBER, LS_MINOR_VER_NUMBER))
+
+
+class EnvPool:
+    """
+    EnvPool(size=4, license_file=None, key=None, params=None)
+
+    Keep up to `size` environments created from one license. The license
+    is read from `license_file` (by default the one under LINDOAPI_HOME)
+    unless `key` is given. `params` limits the parameters reset on return
+    to the given LS_IPARAM_*/LS_DPARAM_* ids; by default every parameter
+    the environment accepts is reset.
+
+    hits counts leases served by an idle environment and misses those
+    that had to create one. A lease waits for a free environment when
+    all `size` are out, up to `timeout` seconds. The wait blocks the
+    thread, so tasks of one event loop that lease at the same time need
+    a pool of that size, or a timeout.
+    """
+
+    def __init__(self, size=4, license_file=None, key=None, params=None):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if key is None:
+            key = N.array('', dtype='S1024')
+            errorcode = pyLSloadLicenseString(license_file or _license_file(), key)
+            if errorcode != LSERR_NO_ERROR:
+                raise LINDO_Exception("%d => Failed to load license file" % errorcode, errorcode)
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._key = key
+        self._params = params
+        self._defaults = None
+        self._idle = []
+        self._count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    def _snapshot(self, env):
+        """Parameter ids of env and their values, taken from the first env."""
+        iparams, dparams = _param_ids()
+        if self._params is not None:
+            wanted = set(self._params)
+            iparams = [p for p in iparams if p in wanted]
+            dparams = [p for p in dparams if p in wanted]
+            unknown = wanted.difference(iparams, dparams)
+            if unknown:
+                raise ValueError("not a parameter id: %s" % sorted(unknown))
+        else:
+            # the constants also list model-only parameters
+            iparams = [p for p in iparams if self._accepts(env, p, 'i')]
+            dparams = [p for p in dparams if self._accepts(env, p, 'd')]
+        iparams = N.array(iparams, dtype=N.int32)
+        dparams = N.array(dparams, dtype=N.int32)
+        ivalues, dvalues = get_env_params(env, iparams, dparams)
+        return iparams, ivalues, dparams, dvalues
+
+    @staticmethod
+    def _accepts(env, param, kind):
+        try:
+            if kind == 'i':
+                get_env_params(env, [param], [])
+            else:
+                get_env_params(env, [], [param])
+        except LINDO_Exception:
+            return False
+        return True
+
+    def _held(self):
+        """Leases held in this thread, [env, depth] per asyncio task or None."""
+        held = getattr(self._local, 'held', None)
+        if held is None:
+            held = self._local.held = {}
+        return held
+
+    def acquire(self, timeout=None):
+        """Lease an environment to the calling thread or task; see lease()."""
+        held, owner = self._held(), _owner()
+        lease = held.get(owner)
+        if lease is not None:
+            lease[1] += 1
+            return lease[0]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("EnvPool is closed")
+                if self._idle:
+                    env = self._idle.pop()
+                    self.hits += 1
+                    break
+                if self._count < self.size:
+                    self._count += 1
+                    self.misses += 1
+                    env = None
+                    break
+                if deadline is None:
+                    self._cond.wait()
+                elif not self._cond.wait(max(deadline - time.monotonic(), 0)):
+                    raise TimeoutError("no environment was returned to the pool in time")
+        if env is None:
+            try:
+                env = Env(self._key)
+                if self._defaults is None:
+                    self._defaults = self._snapshot(env)
+            except BaseException:
+                with self._cond:
+                    self._count -= 1
+                    self._cond.notify()
+                raise
+        held[owner] = [env, 1]
+        return env
+
+    def release(self, env):
+        """End a lease taken with acquire()."""
+        held, owner = self._held(), _owner()
+        lease = held.get(owner)
+        if lease is None or lease[0] is not env:
+            raise ValueError("env is not leased by this thread or task")
+        lease[1] -= 1
+        if lease[1]:
+            return
+        del held[owner]
+        try:
+            set_env_params(env, *self._defaults)
+        except BaseException:
+            env.close()
+            with self._cond:
+                self._count -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            if self._closed:
+                self._count -= 1
+                env.close()
+            else:
+                self._idle.append(env)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """
+        with pool.lease(timeout=None) as env:
+
+        Lease an environment for the duration of the block. Nested leases
+        in one thread, or in one asyncio task, share the environment.
+        """
+        env = self.acquire(timeout)
+        try:
+            yield env
+        finally:
+            self.release(env)
+
+    def stats(self):
+        """Hit and miss counters and the number of idle and leased envs."""
+        with self._cond:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'idle': len(self._idle), 'leased': self._count - len(self._idle)}
+
+    def close(self):
+        """Close the idle environments; leased ones are closed on return."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+            self._cond.notify_all()
+        for env in idle:
+            env.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ModelPool:
+    """
+    ModelPool(size=8)
+
+    Keep up to `size` idle models per (env, template) key, where template
+    is any hashable name for a model shape. A model checked out again is
+    emptied with reset_model(), which keeps its parameters, callbacks and
+    the arrays LINDO allocated for it; with reset=False it keeps its data
+    too, ready for apply_delta(). Returned models release their solution
+    and solver memory.
+
+    hits counts checkouts served by a pooled model and misses those that
+    created one, including those whose pooled model could not be reset.
+    """
+
+    def __init__(self, size=8):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._idle = {}
+        self._leased = {}
+        self._lock = threading.Lock()
+
+    def checkout(self, env, template, sizes=None, reset=True):
+        """
+        checkout(env, template, sizes=None, reset=True) -> Model
+
+        A model of env for template. A new model is pre-sized with
+        pyLSsetProbAllocSizes(model, *sizes) if sizes is given.
+        """
+        key = (env, template)
+        with self._lock:
+            idle = self._idle.get(key)
+            model = idle.pop() if idle else None
+        if model is not None and reset:
+            try:
+                reset_model(model)
+            except LINDO_Exception:
+                # e.g. instruction-list models refuse row and column deletes
+                model.close()
+                model = None
+        with self._lock:
+            if model is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if model is None:
+            model = Model(env)
+            if sizes is not None:
+                pyLSsetProbAllocSizes(model, *sizes)
+        with self._lock:
+            self._leased[model] = key
+        return model
+
+    def checkin(self, model):
+        """Return a model taken with checkout()."""
+        with self._lock:
+            key = self._leased.pop(model, None)
+        if key is None:
+            raise ValueError("model was not checked out from this pool")
+        if model.closed:
+            return
+        pyLSfreeSolutionMemory(model)
+        pyLSfreeSolverMemory(model)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.size:
+                idle.append(model)
+                model = None
+        if model is not None:
+            model.close()
+
+    @contextmanager
+    def lease(self, env, template, sizes=None, reset=True):
+        """
+        with pool.lease(env, template, sizes=None, reset=True) as model:
+
+        Check a model out for the duration of the block.
+        """
+        model = self.checkout(env, template, sizes, reset)
+        try:
+            yield model
+        finally:
+            self.checkin(model)
+
+    def stats(self):
+        """Hit and miss counters and the number of idle and checked out models."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'idle': sum(len(idle) for idle in self._idle.values()),
+                    'leased': len(self._leased)}
+
+    def discard(self, env):
+        """Close the idle models of env, e.g. before closing it."""
+        with self._lock:
+            keys = [key for key in self._idle if key[0] is env]
+            models = [model for key in keys for model in self._idle.pop(key)]
+        for model in models:
+            model.close()
+
+    def close(self):
+        """Close every idle model."""
+        with self._lock:
+            models = [model for idle in self._idle.values() for model in idle]
+            self._idle.clear()
+        for model in models:
+            model.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -1,34 +1,33 @@
 #define NPY_NO_DEPRECATED_API NPY_2_0_API_VERSION 
 #include "Python.h"
+#include <stdarg.h>
+#include <limits.h>
 #include <numpy/arrayobject.h>
 #include "lindo.h"
 
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <pthread.h>
+#include <time.h>
+#endif
+
 #define LSASSERT(a) {if ((errorcode = (a)) != 0) goto ErrorReturn;}
+/*
+ * Scratch slots of the generated wrappers. Nx is the number of slots a
+ * wrapper actually uses; pointer slots start out NULL so that optional
+ * arrays are passed to LINDO as NULL.
+ */
 #define DCL_BUF(Nx) \
     int errorcode = 0;\
-    int    m, n;\
-    size_t buflen;\
-    char  *sbuf[Nx];\
-    int    ibuf[Nx];\
-    double dbuf[Nx];\
-    double *dvecptr[Nx];\
-    int    *ivecptr[Nx];\
-    char   *svecptr[Nx];\
-    PyArrayObject *pyArr[Nx];
-
-
-#define ZERO_BUF(Nx) {\
-    memset(dvecptr, 0, Nx * sizeof(double*));\
-    memset(ivecptr, 0, Nx * sizeof(int*));\
-    memset(svecptr, 0, Nx * sizeof(char*));\
-    memset(sbuf, 0, Nx * sizeof(char*));\
-    memset(ibuf, 0, Nx * sizeof(int));\
-    memset(dbuf, 0, Nx * sizeof(double));\
-    memset(pyArr, 0, Nx * sizeof(PyArrayObject*));\
-    errorcode = m = n = 0;\
-    buflen = 0; buflen++;\
-    index[0] = 0; buflen = (size_t) index[0];\
-}
+    int    m = 0, n = 0;\
+    char  *sbuf[Nx] = {0};\
+    int    ibuf[Nx] = {0};\
+    double dbuf[Nx] = {0};\
+    double *dvecptr[Nx] = {0};\
+    int    *ivecptr[Nx] = {0};\
+    char   *svecptr[Nx] = {0};\
+    PyArrayObject *pyArr[Nx] = {0};
 
 #define D_GET_VECPTR(k) {\
     if (pyArr[k])\
@@ -60,6 +59,536 @@
         svecptr[k] = (char*)PyArray_DATA(pyArr[k]);\
 }
 
+/*
+ * Minimal portable threading primitives used by the native worker pools.
+ */
+#ifdef _WIN32
+typedef HANDLE            ls_thread_t;
+typedef CRITICAL_SECTION  ls_mutex_t;
+typedef DWORD (WINAPI *ls_thread_fn)(void *);
+#define LS_THREAD_RETURN  DWORD WINAPI
+#define LS_MUTEX_INIT(mx)    InitializeCriticalSection(mx)
+#define LS_MUTEX_LOCK(mx)    EnterCriticalSection(mx)
+#define LS_MUTEX_UNLOCK(mx)  LeaveCriticalSection(mx)
+#define LS_MUTEX_DESTROY(mx) DeleteCriticalSection(mx)
+#define LS_THREAD_CREATE(th,fn,arg) \
+    ((*(th) = CreateThread(NULL, 0, (fn), (arg), 0, NULL)) != NULL ? 0 : -1)
+#define LS_THREAD_JOIN(th) {\
+    WaitForSingleObject(th, INFINITE);\
+    CloseHandle(th);\
+}
+#else
+typedef pthread_t         ls_thread_t;
+typedef pthread_mutex_t   ls_mutex_t;
+#define LS_THREAD_RETURN  void *
+#define LS_MUTEX_INIT(mx)    pthread_mutex_init(mx, NULL)
+#define LS_MUTEX_LOCK(mx)    pthread_mutex_lock(mx)
+#define LS_MUTEX_UNLOCK(mx)  pthread_mutex_unlock(mx)
+#define LS_MUTEX_DESTROY(mx) pthread_mutex_destroy(mx)
+#define LS_THREAD_CREATE(th,fn,arg) pthread_create((th), NULL, (fn), (arg))
+#define LS_THREAD_JOIN(th) pthread_join(th, NULL)
+#endif
+
+/* Monotonic wall clock in seconds */
+static double lsWallTime(void)
+{
+#ifdef _WIN32
+    LARGE_INTEGER freq, now;
+    QueryPerformanceFrequency(&freq);
+    QueryPerformanceCounter(&now);
+    return (double)now.QuadPart / (double)freq.QuadPart;
+#else
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + 1.0e-9 * (double)ts.tv_nsec;
+#endif
+}
+
+/*
+ * Array arguments
+ *
+ * LINDO reads and writes array arguments through raw pointers, so every
+ * array handed to it must be aligned, C-contiguous, in native byte order
+ * and of the element type of the C prototype. pyArgArray passes arrays
+ * that already qualify through untouched and converts anything else once
+ * (safe casts only). A converted copy of a writeable array is written
+ * back to it when the wrapper returns, so output arguments keep working,
+ * including when the wrapper fails: whatever LINDO wrote before reporting
+ * an error reaches the caller's array, as it does for arrays passed
+ * through. Copies are kept on the pyArgFrame_t of the call, which the
+ * dispatcher puts on the stack of the calling thread, so calls running
+ * concurrently with the GIL released never see each other's copies.
+ * Copies are counted for lindo.stats().
+ */
+#define PY_ARG_INLINE 8
+
+typedef struct pyArgFrame {
+    Py_ssize_t      iMethod;        //lindo_methods entry being dispatched
+    Py_ssize_t      nCopies, nCap;
+    PyArrayObject   **ppyCopies;    //apyInline, or a heap list once it fills up
+    PyArrayObject   *apyInline[PY_ARG_INLINE];
+} pyArgFrame_t;
+
+static Py_tss_t pyArgKey = Py_tss_NEEDS_INIT;  //pyArgFrame_t* of the innermost call in this thread
+static Py_ssize_t nArrayCopies = 0;         //conversions since load (or last reset)
+static Py_ssize_t *pnMethodCopies = NULL;   //the same per lindo_methods entry
+
+static void pyCountArrayCopy(void)
+{
+    pyArgFrame_t *pFrame = (pyArgFrame_t*)PyThread_tss_get(&pyArgKey);
+
+    nArrayCopies++;
+    if (pnMethodCopies && pFrame)
+        pnMethodCopies[pFrame->iMethod]++;
+}
+
+/*
+ * @brief Keep pyCopy until the call that converted it returns
+ * @remark Steals the reference to pyCopy, also on failure.
+ */
+static int pyArgKeep(PyArrayObject *pyCopy)
+{
+    pyArgFrame_t *pFrame = (pyArgFrame_t*)PyThread_tss_get(&pyArgKey);
+
+    if (!pFrame) {
+        PyErr_SetString(PyExc_SystemError, "array argument converted outside a dispatched call");
+        goto ErrorReturn;
+    }
+    if (pFrame->nCopies == pFrame->nCap) {
+        Py_ssize_t    nCap = 2 * pFrame->nCap;
+        PyArrayObject **ppyCopies;
+        if (pFrame->ppyCopies == pFrame->apyInline) {
+            ppyCopies = (PyArrayObject**)malloc(nCap * sizeof(PyArrayObject*));
+            if (ppyCopies)
+                memcpy(ppyCopies, pFrame->apyInline, sizeof(pFrame->apyInline));
+        } else
+            ppyCopies = (PyArrayObject**)realloc(pFrame->ppyCopies, nCap * sizeof(PyArrayObject*));
+        if (!ppyCopies) {
+            PyErr_NoMemory();
+            goto ErrorReturn;
+        }
+        pFrame->ppyCopies = ppyCopies;
+        pFrame->nCap = nCap;
+    }
+    pFrame->ppyCopies[pFrame->nCopies++] = pyCopy;
+    pyCountArrayCopy();
+    return 1;
+
+ErrorReturn:
+    PyArray_DiscardWritebackIfCopy(pyCopy);
+    Py_DECREF(pyCopy);
+    return 0;
+}
+
+/*
+ * @brief None, or a 0-d object array holding None (np.asarray(None))
+ */
+static int pyArgIsNone(PyObject *arg)
+{
+    return arg == Py_None
+        || (PyArray_Check(arg) && PyArray_NDIM((PyArrayObject*)arg) == 0
+            && PyArray_TYPE((PyArrayObject*)arg) == NPY_OBJECT
+            && *(PyObject**)PyArray_DATA((PyArrayObject*)arg) == Py_None);
+}
+
+/*
+ * @brief Convert array argument k for a typed format unit
+ * @param unit D (float64), N (int32), S (bytes), A (any element type) or
+ *             Y (int32 output written back to an integer array of any width)
+ * @param isOut LINDO writes the array, so a converted copy is written back
+ * @remark None, or a 0-d object array holding None, yields NULL.
+ * @remark A copy of an input array is discarded after the call, so each
+ *         argument is converted at most once.
+ */
+static int pyArgArray(PyObject *arg, int unit, int isOut, Py_ssize_t k, PyArrayObject **ppyArr)
+{
+    PyArrayObject *pyArr, *pyCopy;
+    PyArray_Descr *descr;
+    int           isTyped, nFlags = 0;
+
+    if (pyArgIsNone(arg)) {
+        *ppyArr = NULL;
+        return 1;
+    }
+    if (!PyArray_Check(arg)) {
+        PyErr_Format(PyExc_TypeError, "argument %zd must be numpy.ndarray or None, not %.50s",
+                     k, Py_TYPE(arg)->tp_name);
+        return 0;
+    }
+    pyArr = (PyArrayObject*)arg;
+
+    switch (unit) {
+    case 'D':
+        isTyped = PyArray_DESCR(pyArr)->kind == 'f' && PyArray_ITEMSIZE(pyArr) == sizeof(double);
+        descr = PyArray_DescrFromType(NPY_DOUBLE);
+        break;
+    case 'Y':
+        if (!PyArray_ISINTEGER(pyArr)) {
+            PyErr_Format(PyExc_TypeError, "argument %zd must be an integer array, not dtype '%c'",
+                         k, PyArray_DESCR(pyArr)->type);
+            return 0;
+        }
+        /* only the write-back direction matters, int32 widens safely */
+        nFlags = NPY_ARRAY_FORCECAST;
+        /* fall through */
+    case 'N':
+        isTyped = PyArray_DESCR(pyArr)->kind == 'i' && PyArray_ITEMSIZE(pyArr) == sizeof(int);
+        descr = PyArray_DescrFromType(NPY_INT);
+        break;
+    case 'S':
+        if (PyArray_DESCR(pyArr)->kind != 'S') {
+            PyErr_Format(PyExc_TypeError, "argument %zd must be a bytes ('S') array, not dtype '%c'",
+                         k, PyArray_DESCR(pyArr)->type);
+            return 0;
+        }
+        /* fall through */
+    default:
+        isTyped = 1;
+        descr = PyArray_DescrNewByteorder(PyArray_DESCR(pyArr), NPY_NATIVE);
+        break;
+    }
+    if (!descr)
+        return 0;
+    if (isTyped && PyArray_ISNOTSWAPPED(pyArr)
+        && PyArray_IS_C_CONTIGUOUS(pyArr) && PyArray_ISALIGNED(pyArr)) {
+        Py_DECREF(descr);
+        *ppyArr = pyArr;
+        return 1;
+    }
+
+    pyCopy = (PyArrayObject*)PyArray_FromArray(pyArr, descr, NPY_ARRAY_CARRAY | nFlags
+        | (isOut && PyArray_ISWRITEABLE(pyArr) ? NPY_ARRAY_WRITEBACKIFCOPY : 0));
+    if (!pyCopy || !pyArgKeep(pyCopy))
+        return 0;
+    *ppyArr = pyCopy;
+    return 1;
+}
+
+/*
+ * @brief Narrow the len entries of an integer array into panBuf in one
+ *        pass, checking that every value fits in an int
+ * @remark pyArr must be aligned, in native byte order, and either 1-D
+ *         (any stride) or C-contiguous.
+ * @return -1 on success, the position of the first value out of range,
+ *         or -2 for an element type that is not an integer
+ */
+static npy_intp pyNarrowIndex(PyArrayObject *pyArr, npy_intp len, int *panBuf)
+{
+    const char *p = PyArray_BYTES(pyArr);
+    npy_intp   k, stride = PyArray_NDIM(pyArr) == 1 ? PyArray_STRIDE(pyArr, 0) : PyArray_ITEMSIZE(pyArr);
+
+#define PY_NARROW_SIGNED(ctype) \
+    for (k = 0; k < len; k++) { \
+        ctype v = *(const ctype*)(p + k * stride); \
+        if (v < INT_MIN || v > INT_MAX) return k; \
+        panBuf[k] = (int)v; \
+    }
+#define PY_NARROW_UNSIGNED(ctype) \
+    for (k = 0; k < len; k++) { \
+        ctype v = *(const ctype*)(p + k * stride); \
+        if (v > (ctype)INT_MAX) return k; \
+        panBuf[k] = (int)v; \
+    }
+
+    if (!PyArray_ISINTEGER(pyArr))
+        return -2;
+    switch (PyArray_ITEMSIZE(pyArr) * (PyArray_ISSIGNED(pyArr) ? 1 : -1)) {
+    case  1: for (k = 0; k < len; k++) panBuf[k] = *(const npy_int8*)(p + k * stride); break;
+    case -1: for (k = 0; k < len; k++) panBuf[k] = *(const npy_uint8*)(p + k * stride); break;
+    case  2: for (k = 0; k < len; k++) panBuf[k] = *(const npy_int16*)(p + k * stride); break;
+    case -2: for (k = 0; k < len; k++) panBuf[k] = *(const npy_uint16*)(p + k * stride); break;
+    case  4: for (k = 0; k < len; k++) panBuf[k] = *(const npy_int32*)(p + k * stride); break;
+    case -4: PY_NARROW_UNSIGNED(npy_uint32); break;
+    case  8: PY_NARROW_SIGNED(npy_int64); break;
+    case -8: PY_NARROW_UNSIGNED(npy_uint64); break;
+    default: return -2;
+    }
+#undef PY_NARROW_SIGNED
+#undef PY_NARROW_UNSIGNED
+    return -1;
+}
+
+/*
+ * @brief Convert index array argument k (format unit X)
+ * @remark int32 arrays that qualify are passed through. Any other integer
+ *         array is range checked and narrowed into a new int32 array in a
+ *         single pass, so int64 indices cost one 4 byte/entry buffer for
+ *         the duration of the call and no intermediate copies. The copy is
+ *         input only and never written back.
+ */
+static int pyArgIndex(PyObject *arg, Py_ssize_t k, PyArrayObject **ppyArr)
+{
+    PyArrayObject *pyArr, *pyTmp = NULL, *pyCopy;
+    npy_intp      len, iBad;
+
+    if (pyArgIsNone(arg)) {
+        *ppyArr = NULL;
+        return 1;
+    }
+    if (!PyArray_Check(arg)) {
+        PyErr_Format(PyExc_TypeError, "argument %zd must be numpy.ndarray or None, not %.50s",
+                     k, Py_TYPE(arg)->tp_name);
+        return 0;
+    }
+    pyArr = (PyArrayObject*)arg;
+    if (!PyArray_ISINTEGER(pyArr)) {
+        PyErr_Format(PyExc_TypeError, "argument %zd must be an integer array, not dtype '%c'",
+                     k, PyArray_DESCR(pyArr)->type);
+        return 0;
+    }
+    if (PyArray_TYPE(pyArr) == NPY_INT && PyArray_ISNOTSWAPPED(pyArr)
+        && PyArray_IS_C_CONTIGUOUS(pyArr) && PyArray_ISALIGNED(pyArr)) {
+        *ppyArr = pyArr;
+        return 1;
+    }
+    /* 1-D strided arrays are narrowed in place; anything else is first
+       flattened into a native contiguous temporary */
+    if (PyArray_NDIM(pyArr) > 1 || !PyArray_ISNOTSWAPPED(pyArr) || !PyArray_ISALIGNED(pyArr)) {
+        PyArray_Descr *descr = PyArray_DescrNewByteorder(PyArray_DESCR(pyArr), NPY_NATIVE);
+        if (!descr)
+            return 0;
+        pyTmp = (PyArrayObject*)PyArray_FromArray(pyArr, descr, NPY_ARRAY_CARRAY);
+        if (!pyTmp)
+            return 0;
+        pyArr = pyTmp;
+    }
+    len = PyArray_SIZE(pyArr);
+    pyCopy = (PyArrayObject*)PyArray_SimpleNew(1, &len, NPY_INT);
+    if (!pyCopy) {
+        Py_XDECREF(pyTmp);
+        return 0;
+    }
+    iBad = pyNarrowIndex(pyArr, len, (int*)PyArray_DATA(pyCopy));
+    Py_XDECREF(pyTmp);
+    if (iBad >= 0) {
+        PyErr_Format(PyExc_OverflowError, "argument %zd: entry %zd does not fit in a 32-bit index",
+                     k, (Py_ssize_t)iBad);
+        Py_DECREF(pyCopy);
+        return 0;
+    }
+    if (!pyArgKeep(pyCopy))
+        return 0;
+    *ppyArr = pyCopy;
+    return 1;
+}
+
+/*
+ * @brief Check that array arguments hold at least n entries
+ * @param pszCount The count argument n comes from, for the message
+ * @param nArrays Number of PyArrayObject* that follow; NULL ones (None
+ *        arguments) are skipped. Character arrays are counted in bytes.
+ * @remark Wrappers check the arrays whose length LINDO derives from an
+ *         explicit count argument, so a short array raises instead of
+ *         letting LINDO read or write past its end.
+ * @return 1 if they do, 0 with ValueError set otherwise
+ */
+static int pyArgLen(const char *pszCount, npy_intp n, int nArrays, ...)
+{
+    va_list  va;
+    npy_intp len = 0;
+    int      k, isShort = 0;
+
+    if (n < 0) {
+        PyErr_Format(PyExc_ValueError, "%s must not be negative", pszCount);
+        return 0;
+    }
+    va_start(va, nArrays);
+    for (k = 0; k < nArrays && !isShort; k++) {
+        PyArrayObject *pyArr = va_arg(va, PyArrayObject*);
+        if (!pyArr)
+            continue;
+        len = PyArray_DESCR(pyArr)->kind == 'S' ? PyArray_NBYTES(pyArr) : PyArray_SIZE(pyArr);
+        isShort = len < n;
+    }
+    va_end(va);
+    if (isShort) {
+        PyErr_Format(PyExc_ValueError, "%s is %zd, but an array argument holds only %zd entries",
+                     pszCount, (Py_ssize_t)n, (Py_ssize_t)len);
+        return 0;
+    }
+    return 1;
+}
+
+/*
+ * @brief Write back and drop the argument copies of a call
+ * @remark An exception the call raised is kept; otherwise a failed
+ *         write-back sets one.
+ * @return -1 with an exception set if a write-back failed
+ */
+static int pyArgRelease(pyArgFrame_t *pFrame)
+{
+    int      status = 0;
+    PyObject *pyType, *pyValue, *pyTrace;
+
+    PyErr_Fetch(&pyType, &pyValue, &pyTrace);
+    while (pFrame->nCopies > 0) {
+        PyArrayObject *pyCopy = pFrame->ppyCopies[--pFrame->nCopies];
+        if (status == 0)
+            status = PyArray_ResolveWritebackIfCopy(pyCopy) < 0 ? -1 : 0;
+        else
+            PyArray_DiscardWritebackIfCopy(pyCopy);
+        Py_DECREF(pyCopy);
+    }
+    if (pFrame->ppyCopies != pFrame->apyInline)
+        free(pFrame->ppyCopies);
+    if (pyType) {
+        if (status < 0)
+            PyErr_Clear();
+        PyErr_Restore(pyType, pyValue, pyTrace);
+    }
+    return status;
+}
+
+/*
+ * METH_FASTCALL counterpart of PyArg_ParseTuple for the format units the
+ * wrappers use: O, O!, i, I, d, s, c and |, plus the typed array units
+ * D (float64), N (int32), S (bytes), A (any element type) and Y (int32
+ * output into any integer array), which store a PyArrayObject* prepared
+ * by pyArgArray, and X (int32 index input from any integer array, see
+ * pyArgIndex). D, N, S and A are inputs; followed by '*' (e.g. D*) they
+ * mark an array LINDO writes, the only kind written back when converted.
+ * Conversions and error messages otherwise follow PyArg_ParseTuple.
+ */
+static int pyParseArgs(PyObject *const *args, Py_ssize_t nargs, const char *format, ...)
+{
+    va_list     va;
+    const char  *f;
+    Py_ssize_t  k = 0, nMin = -1, nMax = 0;
+
+    for (f = format; *f; f++) {
+        if (*f == '|')
+            nMin = nMax;
+        else if (*f != '!' && *f != '*')
+            nMax++;
+    }
+    if (nMin < 0)
+        nMin = nMax;
+    if (nargs < nMin || nargs > nMax) {
+        PyErr_Format(PyExc_TypeError, "function takes %s %zd argument%s (%zd given)",
+                     nMin == nMax ? "exactly" : (nargs < nMin ? "at least" : "at most"),
+                     nargs < nMin ? nMin : nMax,
+                     (nargs < nMin ? nMin : nMax) == 1 ? "" : "s",
+                     nargs);
+        return 0;
+    }
+
+    va_start(va, format);
+    for (f = format; *f && k < nargs; f++) {
+        PyObject *arg;
+        if (*f == '|')
+            continue;
+        arg = args[k++];
+        switch (*f) {
+        case 'O':
+            if (f[1] == '!') {
+                PyTypeObject *type = va_arg(va, PyTypeObject*);
+                PyObject **pyObj = va_arg(va, PyObject**);
+                f++;
+                if (!PyObject_TypeCheck(arg, type)) {
+                    PyErr_Format(PyExc_TypeError, "argument %zd must be %.50s, not %.50s",
+                                 k, type->tp_name, Py_TYPE(arg)->tp_name);
+                    goto ErrorReturn;
+                }
+                *pyObj = arg;
+            } else {
+                *va_arg(va, PyObject**) = arg;
+            }
+            break;
+        case 'i': {
+            long v;
+            if (PyFloat_Check(arg)) {
+                PyErr_SetString(PyExc_TypeError, "integer argument expected, got float");
+                goto ErrorReturn;
+            }
+            v = PyLong_AsLong(arg);
+            if (v == -1 && PyErr_Occurred())
+                goto ErrorReturn;
+            if (v > INT_MAX || v < INT_MIN) {
+                PyErr_SetString(PyExc_OverflowError, v > INT_MAX ?
+                                "signed integer is greater than maximum" :
+                                "signed integer is less than minimum");
+                goto ErrorReturn;
+            }
+            *va_arg(va, int*) = (int)v;
+            break;
+        }
+        case 'I': {
+            unsigned long v;
+            if (PyFloat_Check(arg)) {
+                PyErr_SetString(PyExc_TypeError, "integer argument expected, got float");
+                goto ErrorReturn;
+            }
+            v = PyLong_AsUnsignedLongMask(arg);
+            if (v == (unsigned long)-1 && PyErr_Occurred())
+                goto ErrorReturn;
+            *va_arg(va, unsigned int*) = (unsigned int)v;
+            break;
+        }
+        case 'd': {
+            double v = PyFloat_AsDouble(arg);
+            if (v == -1.0 && PyErr_Occurred())
+                goto ErrorReturn;
+            *va_arg(va, double*) = v;
+            break;
+        }
+        case 's': {
+            Py_ssize_t len;
+            const char *v;
+            if (!PyUnicode_Check(arg)) {
+                PyErr_Format(PyExc_TypeError, "argument %zd must be str, not %.50s",
+                             k, Py_TYPE(arg)->tp_name);
+                goto ErrorReturn;
+            }
+            v = PyUnicode_AsUTF8AndSize(arg, &len);
+            if (!v)
+                goto ErrorReturn;
+            if (strlen(v) != (size_t)len) {
+                PyErr_SetString(PyExc_ValueError, "embedded null character");
+                goto ErrorReturn;
+            }
+            *va_arg(va, const char**) = v;
+            break;
+        }
+        case 'c':
+            if (PyBytes_Check(arg) && PyBytes_GET_SIZE(arg) == 1) {
+                *va_arg(va, char*) = PyBytes_AS_STRING(arg)[0];
+            } else if (PyByteArray_Check(arg) && PyByteArray_GET_SIZE(arg) == 1) {
+                *va_arg(va, char*) = PyByteArray_AS_STRING(arg)[0];
+            } else {
+                PyErr_Format(PyExc_TypeError, "argument %zd must be a byte string of length 1, not %.50s",
+                             k, Py_TYPE(arg)->tp_name);
+                goto ErrorReturn;
+            }
+            break;
+        case 'D':
+        case 'N':
+        case 'S':
+        case 'A':
+        case 'Y': {
+            int isOut = *f == 'Y' || f[1] == '*';
+            if (!pyArgArray(arg, *f, isOut, k, va_arg(va, PyArrayObject**)))
+                goto ErrorReturn;
+            if (f[1] == '*')
+                f++;
+            break;
+        }
+        case 'X':
+            if (!pyArgIndex(arg, k, va_arg(va, PyArrayObject**)))
+                goto ErrorReturn;
+            break;
+        default:
+            PyErr_Format(PyExc_SystemError, "bad format unit '%c'", *f);
+            goto ErrorReturn;
+        }
+    }
+    va_end(va);
+    return 1;
+
+ErrorReturn:
+    va_end(va);
+    return 0;
+}
+
 struct module_state {
     PyObject *error;
 };
@@ -85,821 +614,973 @@ static PyObject * error_out(PyObject *m)
 /*********************************************************************
  * Structure Creation and Deletion Routines (5)                      *
  *********************************************************************/
-PyObject *pyLScreateEnv(PyObject *self, PyObject *args);
-PyObject *pyLScreateModel(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteEnv(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteModel(PyObject *self, PyObject *args);
-PyObject *pyLScopyParam(PyObject *self, PyObject *args);
-PyObject *pyLSloadLicenseString(PyObject *self, PyObject *args);
-PyObject *pyLSgetVersionInfo(PyObject *self, PyObject *args);
+PyObject *pyLScreateEnv(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScreateModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteEnv(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScopyParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadLicenseString(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetVersionInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /********************************************************
  * Model I-O Routines (18)                              *
  ********************************************************/
-PyObject *pyLSreadMPSFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteMPSFile(PyObject *self, PyObject *args);
-PyObject *pyLSreadLINDOFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteLINDOFile(PyObject *self, PyObject *args);
-PyObject *pyLSreadLINDOStream(PyObject *self, PyObject *args);
-PyObject *pyLSwriteLINGOFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteDualMPSFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteSolution(PyObject *self, PyObject *args);
-PyObject *pyLSwriteSolutionOfType(PyObject *self, PyObject *args);
-PyObject *pyLSwriteIIS(PyObject *self, PyObject *args);
-PyObject *pyLSwriteIUS(PyObject *self, PyObject *args);
-PyObject *pyLSreadMPIFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteMPIFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteWithSetsAndSC(PyObject *self, PyObject *args);
-PyObject *pyLSreadBasis(PyObject *self, PyObject *args);
-PyObject *pyLSwriteBasis(PyObject *self, PyObject *args);
-PyObject *pyLSreadLPFile(PyObject *self, PyObject *args);
-PyObject *pyLSreadLPStream(PyObject *self, PyObject *args);
+PyObject *pyLSreadMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadLINDOStream(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteLINGOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteDualMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteSolutionOfType(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteIIS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteIUS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteWithSetsAndSC(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadLPFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadLPStream(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /********************************************************
  * Error Handling Routines (3)                          *
  ********************************************************/
-PyObject *pyLSgetErrorMessage(PyObject *self, PyObject *args);
-PyObject *pyLSgetFileError(PyObject *self, PyObject *args);
-PyObject *pyLSgetErrorRowIndex(PyObject *self, PyObject *args);
+PyObject *pyLSgetErrorMessage(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetFileError(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetErrorRowIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /***********************************************************
  * Routines for Setting and Retrieving Parameter Values(21)*
  ***********************************************************/
-PyObject *pyLSsetModelParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetModelParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetEnvParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetEnvParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetModelDouParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetModelDouParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetModelIntParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetModelIntParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetEnvDouParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetEnvDouParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetEnvIntParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetEnvIntParameter(PyObject *self, PyObject *args);
-PyObject *pyLSreadModelParameter(PyObject *self, PyObject *args);
-PyObject *pyLSreadEnvParameter(PyObject *self, PyObject *args);
-PyObject *pyLSwriteModelParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetIntParameterRange(PyObject *self, PyObject *args);
-PyObject *pyLSgetDouParameterRange(PyObject *self, PyObject *args);
-PyObject *pyLSgetParamShortDesc(PyObject *self, PyObject *args);
-PyObject *pyLSgetParamLongDesc(PyObject *self, PyObject *args);
-PyObject *pyLSgetParamMacroName(PyObject *self, PyObject *args);
-PyObject *pyLSgetParamMacroID(PyObject *self, PyObject *args);
+PyObject *pyLSsetModelParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetModelParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetEnvParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetEnvParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetModelDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetModelDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetModelIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetModelIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetEnvDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetEnvDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetEnvIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetEnvIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadModelParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadEnvParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteModelParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetIntParameterRange(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDouParameterRange(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetParamShortDesc(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetParamLongDesc(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetParamMacroName(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetParamMacroID(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /********************************************************
 * Model Loading Routines (10)                           *
 *********************************************************/
-PyObject *pyLSloadLPData(PyObject *self, PyObject *args);
-PyObject *pyLSloadQCData(PyObject *self, PyObject *args);
-PyObject *pyLSloadConeData(PyObject *self, PyObject *args);
-PyObject *pyLSloadSETSData(PyObject *self, PyObject *args);
-PyObject *pyLSloadSemiContData(PyObject *self, PyObject *args);
-PyObject *pyLSloadVarType(PyObject *self, PyObject *args);
-PyObject *pyLSloadNLPData(PyObject *self, PyObject *args);
-PyObject *pyLSloadInstruct(PyObject *self, PyObject *args);
-PyObject *pyLSaddInstruct(PyObject *self, PyObject *args);
-PyObject *pyLSgetDualModel(PyObject *self, PyObject *args);
-PyObject *pyLSloadIndData(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteIndConstraints(PyObject *self, PyObject *args);
+PyObject *pyLSloadLPData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadQCData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadConeData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadSETSData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadSemiContData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadVarType(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadNLPData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadInstruct(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddInstruct(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDualModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadIndData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteIndConstraints(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /**********************************************************************
  * Solver Initialization Routines (9)                                 *
  **********************************************************************/
-PyObject *pyLSloadBasis(PyObject *self, PyObject *args);
-PyObject *pyLSloadVarPriorities(PyObject *self, PyObject *args);
-PyObject *pyLSreadVarPriorities(PyObject *self, PyObject *args);
-PyObject *pyLSloadVarStartPoint(PyObject *self, PyObject *args);
-PyObject *pyLSloadVarStartPointPartial(PyObject *self, PyObject *args);
-PyObject *pyLSloadMIPVarStartPoint(PyObject *self, PyObject *args);
-PyObject *pyLSloadMIPVarStartPointPartial(PyObject *self, PyObject *args);
-PyObject *pyLSreadVarStartPoint(PyObject *self, PyObject *args);
-PyObject *pyLSloadBlockStructure(PyObject *self, PyObject *args);
-PyObject *pyLSfindBlockStructure(PyObject *self, PyObject *args);
+PyObject *pyLSloadBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadVarPriorities(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadVarPriorities(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadVarStartPointPartial(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadMIPVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadMIPVarStartPointPartial(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadBlockStructure(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfindBlockStructure(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /**********************************************************************
  * Optimization Routines (6)                                          *
  **********************************************************************/
-PyObject *pyLSoptimize(PyObject *self, PyObject *args);
-PyObject *pyLSsolveMIP(PyObject *self, PyObject *args);
-PyObject *pyLSsolveGOP(PyObject *self, PyObject *args);
-PyObject *pyLSoptimizeQP(PyObject *self, PyObject *args);
-PyObject *pyLScheckConvexity(PyObject *self, PyObject *args);
-PyObject *pyLSsolveSBD(PyObject *self, PyObject *args);
+PyObject *pyLSoptimize(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsolveMIP(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsolveGOP(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSoptimizeQP(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScheckConvexity(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsolveSBD(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /**********************************************************************
  * Solution Query Routines (14)                                       *
 **********************************************************************/
-PyObject *pyLSgetInfo(PyObject *self, PyObject *args);
-PyObject *pyLSgetPrimalSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetDualSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetReducedCosts(PyObject *self, PyObject *args);
-PyObject *pyLSgetReducedCostsCone(PyObject *self, PyObject *args);
-PyObject *pyLSgetSlacks(PyObject *self, PyObject *args);
-PyObject *pyLSgetBasis(PyObject *self, PyObject *args);
-PyObject *pyLSgetSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPPrimalSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPDualSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPReducedCosts(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPSlacks(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPBasis(PyObject *self, PyObject *args);
-PyObject *pyLSgetNextBestMIPSol(PyObject *self, PyObject *args);
+PyObject *pyLSgetInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetPrimalSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDualSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetReducedCosts(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetReducedCostsCone(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetSlacks(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPPrimalSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPDualSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPReducedCosts(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPSlacks(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNextBestMIPSol(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /*********************************************************************
  *  Model Query Routines (30)                                        *
  *********************************************************************/
-PyObject *pyLSgetLPData(PyObject *self, PyObject *args);
-PyObject *pyLSgetQCData(PyObject *self, PyObject *args);
-PyObject *pyLSgetQCDatai(PyObject *self, PyObject *args);
-PyObject *pyLSgetVarType(PyObject *self, PyObject *args);
-PyObject *pyLSgetVarStartPoint(PyObject *self, PyObject *args);
-PyObject *pyLSgetVarStartPointPartial(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPVarStartPointPartial(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPVarStartPoint(PyObject *self, PyObject *args);
-PyObject *pyLSgetSETSData(PyObject *self, PyObject *args);
-PyObject *pyLSgetSETSDatai(PyObject *self, PyObject *args);
-PyObject *pyLSgetSemiContData(PyObject *self, PyObject *args);
-PyObject *pyLSgetLPVariableDataj(PyObject *self, PyObject *args);
-PyObject *pyLSgetVariableNamej(PyObject *self, PyObject *args);
-PyObject *pyLSgetVariableIndex(PyObject *self, PyObject *args);
-PyObject *pyLSgetConstraintNamei(PyObject *self, PyObject *args);
-PyObject *pyLSgetConstraintIndex(PyObject *self, PyObject *args);
-PyObject *pyLSgetConstraintDatai(PyObject *self, PyObject *args);
-PyObject *pyLSgetLPConstraintDatai(PyObject *self, PyObject *args);
-PyObject *pyLSgetConeNamei(PyObject *self, PyObject *args);
-PyObject *pyLSgetConeIndex(PyObject *self, PyObject *args);
-PyObject *pyLSgetConeDatai(PyObject *self, PyObject *args);
-PyObject *pyLSgetNLPData(PyObject *self, PyObject *args);
-PyObject *pyLSgetNLPConstraintDatai(PyObject *self, PyObject *args);
-PyObject *pyLSgetNLPVariableDataj(PyObject *self, PyObject *args);
-PyObject *pyLSgetNLPObjectiveData(PyObject *self, PyObject *args);
-PyObject *pyLSgetInstruct(PyObject *self, PyObject *args);
-PyObject *pyLScalinfeasMIPsolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetRoundMIPsolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetDuplicateColumns(PyObject *self, PyObject *args);
-PyObject *pyLSgetRangeData(PyObject *self, PyObject *args);
+PyObject *pyLSgetLPData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetQCData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetQCDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetVarType(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetVarStartPointPartial(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPVarStartPointPartial(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetSETSData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetSETSDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetSemiContData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetLPVariableDataj(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetVariableNamej(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetVariableIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetConstraintNamei(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetConstraintIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetConstraintDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetLPConstraintDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetConeNamei(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetConeIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetConeDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNLPData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNLPConstraintDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNLPVariableDataj(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNLPObjectiveData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetInstruct(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScalinfeasMIPsolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetRoundMIPsolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDuplicateColumns(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetRangeData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /**********************************************************************
  *  Model Modification Routines (26)                                  *
  **********************************************************************/
-PyObject *pyLSaddConstraints(PyObject *self, PyObject *args);
-PyObject *pyLSaddVariables(PyObject *self, PyObject *args);
-PyObject *pyLSaddCones(PyObject *self, PyObject *args);
-PyObject *pyLSaddSETS(PyObject *self, PyObject *args);
-PyObject *pyLSaddQCterms(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteConstraints(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteCones(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteSETS(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteSemiContVars(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteVariables(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteQCterms(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteAj(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyLowerBounds(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyUpperBounds(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyRHS(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyObjective(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyObjConstant(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyAj(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyCone(PyObject *self, PyObject *args);
-PyObject *pyLSmodifySET(PyObject *self, PyObject *args);
-PyObject *pyLSmodifySemiContVars(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyConstraintType(PyObject *self, PyObject *args);
-PyObject *pyLSmodifyVariableType(PyObject *self, PyObject *args);
-PyObject *pyLSaddNLPAj(PyObject *self, PyObject *args);
-PyObject *pyLSaddNLPobj(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteNLPobj(PyObject *self, PyObject *args);
+PyObject *pyLSaddConstraints(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddVariables(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddCones(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddSETS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddQCterms(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteConstraints(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteCones(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteSETS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteSemiContVars(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteVariables(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteQCterms(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteAj(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyLowerBounds(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyUpperBounds(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyRHS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyObjective(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyObjConstant(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyAj(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyCone(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifySET(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifySemiContVars(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyConstraintType(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSmodifyVariableType(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddNLPAj(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddNLPobj(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteNLPobj(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 
 /*********************************************************************
  *   Model & Solution Analysis Routines (8)                         *
  *********************************************************************/
-PyObject *pyLSgetConstraintRanges(PyObject *self, PyObject *args);
-PyObject *pyLSgetObjectiveRanges(PyObject *self, PyObject *args);
-PyObject *pyLSgetBoundRanges(PyObject *self, PyObject *args);
-PyObject *pyLSgetBestBounds(PyObject *self, PyObject *args);
-PyObject *pyLSfindIIS(PyObject *self, PyObject *args);
-PyObject *pyLSfindIUS(PyObject *self, PyObject *args);
-PyObject *pyLSgetIIS(PyObject *self, PyObject *args);
-PyObject *pyLSgetBlockStructure(PyObject *self, PyObject *args);
-PyObject *pyLSgetIUS(PyObject *self, PyObject *args);
+PyObject *pyLSgetConstraintRanges(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetObjectiveRanges(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetBoundRanges(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetBestBounds(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfindIIS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfindIUS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetIIS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetBlockStructure(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetIUS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /*********************************************************************
  *    Stochastic Programming Interface (73)                          *
  *********************************************************************/
-PyObject *pyLSwriteDeteqMPSFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteDeteqLINDOFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteSMPSFile(PyObject *self, PyObject *args);
-PyObject *pyLSreadSMPSFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteSMPIFile(PyObject *self, PyObject *args);
-PyObject *pyLSreadSMPIFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteScenarioSolutionFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteNodeSolutionFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteScenarioMPIFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteScenarioMPSFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteScenarioLINDOFile(PyObject *self, PyObject *args);
-PyObject *pyLSgetModelStocDouParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetModelStocIntParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetModelStocIntParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenarioIndex(PyObject *self, PyObject *args);
-PyObject *pyLSgetStageIndex(PyObject *self, PyObject *args);
-PyObject *pyLSgetStocParIndex(PyObject *self, PyObject *args);
-PyObject *pyLSgetStocParName(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenarioName(PyObject *self, PyObject *args);
-PyObject *pyLSgetStageName(PyObject *self, PyObject *args);
-PyObject *pyLSgetStocInfo(PyObject *self, PyObject *args);
-PyObject *pyLSgetStocCCPInfo(PyObject *self, PyObject *args);
-PyObject *pyLSloadSampleSizes(PyObject *self, PyObject *args);
-PyObject *pyLSloadConstraintStages(PyObject *self, PyObject *args);
-PyObject *pyLSloadVariableStages(PyObject *self, PyObject *args);
-PyObject *pyLSloadStageData(PyObject *self, PyObject *args);
-PyObject *pyLSloadStocParData(PyObject *self, PyObject *args);
-PyObject *pyLSgetDeteqModel(PyObject *self, PyObject *args);
-PyObject *pyLSaggregateStages(PyObject *self, PyObject *args);
-PyObject *pyLSgetStageAggScheme(PyObject *self, PyObject *args);
-PyObject *pyLSsolveSP(PyObject *self, PyObject *args);
-PyObject *pyLSsolveHS(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenarioObjective(PyObject *self, PyObject *args);
-PyObject *pyLSgetNodePrimalSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetNodeDualSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetNodeReducedCost(PyObject *self, PyObject *args);
-PyObject *pyLSgetNodeSlacks(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenarioPrimalSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenarioReducedCost(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenarioDualSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenarioSlacks(PyObject *self, PyObject *args);
-PyObject *pyLSgetNodeListByScenario(PyObject *self, PyObject *args);
-PyObject *pyLSgetProbabilityByScenario(PyObject *self, PyObject *args);
-PyObject *pyLSgetProbabilityByNode(PyObject *self, PyObject *args);
-PyObject *pyLSgetStocParData(PyObject *self, PyObject *args);
-PyObject *pyLSaddDiscreteBlocks(PyObject *self, PyObject *args);
-PyObject *pyLSaddScenario(PyObject *self, PyObject *args);
-PyObject *pyLSaddDiscreteIndep(PyObject *self, PyObject *args);
-PyObject *pyLSaddParamDistIndep(PyObject *self, PyObject *args);
-PyObject *pyLSaddChanceConstraint(PyObject *self, PyObject *args);
-PyObject *pyLSsetNumStages(PyObject *self, PyObject *args);
-PyObject *pyLSgetStocParOutcomes(PyObject *self, PyObject *args);
-PyObject *pyLSloadCorrelationMatrix(PyObject *self, PyObject *args);
-PyObject *pyLSgetCorrelationMatrix(PyObject *self, PyObject *args);
-PyObject *pyLSgetStocParSample(PyObject *self, PyObject *args);
-PyObject *pyLSgetDiscreteBlocks(PyObject *self, PyObject *args);
-PyObject *pyLSgetDiscreteBlockOutcomes(PyObject *self, PyObject *args);
-PyObject *pyLSgetDiscreteIndep(PyObject *self, PyObject *args);
-PyObject *pyLSgetParamDistIndep(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenario(PyObject *self, PyObject *args);
-PyObject *pyLSgetChanceConstraint(PyObject *self, PyObject *args);
-PyObject *pyLSgetSampleSizes(PyObject *self, PyObject *args);
-PyObject *pyLSgetConstraintStages(PyObject *self, PyObject *args);
-PyObject *pyLSgetVariableStages(PyObject *self, PyObject *args);
-PyObject *pyLSgetStocRowIndices(PyObject *self, PyObject *args);
-PyObject *pyLSsetStocParRG(PyObject *self, PyObject *args);
-PyObject *pyLSgetScenarioModel(PyObject *self, PyObject *args);
-PyObject *pyLSfreeStocMemory(PyObject *self, PyObject *args);
-PyObject *pyLSfreeStocHashMemory(PyObject *self, PyObject *args);
-PyObject *pyLSgetModelStocParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetModelStocParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetEnvStocParameter(PyObject *self, PyObject *args);
-PyObject *pyLSgetEnvStocParameter(PyObject *self, PyObject *args);
-PyObject *pyLSsetModelStocDouParameter(PyObject *self, PyObject *args);
+PyObject *pyLSwriteDeteqMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteDeteqLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteSMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadSMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteSMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadSMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteScenarioSolutionFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteNodeSolutionFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteScenarioMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteScenarioMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteScenarioLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetModelStocDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetModelStocIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetModelStocIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenarioIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStageIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStocParIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStocParName(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenarioName(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStageName(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStocInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStocCCPInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadSampleSizes(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadConstraintStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadVariableStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadStageData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadStocParData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDeteqModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaggregateStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStageAggScheme(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsolveSP(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsolveHS(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenarioObjective(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNodePrimalSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNodeDualSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNodeReducedCost(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNodeSlacks(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenarioPrimalSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenarioReducedCost(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenarioDualSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenarioSlacks(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNodeListByScenario(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetProbabilityByScenario(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetProbabilityByNode(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStocParData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddDiscreteBlocks(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddScenario(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddDiscreteIndep(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddParamDistIndep(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddChanceConstraint(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetNumStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStocParOutcomes(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadCorrelationMatrix(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetCorrelationMatrix(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStocParSample(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDiscreteBlocks(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDiscreteBlockOutcomes(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDiscreteIndep(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetParamDistIndep(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenario(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetChanceConstraint(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetSampleSizes(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetConstraintStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetVariableStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStocRowIndices(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetStocParRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetScenarioModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfreeStocMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfreeStocHashMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetModelStocParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetModelStocParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetEnvStocParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetEnvStocParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetModelStocDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /*********************************************************************
  *    Statistical Calculations Interface (16)                        *
  *********************************************************************/
-PyObject *pyLSsampCreate(PyObject *self, PyObject *args);
-PyObject *pyLSsampDelete(PyObject *self, PyObject *args);
-PyObject *pyLSsampSetDistrParam(PyObject *self, PyObject *args);
-PyObject *pyLSsampGetDistrParam(PyObject *self, PyObject *args);
-PyObject *pyLSsampEvalDistr(PyObject *self, PyObject *args);
-PyObject *pyLSsampEvalDistrLI(PyObject *self, PyObject *args);
-PyObject *pyLSsampEvalUserDistr(PyObject *self, PyObject *args);
-PyObject *pyLSsampSetRG(PyObject *self, PyObject *args);
-PyObject *pyLSsampGenerate(PyObject *self, PyObject *args);
-PyObject *pyLSsampGetPoints(PyObject *self, PyObject *args);
-PyObject *pyLSsampLoadPoints(PyObject *self, PyObject *args);
-PyObject *pyLSsampGetCIPoints(PyObject *self, PyObject *args);
-PyObject *pyLSsampLoadDiscretePdfTable(PyObject *self, PyObject *args);
-PyObject *pyLSsampGetDiscretePdfTable(PyObject *self, PyObject *args);
-PyObject *pyLSsampGetInfo(PyObject *self, PyObject *args);
-PyObject *pyLSsampAddUserFuncArg(PyObject *self, PyObject *args);
+PyObject *pyLSsampCreate(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampDelete(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampSetDistrParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampGetDistrParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampEvalDistr(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampEvalDistrLI(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampEvalUserDistr(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampSetRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampGenerate(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampGetPoints(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampLoadPoints(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampGetCIPoints(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampLoadDiscretePdfTable(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampGetDiscretePdfTable(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampGetInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsampAddUserFuncArg(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
 
 /*********************************************************************
  *      Random Number Generation Interface()                         *
  *********************************************************************/
-PyObject *pyLScreateRG(PyObject *self, PyObject *args);
-PyObject *pyLScreateRGMT(PyObject *self, PyObject *args);
-PyObject *pyLSgetDoubleRV(PyObject *self, PyObject *args);
-PyObject *pyLSgetInt32RV(PyObject *self, PyObject *args);
-PyObject *pyLSsetRGSeed(PyObject *self, PyObject *args);
-PyObject *pyLSdisposeRG(PyObject *self, PyObject *args);
-PyObject *pyLSsetDistrParamRG(PyObject *self, PyObject *args);
-PyObject *pyLSsetDistrRG(PyObject *self, PyObject *args);
-PyObject *pyLSgetDistrRV(PyObject *self, PyObject *args);
-PyObject *pyLSgetInitSeed(PyObject *self, PyObject *args);
-PyObject *pyLSgetRGNumThreads(PyObject *self, PyObject *args);
-PyObject *pyLSfillRGBuffer(PyObject *self, PyObject *args);
-PyObject *pyLSgetHistogram(PyObject *self, PyObject *args);
-PyObject *pyLSsolveMipBnp(PyObject *self, PyObject *args);
-// lsmakepy.lua 2020-02-22
-PyObject *pyLSwriteMPXFile(PyObject *self, PyObject *args);
-PyObject *pyLSreadMPXFile(PyObject *self, PyObject *args);
-PyObject *pyLSwriteVarPriorities(PyObject *self, PyObject *args);
-PyObject *pyLSwriteNLSolution(PyObject *self, PyObject *args);
-PyObject *pyLSaddTunerInstance(PyObject *self, PyObject *args);
-PyObject *pyLSaddTunerOption(PyObject *self, PyObject *args);
-PyObject *pyLSaddTunerStrOption(PyObject *self, PyObject *args);
-PyObject *pyLSaddTunerZDynamic(PyObject *self, PyObject *args);
-PyObject *pyLSaddTunerZStatic(PyObject *self, PyObject *args);
-PyObject *pyLSclearTuner(PyObject *self, PyObject *args);
-PyObject *pyLSdisplayTunerResults(PyObject *self, PyObject *args);
-PyObject *pyLSgetTunerConfigString(PyObject *self, PyObject *args);
-PyObject *pyLSgetTunerOption(PyObject *self, PyObject *args);
-PyObject *pyLSgetTunerResult(PyObject *self, PyObject *args);
-PyObject *pyLSgetTunerSpace(PyObject *self, PyObject *args);
-PyObject *pyLSgetTunerStrOption(PyObject *self, PyObject *args);
-PyObject *pyLSloadTunerConfigFile(PyObject *self, PyObject *args);
-PyObject *pyLSloadTunerConfigString(PyObject *self, PyObject *args);
-PyObject *pyLSprintTuner(PyObject *self, PyObject *args);
-PyObject *pyLSresetTuner(PyObject *self, PyObject *args);
-PyObject *pyLSrunTuner(PyObject *self, PyObject *args);
-PyObject *pyLSrunTunerFile(PyObject *self, PyObject *args);
-PyObject *pyLSrunTunerString(PyObject *self, PyObject *args);
-PyObject *pyLSsetTunerOption(PyObject *self, PyObject *args);
-PyObject *pyLSsetTunerStrOption(PyObject *self, PyObject *args);
-PyObject *pyLSaddQCShift(PyObject *self, PyObject *args);
-PyObject *pyLSgetQCShift(PyObject *self, PyObject *args);
-PyObject *pyLSresetQCShift(PyObject *self, PyObject *args);
-
-PyObject *pyLSreadCBFFile(PyObject *self, PyObject *args);
-PyObject *pyLSreadNLFile(PyObject *self, PyObject *args);
-PyObject *pyLSreadSDPAFile(PyObject *self, PyObject *args);
-PyObject *pyLSsolveFileLP(PyObject *self, PyObject *args);
-PyObject *pyLSgetProfilerContext(PyObject *self, PyObject *args);
-PyObject *pyLSgetProfilerInfo(PyObject *self, PyObject *args);
-PyObject *pyLSaddEmptySpacesAcolumns(PyObject *self, PyObject *args);
-PyObject *pyLSaddEmptySpacesNLPAcolumns(PyObject *self, PyObject *args);
-PyObject *pyLSaddObjPool(PyObject *self, PyObject *args);
-PyObject *pyLSapplyLtf(PyObject *self, PyObject *args);
-PyObject *pyLSbnbSolve(PyObject *self, PyObject *args);
-PyObject *pyLSbuildStringData(PyObject *self, PyObject *args);
-PyObject *pyLScalcConFunc(PyObject *self, PyObject *args);
-PyObject *pyLScalcConGrad(PyObject *self, PyObject *args);
-PyObject *pyLScalcObjFunc(PyObject *self, PyObject *args);
-PyObject *pyLScalcObjGrad(PyObject *self, PyObject *args);
-PyObject *pyLScheckQterms(PyObject *self, PyObject *args);
-PyObject *pyLSdeduceStages(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteString(PyObject *self, PyObject *args);
-PyObject *pyLSdeleteStringData(PyObject *self, PyObject *args);
-PyObject *pyLSdisplayBlockStructure(PyObject *self, PyObject *args);
-PyObject *pyLSdoBTRAN(PyObject *self, PyObject *args);
-PyObject *pyLSdoFTRAN(PyObject *self, PyObject *args);
-PyObject *pyLSfindLtf(PyObject *self, PyObject *args);
-PyObject *pyLSfindSymmetry(PyObject *self, PyObject *args);
-PyObject *pyLSfreeGOPSolutionMemory(PyObject *self, PyObject *args);
-PyObject *pyLSfreeHashMemory(PyObject *self, PyObject *args);
-PyObject *pyLSfreeMIPSolutionMemory(PyObject *self, PyObject *args);
-PyObject *pyLSfreeObjPool(PyObject *self, PyObject *args);
-PyObject *pyLSfreeSolutionMemory(PyObject *self, PyObject *args);
-PyObject *pyLSfreeSolverMemory(PyObject *self, PyObject *args);
-PyObject *pyLSgetALLDIFFData(PyObject *self, PyObject *args);
-PyObject *pyLSgetALLDIFFDatai(PyObject *self, PyObject *args);
-PyObject *pyLSgetDimensions(PyObject *self, PyObject *args);
-PyObject *pyLSgetDualMIPsolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetGOPVariablePriority(PyObject *self, PyObject *args);
-PyObject *pyLSgetHess(PyObject *self, PyObject *args);
-PyObject *pyLSgetIISInts(PyObject *self, PyObject *args);
-PyObject *pyLSgetIISSETs(PyObject *self, PyObject *args);
-PyObject *pyLSgetJac(PyObject *self, PyObject *args);
-PyObject *pyLSgetKBestMIPSols(PyObject *self, PyObject *args);
-PyObject *pyLSgetLicenseInfo(PyObject *self, PyObject *args);
-PyObject *pyLSgetMasterModel(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPCallbackInfo(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPSolutionStatus(PyObject *self, PyObject *args);
-PyObject *pyLSgetNextBestSol(PyObject *self, PyObject *args);
-PyObject *pyLSgetNnzData(PyObject *self, PyObject *args);
-PyObject *pyLSgetObjectiveRanges(PyObject *self, PyObject *args);
-PyObject *pyLSgetObjPoolNumSol(PyObject *self, PyObject *args);
-PyObject *pyLSgetOrbitInfo(PyObject *self, PyObject *args);
-PyObject *pyLSgetPOSDData(PyObject *self, PyObject *args);
-PyObject *pyLSgetPOSDDatai(PyObject *self, PyObject *args);
-PyObject *pyLSgetProgressInfo(PyObject *self, PyObject *args);
-PyObject *pyLSgetSolutionInfo(PyObject *self, PyObject *args);
-PyObject *pyLSgetSolutionStatus(PyObject *self, PyObject *args);
-PyObject *pyLSgetXSolverLibrary(PyObject *self, PyObject *args);
-PyObject *pyLSloadALLDIFFData(PyObject *self, PyObject *args);
-PyObject *pyLSloadGASolution(PyObject *self, PyObject *args);
-PyObject *pyLSloadIISPriorities(PyObject *self, PyObject *args);
-PyObject *pyLSloadMultiStartSolution(PyObject *self, PyObject *args);
-PyObject *pyLSloadNLPDense(PyObject *self, PyObject *args);
-PyObject *pyLSloadPOSDData(PyObject *self, PyObject *args);
-PyObject *pyLSloadSolutionAt(PyObject *self, PyObject *args);
-PyObject *pyLSloadStringData(PyObject *self, PyObject *args);
-PyObject *pyLSloadStringData(PyObject *self, PyObject *args);
-PyObject *pyLSreadMPXStream(PyObject *self, PyObject *args);
-PyObject *pyLSsetObjPoolParam(PyObject *self, PyObject *args);
-PyObject *pyLSgetObjPoolParam(PyObject *self, PyObject *args);
-PyObject *pyLSsetProbAllocSizes(PyObject *self, PyObject *args);
-PyObject *pyLSsetProbNameAllocSizes(PyObject *self, PyObject *args);
-PyObject *pyLSsetSETSStatei(PyObject *self, PyObject *args);
-PyObject *pyLSsetXSolverLibrary(PyObject *self, PyObject *args);
-PyObject *pyLSsetConstraintProperty(PyObject *self, PyObject *args);
-PyObject *pyLSregress(PyObject *self, PyObject *args);
-PyObject *pyLSremObjPool(PyObject *self, PyObject *args);
-PyObject *pyLSgetMIPSolution(PyObject *self, PyObject *args);
-PyObject *pyLSgetObjective(PyObject *self, PyObject *args);
-PyObject *pyLSsetGOPVariablePriority(PyObject *self, PyObject *args);
-PyObject *pyLSgetStringValue(PyObject *self, PyObject *args);
-PyObject *pyLSrepairQterms(PyObject *self, PyObject *args);
-PyObject *pyLSsetMIPCCStrategy(PyObject *self, PyObject *args);
-
-PyObject *pyLSsetModelLogfunc(PyObject *self, PyObject *args);
-PyObject *pyLSsetEnvLogfunc(PyObject *self, PyObject *args);
-PyObject *pyLSsetCallback(PyObject *self, PyObject *args);
-PyObject *pyLSsetMIPCallback(PyObject *self, PyObject *args);
-PyObject *pyLSsetFuncalc(PyObject *self, PyObject *args);
-PyObject *pyLSsetGradcalc(PyObject *self, PyObject *args);
-PyObject *pyLSwriteTunerParameters(PyObject *self, PyObject *args);
+PyObject *pyLScreateRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScreateRGMT(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDoubleRV(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetInt32RV(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetRGSeed(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdisposeRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetDistrParamRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetDistrRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDistrRV(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetInitSeed(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetRGNumThreads(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfillRGBuffer(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetHistogram(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsolveMipBnp(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+// lsmakepy.lua 2020-02-22 (METH_FASTCALL)
+PyObject *pyLSwriteMPXFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadMPXFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteVarPriorities(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteNLSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddTunerInstance(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddTunerOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddTunerStrOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddTunerZDynamic(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddTunerZStatic(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSclearTuner(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdisplayTunerResults(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetTunerConfigString(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetTunerOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetTunerResult(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetTunerSpace(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetTunerStrOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadTunerConfigFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadTunerConfigString(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSprintTuner(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSresetTuner(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSrunTuner(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSrunTunerFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSrunTunerString(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetTunerOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetTunerStrOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddQCShift(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetQCShift(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSresetQCShift(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+
+PyObject *pyLSreadCBFFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadNLFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadSDPAFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsolveFileLP(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetProfilerContext(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetProfilerInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddEmptySpacesAcolumns(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddEmptySpacesNLPAcolumns(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSaddObjPool(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSapplyLtf(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSbnbSolve(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSbuildStringData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScalcConFunc(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScalcConGrad(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScalcObjFunc(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScalcObjGrad(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLScheckQterms(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeduceStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteString(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdeleteStringData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdisplayBlockStructure(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdoBTRAN(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSdoFTRAN(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfindLtf(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfindSymmetry(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfreeGOPSolutionMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfreeHashMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfreeMIPSolutionMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfreeObjPool(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfreeSolutionMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSfreeSolverMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetALLDIFFData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetALLDIFFDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDimensions(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetDualMIPsolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetGOPVariablePriority(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetHess(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetIISInts(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetIISSETs(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetJac(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetKBestMIPSols(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetLicenseInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMasterModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPCallbackInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPSolutionStatus(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNextBestSol(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetNnzData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetObjectiveRanges(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetObjPoolNumSol(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetOrbitInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetPOSDData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetPOSDDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetProgressInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetSolutionInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetSolutionStatus(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetXSolverLibrary(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadALLDIFFData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadGASolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadIISPriorities(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadMultiStartSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadNLPDense(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadPOSDData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadSolutionAt(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadStringData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSloadStringData(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSreadMPXStream(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetObjPoolParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetObjPoolParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetProbAllocSizes(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetProbNameAllocSizes(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetSETSStatei(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetXSolverLibrary(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetConstraintProperty(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSregress(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSremObjPool(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetMIPSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetObjective(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetGOPVariablePriority(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSgetStringValue(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSrepairQterms(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetMIPCCStrategy(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+
+PyObject *pyLSsetModelLogfunc(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetEnvLogfunc(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetCallback(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pySetInterrupt(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetMIPCallback(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetFuncalc(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSsetGradcalc(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+PyObject *pyLSwriteTunerParameters(PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+
+/*********************************************************************
+ *      Batch Solve Interface                                        *
+ *********************************************************************/
+PyObject *pySolveBatch(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyGetSolution(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyLoadLP(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyGetLP(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyGetRows(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyGetCols(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyStats(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyBatchBegin(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyBatchEnd(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyModelCache(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyLoadNames(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyGetNames(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyNameIndex(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyGetEnvParams(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pySetEnvParams(PyObject *self, PyObject *args, PyObject *kwds);
+PyObject *pyResetModel(PyObject *self, PyObject *args, PyObject *kwds);
+static int pyModBatchCheck(const char *pszName, PyObject *pyModel);
+
+/*********************************************************************
+ *      Owning Handle Types                                          *
+ *********************************************************************/
+/*
+ * Storage of lindo.Env, lindo.Model, lindo.Sample and lindo.RandGen. The
+ * object owns pHandle and deletes it when closed or collected; models,
+ * samples and generators hold a reference to the Env they were created
+ * in, and a closed Env is deleted only after its last child is closed.
+ */
+typedef struct pyHandle_t {
+    PyObject_HEAD
+    void              *pHandle;   //native object, NULL once deleted
+    struct pyHandle_t *pyParent;  //Env of a model, sample or generator
+    Py_ssize_t        nChildren;  //open handles created from this Env
+    int               nType;      //LS_PTR_ENV, LS_PTR_MODEL, LS_PTR_SAMPLE or LS_PTR_RG
+    int               isClosed;
+} pyHandle_t;
+
+static PyTypeObject pyEnvType, pyModelType, pySampleType, pyRandGenType;
+static int pyIsHandle(PyObject *pyObj);
+static int pyHandleClose(pyHandle_t *pyHandle);
+static int pyAddHandleTypes(PyObject *module);
+static void pyReleaseModelData(pLSmodel pModel);
+static void pyReleaseEnvData(pLSenv pEnv);
 #ifdef _DEBUG
 #include "pyLindo_decl.h"
 #endif
 static PyMethodDef lindo_methods[] =
 {
     {"error_out", (PyCFunction)error_out, METH_NOARGS, NULL},
-    {"pyLScreateEnv", pyLScreateEnv, METH_VARARGS},
-    {"pyLScreateModel", pyLScreateModel, METH_VARARGS},
-    {"pyLSdeleteEnv", pyLSdeleteEnv, METH_VARARGS},
-    {"pyLSdeleteModel", pyLSdeleteModel, METH_VARARGS},
-    {"pyLScopyParam", pyLScopyParam, METH_VARARGS},
-    {"pyLSloadLicenseString", pyLSloadLicenseString, METH_VARARGS},
-    {"pyLSgetVersionInfo", pyLSgetVersionInfo, METH_VARARGS},
-    {"pyLSreadMPSFile", pyLSreadMPSFile, METH_VARARGS},
-    {"pyLSwriteMPSFile", pyLSwriteMPSFile, METH_VARARGS},
-    {"pyLSreadLINDOFile", pyLSreadLINDOFile, METH_VARARGS},
-    {"pyLSwriteLINDOFile", pyLSwriteLINDOFile, METH_VARARGS},
-    {"pyLSreadLINDOStream", pyLSreadLINDOStream, METH_VARARGS},
-    {"pyLSwriteLINGOFile", pyLSwriteLINGOFile, METH_VARARGS},
-    {"pyLSwriteDualMPSFile", pyLSwriteDualMPSFile, METH_VARARGS},
-    {"pyLSwriteSolution", pyLSwriteSolution, METH_VARARGS},
-    {"pyLSwriteSolutionOfType", pyLSwriteSolutionOfType, METH_VARARGS},
-    {"pyLSwriteIIS", pyLSwriteIIS, METH_VARARGS},
-    {"pyLSwriteIUS", pyLSwriteIUS, METH_VARARGS},
-    {"pyLSreadMPIFile", pyLSreadMPIFile, METH_VARARGS},
-    {"pyLSwriteMPIFile", pyLSwriteMPIFile, METH_VARARGS},
-    {"pyLSwriteWithSetsAndSC", pyLSwriteWithSetsAndSC, METH_VARARGS},
-    {"pyLSreadBasis", pyLSreadBasis, METH_VARARGS},
-    {"pyLSwriteBasis", pyLSwriteBasis, METH_VARARGS},
-    {"pyLSreadLPFile", pyLSreadLPFile, METH_VARARGS},
-    {"pyLSreadLPStream", pyLSreadLPStream, METH_VARARGS},
-    {"pyLSgetErrorMessage", pyLSgetErrorMessage, METH_VARARGS},
-    {"pyLSgetFileError", pyLSgetFileError, METH_VARARGS},
-    {"pyLSgetErrorRowIndex", pyLSgetErrorRowIndex, METH_VARARGS},
-    {"pyLSsetModelParameter", pyLSsetModelParameter, METH_VARARGS},
-    {"pyLSgetModelParameterr", pyLSgetModelParameter, METH_VARARGS},
-    {"pyLSsetEnvParameter", pyLSsetEnvParameter, METH_VARARGS},
-    {"pyLSgetEnvParameter", pyLSgetEnvParameter, METH_VARARGS},
-    {"pyLSsetModelDouParameter", pyLSsetModelDouParameter, METH_VARARGS},
-    {"pyLSgetModelDouParameter", pyLSgetModelDouParameter, METH_VARARGS},
-    {"pyLSsetModelIntParameter", pyLSsetModelIntParameter, METH_VARARGS},
-    {"pyLSgetModelIntParameter", pyLSgetModelIntParameter, METH_VARARGS},
-    {"pyLSsetEnvDouParameter", pyLSsetEnvDouParameter, METH_VARARGS},
-    {"pyLSgetEnvDouParameter", pyLSgetEnvDouParameter, METH_VARARGS},
-    {"pyLSsetEnvIntParameter", pyLSsetEnvIntParameter, METH_VARARGS},
-    {"pyLSgetEnvIntParameter", pyLSgetEnvIntParameter, METH_VARARGS},
-    {"pyLSreadModelParameter", pyLSreadModelParameter, METH_VARARGS},
-    {"pyLSreadEnvParameter", pyLSreadEnvParameter, METH_VARARGS},
-    {"pyLSwriteModelParameter", pyLSwriteModelParameter, METH_VARARGS},
-    {"pyLSgetIntParameterRange", pyLSgetIntParameterRange, METH_VARARGS},
-    {"pyLSgetDouParameterRange", pyLSgetDouParameterRange, METH_VARARGS},
-    {"pyLSgetParamShortDesc", pyLSgetParamShortDesc, METH_VARARGS},
-    {"pyLSgetParamLongDesc", pyLSgetParamLongDesc, METH_VARARGS},
-    {"pyLSgetParamMacroName", pyLSgetParamMacroName, METH_VARARGS},
-    {"pyLSgetParamMacroID", pyLSgetParamMacroID, METH_VARARGS},
-    {"pyLSloadLPData", pyLSloadLPData, METH_VARARGS},
-    {"pyLSloadQCData", pyLSloadQCData, METH_VARARGS},
-    {"pyLSloadConeData", pyLSloadConeData, METH_VARARGS},
-    {"pyLSloadSETSData", pyLSloadSETSData, METH_VARARGS},
-    {"pyLSloadSemiContData", pyLSloadSemiContData, METH_VARARGS},
-    {"pyLSloadVarType", pyLSloadVarType, METH_VARARGS},
-    {"pyLSloadNLPData", pyLSloadNLPData, METH_VARARGS},
-    {"pyLSloadInstruct", pyLSloadInstruct, METH_VARARGS},
-    {"pyLSaddInstruct", pyLSaddInstruct, METH_VARARGS},
-    {"pyLSloadBasis", pyLSloadBasis, METH_VARARGS},
-    {"pyLSloadVarPriorities", pyLSloadVarPriorities, METH_VARARGS},
-    {"pyLSreadVarPriorities", pyLSreadVarPriorities, METH_VARARGS},
-    {"pyLSloadVarStartPoint", pyLSloadVarStartPoint, METH_VARARGS},
-    {"pyLSloadVarStartPointPartial", pyLSloadVarStartPointPartial, METH_VARARGS},
-    {"pyLSloadMIPVarStartPoint", pyLSloadMIPVarStartPoint, METH_VARARGS},
-    {"pyLSloadMIPVarStartPointPartial", pyLSloadMIPVarStartPointPartial, METH_VARARGS},
-    {"pyLSreadVarStartPoint", pyLSreadVarStartPoint, METH_VARARGS},
-    {"pyLSloadBlockStructure", pyLSloadBlockStructure, METH_VARARGS},
-    {"pyLSoptimize", pyLSoptimize, METH_VARARGS},
-    {"pyLSsolveMIP", pyLSsolveMIP, METH_VARARGS},
-    {"pyLSsolveGOP", pyLSsolveGOP, METH_VARARGS},
-    {"pyLSoptimizeQP", pyLSoptimizeQP, METH_VARARGS},
-    {"pyLScheckConvexity", pyLScheckConvexity, METH_VARARGS},
-    {"pyLSsolveSBD", pyLSsolveSBD, METH_VARARGS},
-    {"pyLSgetInfo", pyLSgetInfo, METH_VARARGS},
-    {"pyLSgetPrimalSolution", pyLSgetPrimalSolution, METH_VARARGS},
-    {"pyLSgetDualSolution", pyLSgetDualSolution, METH_VARARGS},
-    {"pyLSgetReducedCosts", pyLSgetReducedCosts, METH_VARARGS},
-    {"pyLSgetReducedCostsCone", pyLSgetReducedCostsCone, METH_VARARGS},
-    {"pyLSgetSlacks", pyLSgetSlacks, METH_VARARGS},
-    {"pyLSgetBasis", pyLSgetBasis, METH_VARARGS},
-    {"pyLSgetSolution", pyLSgetSolution, METH_VARARGS},
-    {"pyLSgetMIPPrimalSolution", pyLSgetMIPPrimalSolution, METH_VARARGS},
-    {"pyLSgetMIPDualSolution", pyLSgetMIPDualSolution, METH_VARARGS},
-    {"pyLSgetMIPReducedCosts", pyLSgetMIPReducedCosts, METH_VARARGS},
-    {"pyLSgetMIPSlacks", pyLSgetMIPSlacks, METH_VARARGS},
-    {"pyLSgetMIPBasis", pyLSgetMIPBasis, METH_VARARGS},
-    {"pyLSgetNextBestMIPSol", pyLSgetNextBestMIPSol, METH_VARARGS},
-    {"pyLSgetLPData", pyLSgetLPData, METH_VARARGS},
-    {"pyLSgetQCData", pyLSgetQCData, METH_VARARGS},
-    {"pyLSgetQCDatai", pyLSgetQCDatai, METH_VARARGS},
-    {"pyLSgetVarType", pyLSgetVarType, METH_VARARGS},
-    {"pyLSgetVarStartPoint", pyLSgetVarStartPoint, METH_VARARGS},
-    {"pyLSgetVarStartPointPartial", pyLSgetVarStartPointPartial, METH_VARARGS},
-    {"pyLSgetMIPVarStartPointPartial", pyLSgetMIPVarStartPointPartial, METH_VARARGS},
-    {"pyLSgetMIPVarStartPoint", pyLSgetMIPVarStartPoint, METH_VARARGS},
-    {"pyLSgetSETSData", pyLSgetSETSData, METH_VARARGS},
-    {"pyLSgetSETSDatai", pyLSgetSETSDatai, METH_VARARGS},
-    {"pyLSgetSemiContData", pyLSgetSemiContData, METH_VARARGS},
-    {"pyLSgetLPVariableDataj", pyLSgetLPVariableDataj, METH_VARARGS},
-    {"pyLSgetVariableNamej", pyLSgetVariableNamej, METH_VARARGS},
-    {"pyLSgetVariableIndex", pyLSgetVariableIndex, METH_VARARGS},
-    {"pyLSgetConstraintNamei", pyLSgetConstraintNamei, METH_VARARGS},
-    {"pyLSgetConstraintIndex", pyLSgetConstraintIndex, METH_VARARGS},
-    {"pyLSgetConstraintDatai", pyLSgetConstraintDatai, METH_VARARGS},
-    {"pyLSgetLPConstraintDatai", pyLSgetLPConstraintDatai, METH_VARARGS},
-    {"pyLSgetConeNamei", pyLSgetConeNamei, METH_VARARGS},
-    {"pyLSgetConeIndex", pyLSgetConeIndex, METH_VARARGS},
-    {"pyLSgetConeDatai", pyLSgetConeDatai, METH_VARARGS},
-    {"pyLSgetNLPData", pyLSgetNLPData, METH_VARARGS},
-    {"pyLSgetNLPConstraintDatai", pyLSgetNLPConstraintDatai, METH_VARARGS},
-    {"pyLSgetNLPVariableDataj", pyLSgetNLPVariableDataj, METH_VARARGS},
-    {"pyLSgetNLPObjectiveData", pyLSgetNLPObjectiveData, METH_VARARGS},
-    {"pyLSgetInstruct", pyLSgetInstruct, METH_VARARGS},
-    {"pyLScalinfeasMIPsolution", pyLScalinfeasMIPsolution, METH_VARARGS},
-    {"pyLSgetRoundMIPsolution", pyLSgetRoundMIPsolution, METH_VARARGS},
-    {"pyLSgetDuplicateColumns", pyLSgetDuplicateColumns, METH_VARARGS},
-    {"pyLSgetRangeData", pyLSgetRangeData, METH_VARARGS},
-    {"pyLSaddConstraints", pyLSaddConstraints, METH_VARARGS},
-    {"pyLSaddVariables", pyLSaddVariables, METH_VARARGS},
-    {"pyLSaddCones", pyLSaddCones, METH_VARARGS},
-    {"pyLSaddSETS", pyLSaddSETS, METH_VARARGS},
-    {"pyLSaddQCterms", pyLSaddQCterms, METH_VARARGS},
-    {"pyLSdeleteConstraints", pyLSdeleteConstraints, METH_VARARGS},
-    {"pyLSdeleteCones", pyLSdeleteCones, METH_VARARGS},
-    {"pyLSdeleteSETS", pyLSdeleteSETS, METH_VARARGS},
-    {"pyLSdeleteSemiContVars", pyLSdeleteSemiContVars, METH_VARARGS},
-    {"pyLSdeleteVariables", pyLSdeleteVariables, METH_VARARGS},
-    {"pyLSdeleteQCterms", pyLSdeleteQCterms, METH_VARARGS},
-    {"pyLSdeleteAj", pyLSdeleteAj, METH_VARARGS},
-    {"pyLSmodifyLowerBounds", pyLSmodifyLowerBounds, METH_VARARGS},
-    {"pyLSmodifyUpperBounds", pyLSmodifyUpperBounds, METH_VARARGS},
-    {"pyLSmodifyRHS", pyLSmodifyRHS, METH_VARARGS},
-    {"pyLSmodifyObjective", pyLSmodifyObjective, METH_VARARGS},
-    {"pyLSmodifyObjConstant", pyLSmodifyObjConstant, METH_VARARGS},
-    {"pyLSmodifyAj", pyLSmodifyAj, METH_VARARGS},
-    {"pyLSmodifyCone", pyLSmodifyCone, METH_VARARGS},
-    {"pyLSmodifySET", pyLSmodifySET, METH_VARARGS},
-    {"pyLSmodifySemiContVars", pyLSmodifySemiContVars, METH_VARARGS},
-    {"pyLSmodifyConstraintType", pyLSmodifyConstraintType, METH_VARARGS},
-    {"pyLSmodifyVariableType", pyLSmodifyVariableType, METH_VARARGS},
-    {"pyLSaddNLPAj", pyLSaddNLPAj, METH_VARARGS},
-    {"pyLSaddNLPobj", pyLSaddNLPobj, METH_VARARGS},
-    {"pyLSdeleteNLPobj", pyLSdeleteNLPobj, METH_VARARGS},
-    {"pyLSgetConstraintRanges", pyLSgetConstraintRanges, METH_VARARGS},
-    {"pyLSdeleteNLPobj", pyLSdeleteNLPobj, METH_VARARGS},
-    {"pyLSgetBoundRanges", pyLSgetBoundRanges, METH_VARARGS},
-    {"pyLSgetBestBounds", pyLSgetBoundRanges, METH_VARARGS},
-    {"pyLSfindIIS", pyLSfindIIS, METH_VARARGS},
-    {"pyLSfindIUS", pyLSfindIUS, METH_VARARGS},
-    {"pyLSgetIIS", pyLSgetIIS, METH_VARARGS},
-    {"pyLSgetBlockStructure", pyLSgetBlockStructure, METH_VARARGS},
-    {"pyLSwriteDeteqMPSFile", pyLSwriteDeteqMPSFile, METH_VARARGS},
-    {"pyLSwriteDeteqLINDOFile", pyLSwriteDeteqLINDOFile, METH_VARARGS},
-    {"pyLSwriteSMPSFile", pyLSwriteSMPSFile, METH_VARARGS},
-    {"pyLSreadSMPSFile", pyLSreadSMPSFile, METH_VARARGS},
-    {"pyLSwriteSMPIFile", pyLSwriteSMPIFile, METH_VARARGS},
-    {"pyLSreadSMPIFile", pyLSreadSMPIFile, METH_VARARGS},
-    {"pyLSwriteScenarioSolutionFile", pyLSwriteScenarioSolutionFile, METH_VARARGS},
-    {"pyLSwriteNodeSolutionFile", pyLSwriteNodeSolutionFile, METH_VARARGS},
-    {"pyLSwriteScenarioMPIFile", pyLSwriteScenarioMPIFile, METH_VARARGS},
-    {"pyLSwriteScenarioMPSFile", pyLSwriteScenarioMPSFile, METH_VARARGS},
-    {"pyLSwriteScenarioLINDOFile", pyLSwriteScenarioLINDOFile, METH_VARARGS},
-    {"pyLSgetModelStocDouParameter", pyLSgetModelStocDouParameter, METH_VARARGS},
-    {"pyLSsetModelStocIntParameter", pyLSsetModelStocIntParameter, METH_VARARGS},
-    {"pyLSgetModelStocIntParameter", pyLSgetModelStocIntParameter, METH_VARARGS},
-    {"pyLSgetScenarioIndex", pyLSgetScenarioIndex, METH_VARARGS},
-    {"pyLSgetStageIndex", pyLSgetStageIndex, METH_VARARGS},
-    {"pyLSgetStocParIndex", pyLSgetStocParIndex, METH_VARARGS},
-    {"pyLSgetStocParName", pyLSgetStocParName, METH_VARARGS},
-    {"pyLSgetScenarioName", pyLSgetScenarioName, METH_VARARGS},
-    {"pyLSgetStageName", pyLSgetStageName, METH_VARARGS},
-    {"pyLSgetStocInfo", pyLSgetStocInfo, METH_VARARGS},
-    {"pyLSgetStocCCPInfo", pyLSgetStocCCPInfo, METH_VARARGS},
-    {"pyLSloadSampleSizes", pyLSloadSampleSizes, METH_VARARGS},
-    {"pyLSloadConstraintStages", pyLSloadConstraintStages, METH_VARARGS},
-    {"pyLSloadVariableStages", pyLSloadVariableStages, METH_VARARGS},
-    {"pyLSloadStageData", pyLSloadStageData, METH_VARARGS},
-    {"pyLSloadStocParData", pyLSloadStocParData, METH_VARARGS},
-    {"pyLSgetDeteqModel", pyLSgetDeteqModel, METH_VARARGS},
-    {"pyLSaggregateStages", pyLSaggregateStages, METH_VARARGS},
-    {"pyLSgetStageAggScheme", pyLSgetStageAggScheme, METH_VARARGS},
-    {"pyLSsolveSP", pyLSsolveSP, METH_VARARGS},
-    {"pyLSsolveHS", pyLSsolveHS, METH_VARARGS},
-    {"pyLSgetScenarioObjective", pyLSgetScenarioObjective, METH_VARARGS},
-    {"pyLSgetNodePrimalSolution", pyLSgetNodePrimalSolution, METH_VARARGS},
-    {"pyLSgetNodeDualSolution", pyLSgetNodeDualSolution, METH_VARARGS},
-    {"pyLSgetNodeReducedCost", pyLSgetNodeReducedCost, METH_VARARGS},
-    {"pyLSgetNodeSlacks", pyLSgetNodeSlacks, METH_VARARGS},
-    {"pyLSgetScenarioPrimalSolution", pyLSgetScenarioPrimalSolution, METH_VARARGS},
-    {"pyLSgetScenarioReducedCost", pyLSgetScenarioReducedCost, METH_VARARGS},
-    {"pyLSgetScenarioDualSolution", pyLSgetScenarioDualSolution, METH_VARARGS},
-    {"pyLSgetScenarioSlacks", pyLSgetScenarioSlacks, METH_VARARGS},
-    {"pyLSgetNodeListByScenario", pyLSgetNodeListByScenario, METH_VARARGS},
-    {"pyLSgetProbabilityByScenario", pyLSgetProbabilityByScenario, METH_VARARGS},
-    {"pyLSgetProbabilityByNode", pyLSgetProbabilityByNode, METH_VARARGS},
-    {"pyLSgetStocParData", pyLSgetStocParData, METH_VARARGS},
-    {"pyLSaddDiscreteBlocks", pyLSaddDiscreteBlocks, METH_VARARGS},
-    {"pyLSaddScenario", pyLSaddScenario, METH_VARARGS},
-    {"pyLSaddDiscreteIndep", pyLSaddDiscreteIndep, METH_VARARGS},
-    {"pyLSaddParamDistIndep", pyLSaddParamDistIndep, METH_VARARGS},
-    {"pyLSaddChanceConstraint", pyLSaddChanceConstraint, METH_VARARGS},
-    {"pyLSsetNumStages", pyLSsetNumStages, METH_VARARGS},
-    {"pyLSgetStocParOutcomes", pyLSgetStocParOutcomes, METH_VARARGS},
-    {"pyLSloadCorrelationMatrix", pyLSloadCorrelationMatrix, METH_VARARGS},
-    {"pyLSgetCorrelationMatrix", pyLSgetCorrelationMatrix, METH_VARARGS},
-    {"pyLSgetStocParSample", pyLSgetStocParSample, METH_VARARGS},
-    {"pyLSgetDiscreteBlocks", pyLSgetDiscreteBlocks, METH_VARARGS},
-    {"pyLSgetDiscreteBlockOutcomes", pyLSgetDiscreteBlockOutcomes, METH_VARARGS},
-    {"pyLSgetDiscreteIndep", pyLSgetDiscreteIndep, METH_VARARGS},
-    {"pyLSgetParamDistIndep", pyLSgetParamDistIndep, METH_VARARGS},
-    {"pyLSgetScenario", pyLSgetScenario, METH_VARARGS},
-    {"pyLSgetChanceConstraint", pyLSgetChanceConstraint, METH_VARARGS},
-    {"pyLSgetSampleSizes", pyLSgetSampleSizes, METH_VARARGS},
-    {"pyLSgetConstraintStages", pyLSgetConstraintStages, METH_VARARGS},
-    {"pyLSgetVariableStages", pyLSgetVariableStages, METH_VARARGS},
-    {"pyLSgetStocRowIndices", pyLSgetStocRowIndices, METH_VARARGS},
-    {"pyLSsetStocParRG", pyLSsetStocParRG, METH_VARARGS},
-    {"pyLSgetScenarioModel", pyLSgetScenarioModel, METH_VARARGS},
-    {"pyLSfreeStocMemory", pyLSfreeStocMemory, METH_VARARGS},
-    {"pyLSfreeStocHashMemory", pyLSfreeStocHashMemory, METH_VARARGS},
-    {"pyLSgetModelStocParameter", pyLSgetModelStocParameter, METH_VARARGS},
-    {"pyLSsetModelStocParameter", pyLSsetModelStocParameter, METH_VARARGS},
-    {"pyLSsetEnvStocParameter", pyLSsetEnvStocParameter, METH_VARARGS},
-    {"pyLSgetEnvStocParameter", pyLSgetEnvStocParameter, METH_VARARGS},
-    {"pyLSsampCreate", pyLSsampCreate, METH_VARARGS},
-    {"pyLSsampDelete", pyLSsampDelete, METH_VARARGS},
-    {"pyLSsampSetDistrParam", pyLSsampSetDistrParam, METH_VARARGS},
-    {"pyLSsampGetDistrParam", pyLSsampGetDistrParam, METH_VARARGS},
-    {"pyLSsampEvalDistr", pyLSsampEvalDistr, METH_VARARGS},
-    {"pyLSsampEvalDistrLI", pyLSsampEvalDistrLI, METH_VARARGS},
-    {"pyLSsampEvalUserDistr", pyLSsampEvalUserDistr, METH_VARARGS},
-    {"pyLSsampSetRG", pyLSsampSetRG, METH_VARARGS},
-    {"pyLSsampGenerate", pyLSsampGenerate, METH_VARARGS},
-    {"pyLSsampGetPoints", pyLSsampGetPoints, METH_VARARGS},
-    {"pyLSsampLoadPoints", pyLSsampLoadPoints, METH_VARARGS},
-    {"pyLSsampGetCIPoints", pyLSsampGetCIPoints, METH_VARARGS},
-    {"pyLSsampLoadDiscretePdfTable", pyLSsampLoadDiscretePdfTable, METH_VARARGS},
-    {"pyLSsampGetDiscretePdfTable", pyLSsampGetDiscretePdfTable, METH_VARARGS},
-    {"pyLSsampGetInfo", pyLSsampGetInfo, METH_VARARGS},
-    {"pyLSsampAddUserFuncArg", pyLSsampAddUserFuncArg, METH_VARARGS},
-    {"pyLScreateRG", pyLScreateRG, METH_VARARGS},
-    {"pyLScreateRGMT", pyLScreateRGMT, METH_VARARGS},
-    {"pyLSgetDoubleRV", pyLSgetDoubleRV, METH_VARARGS},
-    {"pyLSgetInt32RV", pyLSgetInt32RV, METH_VARARGS},
-    {"pyLSsetRGSeed", pyLSsetRGSeed, METH_VARARGS},
-    {"pyLSdisposeRG", pyLSdisposeRG, METH_VARARGS},
-    {"pyLSsetDistrParamRG", pyLSsetDistrParamRG, METH_VARARGS},
-    {"pyLSsetDistrRG", pyLSsetDistrRG, METH_VARARGS},
-    {"pyLSgetDistrRV", pyLSgetDistrRV, METH_VARARGS},
-    {"pyLSgetInitSeed", pyLSgetInitSeed, METH_VARARGS},
-    {"pyLSgetRGNumThreads", pyLSgetRGNumThreads, METH_VARARGS},
-    {"pyLSfillRGBuffer", pyLSfillRGBuffer, METH_VARARGS},
-    {"pyLSgetHistogram", pyLSgetHistogram, METH_VARARGS},
-    {"pyLSsolveMipBnp", pyLSsolveMipBnp, METH_VARARGS},
-
-    { "pyLSwriteMPXFile", pyLSwriteMPXFile, METH_VARARGS },
-    { "pyLSreadMPXFile", pyLSreadMPXFile, METH_VARARGS },
-    { "pyLSwriteVarPriorities", pyLSwriteVarPriorities, METH_VARARGS },
-    { "pyLSwriteNLSolution", pyLSwriteNLSolution, METH_VARARGS },
-    { "pyLSaddTunerInstance", pyLSaddTunerInstance, METH_VARARGS },
-    { "pyLSaddTunerOption", pyLSaddTunerOption, METH_VARARGS },
-    { "pyLSaddTunerStrOption", pyLSaddTunerStrOption, METH_VARARGS },
-    { "pyLSaddTunerZDynamic", pyLSaddTunerZDynamic, METH_VARARGS },
-    { "pyLSaddTunerZStatic", pyLSaddTunerZStatic, METH_VARARGS },
-    { "pyLSclearTuner", pyLSclearTuner, METH_VARARGS },
-    { "pyLSdisplayTunerResults", pyLSdisplayTunerResults, METH_VARARGS },
-    { "pyLSgetTunerConfigString", pyLSgetTunerConfigString, METH_VARARGS },
-    { "pyLSgetTunerOption", pyLSgetTunerOption, METH_VARARGS },
-    { "pyLSgetTunerResult", pyLSgetTunerResult, METH_VARARGS },
-    { "pyLSgetTunerSpace", pyLSgetTunerSpace, METH_VARARGS },
-    { "pyLSgetTunerStrOption", pyLSgetTunerStrOption, METH_VARARGS },
-    { "pyLSloadTunerConfigFile", pyLSloadTunerConfigFile, METH_VARARGS },
-    { "pyLSloadTunerConfigString", pyLSloadTunerConfigString, METH_VARARGS },
-    { "pyLSprintTuner", pyLSprintTuner, METH_VARARGS },
-    { "pyLSresetTuner", pyLSresetTuner, METH_VARARGS },
-    { "pyLSrunTuner", pyLSrunTuner, METH_VARARGS },
-    { "pyLSrunTunerFile", pyLSrunTunerFile, METH_VARARGS },
-    { "pyLSrunTunerString", pyLSrunTunerString, METH_VARARGS },
-    { "pyLSsetTunerOption", pyLSsetTunerOption, METH_VARARGS },
-    { "pyLSsetTunerStrOption", pyLSsetTunerStrOption, METH_VARARGS },
-    { "pyLSaddQCShift", pyLSaddQCShift, METH_VARARGS },
-    { "pyLSgetQCShift", pyLSgetQCShift, METH_VARARGS },
-    { "pyLSresetQCShift", pyLSresetQCShift, METH_VARARGS },
-    { "pyLSreadCBFFile", pyLSreadCBFFile, METH_VARARGS },
-    { "pyLSreadNLFile", pyLSreadNLFile, METH_VARARGS },
-    { "pyLSreadSDPAFile", pyLSreadSDPAFile, METH_VARARGS },
-    { "pyLSsolveFileLP", pyLSsolveFileLP, METH_VARARGS },
-    { "pyLSgetProfilerContext", pyLSgetProfilerContext, METH_VARARGS },
-    { "pyLSgetProfilerInfo", pyLSgetProfilerInfo, METH_VARARGS },
-    { "pyLSaddEmptySpacesAcolumns", pyLSaddEmptySpacesAcolumns, METH_VARARGS },
-    { "pyLSaddEmptySpacesNLPAcolumns", pyLSaddEmptySpacesNLPAcolumns, METH_VARARGS },
-    { "pyLSaddObjPool", pyLSaddObjPool, METH_VARARGS },
-    { "pyLSapplyLtf", pyLSapplyLtf, METH_VARARGS },
-    { "pyLSbnbSolve", pyLSbnbSolve, METH_VARARGS },
-    { "pyLSbuildStringData", pyLSbuildStringData, METH_VARARGS },
-    { "pyLScalcConFunc", pyLScalcConFunc, METH_VARARGS },
-    { "pyLScalcConGrad", pyLScalcConGrad, METH_VARARGS },
-    { "pyLScalcObjFunc", pyLScalcObjFunc, METH_VARARGS },
-    { "pyLScalcObjGrad", pyLScalcObjGrad, METH_VARARGS },
-    { "pyLScheckQterms", pyLScheckQterms, METH_VARARGS },
-    { "pyLSdeduceStages", pyLSdeduceStages, METH_VARARGS },
-    { "pyLSdeleteString", pyLSdeleteString, METH_VARARGS },
-    { "pyLSdeleteStringData", pyLSdeleteStringData, METH_VARARGS },
-    { "pyLSdisplayBlockStructure", pyLSdisplayBlockStructure, METH_VARARGS },
-    { "pyLSdoBTRAN", pyLSdoBTRAN, METH_VARARGS },
-    { "pyLSdoFTRAN", pyLSdoFTRAN, METH_VARARGS },
-    { "pyLSfindLtf", pyLSfindLtf, METH_VARARGS },
-    { "pyLSfindSymmetry", pyLSfindSymmetry, METH_VARARGS },
-    { "pyLSfreeGOPSolutionMemory", pyLSfreeGOPSolutionMemory, METH_VARARGS },
-    { "pyLSfreeHashMemory", pyLSfreeHashMemory, METH_VARARGS },
-    { "pyLSfreeMIPSolutionMemory", pyLSfreeMIPSolutionMemory, METH_VARARGS },
-    { "pyLSfreeObjPool", pyLSfreeObjPool, METH_VARARGS },
-    { "pyLSfreeSolutionMemory", pyLSfreeSolutionMemory, METH_VARARGS },
-    { "pyLSfreeSolverMemory", pyLSfreeSolverMemory, METH_VARARGS },
-    { "pyLSgetALLDIFFData", pyLSgetALLDIFFData, METH_VARARGS },
-    { "pyLSgetALLDIFFDatai", pyLSgetALLDIFFDatai, METH_VARARGS },
-    { "pyLSgetDimensions", pyLSgetDimensions, METH_VARARGS },
-    { "pyLSgetDualMIPsolution", pyLSgetDualMIPsolution, METH_VARARGS },
-    { "pyLSgetGOPVariablePriority", pyLSgetGOPVariablePriority, METH_VARARGS },
-    { "pyLSgetHess", pyLSgetHess, METH_VARARGS },
-    { "pyLSgetIISInts", pyLSgetIISInts, METH_VARARGS },
-    { "pyLSgetIISSETs", pyLSgetIISSETs, METH_VARARGS },
-    { "pyLSgetJac", pyLSgetJac, METH_VARARGS },
-    { "pyLSgetKBestMIPSols", pyLSgetKBestMIPSols, METH_VARARGS },
-    { "pyLSgetLicenseInfo", pyLSgetLicenseInfo, METH_VARARGS },
-    { "pyLSgetMasterModel", pyLSgetMasterModel, METH_VARARGS },
-    { "pyLSgetMIPCallbackInfo", pyLSgetMIPCallbackInfo, METH_VARARGS },
-    { "pyLSgetMIPSolutionStatus", pyLSgetMIPSolutionStatus, METH_VARARGS },
-    { "pyLSgetMIPSolutionStatus", pyLSgetMIPSolutionStatus, METH_VARARGS },
-    { "pyLSgetNextBestSol", pyLSgetNextBestSol, METH_VARARGS },
-    { "pyLSgetNnzData", pyLSgetNnzData, METH_VARARGS },
-    { "pyLSgetObjectiveRanges", pyLSgetObjectiveRanges, METH_VARARGS },
-    { "pyLSgetObjPoolNumSol", pyLSgetObjPoolNumSol, METH_VARARGS },
-    { "pyLSgetOrbitInfo", pyLSgetOrbitInfo, METH_VARARGS },
-    { "pyLSgetPOSDData", pyLSgetPOSDData, METH_VARARGS },
-    { "pyLSgetPOSDDatai", pyLSgetPOSDDatai, METH_VARARGS },
-    { "pyLSgetMIPSolutionStatus", pyLSgetMIPSolutionStatus, METH_VARARGS },
-    { "pyLSgetObjectiveRanges", pyLSgetObjectiveRanges, METH_VARARGS },
-    { "pyLSgetProgressInfo", pyLSgetProgressInfo, METH_VARARGS },
-    { "pyLSgetSolutionInfo", pyLSgetSolutionInfo, METH_VARARGS },
-    { "pyLSgetSolutionStatus", pyLSgetSolutionStatus, METH_VARARGS },
-    { "pyLSgetXSolverLibrary", pyLSgetXSolverLibrary, METH_VARARGS },
-    { "pyLSloadALLDIFFData", pyLSloadALLDIFFData, METH_VARARGS },
-    { "pyLSloadGASolution", pyLSloadGASolution, METH_VARARGS },
-    { "pyLSloadIISPriorities", pyLSloadIISPriorities, METH_VARARGS },
-    { "pyLSloadMultiStartSolution", pyLSloadMultiStartSolution, METH_VARARGS },
-    { "pyLSloadNLPDense", pyLSloadNLPDense, METH_VARARGS },
-    { "pyLSloadPOSDData", pyLSloadPOSDData, METH_VARARGS },
-    { "pyLSloadSolutionAt", pyLSloadSolutionAt, METH_VARARGS },
-    { "pyLSloadStringData", pyLSloadStringData, METH_VARARGS },
-    { "pyLSloadStringData", pyLSloadStringData, METH_VARARGS },
-    { "pyLSreadMPXStream", pyLSreadMPXStream, METH_VARARGS },
-    { "pyLSsetObjPoolParam", pyLSsetObjPoolParam, METH_VARARGS },
-    { "pyLSsetProbAllocSizes", pyLSsetProbAllocSizes, METH_VARARGS },
-    { "pyLSsetProbNameAllocSizes", pyLSsetProbNameAllocSizes, METH_VARARGS },
-    { "pyLSsetSETSStatei", pyLSsetSETSStatei, METH_VARARGS },
-    { "pyLSsetXSolverLibrary", pyLSsetXSolverLibrary, METH_VARARGS },
-    { "pyLSsetConstraintProperty", pyLSsetConstraintProperty, METH_VARARGS },
-    { "pyLSregress", pyLSregress, METH_VARARGS },
-    { "pyLSremObjPool", pyLSremObjPool, METH_VARARGS },
-    { "pyLSgetObjectiveRanges", pyLSgetObjectiveRanges, METH_VARARGS },
-    { "pyLSgetMIPSolutionStatus", pyLSgetMIPSolutionStatus, METH_VARARGS },
-    { "pyLSgetMIPSolution", pyLSgetMIPSolution, METH_VARARGS },
-    { "pyLSgetObjective", pyLSgetObjective, METH_VARARGS },
-    { "pyLSsetGOPVariablePriority", pyLSsetGOPVariablePriority, METH_VARARGS },
-    { "pyLSgetStringValue", pyLSgetStringValue, METH_VARARGS },
-    { "pyLSrepairQterms", pyLSrepairQterms, METH_VARARGS },
-    { "pyLSsetMIPCCStrategy", pyLSsetMIPCCStrategy, METH_VARARGS },
-    { "pyLSsetModelLogfunc", pyLSsetModelLogfunc, METH_VARARGS },
-    { "pyLSsetEnvLogfunc", pyLSsetEnvLogfunc, METH_VARARGS },
-    { "pyLSsetCallback", pyLSsetCallback, METH_VARARGS },
-    { "pyLSsetMIPCallback", pyLSsetMIPCallback, METH_VARARGS },
-    { "pyLSsetFuncalc", pyLSsetFuncalc, METH_VARARGS },
-    { "pyLSsetGradcalc", pyLSsetGradcalc, METH_VARARGS },
-    { "pyLSwriteTunerParameters", pyLSwriteTunerParameters, METH_VARARGS },
-    { "pyLSloadIndData", pyLSloadIndData, METH_VARARGS },
-    { "pyLSdeleteIndConstraints", pyLSdeleteIndConstraints, METH_VARARGS },
+    {"pyLScreateEnv", (PyCFunction)(void(*)(void))pyLScreateEnv, METH_FASTCALL},
+    {"pyLScreateModel", (PyCFunction)(void(*)(void))pyLScreateModel, METH_FASTCALL},
+    {"pyLSdeleteEnv", (PyCFunction)(void(*)(void))pyLSdeleteEnv, METH_FASTCALL},
+    {"pyLSdeleteModel", (PyCFunction)(void(*)(void))pyLSdeleteModel, METH_FASTCALL},
+    {"pyLScopyParam", (PyCFunction)(void(*)(void))pyLScopyParam, METH_FASTCALL},
+    {"pyLSloadLicenseString", (PyCFunction)(void(*)(void))pyLSloadLicenseString, METH_FASTCALL},
+    {"pyLSgetVersionInfo", (PyCFunction)(void(*)(void))pyLSgetVersionInfo, METH_FASTCALL},
+    {"pyLSreadMPSFile", (PyCFunction)(void(*)(void))pyLSreadMPSFile, METH_FASTCALL},
+    {"pyLSwriteMPSFile", (PyCFunction)(void(*)(void))pyLSwriteMPSFile, METH_FASTCALL},
+    {"pyLSreadLINDOFile", (PyCFunction)(void(*)(void))pyLSreadLINDOFile, METH_FASTCALL},
+    {"pyLSwriteLINDOFile", (PyCFunction)(void(*)(void))pyLSwriteLINDOFile, METH_FASTCALL},
+    {"pyLSreadLINDOStream", (PyCFunction)(void(*)(void))pyLSreadLINDOStream, METH_FASTCALL},
+    {"pyLSwriteLINGOFile", (PyCFunction)(void(*)(void))pyLSwriteLINGOFile, METH_FASTCALL},
+    {"pyLSwriteDualMPSFile", (PyCFunction)(void(*)(void))pyLSwriteDualMPSFile, METH_FASTCALL},
+    {"pyLSwriteSolution", (PyCFunction)(void(*)(void))pyLSwriteSolution, METH_FASTCALL},
+    {"pyLSwriteSolutionOfType", (PyCFunction)(void(*)(void))pyLSwriteSolutionOfType, METH_FASTCALL},
+    {"pyLSwriteIIS", (PyCFunction)(void(*)(void))pyLSwriteIIS, METH_FASTCALL},
+    {"pyLSwriteIUS", (PyCFunction)(void(*)(void))pyLSwriteIUS, METH_FASTCALL},
+    {"pyLSreadMPIFile", (PyCFunction)(void(*)(void))pyLSreadMPIFile, METH_FASTCALL},
+    {"pyLSwriteMPIFile", (PyCFunction)(void(*)(void))pyLSwriteMPIFile, METH_FASTCALL},
+    {"pyLSwriteWithSetsAndSC", (PyCFunction)(void(*)(void))pyLSwriteWithSetsAndSC, METH_FASTCALL},
+    {"pyLSreadBasis", (PyCFunction)(void(*)(void))pyLSreadBasis, METH_FASTCALL},
+    {"pyLSwriteBasis", (PyCFunction)(void(*)(void))pyLSwriteBasis, METH_FASTCALL},
+    {"pyLSreadLPFile", (PyCFunction)(void(*)(void))pyLSreadLPFile, METH_FASTCALL},
+    {"pyLSreadLPStream", (PyCFunction)(void(*)(void))pyLSreadLPStream, METH_FASTCALL},
+    {"pyLSgetErrorMessage", (PyCFunction)(void(*)(void))pyLSgetErrorMessage, METH_FASTCALL},
+    {"pyLSgetFileError", (PyCFunction)(void(*)(void))pyLSgetFileError, METH_FASTCALL},
+    {"pyLSgetErrorRowIndex", (PyCFunction)(void(*)(void))pyLSgetErrorRowIndex, METH_FASTCALL},
+    {"pyLSsetModelParameter", (PyCFunction)(void(*)(void))pyLSsetModelParameter, METH_FASTCALL},
+    {"pyLSgetModelParameterr", (PyCFunction)(void(*)(void))pyLSgetModelParameter, METH_FASTCALL},
+    {"pyLSsetEnvParameter", (PyCFunction)(void(*)(void))pyLSsetEnvParameter, METH_FASTCALL},
+    {"pyLSgetEnvParameter", (PyCFunction)(void(*)(void))pyLSgetEnvParameter, METH_FASTCALL},
+    {"pyLSsetModelDouParameter", (PyCFunction)(void(*)(void))pyLSsetModelDouParameter, METH_FASTCALL},
+    {"pyLSgetModelDouParameter", (PyCFunction)(void(*)(void))pyLSgetModelDouParameter, METH_FASTCALL},
+    {"pyLSsetModelIntParameter", (PyCFunction)(void(*)(void))pyLSsetModelIntParameter, METH_FASTCALL},
+    {"pyLSgetModelIntParameter", (PyCFunction)(void(*)(void))pyLSgetModelIntParameter, METH_FASTCALL},
+    {"pyLSsetEnvDouParameter", (PyCFunction)(void(*)(void))pyLSsetEnvDouParameter, METH_FASTCALL},
+    {"pyLSgetEnvDouParameter", (PyCFunction)(void(*)(void))pyLSgetEnvDouParameter, METH_FASTCALL},
+    {"pyLSsetEnvIntParameter", (PyCFunction)(void(*)(void))pyLSsetEnvIntParameter, METH_FASTCALL},
+    {"pyLSgetEnvIntParameter", (PyCFunction)(void(*)(void))pyLSgetEnvIntParameter, METH_FASTCALL},
+    {"pyLSreadModelParameter", (PyCFunction)(void(*)(void))pyLSreadModelParameter, METH_FASTCALL},
+    {"pyLSreadEnvParameter", (PyCFunction)(void(*)(void))pyLSreadEnvParameter, METH_FASTCALL},
+    {"pyLSwriteModelParameter", (PyCFunction)(void(*)(void))pyLSwriteModelParameter, METH_FASTCALL},
+    {"pyLSgetIntParameterRange", (PyCFunction)(void(*)(void))pyLSgetIntParameterRange, METH_FASTCALL},
+    {"pyLSgetDouParameterRange", (PyCFunction)(void(*)(void))pyLSgetDouParameterRange, METH_FASTCALL},
+    {"pyLSgetParamShortDesc", (PyCFunction)(void(*)(void))pyLSgetParamShortDesc, METH_FASTCALL},
+    {"pyLSgetParamLongDesc", (PyCFunction)(void(*)(void))pyLSgetParamLongDesc, METH_FASTCALL},
+    {"pyLSgetParamMacroName", (PyCFunction)(void(*)(void))pyLSgetParamMacroName, METH_FASTCALL},
+    {"pyLSgetParamMacroID", (PyCFunction)(void(*)(void))pyLSgetParamMacroID, METH_FASTCALL},
+    {"pyLSloadLPData", (PyCFunction)(void(*)(void))pyLSloadLPData, METH_FASTCALL},
+    {"pyLSloadQCData", (PyCFunction)(void(*)(void))pyLSloadQCData, METH_FASTCALL},
+    {"pyLSloadConeData", (PyCFunction)(void(*)(void))pyLSloadConeData, METH_FASTCALL},
+    {"pyLSloadSETSData", (PyCFunction)(void(*)(void))pyLSloadSETSData, METH_FASTCALL},
+    {"pyLSloadSemiContData", (PyCFunction)(void(*)(void))pyLSloadSemiContData, METH_FASTCALL},
+    {"pyLSloadVarType", (PyCFunction)(void(*)(void))pyLSloadVarType, METH_FASTCALL},
+    {"pyLSloadNLPData", (PyCFunction)(void(*)(void))pyLSloadNLPData, METH_FASTCALL},
+    {"pyLSloadInstruct", (PyCFunction)(void(*)(void))pyLSloadInstruct, METH_FASTCALL},
+    {"pyLSaddInstruct", (PyCFunction)(void(*)(void))pyLSaddInstruct, METH_FASTCALL},
+    {"pyLSloadBasis", (PyCFunction)(void(*)(void))pyLSloadBasis, METH_FASTCALL},
+    {"pyLSloadVarPriorities", (PyCFunction)(void(*)(void))pyLSloadVarPriorities, METH_FASTCALL},
+    {"pyLSreadVarPriorities", (PyCFunction)(void(*)(void))pyLSreadVarPriorities, METH_FASTCALL},
+    {"pyLSloadVarStartPoint", (PyCFunction)(void(*)(void))pyLSloadVarStartPoint, METH_FASTCALL},
+    {"pyLSloadVarStartPointPartial", (PyCFunction)(void(*)(void))pyLSloadVarStartPointPartial, METH_FASTCALL},
+    {"pyLSloadMIPVarStartPoint", (PyCFunction)(void(*)(void))pyLSloadMIPVarStartPoint, METH_FASTCALL},
+    {"pyLSloadMIPVarStartPointPartial", (PyCFunction)(void(*)(void))pyLSloadMIPVarStartPointPartial, METH_FASTCALL},
+    {"pyLSreadVarStartPoint", (PyCFunction)(void(*)(void))pyLSreadVarStartPoint, METH_FASTCALL},
+    {"pyLSloadBlockStructure", (PyCFunction)(void(*)(void))pyLSloadBlockStructure, METH_FASTCALL},
+    {"pyLSoptimize", (PyCFunction)(void(*)(void))pyLSoptimize, METH_FASTCALL},
+    {"pyLSsolveMIP", (PyCFunction)(void(*)(void))pyLSsolveMIP, METH_FASTCALL},
+    {"pyLSsolveGOP", (PyCFunction)(void(*)(void))pyLSsolveGOP, METH_FASTCALL},
+    {"pyLSoptimizeQP", (PyCFunction)(void(*)(void))pyLSoptimizeQP, METH_FASTCALL},
+    {"pyLScheckConvexity", (PyCFunction)(void(*)(void))pyLScheckConvexity, METH_FASTCALL},
+    {"pyLSsolveSBD", (PyCFunction)(void(*)(void))pyLSsolveSBD, METH_FASTCALL},
+    {"pyLSgetInfo", (PyCFunction)(void(*)(void))pyLSgetInfo, METH_FASTCALL},
+    {"pyLSgetPrimalSolution", (PyCFunction)(void(*)(void))pyLSgetPrimalSolution, METH_FASTCALL},
+    {"pyLSgetDualSolution", (PyCFunction)(void(*)(void))pyLSgetDualSolution, METH_FASTCALL},
+    {"pyLSgetReducedCosts", (PyCFunction)(void(*)(void))pyLSgetReducedCosts, METH_FASTCALL},
+    {"pyLSgetReducedCostsCone", (PyCFunction)(void(*)(void))pyLSgetReducedCostsCone, METH_FASTCALL},
+    {"pyLSgetSlacks", (PyCFunction)(void(*)(void))pyLSgetSlacks, METH_FASTCALL},
+    {"pyLSgetBasis", (PyCFunction)(void(*)(void))pyLSgetBasis, METH_FASTCALL},
+    {"pyLSgetSolution", (PyCFunction)(void(*)(void))pyLSgetSolution, METH_FASTCALL},
+    {"pyLSgetMIPPrimalSolution", (PyCFunction)(void(*)(void))pyLSgetMIPPrimalSolution, METH_FASTCALL},
+    {"pyLSgetMIPDualSolution", (PyCFunction)(void(*)(void))pyLSgetMIPDualSolution, METH_FASTCALL},
+    {"pyLSgetMIPReducedCosts", (PyCFunction)(void(*)(void))pyLSgetMIPReducedCosts, METH_FASTCALL},
+    {"pyLSgetMIPSlacks", (PyCFunction)(void(*)(void))pyLSgetMIPSlacks, METH_FASTCALL},
+    {"pyLSgetMIPBasis", (PyCFunction)(void(*)(void))pyLSgetMIPBasis, METH_FASTCALL},
+    {"pyLSgetNextBestMIPSol", (PyCFunction)(void(*)(void))pyLSgetNextBestMIPSol, METH_FASTCALL},
+    {"pyLSgetLPData", (PyCFunction)(void(*)(void))pyLSgetLPData, METH_FASTCALL},
+    {"pyLSgetQCData", (PyCFunction)(void(*)(void))pyLSgetQCData, METH_FASTCALL},
+    {"pyLSgetQCDatai", (PyCFunction)(void(*)(void))pyLSgetQCDatai, METH_FASTCALL},
+    {"pyLSgetVarType", (PyCFunction)(void(*)(void))pyLSgetVarType, METH_FASTCALL},
+    {"pyLSgetVarStartPoint", (PyCFunction)(void(*)(void))pyLSgetVarStartPoint, METH_FASTCALL},
+    {"pyLSgetVarStartPointPartial", (PyCFunction)(void(*)(void))pyLSgetVarStartPointPartial, METH_FASTCALL},
+    {"pyLSgetMIPVarStartPointPartial", (PyCFunction)(void(*)(void))pyLSgetMIPVarStartPointPartial, METH_FASTCALL},
+    {"pyLSgetMIPVarStartPoint", (PyCFunction)(void(*)(void))pyLSgetMIPVarStartPoint, METH_FASTCALL},
+    {"pyLSgetSETSData", (PyCFunction)(void(*)(void))pyLSgetSETSData, METH_FASTCALL},
+    {"pyLSgetSETSDatai", (PyCFunction)(void(*)(void))pyLSgetSETSDatai, METH_FASTCALL},
+    {"pyLSgetSemiContData", (PyCFunction)(void(*)(void))pyLSgetSemiContData, METH_FASTCALL},
+    {"pyLSgetLPVariableDataj", (PyCFunction)(void(*)(void))pyLSgetLPVariableDataj, METH_FASTCALL},
+    {"pyLSgetVariableNamej", (PyCFunction)(void(*)(void))pyLSgetVariableNamej, METH_FASTCALL},
+    {"pyLSgetVariableIndex", (PyCFunction)(void(*)(void))pyLSgetVariableIndex, METH_FASTCALL},
+    {"pyLSgetConstraintNamei", (PyCFunction)(void(*)(void))pyLSgetConstraintNamei, METH_FASTCALL},
+    {"pyLSgetConstraintIndex", (PyCFunction)(void(*)(void))pyLSgetConstraintIndex, METH_FASTCALL},
+    {"pyLSgetConstraintDatai", (PyCFunction)(void(*)(void))pyLSgetConstraintDatai, METH_FASTCALL},
+    {"pyLSgetLPConstraintDatai", (PyCFunction)(void(*)(void))pyLSgetLPConstraintDatai, METH_FASTCALL},
+    {"pyLSgetConeNamei", (PyCFunction)(void(*)(void))pyLSgetConeNamei, METH_FASTCALL},
+    {"pyLSgetConeIndex", (PyCFunction)(void(*)(void))pyLSgetConeIndex, METH_FASTCALL},
+    {"pyLSgetConeDatai", (PyCFunction)(void(*)(void))pyLSgetConeDatai, METH_FASTCALL},
+    {"pyLSgetNLPData", (PyCFunction)(void(*)(void))pyLSgetNLPData, METH_FASTCALL},
+    {"pyLSgetNLPConstraintDatai", (PyCFunction)(void(*)(void))pyLSgetNLPConstraintDatai, METH_FASTCALL},
+    {"pyLSgetNLPVariableDataj", (PyCFunction)(void(*)(void))pyLSgetNLPVariableDataj, METH_FASTCALL},
+    {"pyLSgetNLPObjectiveData", (PyCFunction)(void(*)(void))pyLSgetNLPObjectiveData, METH_FASTCALL},
+    {"pyLSgetInstruct", (PyCFunction)(void(*)(void))pyLSgetInstruct, METH_FASTCALL},
+    {"pyLScalinfeasMIPsolution", (PyCFunction)(void(*)(void))pyLScalinfeasMIPsolution, METH_FASTCALL},
+    {"pyLSgetRoundMIPsolution", (PyCFunction)(void(*)(void))pyLSgetRoundMIPsolution, METH_FASTCALL},
+    {"pyLSgetDuplicateColumns", (PyCFunction)(void(*)(void))pyLSgetDuplicateColumns, METH_FASTCALL},
+    {"pyLSgetRangeData", (PyCFunction)(void(*)(void))pyLSgetRangeData, METH_FASTCALL},
+    {"pyLSaddConstraints", (PyCFunction)(void(*)(void))pyLSaddConstraints, METH_FASTCALL},
+    {"pyLSaddVariables", (PyCFunction)(void(*)(void))pyLSaddVariables, METH_FASTCALL},
+    {"pyLSaddCones", (PyCFunction)(void(*)(void))pyLSaddCones, METH_FASTCALL},
+    {"pyLSaddSETS", (PyCFunction)(void(*)(void))pyLSaddSETS, METH_FASTCALL},
+    {"pyLSaddQCterms", (PyCFunction)(void(*)(void))pyLSaddQCterms, METH_FASTCALL},
+    {"pyLSdeleteConstraints", (PyCFunction)(void(*)(void))pyLSdeleteConstraints, METH_FASTCALL},
+    {"pyLSdeleteCones", (PyCFunction)(void(*)(void))pyLSdeleteCones, METH_FASTCALL},
+    {"pyLSdeleteSETS", (PyCFunction)(void(*)(void))pyLSdeleteSETS, METH_FASTCALL},
+    {"pyLSdeleteSemiContVars", (PyCFunction)(void(*)(void))pyLSdeleteSemiContVars, METH_FASTCALL},
+    {"pyLSdeleteVariables", (PyCFunction)(void(*)(void))pyLSdeleteVariables, METH_FASTCALL},
+    {"pyLSdeleteQCterms", (PyCFunction)(void(*)(void))pyLSdeleteQCterms, METH_FASTCALL},
+    {"pyLSdeleteAj", (PyCFunction)(void(*)(void))pyLSdeleteAj, METH_FASTCALL},
+    {"pyLSmodifyLowerBounds", (PyCFunction)(void(*)(void))pyLSmodifyLowerBounds, METH_FASTCALL},
+    {"pyLSmodifyUpperBounds", (PyCFunction)(void(*)(void))pyLSmodifyUpperBounds, METH_FASTCALL},
+    {"pyLSmodifyRHS", (PyCFunction)(void(*)(void))pyLSmodifyRHS, METH_FASTCALL},
+    {"pyLSmodifyObjective", (PyCFunction)(void(*)(void))pyLSmodifyObjective, METH_FASTCALL},
+    {"pyLSmodifyObjConstant", (PyCFunction)(void(*)(void))pyLSmodifyObjConstant, METH_FASTCALL},
+    {"pyLSmodifyAj", (PyCFunction)(void(*)(void))pyLSmodifyAj, METH_FASTCALL},
+    {"pyLSmodifyCone", (PyCFunction)(void(*)(void))pyLSmodifyCone, METH_FASTCALL},
+    {"pyLSmodifySET", (PyCFunction)(void(*)(void))pyLSmodifySET, METH_FASTCALL},
+    {"pyLSmodifySemiContVars", (PyCFunction)(void(*)(void))pyLSmodifySemiContVars, METH_FASTCALL},
+    {"pyLSmodifyConstraintType", (PyCFunction)(void(*)(void))pyLSmodifyConstraintType, METH_FASTCALL},
+    {"pyLSmodifyVariableType", (PyCFunction)(void(*)(void))pyLSmodifyVariableType, METH_FASTCALL},
+    {"pyLSaddNLPAj", (PyCFunction)(void(*)(void))pyLSaddNLPAj, METH_FASTCALL},
+    {"pyLSaddNLPobj", (PyCFunction)(void(*)(void))pyLSaddNLPobj, METH_FASTCALL},
+    {"pyLSdeleteNLPobj", (PyCFunction)(void(*)(void))pyLSdeleteNLPobj, METH_FASTCALL},
+    {"pyLSgetConstraintRanges", (PyCFunction)(void(*)(void))pyLSgetConstraintRanges, METH_FASTCALL},
+    {"pyLSdeleteNLPobj", (PyCFunction)(void(*)(void))pyLSdeleteNLPobj, METH_FASTCALL},
+    {"pyLSgetBoundRanges", (PyCFunction)(void(*)(void))pyLSgetBoundRanges, METH_FASTCALL},
+    {"pyLSgetBestBounds", (PyCFunction)(void(*)(void))pyLSgetBoundRanges, METH_FASTCALL},
+    {"pyLSfindIIS", (PyCFunction)(void(*)(void))pyLSfindIIS, METH_FASTCALL},
+    {"pyLSfindIUS", (PyCFunction)(void(*)(void))pyLSfindIUS, METH_FASTCALL},
+    {"pyLSgetIIS", (PyCFunction)(void(*)(void))pyLSgetIIS, METH_FASTCALL},
+    {"pyLSgetBlockStructure", (PyCFunction)(void(*)(void))pyLSgetBlockStructure, METH_FASTCALL},
+    {"pyLSwriteDeteqMPSFile", (PyCFunction)(void(*)(void))pyLSwriteDeteqMPSFile, METH_FASTCALL},
+    {"pyLSwriteDeteqLINDOFile", (PyCFunction)(void(*)(void))pyLSwriteDeteqLINDOFile, METH_FASTCALL},
+    {"pyLSwriteSMPSFile", (PyCFunction)(void(*)(void))pyLSwriteSMPSFile, METH_FASTCALL},
+    {"pyLSreadSMPSFile", (PyCFunction)(void(*)(void))pyLSreadSMPSFile, METH_FASTCALL},
+    {"pyLSwriteSMPIFile", (PyCFunction)(void(*)(void))pyLSwriteSMPIFile, METH_FASTCALL},
+    {"pyLSreadSMPIFile", (PyCFunction)(void(*)(void))pyLSreadSMPIFile, METH_FASTCALL},
+    {"pyLSwriteScenarioSolutionFile", (PyCFunction)(void(*)(void))pyLSwriteScenarioSolutionFile, METH_FASTCALL},
+    {"pyLSwriteNodeSolutionFile", (PyCFunction)(void(*)(void))pyLSwriteNodeSolutionFile, METH_FASTCALL},
+    {"pyLSwriteScenarioMPIFile", (PyCFunction)(void(*)(void))pyLSwriteScenarioMPIFile, METH_FASTCALL},
+    {"pyLSwriteScenarioMPSFile", (PyCFunction)(void(*)(void))pyLSwriteScenarioMPSFile, METH_FASTCALL},
+    {"pyLSwriteScenarioLINDOFile", (PyCFunction)(void(*)(void))pyLSwriteScenarioLINDOFile, METH_FASTCALL},
+    {"pyLSgetModelStocDouParameter", (PyCFunction)(void(*)(void))pyLSgetModelStocDouParameter, METH_FASTCALL},
+    {"pyLSsetModelStocIntParameter", (PyCFunction)(void(*)(void))pyLSsetModelStocIntParameter, METH_FASTCALL},
+    {"pyLSgetModelStocIntParameter", (PyCFunction)(void(*)(void))pyLSgetModelStocIntParameter, METH_FASTCALL},
+    {"pyLSgetScenarioIndex", (PyCFunction)(void(*)(void))pyLSgetScenarioIndex, METH_FASTCALL},
+    {"pyLSgetStageIndex", (PyCFunction)(void(*)(void))pyLSgetStageIndex, METH_FASTCALL},
+    {"pyLSgetStocParIndex", (PyCFunction)(void(*)(void))pyLSgetStocParIndex, METH_FASTCALL},
+    {"pyLSgetStocParName", (PyCFunction)(void(*)(void))pyLSgetStocParName, METH_FASTCALL},
+    {"pyLSgetScenarioName", (PyCFunction)(void(*)(void))pyLSgetScenarioName, METH_FASTCALL},
+    {"pyLSgetStageName", (PyCFunction)(void(*)(void))pyLSgetStageName, METH_FASTCALL},
+    {"pyLSgetStocInfo", (PyCFunction)(void(*)(void))pyLSgetStocInfo, METH_FASTCALL},
+    {"pyLSgetStocCCPInfo", (PyCFunction)(void(*)(void))pyLSgetStocCCPInfo, METH_FASTCALL},
+    {"pyLSloadSampleSizes", (PyCFunction)(void(*)(void))pyLSloadSampleSizes, METH_FASTCALL},
+    {"pyLSloadConstraintStages", (PyCFunction)(void(*)(void))pyLSloadConstraintStages, METH_FASTCALL},
+    {"pyLSloadVariableStages", (PyCFunction)(void(*)(void))pyLSloadVariableStages, METH_FASTCALL},
+    {"pyLSloadStageData", (PyCFunction)(void(*)(void))pyLSloadStageData, METH_FASTCALL},
+    {"pyLSloadStocParData", (PyCFunction)(void(*)(void))pyLSloadStocParData, METH_FASTCALL},
+    {"pyLSgetDeteqModel", (PyCFunction)(void(*)(void))pyLSgetDeteqModel, METH_FASTCALL},
+    {"pyLSaggregateStages", (PyCFunction)(void(*)(void))pyLSaggregateStages, METH_FASTCALL},
+    {"pyLSgetStageAggScheme", (PyCFunction)(void(*)(void))pyLSgetStageAggScheme, METH_FASTCALL},
+    {"pyLSsolveSP", (PyCFunction)(void(*)(void))pyLSsolveSP, METH_FASTCALL},
+    {"pyLSsolveHS", (PyCFunction)(void(*)(void))pyLSsolveHS, METH_FASTCALL},
+    {"pyLSgetScenarioObjective", (PyCFunction)(void(*)(void))pyLSgetScenarioObjective, METH_FASTCALL},
+    {"pyLSgetNodePrimalSolution", (PyCFunction)(void(*)(void))pyLSgetNodePrimalSolution, METH_FASTCALL},
+    {"pyLSgetNodeDualSolution", (PyCFunction)(void(*)(void))pyLSgetNodeDualSolution, METH_FASTCALL},
+    {"pyLSgetNodeReducedCost", (PyCFunction)(void(*)(void))pyLSgetNodeReducedCost, METH_FASTCALL},
+    {"pyLSgetNodeSlacks", (PyCFunction)(void(*)(void))pyLSgetNodeSlacks, METH_FASTCALL},
+    {"pyLSgetScenarioPrimalSolution", (PyCFunction)(void(*)(void))pyLSgetScenarioPrimalSolution, METH_FASTCALL},
+    {"pyLSgetScenarioReducedCost", (PyCFunction)(void(*)(void))pyLSgetScenarioReducedCost, METH_FASTCALL},
+    {"pyLSgetScenarioDualSolution", (PyCFunction)(void(*)(void))pyLSgetScenarioDualSolution, METH_FASTCALL},
+    {"pyLSgetScenarioSlacks", (PyCFunction)(void(*)(void))pyLSgetScenarioSlacks, METH_FASTCALL},
+    {"pyLSgetNodeListByScenario", (PyCFunction)(void(*)(void))pyLSgetNodeListByScenario, METH_FASTCALL},
+    {"pyLSgetProbabilityByScenario", (PyCFunction)(void(*)(void))pyLSgetProbabilityByScenario, METH_FASTCALL},
+    {"pyLSgetProbabilityByNode", (PyCFunction)(void(*)(void))pyLSgetProbabilityByNode, METH_FASTCALL},
+    {"pyLSgetStocParData", (PyCFunction)(void(*)(void))pyLSgetStocParData, METH_FASTCALL},
+    {"pyLSaddDiscreteBlocks", (PyCFunction)(void(*)(void))pyLSaddDiscreteBlocks, METH_FASTCALL},
+    {"pyLSaddScenario", (PyCFunction)(void(*)(void))pyLSaddScenario, METH_FASTCALL},
+    {"pyLSaddDiscreteIndep", (PyCFunction)(void(*)(void))pyLSaddDiscreteIndep, METH_FASTCALL},
+    {"pyLSaddParamDistIndep", (PyCFunction)(void(*)(void))pyLSaddParamDistIndep, METH_FASTCALL},
+    {"pyLSaddChanceConstraint", (PyCFunction)(void(*)(void))pyLSaddChanceConstraint, METH_FASTCALL},
+    {"pyLSsetNumStages", (PyCFunction)(void(*)(void))pyLSsetNumStages, METH_FASTCALL},
+    {"pyLSgetStocParOutcomes", (PyCFunction)(void(*)(void))pyLSgetStocParOutcomes, METH_FASTCALL},
+    {"pyLSloadCorrelationMatrix", (PyCFunction)(void(*)(void))pyLSloadCorrelationMatrix, METH_FASTCALL},
+    {"pyLSgetCorrelationMatrix", (PyCFunction)(void(*)(void))pyLSgetCorrelationMatrix, METH_FASTCALL},
+    {"pyLSgetStocParSample", (PyCFunction)(void(*)(void))pyLSgetStocParSample, METH_FASTCALL},
+    {"pyLSgetDiscreteBlocks", (PyCFunction)(void(*)(void))pyLSgetDiscreteBlocks, METH_FASTCALL},
+    {"pyLSgetDiscreteBlockOutcomes", (PyCFunction)(void(*)(void))pyLSgetDiscreteBlockOutcomes, METH_FASTCALL},
+    {"pyLSgetDiscreteIndep", (PyCFunction)(void(*)(void))pyLSgetDiscreteIndep, METH_FASTCALL},
+    {"pyLSgetParamDistIndep", (PyCFunction)(void(*)(void))pyLSgetParamDistIndep, METH_FASTCALL},
+    {"pyLSgetScenario", (PyCFunction)(void(*)(void))pyLSgetScenario, METH_FASTCALL},
+    {"pyLSgetChanceConstraint", (PyCFunction)(void(*)(void))pyLSgetChanceConstraint, METH_FASTCALL},
+    {"pyLSgetSampleSizes", (PyCFunction)(void(*)(void))pyLSgetSampleSizes, METH_FASTCALL},
+    {"pyLSgetConstraintStages", (PyCFunction)(void(*)(void))pyLSgetConstraintStages, METH_FASTCALL},
+    {"pyLSgetVariableStages", (PyCFunction)(void(*)(void))pyLSgetVariableStages, METH_FASTCALL},
+    {"pyLSgetStocRowIndices", (PyCFunction)(void(*)(void))pyLSgetStocRowIndices, METH_FASTCALL},
+    {"pyLSsetStocParRG", (PyCFunction)(void(*)(void))pyLSsetStocParRG, METH_FASTCALL},
+    {"pyLSgetScenarioModel", (PyCFunction)(void(*)(void))pyLSgetScenarioModel, METH_FASTCALL},
+    {"pyLSfreeStocMemory", (PyCFunction)(void(*)(void))pyLSfreeStocMemory, METH_FASTCALL},
+    {"pyLSfreeStocHashMemory", (PyCFunction)(void(*)(void))pyLSfreeStocHashMemory, METH_FASTCALL},
+    {"pyLSgetModelStocParameter", (PyCFunction)(void(*)(void))pyLSgetModelStocParameter, METH_FASTCALL},
+    {"pyLSsetModelStocParameter", (PyCFunction)(void(*)(void))pyLSsetModelStocParameter, METH_FASTCALL},
+    {"pyLSsetEnvStocParameter", (PyCFunction)(void(*)(void))pyLSsetEnvStocParameter, METH_FASTCALL},
+    {"pyLSgetEnvStocParameter", (PyCFunction)(void(*)(void))pyLSgetEnvStocParameter, METH_FASTCALL},
+    {"pyLSsampCreate", (PyCFunction)(void(*)(void))pyLSsampCreate, METH_FASTCALL},
+    {"pyLSsampDelete", (PyCFunction)(void(*)(void))pyLSsampDelete, METH_FASTCALL},
+    {"pyLSsampSetDistrParam", (PyCFunction)(void(*)(void))pyLSsampSetDistrParam, METH_FASTCALL},
+    {"pyLSsampGetDistrParam", (PyCFunction)(void(*)(void))pyLSsampGetDistrParam, METH_FASTCALL},
+    {"pyLSsampEvalDistr", (PyCFunction)(void(*)(void))pyLSsampEvalDistr, METH_FASTCALL},
+    {"pyLSsampEvalDistrLI", (PyCFunction)(void(*)(void))pyLSsampEvalDistrLI, METH_FASTCALL},
+    {"pyLSsampEvalUserDistr", (PyCFunction)(void(*)(void))pyLSsampEvalUserDistr, METH_FASTCALL},
+    {"pyLSsampSetRG", (PyCFunction)(void(*)(void))pyLSsampSetRG, METH_FASTCALL},
+    {"pyLSsampGenerate", (PyCFunction)(void(*)(void))pyLSsampGenerate, METH_FASTCALL},
+    {"pyLSsampGetPoints", (PyCFunction)(void(*)(void))pyLSsampGetPoints, METH_FASTCALL},
+    {"pyLSsampLoadPoints", (PyCFunction)(void(*)(void))pyLSsampLoadPoints, METH_FASTCALL},
+    {"pyLSsampGetCIPoints", (PyCFunction)(void(*)(void))pyLSsampGetCIPoints, METH_FASTCALL},
+    {"pyLSsampLoadDiscretePdfTable", (PyCFunction)(void(*)(void))pyLSsampLoadDiscretePdfTable, METH_FASTCALL},
+    {"pyLSsampGetDiscretePdfTable", (PyCFunction)(void(*)(void))pyLSsampGetDiscretePdfTable, METH_FASTCALL},
+    {"pyLSsampGetInfo", (PyCFunction)(void(*)(void))pyLSsampGetInfo, METH_FASTCALL},
+    {"pyLSsampAddUserFuncArg", (PyCFunction)(void(*)(void))pyLSsampAddUserFuncArg, METH_FASTCALL},
+    {"pyLScreateRG", (PyCFunction)(void(*)(void))pyLScreateRG, METH_FASTCALL},
+    {"pyLScreateRGMT", (PyCFunction)(void(*)(void))pyLScreateRGMT, METH_FASTCALL},
+    {"pyLSgetDoubleRV", (PyCFunction)(void(*)(void))pyLSgetDoubleRV, METH_FASTCALL},
+    {"pyLSgetInt32RV", (PyCFunction)(void(*)(void))pyLSgetInt32RV, METH_FASTCALL},
+    {"pyLSsetRGSeed", (PyCFunction)(void(*)(void))pyLSsetRGSeed, METH_FASTCALL},
+    {"pyLSdisposeRG", (PyCFunction)(void(*)(void))pyLSdisposeRG, METH_FASTCALL},
+    {"pyLSsetDistrParamRG", (PyCFunction)(void(*)(void))pyLSsetDistrParamRG, METH_FASTCALL},
+    {"pyLSsetDistrRG", (PyCFunction)(void(*)(void))pyLSsetDistrRG, METH_FASTCALL},
+    {"pyLSgetDistrRV", (PyCFunction)(void(*)(void))pyLSgetDistrRV, METH_FASTCALL},
+    {"pyLSgetInitSeed", (PyCFunction)(void(*)(void))pyLSgetInitSeed, METH_FASTCALL},
+    {"pyLSgetRGNumThreads", (PyCFunction)(void(*)(void))pyLSgetRGNumThreads, METH_FASTCALL},
+    {"pyLSfillRGBuffer", (PyCFunction)(void(*)(void))pyLSfillRGBuffer, METH_FASTCALL},
+    {"pyLSgetHistogram", (PyCFunction)(void(*)(void))pyLSgetHistogram, METH_FASTCALL},
+    {"pyLSsolveMipBnp", (PyCFunction)(void(*)(void))pyLSsolveMipBnp, METH_FASTCALL},
+
+    { "pyLSwriteMPXFile", (PyCFunction)(void(*)(void))pyLSwriteMPXFile, METH_FASTCALL},
+    { "pyLSreadMPXFile", (PyCFunction)(void(*)(void))pyLSreadMPXFile, METH_FASTCALL},
+    { "pyLSwriteVarPriorities", (PyCFunction)(void(*)(void))pyLSwriteVarPriorities, METH_FASTCALL},
+    { "pyLSwriteNLSolution", (PyCFunction)(void(*)(void))pyLSwriteNLSolution, METH_FASTCALL},
+    { "pyLSaddTunerInstance", (PyCFunction)(void(*)(void))pyLSaddTunerInstance, METH_FASTCALL},
+    { "pyLSaddTunerOption", (PyCFunction)(void(*)(void))pyLSaddTunerOption, METH_FASTCALL},
+    { "pyLSaddTunerStrOption", (PyCFunction)(void(*)(void))pyLSaddTunerStrOption, METH_FASTCALL},
+    { "pyLSaddTunerZDynamic", (PyCFunction)(void(*)(void))pyLSaddTunerZDynamic, METH_FASTCALL},
+    { "pyLSaddTunerZStatic", (PyCFunction)(void(*)(void))pyLSaddTunerZStatic, METH_FASTCALL},
+    { "pyLSclearTuner", (PyCFunction)(void(*)(void))pyLSclearTuner, METH_FASTCALL},
+    { "pyLSdisplayTunerResults", (PyCFunction)(void(*)(void))pyLSdisplayTunerResults, METH_FASTCALL},
+    { "pyLSgetTunerConfigString", (PyCFunction)(void(*)(void))pyLSgetTunerConfigString, METH_FASTCALL},
+    { "pyLSgetTunerOption", (PyCFunction)(void(*)(void))pyLSgetTunerOption, METH_FASTCALL},
+    { "pyLSgetTunerResult", (PyCFunction)(void(*)(void))pyLSgetTunerResult, METH_FASTCALL},
+    { "pyLSgetTunerSpace", (PyCFunction)(void(*)(void))pyLSgetTunerSpace, METH_FASTCALL},
+    { "pyLSgetTunerStrOption", (PyCFunction)(void(*)(void))pyLSgetTunerStrOption, METH_FASTCALL},
+    { "pyLSloadTunerConfigFile", (PyCFunction)(void(*)(void))pyLSloadTunerConfigFile, METH_FASTCALL},
+    { "pyLSloadTunerConfigString", (PyCFunction)(void(*)(void))pyLSloadTunerConfigString, METH_FASTCALL},
+    { "pyLSprintTuner", (PyCFunction)(void(*)(void))pyLSprintTuner, METH_FASTCALL},
+    { "pyLSresetTuner", (PyCFunction)(void(*)(void))pyLSresetTuner, METH_FASTCALL},
+    { "pyLSrunTuner", (PyCFunction)(void(*)(void))pyLSrunTuner, METH_FASTCALL},
+    { "pyLSrunTunerFile", (PyCFunction)(void(*)(void))pyLSrunTunerFile, METH_FASTCALL},
+    { "pyLSrunTunerString", (PyCFunction)(void(*)(void))pyLSrunTunerString, METH_FASTCALL},
+    { "pyLSsetTunerOption", (PyCFunction)(void(*)(void))pyLSsetTunerOption, METH_FASTCALL},
+    { "pyLSsetTunerStrOption", (PyCFunction)(void(*)(void))pyLSsetTunerStrOption, METH_FASTCALL},
+    { "pyLSaddQCShift", (PyCFunction)(void(*)(void))pyLSaddQCShift, METH_FASTCALL},
+    { "pyLSgetQCShift", (PyCFunction)(void(*)(void))pyLSgetQCShift, METH_FASTCALL},
+    { "pyLSresetQCShift", (PyCFunction)(void(*)(void))pyLSresetQCShift, METH_FASTCALL},
+    { "pyLSreadCBFFile", (PyCFunction)(void(*)(void))pyLSreadCBFFile, METH_FASTCALL},
+    { "pyLSreadNLFile", (PyCFunction)(void(*)(void))pyLSreadNLFile, METH_FASTCALL},
+    { "pyLSreadSDPAFile", (PyCFunction)(void(*)(void))pyLSreadSDPAFile, METH_FASTCALL},
+    { "pyLSsolveFileLP", (PyCFunction)(void(*)(void))pyLSsolveFileLP, METH_FASTCALL},
+    { "pyLSgetProfilerContext", (PyCFunction)(void(*)(void))pyLSgetProfilerContext, METH_FASTCALL},
+    { "pyLSgetProfilerInfo", (PyCFunction)(void(*)(void))pyLSgetProfilerInfo, METH_FASTCALL},
+    { "pyLSaddEmptySpacesAcolumns", (PyCFunction)(void(*)(void))pyLSaddEmptySpacesAcolumns, METH_FASTCALL},
+    { "pyLSaddEmptySpacesNLPAcolumns", (PyCFunction)(void(*)(void))pyLSaddEmptySpacesNLPAcolumns, METH_FASTCALL},
+    { "pyLSaddObjPool", (PyCFunction)(void(*)(void))pyLSaddObjPool, METH_FASTCALL},
+    { "pyLSapplyLtf", (PyCFunction)(void(*)(void))pyLSapplyLtf, METH_FASTCALL},
+    { "pyLSbnbSolve", (PyCFunction)(void(*)(void))pyLSbnbSolve, METH_FASTCALL},
+    { "pyLSbuildStringData", (PyCFunction)(void(*)(void))pyLSbuildStringData, METH_FASTCALL},
+    { "pyLScalcConFunc", (PyCFunction)(void(*)(void))pyLScalcConFunc, METH_FASTCALL},
+    { "pyLScalcConGrad", (PyCFunction)(void(*)(void))pyLScalcConGrad, METH_FASTCALL},
+    { "pyLScalcObjFunc", (PyCFunction)(void(*)(void))pyLScalcObjFunc, METH_FASTCALL},
+    { "pyLScalcObjGrad", (PyCFunction)(void(*)(void))pyLScalcObjGrad, METH_FASTCALL},
+    { "pyLScheckQterms", (PyCFunction)(void(*)(void))pyLScheckQterms, METH_FASTCALL},
+    { "pyLSdeduceStages", (PyCFunction)(void(*)(void))pyLSdeduceStages, METH_FASTCALL},
+    { "pyLSdeleteString", (PyCFunction)(void(*)(void))pyLSdeleteString, METH_FASTCALL},
+    { "pyLSdeleteStringData", (PyCFunction)(void(*)(void))pyLSdeleteStringData, METH_FASTCALL},
+    { "pyLSdisplayBlockStructure", (PyCFunction)(void(*)(void))pyLSdisplayBlockStructure, METH_FASTCALL},
+    { "pyLSdoBTRAN", (PyCFunction)(void(*)(void))pyLSdoBTRAN, METH_FASTCALL},
+    { "pyLSdoFTRAN", (PyCFunction)(void(*)(void))pyLSdoFTRAN, METH_FASTCALL},
+    { "pyLSfindLtf", (PyCFunction)(void(*)(void))pyLSfindLtf, METH_FASTCALL},
+    { "pyLSfindSymmetry", (PyCFunction)(void(*)(void))pyLSfindSymmetry, METH_FASTCALL},
+    { "pyLSfreeGOPSolutionMemory", (PyCFunction)(void(*)(void))pyLSfreeGOPSolutionMemory, METH_FASTCALL},
+    { "pyLSfreeHashMemory", (PyCFunction)(void(*)(void))pyLSfreeHashMemory, METH_FASTCALL},
+    { "pyLSfreeMIPSolutionMemory", (PyCFunction)(void(*)(void))pyLSfreeMIPSolutionMemory, METH_FASTCALL},
+    { "pyLSfreeObjPool", (PyCFunction)(void(*)(void))pyLSfreeObjPool, METH_FASTCALL},
+    { "pyLSfreeSolutionMemory", (PyCFunction)(void(*)(void))pyLSfreeSolutionMemory, METH_FASTCALL},
+    { "pyLSfreeSolverMemory", (PyCFunction)(void(*)(void))pyLSfreeSolverMemory, METH_FASTCALL},
+    { "pyLSgetALLDIFFData", (PyCFunction)(void(*)(void))pyLSgetALLDIFFData, METH_FASTCALL},
+    { "pyLSgetALLDIFFDatai", (PyCFunction)(void(*)(void))pyLSgetALLDIFFDatai, METH_FASTCALL},
+    { "pyLSgetDimensions", (PyCFunction)(void(*)(void))pyLSgetDimensions, METH_FASTCALL},
+    { "pyLSgetDualMIPsolution", (PyCFunction)(void(*)(void))pyLSgetDualMIPsolution, METH_FASTCALL},
+    { "pyLSgetGOPVariablePriority", (PyCFunction)(void(*)(void))pyLSgetGOPVariablePriority, METH_FASTCALL},
+    { "pyLSgetHess", (PyCFunction)(void(*)(void))pyLSgetHess, METH_FASTCALL},
+    { "pyLSgetIISInts", (PyCFunction)(void(*)(void))pyLSgetIISInts, METH_FASTCALL},
+    { "pyLSgetIISSETs", (PyCFunction)(void(*)(void))pyLSgetIISSETs, METH_FASTCALL},
+    { "pyLSgetJac", (PyCFunction)(void(*)(void))pyLSgetJac, METH_FASTCALL},
+    { "pyLSgetKBestMIPSols", (PyCFunction)(void(*)(void))pyLSgetKBestMIPSols, METH_FASTCALL},
+    { "pyLSgetLicenseInfo", (PyCFunction)(void(*)(void))pyLSgetLicenseInfo, METH_FASTCALL},
+    { "pyLSgetMasterModel", (PyCFunction)(void(*)(void))pyLSgetMasterModel, METH_FASTCALL},
+    { "pyLSgetMIPCallbackInfo", (PyCFunction)(void(*)(void))pyLSgetMIPCallbackInfo, METH_FASTCALL},
+    { "pyLSgetMIPSolutionStatus", (PyCFunction)(void(*)(void))pyLSgetMIPSolutionStatus, METH_FASTCALL},
+    { "pyLSgetMIPSolutionStatus", (PyCFunction)(void(*)(void))pyLSgetMIPSolutionStatus, METH_FASTCALL},
+    { "pyLSgetNextBestSol", (PyCFunction)(void(*)(void))pyLSgetNextBestSol, METH_FASTCALL},
+    { "pyLSgetNnzData", (PyCFunction)(void(*)(void))pyLSgetNnzData, METH_FASTCALL},
+    { "pyLSgetObjectiveRanges", (PyCFunction)(void(*)(void))pyLSgetObjectiveRanges, METH_FASTCALL},
+    { "pyLSgetObjPoolNumSol", (PyCFunction)(void(*)(void))pyLSgetObjPoolNumSol, METH_FASTCALL},
+    { "pyLSgetOrbitInfo", (PyCFunction)(void(*)(void))pyLSgetOrbitInfo, METH_FASTCALL},
+    { "pyLSgetPOSDData", (PyCFunction)(void(*)(void))pyLSgetPOSDData, METH_FASTCALL},
+    { "pyLSgetPOSDDatai", (PyCFunction)(void(*)(void))pyLSgetPOSDDatai, METH_FASTCALL},
+    { "pyLSgetMIPSolutionStatus", (PyCFunction)(void(*)(void))pyLSgetMIPSolutionStatus, METH_FASTCALL},
+    { "pyLSgetObjectiveRanges", (PyCFunction)(void(*)(void))pyLSgetObjectiveRanges, METH_FASTCALL},
+    { "pyLSgetProgressInfo", (PyCFunction)(void(*)(void))pyLSgetProgressInfo, METH_FASTCALL},
+    { "pyLSgetSolutionInfo", (PyCFunction)(void(*)(void))pyLSgetSolutionInfo, METH_FASTCALL},
+    { "pyLSgetSolutionStatus", (PyCFunction)(void(*)(void))pyLSgetSolutionStatus, METH_FASTCALL},
+    { "pyLSgetXSolverLibrary", (PyCFunction)(void(*)(void))pyLSgetXSolverLibrary, METH_FASTCALL},
+    { "pyLSloadALLDIFFData", (PyCFunction)(void(*)(void))pyLSloadALLDIFFData, METH_FASTCALL},
+    { "pyLSloadGASolution", (PyCFunction)(void(*)(void))pyLSloadGASolution, METH_FASTCALL},
+    { "pyLSloadIISPriorities", (PyCFunction)(void(*)(void))pyLSloadIISPriorities, METH_FASTCALL},
+    { "pyLSloadMultiStartSolution", (PyCFunction)(void(*)(void))pyLSloadMultiStartSolution, METH_FASTCALL},
+    { "pyLSloadNLPDense", (PyCFunction)(void(*)(void))pyLSloadNLPDense, METH_FASTCALL},
+    { "pyLSloadPOSDData", (PyCFunction)(void(*)(void))pyLSloadPOSDData, METH_FASTCALL},
+    { "pyLSloadSolutionAt", (PyCFunction)(void(*)(void))pyLSloadSolutionAt, METH_FASTCALL},
+    { "pyLSloadStringData", (PyCFunction)(void(*)(void))pyLSloadStringData, METH_FASTCALL},
+    { "pyLSloadStringData", (PyCFunction)(void(*)(void))pyLSloadStringData, METH_FASTCALL},
+    { "pyLSreadMPXStream", (PyCFunction)(void(*)(void))pyLSreadMPXStream, METH_FASTCALL},
+    { "pyLSsetObjPoolParam", (PyCFunction)(void(*)(void))pyLSsetObjPoolParam, METH_FASTCALL},
+    { "pyLSsetProbAllocSizes", (PyCFunction)(void(*)(void))pyLSsetProbAllocSizes, METH_FASTCALL},
+    { "pyLSsetProbNameAllocSizes", (PyCFunction)(void(*)(void))pyLSsetProbNameAllocSizes, METH_FASTCALL},
+    { "pyLSsetSETSStatei", (PyCFunction)(void(*)(void))pyLSsetSETSStatei, METH_FASTCALL},
+    { "pyLSsetXSolverLibrary", (PyCFunction)(void(*)(void))pyLSsetXSolverLibrary, METH_FASTCALL},
+    { "pyLSsetConstraintProperty", (PyCFunction)(void(*)(void))pyLSsetConstraintProperty, METH_FASTCALL},
+    { "pyLSregress", (PyCFunction)(void(*)(void))pyLSregress, METH_FASTCALL},
+    { "pyLSremObjPool", (PyCFunction)(void(*)(void))pyLSremObjPool, METH_FASTCALL},
+    { "pyLSgetObjectiveRanges", (PyCFunction)(void(*)(void))pyLSgetObjectiveRanges, METH_FASTCALL},
+    { "pyLSgetMIPSolutionStatus", (PyCFunction)(void(*)(void))pyLSgetMIPSolutionStatus, METH_FASTCALL},
+    { "pyLSgetMIPSolution", (PyCFunction)(void(*)(void))pyLSgetMIPSolution, METH_FASTCALL},
+    { "pyLSgetObjective", (PyCFunction)(void(*)(void))pyLSgetObjective, METH_FASTCALL},
+    { "pyLSsetGOPVariablePriority", (PyCFunction)(void(*)(void))pyLSsetGOPVariablePriority, METH_FASTCALL},
+    { "pyLSgetStringValue", (PyCFunction)(void(*)(void))pyLSgetStringValue, METH_FASTCALL},
+    { "pyLSrepairQterms", (PyCFunction)(void(*)(void))pyLSrepairQterms, METH_FASTCALL},
+    { "pyLSsetMIPCCStrategy", (PyCFunction)(void(*)(void))pyLSsetMIPCCStrategy, METH_FASTCALL},
+    { "pyLSsetModelLogfunc", (PyCFunction)(void(*)(void))pyLSsetModelLogfunc, METH_FASTCALL},
+    { "pyLSsetEnvLogfunc", (PyCFunction)(void(*)(void))pyLSsetEnvLogfunc, METH_FASTCALL},
+    { "pyLSsetCallback", (PyCFunction)(void(*)(void))pyLSsetCallback, METH_FASTCALL},
+    { "set_interrupt", (PyCFunction)(void(*)(void))pySetInterrupt, METH_FASTCALL,
+      "set_interrupt(model, flag=1) -> int\n\n"
+      "Make the progress callback relay return `flag` so a running solve on\n"
+      "`model` stops at its next callback. Pass 0 to clear the request.\n"
+      "Call set_interrupt(model, 0) before the solve: it installs the relay,\n"
+      "which LINDO may not pick up once the solve has started." },
+    { "pyLSsetMIPCallback", (PyCFunction)(void(*)(void))pyLSsetMIPCallback, METH_FASTCALL},
+    { "pyLSsetFuncalc", (PyCFunction)(void(*)(void))pyLSsetFuncalc, METH_FASTCALL},
+    { "pyLSsetGradcalc", (PyCFunction)(void(*)(void))pyLSsetGradcalc, METH_FASTCALL},
+    { "pyLSwriteTunerParameters", (PyCFunction)(void(*)(void))pyLSwriteTunerParameters, METH_FASTCALL},
+    { "pyLSloadIndData", (PyCFunction)(void(*)(void))pyLSloadIndData, METH_FASTCALL},
+    { "pyLSdeleteIndConstraints", (PyCFunction)(void(*)(void))pyLSdeleteIndConstraints, METH_FASTCALL},
+    { "solve_batch", (PyCFunction)(void(*)(void))pySolveBatch, METH_VARARGS | METH_KEYWORDS,
+      "solve_batch(models, method=LS_METHOD_FREE, nthreads=1) -> dict\n\n"
+      "Solve a sequence of independent models on native worker threads with\n"
+      "the GIL released. Returns a dict with int32 'errorcode' and 'status',\n"
+      "float64 'objective' and 'walltime' vectors and a 2-D float64 'primal'\n"
+      "array (one row per model, NaN-padded to the widest model)." },
+    { "get_solution", (PyCFunction)(void(*)(void))pyGetSolution, METH_VARARGS | METH_KEYWORDS,
+      "get_solution(model, kind='lp', fields=None) -> dict\n\n"
+      "Fetch the status, objective and solution vectors of a solved model in\n"
+      "one call. kind is 'lp', 'mip' or 'gop'; fields is any of 'primal',\n"
+      "'dual', 'slacks', 'redcosts' and 'basis' (default: all but 'basis').\n"
+      "The vectors are views into one contiguous buffer; 'basis' yields\n"
+      "int32 'cstatus' and 'rstatus' entries." },
+    { "load_lp", (PyCFunction)(void(*)(void))pyLoadLP, METH_VARARGS | METH_KEYWORDS,
+      "load_lp(model, A, c, b, contypes, lb=None, ub=None, sense=LS_MIN, objconst=0.0) -> int\n\n"
+      "Load an LP whose constraint matrix A is a scipy.sparse matrix or array\n"
+      "in csc, csr or coo format. A canonical CSC matrix (rows sorted, no\n"
+      "duplicates) with int32 indptr/indices and float64 data is handed to\n"
+      "LSloadLPData without copying; other index types are narrowed. Any\n"
+      "other input is converted natively to canonical CSC, duplicates summed,\n"
+      "so every format loads the same matrix. contypes is a str, bytes or\n"
+      "'S1' array." },
+    { "get_lp", (PyCFunction)(void(*)(void))pyGetLP, METH_VARARGS | METH_KEYWORDS,
+      "get_lp(model, raw=False) -> dict\n\n"
+      "Read the LP data of a model with one LSgetLPData call. Returns the\n"
+      "keyword arguments of load_lp: A, c, b, contypes, lb, ub, sense and\n"
+      "objconst. A is a scipy.sparse.csc_matrix over int32/float64 buffers\n"
+      "that are not copied, or the (data, indices, indptr) triplet if raw is\n"
+      "True or scipy is not installed." },
+    { "get_rows", (PyCFunction)(void(*)(void))pyGetRows, METH_VARARGS | METH_KEYWORDS,
+      "get_rows(model, index=None, names=False) -> dict\n\n"
+      "Constraint data of the rows in `index` (all rows if None), read in\n"
+      "one native loop over LSgetLPConstraintDatai. The rows come back in\n"
+      "CSR form, 'indptr', 'indices' (columns) and 'data', next to per-row\n"
+      "'contypes' and 'b' arrays and, if names is True, 'names'." },
+    { "get_cols", (PyCFunction)(void(*)(void))pyGetCols, METH_VARARGS | METH_KEYWORDS,
+      "get_cols(model, index=None, names=False) -> dict\n\n"
+      "Variable data of the columns in `index` (all columns if None), read\n"
+      "in one native loop over LSgetLPVariableDataj. The columns come back\n"
+      "in CSC form, 'indptr', 'indices' (rows) and 'data', next to\n"
+      "per-column 'vartypes', 'c', 'lb' and 'ub' arrays and, if names is\n"
+      "True, 'names'." },
+    { "stats", (PyCFunction)(void(*)(void))pyStats, METH_VARARGS | METH_KEYWORDS,
+      "stats(reset=False) -> dict\n\n"
+      "Counters of the binding layer. 'array_copies' is the number of array\n"
+      "arguments that had to be converted (wrong dtype, byte order or\n"
+      "layout) and 'array_copies_by_function' breaks it down per function.\n"
+      "reset=True zeroes the counters after reading them." },
+    { "batch_begin", (PyCFunction)(void(*)(void))pyBatchBegin, METH_VARARGS | METH_KEYWORDS,
+      "batch_begin(model) -> int\n\n"
+      "Start buffering pyLSmodifyRHS, pyLSmodifyLowerBounds,\n"
+      "pyLSmodifyUpperBounds, pyLSmodifyObjective, pyLSmodifyObjConstant and\n"
+      "pyLSmodifyAj on `model` instead of calling LINDO. Batches nest; the\n"
+      "return value is the nesting depth. Until the batch ends, other calls\n"
+      "on `model` raise RuntimeError, except model parameters and deleting\n"
+      "or resetting the model. See lindo.batch_update()." },
+    { "batch_end", (PyCFunction)(void(*)(void))pyBatchEnd, METH_VARARGS | METH_KEYWORDS,
+      "batch_end(model, commit=True) -> int\n\n"
+      "Close the batch opened by batch_begin(). Closing the outermost batch\n"
+      "applies the buffered modifications, merged per index (the last write\n"
+      "wins) and sorted, with one LINDO call per kind and one LSmodifyAj per\n"
+      "column, or discards them if commit is False. Returns the number of\n"
+      "LINDO calls issued. Indices are checked before the first call; one\n"
+      "out of range raises LINDO_Exception (LSERR_INDEX_OUT_OF_RANGE) with\n"
+      "the model left unchanged." },
+    { "model_cache", (PyCFunction)(void(*)(void))pyModelCache, METH_VARARGS | METH_KEYWORDS,
+      "model_cache(model) -> dict\n\n"
+      "A dict attached to `model` for data derived from it on the Python\n"
+      "side. It is emptied when the model is loaded, read, gains or loses\n"
+      "rows or columns, or is deleted; its 'lp' entry is also dropped by\n"
+      "the pyLSmodify* wrappers that change LP coefficients." },
+    { "load_names", (PyCFunction)(void(*)(void))pyLoadNames, METH_VARARGS | METH_KEYWORDS,
+      "load_names(model, varnames=None, connames=None) -> int\n\n"
+      "Name all variables and/or all constraints with a single LSloadNameData\n"
+      "call. Names are a list of str or bytes or a 1-D 'S' or 'U' array." },
+    { "get_names", (PyCFunction)(void(*)(void))pyGetNames, METH_VARARGS | METH_KEYWORDS,
+      "get_names(model, kind='var') -> numpy.ndarray\n\n"
+      "All variable ('var') or constraint ('con') names, read with a single\n"
+      "LSgetNameData call into an 'S' array as wide as the longest name." },
+    { "name_index", (PyCFunction)(void(*)(void))pyNameIndex, METH_VARARGS | METH_KEYWORDS,
+      "name_index(model, kind='var') -> dict\n\n"
+      "Dict from variable ('var') or constraint ('con') name to index. It is\n"
+      "built once and kept in model_cache(model) until names or dimensions\n"
+      "change; treat it as read-only." },
+    { "get_env_params", (PyCFunction)(void(*)(void))pyGetEnvParams, METH_VARARGS | METH_KEYWORDS,
+      "get_env_params(env, iparams, dparams) -> (ivalues, dvalues)\n\n"
+      "Values of the integer parameters `iparams` and the double parameters\n"
+      "`dparams` of env, read in one native loop." },
+    { "set_env_params", (PyCFunction)(void(*)(void))pySetEnvParams, METH_VARARGS | METH_KEYWORDS,
+      "set_env_params(env, iparams, ivalues, dparams, dvalues) -> int\n\n"
+      "Bring the parameters of env to the given values, as returned by\n"
+      "get_env_params(). Only parameters whose current value differs are\n"
+      "set. Returns the number of parameters set." },
+    { "reset_model", (PyCFunction)(void(*)(void))pyResetModel, METH_VARARGS | METH_KEYWORDS,
+      "reset_model(model) -> int\n\n"
+      "Remove every constraint and variable of model and zero its objective\n"
+      "constant, with one LSdeleteConstraints and one LSdeleteVariables call.\n"
+      "The model keeps its parameters, callbacks and the arrays LINDO has\n"
+      "allocated for it, so it can be filled again without reallocating." },
 
 
 #ifdef _DEBUG
@@ -908,6 +1589,163 @@ static PyMethodDef lindo_methods[] =
     {NULL, NULL, 0}
 };
 
+/*
+ * Dispatch
+ *
+ * Every wrapper is registered through a trampoline whose self is a capsule
+ * holding its lindo_methods entry. The trampoline gives the call its own
+ * pyArgFrame_t, calls the wrapper and then writes back and releases the
+ * array copies pyArgArray made for that call. Nested calls from callbacks
+ * get frames of their own, as do calls made by other threads while this
+ * one runs with the GIL released. Calls on a model with an open batch are
+ * checked first, see pyModBatchCheck.
+ */
+typedef PyObject *(*pyFastFunc_t)(PyObject *, PyObject *const *, Py_ssize_t);
+
+static PyMethodDef *pyDispatchDefs = NULL;
+
+static int pyArgEnter(pyArgFrame_t *pFrame, PyMethodDef *def, void **ppPrev)
+{
+    pFrame->iMethod = def - lindo_methods;
+    pFrame->nCopies = 0;
+    pFrame->nCap = PY_ARG_INLINE;
+    pFrame->ppyCopies = pFrame->apyInline;
+    *ppPrev = PyThread_tss_get(&pyArgKey);
+    if (PyThread_tss_set(&pyArgKey, pFrame) != 0) {
+        PyErr_NoMemory();
+        return 0;
+    }
+    return 1;
+}
+
+static PyObject *pyArgDone(PyObject *pyResult, pyArgFrame_t *pFrame, void *pPrev)
+{
+    PyThread_tss_set(&pyArgKey, pPrev);
+    if (pyArgRelease(pFrame) < 0)
+        Py_CLEAR(pyResult);
+    return pyResult;
+}
+
+static PyObject *pyArgDispatch(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyMethodDef  *def = (PyMethodDef*)PyCapsule_GetPointer(self, NULL);
+    pyArgFrame_t frame;
+    void         *pPrev;
+
+    if (pyModBatchCheck(def->ml_name, nargs > 0 ? args[0] : NULL) < 0)
+        return NULL;
+    if (!pyArgEnter(&frame, def, &pPrev))
+        return NULL;
+    return pyArgDone(((pyFastFunc_t)(void(*)(void))def->ml_meth)(self, args, nargs),
+                     &frame, pPrev);
+}
+
+static PyObject *pyArgDispatchKw(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    PyMethodDef  *def = (PyMethodDef*)PyCapsule_GetPointer(self, NULL);
+    pyArgFrame_t frame;
+    void         *pPrev;
+
+    if (pyModBatchCheck(def->ml_name, PyTuple_GET_SIZE(args) > 0 ? PyTuple_GET_ITEM(args, 0)
+                        : kwds ? PyDict_GetItemString(kwds, "model") : NULL) < 0)
+        return NULL;
+    if (!pyArgEnter(&frame, def, &pPrev))
+        return NULL;
+    return pyArgDone(((PyCFunctionWithKeywords)(void(*)(void))def->ml_meth)(self, args, kwds),
+                     &frame, pPrev);
+}
+
+/*
+ * @brief Register the wrappers of lindo_methods through the trampolines
+ */
+static int pyInstallDispatch(PyObject *module)
+{
+    Py_ssize_t k, nMethods = 0;
+    PyObject   *pyName = PyModule_GetNameObject(module);
+
+    if (!pyName)
+        return -1;
+    if (!PyThread_tss_is_created(&pyArgKey) && PyThread_tss_create(&pyArgKey) != 0) {
+        Py_DECREF(pyName);
+        PyErr_NoMemory();
+        return -1;
+    }
+    while (lindo_methods[nMethods].ml_name)
+        nMethods++;
+    pyDispatchDefs = (PyMethodDef*)calloc(nMethods, sizeof(PyMethodDef));
+    pnMethodCopies = (Py_ssize_t*)calloc(nMethods, sizeof(Py_ssize_t));
+    if (!pyDispatchDefs || !pnMethodCopies) {
+        Py_DECREF(pyName);
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (k = 0; k < nMethods; k++) {
+        PyObject *pyDef, *pyFunc;
+        int      nFlags = lindo_methods[k].ml_flags;
+
+        pyDispatchDefs[k] = lindo_methods[k];
+        if (nFlags == METH_FASTCALL)
+            pyDispatchDefs[k].ml_meth = (PyCFunction)(void(*)(void))pyArgDispatch;
+        else if (nFlags == (METH_VARARGS | METH_KEYWORDS))
+            pyDispatchDefs[k].ml_meth = (PyCFunction)(void(*)(void))pyArgDispatchKw;
+        else
+            continue;
+        pyDef = PyCapsule_New(&lindo_methods[k], NULL, NULL);
+        pyFunc = pyDef ? PyCFunction_NewEx(&pyDispatchDefs[k], pyDef, pyName) : NULL;
+        Py_XDECREF(pyDef);
+        if (!pyFunc || PyModule_AddObject(module, lindo_methods[k].ml_name, pyFunc) < 0) {
+            Py_XDECREF(pyFunc);
+            Py_DECREF(pyName);
+            return -1;
+        }
+    }
+    Py_DECREF(pyName);
+    return 0;
+}
+
+/*
+* @brief Counters of the binding layer
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return dict
+* @remark d = lindo.stats(reset)
+*/
+PyObject *pyStats(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"reset", NULL};
+    int         isReset = 0;
+    Py_ssize_t  k;
+    PyObject    *pyByFunc, *pyResult;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|p", kwlist, &isReset))
+        return NULL;
+
+    pyByFunc = PyDict_New();
+    if (!pyByFunc)
+        return NULL;
+    for (k = 0; pnMethodCopies && lindo_methods[k].ml_name; k++) {
+        PyObject *pyCount;
+        if (!pnMethodCopies[k])
+            continue;
+        pyCount = PyLong_FromSsize_t(pnMethodCopies[k]);
+        if (!pyCount || PyDict_SetItemString(pyByFunc, lindo_methods[k].ml_name, pyCount) < 0) {
+            Py_XDECREF(pyCount);
+            Py_DECREF(pyByFunc);
+            return NULL;
+        }
+        Py_DECREF(pyCount);
+    }
+    pyResult = Py_BuildValue("{snsN}",
+                             "array_copies", nArrayCopies,
+                             "array_copies_by_function", pyByFunc);
+    if (pyResult && isReset) {
+        nArrayCopies = 0;
+        for (k = 0; pnMethodCopies && lindo_methods[k].ml_name; k++)
+            pnMethodCopies[k] = 0;
+    }
+    return pyResult;
+}
+
 #if PY_MAJOR_VERSION >= 3
 
 static int lindo_traverse(PyObject *m, visitproc visit, void *arg)
@@ -983,6 +1821,11 @@ initlindo(void)
         PyModule_AddObject(module, "LINDO_Exception", LINDO_Exception);
     }
 
+    if (pyInstallDispatch(module) < 0 || pyAddHandleTypes(module) < 0) {
+        Py_DECREF(module);
+        INITERROR;
+    }
+
     
 
 #if PY_MAJOR_VERSION >= 3
@@ -1031,9 +1874,22 @@ pyobj->flags |= NPY_OWNDATA;\
     PyCObject_AsVoidPtr(pointer_to_value)
 #else
     #define PyGetObjPtr(pointer_to_value)\
-    PyCapsule_GetPointer(pointer_to_value, NULL)
+    pyGetObjPtr(pointer_to_value)
 #endif
 
+/*
+ * @brief Native pointer behind a capsule or an owning handle object
+ * @remark Closed handles yield NULL, which the CHECK_ macros reject.
+ */
+static void *pyGetObjPtr(PyObject *pyObj)
+{
+    if (pyIsHandle(pyObj)) {
+        pyHandle_t *pyHandle = (pyHandle_t*)pyObj;
+        return pyHandle->isClosed ? NULL : pyHandle->pHandle;
+    }
+    return PyCapsule_GetPointer(pyObj, NULL);
+}
+
 #define CHECK_ENV\
     pEnv = PyGetObjPtr(pyEnv);\
     if(pEnv == NULL)\
@@ -1085,102 +1941,591 @@ static void LS_CALLTYPE pyPrintLog(pLSmodel model,
 {
     printf("%s",line);
 }
+
 /*********************************************************************
- * Structure Creation and Deletion Routines (6)                      *
+ * Per-model Python cache                                            *
+ *                                                                   *
+ * A dict per model, returned by lindo.model_cache(), for data the   *
+ * Python side derives from a loaded model, e.g. the snapshot that   *
+ * lindo.apply_delta() compares against. pyResetModelDims() drops    *
+ * the whole dict; wrappers that modify LP coefficients drop its     *
+ * "lp" entry. Only accessed with the GIL held.                      *
  *********************************************************************/
-PyObject *pyLScreateEnv(PyObject *self, PyObject *args)
-{
-    pLSenv    pEnv = NULL;
-    int       *pnErrorCode = NULL;
-    char      *pachLicenseKey = NULL;
-    npy_intp  index[1] = {0};
-
-    PyArrayObject   *pyErrorCode = NULL, *pyLicenseKey = NULL;
-
-    if (!PyArg_ParseTuple(args, "O!O!",
-                                 &PyArray_Type,&pyErrorCode,
-                                 &PyArray_Type,&pyLicenseKey))
-    {
-        return NULL;
-    }
+static PyObject *pyModelCaches = NULL;  //{model pointer: dict}
 
-    if(pyErrorCode && PyArray_DIMS(pyErrorCode) > 0)
-        pnErrorCode = (int *)PyArray_GetPtr(pyErrorCode,index);
+/*
+* @brief Drop an entry of the Python cache of a model, or all of it if szKey is NULL
+*/
+static void pyModelCacheDrop(pLSmodel pModel, const char *szKey)
+{
+    PyObject *pyKey, *pyCache;
+    PyObject *pyType, *pyValue, *pyTrace;
 
-    if(pyLicenseKey)
-        pachLicenseKey = (char *)PyArray_DATA(pyLicenseKey);
+    if (!pyModelCaches || !PyDict_GET_SIZE(pyModelCaches))
+        return;
+    PyErr_Fetch(&pyType, &pyValue, &pyTrace);
+    pyKey = PyLong_FromVoidPtr(pModel);
+    pyCache = pyKey ? PyDict_GetItemWithError(pyModelCaches, pyKey) : NULL;
+    if (pyCache && !szKey)
+        PyDict_DelItem(pyModelCaches, pyKey);
+    else if (pyCache && PyDict_GetItemString(pyCache, szKey))
+        PyDict_DelItemString(pyCache, szKey);
+    Py_XDECREF(pyKey);
+    PyErr_Clear();
+    PyErr_Restore(pyType, pyValue, pyTrace);
+}
 
-    pEnv = LScreateEnv(pnErrorCode,pachLicenseKey);
+/*********************************************************************
+ * Per-model dimension cache                                         *
+ *                                                                   *
+ * Number of variables and constraints of a model, keyed by the      *
+ * model pointer. Wrappers that need the dimensions read them with   *
+ * pyGetModelDims(); calls that can change them (load, read, add,    *
+ * delete) drop the entry, and the model's Python cache, with        *
+ * pyResetModelDims(). Only accessed with the GIL held.              *
+ *********************************************************************/
+typedef struct pyModelDims_t {
+    pLSmodel pModel;
+    int      nVars;
+    int      nCons;
+} pyModelDims_t;
 
-    if(*pnErrorCode)
-    {
-        char errStr[] = "Failed to load license key";
-        LINDO_EXCEPTION(*pnErrorCode,errStr);
-    }
+static pyModelDims_t *pyDimsTab = NULL;
+static size_t pyDimsCap = 0;  //power of two, open addressing
+static size_t pyDimsLen = 0;
 
-    return PyNewObjPtr(pEnv);
+static size_t pyDimsSlot(pLSmodel pModel, size_t cap)
+{
+    size_t h = (size_t)(Py_uintptr_t)pModel;
+    h ^= h >> 16;
+    h *= (size_t)0x45d9f3b7UL;
+    h ^= h >> 16;
+    return h & (cap - 1);
 }
 
-PyObject *pyLScreateModel(PyObject *self, PyObject *args)
+static pyModelDims_t *pyDimsFind(pLSmodel pModel)
 {
-    pLSmodel  pModel = NULL;
-    pLSenv    pEnv;
-    int       *pnErrorCode = NULL;
-    npy_intp  index[1] = {0};
-
-    PyObject        *pyEnv;
-    PyArrayObject   *pyErrorCode = NULL;
-
-    if (!PyArg_ParseTuple(args, "OO!",
-                                 &pyEnv,
-                                 &PyArray_Type,&pyErrorCode))
-    {
+    size_t k;
+    if (!pyDimsLen)
         return NULL;
-    }
-
-    if(pyErrorCode && PyArray_DIMS(pyErrorCode) > 0)
-        pnErrorCode = (int *)PyArray_GetPtr(pyErrorCode,index);
+    for (k = pyDimsSlot(pModel, pyDimsCap); pyDimsTab[k].pModel; k = (k + 1) & (pyDimsCap - 1))
+        if (pyDimsTab[k].pModel == pModel)
+            return &pyDimsTab[k];
+    return NULL;
+}
 
-    pEnv = PyGetObjPtr(pyEnv);
-    if(pEnv == NULL)
-    {
-        *pnErrorCode = LSERR_ILLEGAL_NULL_POINTER;
-        printf("Illegal NULL pointer (error %d)\n",*pnErrorCode);
-        return NULL;
-    };
+static int pyDimsGrow(void)
+{
+    size_t j, k, cap = pyDimsCap ? 2 * pyDimsCap : 64;
+    pyModelDims_t *tab = calloc(cap, sizeof(pyModelDims_t));
+    if (!tab)
+        return -1;
+    for (j = 0; j < pyDimsCap; j++) {
+        if (!pyDimsTab[j].pModel)
+            continue;
+        for (k = pyDimsSlot(pyDimsTab[j].pModel, cap); tab[k].pModel; k = (k + 1) & (cap - 1))
+            ;
+        tab[k] = pyDimsTab[j];
+    }
+    free(pyDimsTab);
+    pyDimsTab = tab;
+    pyDimsCap = cap;
+    return 0;
+}
 
-    pModel = LScreateModel(pEnv,pnErrorCode);
+/*
+* @brief Drop the cached dimensions of a model
+* @remark Call before anything that may change the number of variables or
+*         constraints, and before the model is deleted.
+*/
+static void pyResetModelDims(pLSmodel pModel)
+{
+    size_t i, j, k;
+    pyModelDims_t *p = pyDimsFind(pModel);
+    pyModelCacheDrop(pModel, NULL);
+    if (!p)
+        return;
+    // backward-shift deletion keeps probe sequences intact
+    i = (size_t)(p - pyDimsTab);
+    for (j = (i + 1) & (pyDimsCap - 1); pyDimsTab[j].pModel; j = (j + 1) & (pyDimsCap - 1)) {
+        k = pyDimsSlot(pyDimsTab[j].pModel, pyDimsCap);
+        if ((j > i && (k <= i || k > j)) || (j < i && (k <= i && k > j))) {
+            pyDimsTab[i] = pyDimsTab[j];
+            i = j;
+        }
+    }
+    pyDimsTab[i].pModel = NULL;
+    pyDimsLen--;
+}
 
-    if(*pnErrorCode)
-    {
-        char errStr[] = "Failed to create model";
-        LINDO_EXCEPTION(*pnErrorCode,errStr);
+/*
+* @brief Number of variables and constraints of a model
+* @return LINDO error code of the underlying LSgetInfo query, if any
+*/
+static int pyGetModelDims(pLSmodel pModel, int *pnVars, int *pnCons)
+{
+    int errorcode, nVars = 0, nCons = 0;
+    size_t k;
+    pyModelDims_t *p = pyDimsFind(pModel);
+
+    if (!p) {
+        errorcode = LSgetInfo(pModel, LS_IINFO_NUM_VARS, &nVars);
+        if (!errorcode)
+            errorcode = LSgetInfo(pModel, LS_IINFO_NUM_CONS, &nCons);
+        if (errorcode)
+            return errorcode;
+        if ((pyDimsLen + 1) * 2 > pyDimsCap && pyDimsGrow()) {
+            //out of memory, answer uncached
+            if (pnVars) *pnVars = nVars;
+            if (pnCons) *pnCons = nCons;
+            return LSERR_NO_ERROR;
+        }
+        for (k = pyDimsSlot(pModel, pyDimsCap); pyDimsTab[k].pModel; k = (k + 1) & (pyDimsCap - 1))
+            ;
+        p = &pyDimsTab[k];
+        p->pModel = pModel;
+        p->nVars = nVars;
+        p->nCons = nCons;
+        pyDimsLen++;
     }
+    if (pnVars) *pnVars = p->nVars;
+    if (pnCons) *pnCons = p->nCons;
+    return LSERR_NO_ERROR;
+}
 
-    *pnErrorCode = LSsetModelLogfunc(pModel,(printLOG_t)pyPrintLog,NULL);
+/*********************************************************************
+ * Batched model modifications                                       *
+ *                                                                   *
+ * Between batch_begin(model) and batch_end(model) the wrappers of   *
+ * LSmodifyRHS, LSmodifyLowerBounds, LSmodifyUpperBounds,            *
+ * LSmodifyObjective, LSmodifyObjConstant and LSmodifyAj append to   *
+ * native buffers instead of calling LINDO. batch_end merges entries *
+ * written more than once (the last write wins), sorts them by index *
+ * and issues one LINDO call per kind, one LSmodifyAj per column.    *
+ * Any other call that reads the model or changes its structure      *
+ * would see it without the buffered entries, or shift the indices   *
+ * they refer to, so the dispatcher refuses those calls on a model   *
+ * with an open batch (pyModBatchCheck).                             *
+ * Only accessed with the GIL held.                                  *
+ *********************************************************************/
+enum { LS_MOD_RHS, LS_MOD_LB, LS_MOD_UB, LS_MOD_OBJ, LS_MOD_AJ, LS_MOD_KINDS };
+
+typedef struct lsModEntry_t {
+    int    iCol;    //column of an LS_MOD_AJ entry, 0 otherwise
+    int    iIdx;    //variable, constraint or row index
+    size_t nSeq;    //insertion order
+    double dVal;
+} lsModEntry_t;
+
+typedef struct lsModBatch_t {
+    pLSmodel            pModel;
+    int                 nDepth;
+    int                 hasObjConst;
+    double              dObjConst;
+    size_t              nSeq;
+    lsModEntry_t        *paEntries[LS_MOD_KINDS];
+    size_t              nEntries[LS_MOD_KINDS];
+    size_t              nCap[LS_MOD_KINDS];
+    struct lsModBatch_t *next;
+} lsModBatch_t;
+
+static lsModBatch_t *pyModBatches = NULL;
+
+static lsModBatch_t *pyModBatchFind(pLSmodel pModel)
+{
+    lsModBatch_t *b;
+    for (b = pyModBatches; b; b = b->next)
+        if (b->pModel == pModel)
+            return b;
+    return NULL;
+}
 
-    if(*pnErrorCode)
-    {
-        char errStr[] = "Failed to set print log";
-        LINDO_EXCEPTION(*pnErrorCode,errStr);
+/*
+* @brief Close the batch of a model without applying it
+*/
+static void pyModBatchDrop(pLSmodel pModel)
+{
+    lsModBatch_t **pb, *b;
+    int k;
+    for (pb = &pyModBatches; *pb; pb = &(*pb)->next) {
+        if ((*pb)->pModel != pModel)
+            continue;
+        b = *pb;
+        *pb = b->next;
+        for (k = 0; k < LS_MOD_KINDS; k++)
+            free(b->paEntries[k]);
+        free(b);
+        return;
     }
+}
 
-    return PyNewObjPtr(pModel);
+/*
+* @brief Buffer a modification of pModel if it has an open batch
+* @param iCol Column of an LS_MOD_AJ modification
+* @return 1 if buffered, 0 if there is no open batch, -1 with an exception set
+*/
+static int pyModBatchAdd(pLSmodel pModel, int kind, int iCol, int n,
+                         PyArrayObject *pyIdx, PyArrayObject *pyVal)
+{
+    lsModBatch_t *b = pModel && pyModBatches ? pyModBatchFind(pModel) : NULL;
+    lsModEntry_t *e;
+    const int    *pai;
+    const double *pad;
+    int          k;
+
+    if (!b)
+        return 0;
+    if (n < 0 || (n > 0 && (!pyIdx || !pyVal || PyArray_SIZE(pyIdx) < n || PyArray_SIZE(pyVal) < n))) {
+        PyErr_Format(PyExc_ValueError, "index and value arrays must hold at least %d entries", n);
+        return -1;
+    }
+    if (b->nEntries[kind] + n > b->nCap[kind]) {
+        size_t nCap = b->nCap[kind] ? 2 * b->nCap[kind] : 256;
+        while (nCap < b->nEntries[kind] + n)
+            nCap *= 2;
+        e = (lsModEntry_t*)realloc(b->paEntries[kind], nCap * sizeof(lsModEntry_t));
+        if (!e) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        b->paEntries[kind] = e;
+        b->nCap[kind] = nCap;
+    }
+    e = b->paEntries[kind] + b->nEntries[kind];
+    pai = n > 0 ? (const int*)PyArray_DATA(pyIdx) : NULL;
+    pad = n > 0 ? (const double*)PyArray_DATA(pyVal) : NULL;
+    for (k = 0; k < n; k++) {
+        e[k].iCol = iCol;
+        e[k].iIdx = pai[k];
+        e[k].nSeq = b->nSeq++;
+        e[k].dVal = pad[k];
+    }
+    b->nEntries[kind] += n;
+    return 1;
 }
 
-PyObject *pyLSdeleteModel(PyObject *self, PyObject *args)
+static int lsModEntryCmp(const void *pa, const void *pb)
 {
-    int       errorcode = LSERR_NO_ERROR;
-    pLSmodel  pModel;
-
-    PyObject  *pyModel;
+    const lsModEntry_t *a = (const lsModEntry_t*)pa, *b = (const lsModEntry_t*)pb;
+    if (a->iCol != b->iCol)
+        return a->iCol < b->iCol ? -1 : 1;
+    if (a->iIdx != b->iIdx)
+        return a->iIdx < b->iIdx ? -1 : 1;
+    return a->nSeq < b->nSeq ? -1 : (a->nSeq > b->nSeq);
+}
 
-    if (!PyArg_ParseTuple(args, "O", &pyModel))
-    {
-        return NULL;
+/*
+* @brief Check every buffered index against the model dimensions
+* @return LSERR_INDEX_OUT_OF_RANGE if one is out of range, the error code
+*         of the dimension query if it failed, LSERR_NO_ERROR otherwise
+*/
+static int pyModBatchValidate(lsModBatch_t *b)
+{
+    int    errorcode, nVars = 0, nCons = 0, nLen;
+    size_t i;
+    int    kind;
+    lsModEntry_t *e;
+
+    errorcode = pyGetModelDims(b->pModel, &nVars, &nCons);
+    if (errorcode)
+        return errorcode;
+    for (kind = 0; kind < LS_MOD_KINDS; kind++) {
+        nLen = kind == LS_MOD_RHS || kind == LS_MOD_AJ ? nCons : nVars;
+        for (i = 0, e = b->paEntries[kind]; i < b->nEntries[kind]; i++, e++) {
+            if (e->iIdx < 0 || e->iIdx >= nLen)
+                return LSERR_INDEX_OUT_OF_RANGE;
+            if (kind == LS_MOD_AJ && (e->iCol < 0 || e->iCol >= nVars))
+                return LSERR_INDEX_OUT_OF_RANGE;
+        }
     }
+    return LSERR_NO_ERROR;
+}
 
-    CHECK_MODEL;
+/*
+* @brief Apply the buffered modifications of a batch
+* @param[out] pnCalls Number of LINDO calls issued
+* @return LINDO error code of the first call that failed, -1 when out of
+*         memory; the remaining modifications are not applied then
+* @remark Indices are checked before the first call, so a batch with an
+*         index out of range fails with LSERR_INDEX_OUT_OF_RANGE and
+*         leaves the model as it was.
+*/
+static int pyModBatchApply(lsModBatch_t *b, int *pnCalls)
+{
+    int    errorcode = LSERR_NO_ERROR;
+    int    *pai = NULL;
+    double *pad = NULL;
+    size_t i, n, nMax = 0, nBeg;
+    int    kind;
+
+    *pnCalls = 0;
+    errorcode = pyModBatchValidate(b);
+    if (errorcode)
+        return errorcode;
+    for (kind = 0; kind < LS_MOD_KINDS; kind++)
+        if (b->nEntries[kind] > nMax)
+            nMax = b->nEntries[kind];
+    if (nMax > INT_MAX)
+        return -1;
+    if (nMax) {
+        pai = (int*)malloc(nMax * sizeof(int));
+        pad = (double*)malloc(nMax * sizeof(double));
+        if (!pai || !pad) {
+            free(pai);
+            free(pad);
+            return -1;
+        }
+    }
+
+    for (kind = 0; kind < LS_MOD_KINDS && !errorcode; kind++) {
+        lsModEntry_t *e = b->paEntries[kind];
+        if (!b->nEntries[kind])
+            continue;
+        qsort(e, b->nEntries[kind], sizeof(lsModEntry_t), lsModEntryCmp);
+        // keep the last write of every (column, index)
+        for (i = n = 0; i < b->nEntries[kind]; i++) {
+            if (i + 1 < b->nEntries[kind] && e[i + 1].iCol == e[i].iCol && e[i + 1].iIdx == e[i].iIdx)
+                continue;
+            e[n] = e[i];
+            pai[n] = e[i].iIdx;
+            pad[n] = e[i].dVal;
+            n++;
+        }
+        if (kind == LS_MOD_AJ) {
+            for (nBeg = i = 0; i < n && !errorcode; i++) {
+                if (i + 1 < n && e[i + 1].iCol == e[nBeg].iCol)
+                    continue;
+                errorcode = LSmodifyAj(b->pModel, e[nBeg].iCol, (int)(i + 1 - nBeg), pai + nBeg, pad + nBeg);
+                (*pnCalls)++;
+                nBeg = i + 1;
+            }
+            continue;
+        }
+        switch (kind) {
+        case LS_MOD_RHS: errorcode = LSmodifyRHS(b->pModel, (int)n, pai, pad); break;
+        case LS_MOD_LB:  errorcode = LSmodifyLowerBounds(b->pModel, (int)n, pai, pad); break;
+        case LS_MOD_UB:  errorcode = LSmodifyUpperBounds(b->pModel, (int)n, pai, pad); break;
+        case LS_MOD_OBJ: errorcode = LSmodifyObjective(b->pModel, (int)n, pai, pad); break;
+        }
+        (*pnCalls)++;
+    }
+    if (!errorcode && b->hasObjConst) {
+        errorcode = LSmodifyObjConstant(b->pModel, b->dObjConst);
+        (*pnCalls)++;
+    }
+    free(pai);
+    free(pad);
+    return errorcode;
+}
+
+/*
+* @brief Refuse a call on a model with an open batch
+* @remark Allowed are the buffered modifications, batch_begin/batch_end,
+*         deleting or resetting the model (both discard the batch), model
+*         parameters, which the batch leaves alone, and model_cache.
+* @return 0 if the call may proceed, -1 with RuntimeError set
+*/
+static int pyModBatchCheck(const char *pszName, PyObject *pyModel)
+{
+    static const char *const apszAllowed[] = {
+        "pyLSmodifyRHS", "pyLSmodifyLowerBounds", "pyLSmodifyUpperBounds",
+        "pyLSmodifyObjective", "pyLSmodifyObjConstant", "pyLSmodifyAj",
+        "batch_begin", "batch_end", "pyLSdeleteModel", "reset_model",
+        "pyLSgetModelIntParameter", "pyLSgetModelDouParameter",
+        "pyLSsetModelIntParameter", "pyLSsetModelDouParameter",
+        "pyLSsetModelParameter", "model_cache", NULL };
+    void *pObj;
+    int  k;
+
+    if (!pyModBatches || !pyModel || !(pyIsHandle(pyModel) || PyCapsule_CheckExact(pyModel)))
+        return 0;
+    pObj = pyGetObjPtr(pyModel);
+    if (!pObj) {
+        PyErr_Clear();
+        return 0;
+    }
+    if (!pyModBatchFind((pLSmodel)pObj))
+        return 0;
+    for (k = 0; apszAllowed[k]; k++)
+        if (!strcmp(pszName, apszAllowed[k]))
+            return 0;
+    PyErr_Format(PyExc_RuntimeError,
+        "%s() cannot be called on a model with an open batch, call batch_end() first", pszName);
+    return -1;
+}
+
+/*
+* @brief Output array of a solution query
+* @remark With pyOut NULL or None a new 1-D array of len elements is
+*         allocated. Otherwise pyOut must be a writeable, aligned,
+*         C-contiguous 1-D array of the given type holding at least len
+*         elements; it is written in place.
+* @return New reference, or NULL with an exception set
+*/
+static PyArrayObject *pyOutArray(PyObject *pyOut, npy_intp len, int type, const char *name)
+{
+    PyArrayObject *pyArr;
+
+    if (!pyOut || pyOut == Py_None)
+        return (PyArrayObject*)PyArray_SimpleNew(1, &len, type);
+
+    if (!PyArray_Check(pyOut)) {
+        PyErr_Format(PyExc_TypeError, "%s must be a numpy array or None", name);
+        return NULL;
+    }
+    pyArr = (PyArrayObject*)pyOut;
+    if (PyArray_TYPE(pyArr) != type) {
+        PyArray_Descr *descr = PyArray_DescrFromType(type);
+        PyErr_Format(PyExc_TypeError, "%s must have dtype '%c', got '%c'",
+            name, descr->type, PyArray_DESCR(pyArr)->type);
+        Py_DECREF(descr);
+        return NULL;
+    }
+    if (!PyArray_ISNOTSWAPPED(pyArr)) {
+        PyErr_Format(PyExc_TypeError, "%s must be in native byte order", name);
+        return NULL;
+    }
+    if (PyArray_NDIM(pyArr) != 1 || PyArray_DIM(pyArr, 0) < len) {
+        PyErr_Format(PyExc_ValueError, "%s must be 1-D with at least %zd elements",
+            name, (Py_ssize_t)len);
+        return NULL;
+    }
+    if (!PyArray_IS_C_CONTIGUOUS(pyArr) || !PyArray_ISALIGNED(pyArr) || !PyArray_ISWRITEABLE(pyArr)) {
+        PyErr_Format(PyExc_ValueError, "%s must be a writeable, aligned, contiguous array", name);
+        return NULL;
+    }
+    Py_INCREF(pyArr);
+    return pyArr;
+}
+
+/*
+* @brief Result of a solution query filling pyArr
+* @remark Returns the error code when the caller supplied the output array
+*         and pyArr itself when it was allocated. Steals pyArr.
+*/
+static PyObject *pyOutResult(PyObject *pyOut, PyArrayObject *pyArr, int errorcode)
+{
+    if (errorcode != 0) {
+        Py_DECREF(pyArr);
+        ERROR_SET(errorcode);
+    }
+    if (pyOut && pyOut != Py_None) {
+        Py_DECREF(pyArr);
+        return Py_BuildValue("i", errorcode);
+    }
+    return (PyObject*)pyArr;
+}
+
+/*********************************************************************
+ * Structure Creation and Deletion Routines (6)                      *
+ *********************************************************************/
+PyObject *pyLScreateEnv(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    pLSenv    pEnv = NULL;
+    int       *pnErrorCode = NULL;
+    char      *pachLicenseKey = NULL;
+    npy_intp  index[1] = {0};
+
+    PyArrayObject   *pyErrorCode = NULL, *pyLicenseKey = NULL;
+
+    if (!pyParseArgs(args, nargs, "N*S",
+                                 &pyErrorCode,
+                                 &pyLicenseKey))
+    {
+        return NULL;
+    }
+
+    if(pyErrorCode && PyArray_DIMS(pyErrorCode) > 0)
+        pnErrorCode = (int *)PyArray_GetPtr(pyErrorCode,index);
+
+    if(pyLicenseKey)
+        pachLicenseKey = (char *)PyArray_DATA(pyLicenseKey);
+
+    pEnv = LScreateEnv(pnErrorCode,pachLicenseKey);
+
+    if(*pnErrorCode)
+    {
+        char errStr[] = "Failed to load license key";
+        LINDO_EXCEPTION(*pnErrorCode,errStr);
+    }
+
+    return PyNewObjPtr(pEnv);
+}
+
+PyObject *pyLScreateModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    pLSmodel  pModel = NULL;
+    pLSenv    pEnv;
+    int       *pnErrorCode = NULL;
+    npy_intp  index[1] = {0};
+
+    PyObject        *pyEnv;
+    PyArrayObject   *pyErrorCode = NULL;
+
+    if (!pyParseArgs(args, nargs, "ON*",
+                                 &pyEnv,
+                                 &pyErrorCode))
+    {
+        return NULL;
+    }
+
+    if(pyErrorCode && PyArray_DIMS(pyErrorCode) > 0)
+        pnErrorCode = (int *)PyArray_GetPtr(pyErrorCode,index);
+
+    pEnv = PyGetObjPtr(pyEnv);
+    if(pEnv == NULL)
+    {
+        *pnErrorCode = LSERR_ILLEGAL_NULL_POINTER;
+        printf("Illegal NULL pointer (error %d)\n",*pnErrorCode);
+        return NULL;
+    };
+
+    pModel = LScreateModel(pEnv,pnErrorCode);
+
+    if(*pnErrorCode)
+    {
+        char errStr[] = "Failed to create model";
+        LINDO_EXCEPTION(*pnErrorCode,errStr);
+    }
+    // the address may belong to a model freed along with its environment
+    pyResetModelDims(pModel);
+    pyModBatchDrop(pModel);
+
+    *pnErrorCode = LSsetModelLogfunc(pModel,(printLOG_t)pyPrintLog,NULL);
+
+    if(*pnErrorCode)
+    {
+        char errStr[] = "Failed to set print log";
+        LINDO_EXCEPTION(*pnErrorCode,errStr);
+    }
+
+    return PyNewObjPtr(pModel);
+}
+
+PyObject *pyLSdeleteModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int       errorcode = LSERR_NO_ERROR;
+    pLSmodel  pModel;
+
+    PyObject  *pyModel;
+
+    if (!pyParseArgs(args, nargs, "O", &pyModel))
+    {
+        return NULL;
+    }
+
+    if (pyIsHandle(pyModel)) {
+        errorcode = pyHandleClose((pyHandle_t*)pyModel);
+        if (errorcode != 0){
+            ERROR_SET(errorcode);
+        }
+        return Py_BuildValue("i",errorcode);
+    }
+
+    CHECK_MODEL;
+    pyResetModelDims(pModel);
+    pyModBatchDrop(pModel);
+    pyReleaseModelData(pModel);
 
     errorcode = LSdeleteModel(&pModel);
 
@@ -1191,19 +2536,28 @@ PyObject *pyLSdeleteModel(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteEnv(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteEnv(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
 
     PyObject  *pyEnv;
 
-    if (!PyArg_ParseTuple(args, "O", &pyEnv))
+    if (!pyParseArgs(args, nargs, "O", &pyEnv))
     {
         return NULL;
     }
 
+    if (pyIsHandle(pyEnv)) {
+        errorcode = pyHandleClose((pyHandle_t*)pyEnv);
+        if (errorcode != 0){
+            ERROR_SET(errorcode);
+        }
+        return Py_BuildValue("i",errorcode);
+    }
+
     CHECK_ENV;
+    pyReleaseEnvData(pEnv);
 
     errorcode = LSdeleteEnv(&pEnv);
     
@@ -1213,7 +2567,7 @@ PyObject *pyLSdeleteEnv(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLScopyParam(PyObject *self, PyObject *args)
+PyObject *pyLScopyParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  targetModel, sourceModel;
@@ -1221,7 +2575,7 @@ PyObject *pyLScopyParam(PyObject *self, PyObject *args)
 
     PyObject  *pytargetModel, *pysourceModel;
 
-    if (!PyArg_ParseTuple(args, "OOi",
+    if (!pyParseArgs(args, nargs, "OOi",
                                  &pysourceModel,
                                  &pytargetModel,
                                  &mSolverType))
@@ -1247,7 +2601,7 @@ PyObject *pyLScopyParam(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadLicenseString(PyObject *self, PyObject *args)
+PyObject *pyLSloadLicenseString(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     char      *pszFname;
@@ -1256,9 +2610,9 @@ PyObject *pyLSloadLicenseString(PyObject *self, PyObject *args)
 
     PyArrayObject   *pyLicenseKey = NULL;
 
-    if (!PyArg_ParseTuple(args, "sO!",
+    if (!pyParseArgs(args, nargs, "sS",
                                  &pszFname,
-                                 &PyArray_Type,&pyLicenseKey))
+                                 &pyLicenseKey))
     {
         return NULL;
     }
@@ -1277,7 +2631,7 @@ PyObject *pyLSloadLicenseString(PyObject *self, PyObject *args)
 /********************************************************
  * Model I-O Routines (18)                              *
  ********************************************************/
-PyObject *pyLSreadMPSFile(PyObject *self, PyObject *args)
+PyObject *pyLSreadMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1287,7 +2641,7 @@ PyObject *pyLSreadMPSFile(PyObject *self, PyObject *args)
     PyObject       *pyModel;
 
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszFname,
                                  &nFormat))
@@ -1296,6 +2650,7 @@ PyObject *pyLSreadMPSFile(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     errorcode = LSreadMPSFile(pModel,pszFname,nFormat);
 
@@ -1306,7 +2661,7 @@ PyObject *pyLSreadMPSFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteMPSFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1315,7 +2670,7 @@ PyObject *pyLSwriteMPSFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszFname,
                                  &nFormat))
@@ -1334,7 +2689,7 @@ PyObject *pyLSwriteMPSFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadLINDOFile(PyObject *self, PyObject *args)
+PyObject *pyLSreadLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1342,7 +2697,7 @@ PyObject *pyLSreadLINDOFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1350,6 +2705,7 @@ PyObject *pyLSreadLINDOFile(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     errorcode = LSreadLINDOFile(pModel,pszFname);
 
@@ -1360,7 +2716,7 @@ PyObject *pyLSreadLINDOFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteLINDOFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1368,7 +2724,7 @@ PyObject *pyLSwriteLINDOFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1386,7 +2742,7 @@ PyObject *pyLSwriteLINDOFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadLINDOStream(PyObject *self, PyObject *args)
+PyObject *pyLSreadLINDOStream(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1395,7 +2751,7 @@ PyObject *pyLSreadLINDOStream(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszStream,
                                  &nStreamLen))
@@ -1404,6 +2760,7 @@ PyObject *pyLSreadLINDOStream(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     errorcode = LSreadLINDOStream(pModel,pszStream,nStreamLen);
 
@@ -1414,7 +2771,7 @@ PyObject *pyLSreadLINDOStream(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteLINGOFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteLINGOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1422,7 +2779,7 @@ PyObject *pyLSwriteLINGOFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1440,7 +2797,7 @@ PyObject *pyLSwriteLINGOFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteDualMPSFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteDualMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1449,7 +2806,7 @@ PyObject *pyLSwriteDualMPSFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osii",
+    if (!pyParseArgs(args, nargs, "Osii",
                                  &pyModel,
                                  &pszFname,
                                  &nFormat,
@@ -1469,7 +2826,7 @@ PyObject *pyLSwriteDualMPSFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteSolution(PyObject *self, PyObject *args)
+PyObject *pyLSwriteSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1477,7 +2834,7 @@ PyObject *pyLSwriteSolution(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1495,7 +2852,7 @@ PyObject *pyLSwriteSolution(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteSolutionOfType(PyObject *self, PyObject *args)
+PyObject *pyLSwriteSolutionOfType(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1504,7 +2861,7 @@ PyObject *pyLSwriteSolutionOfType(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszFname,
                                  &nFormat))
@@ -1523,7 +2880,7 @@ PyObject *pyLSwriteSolutionOfType(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteIIS(PyObject *self, PyObject *args)
+PyObject *pyLSwriteIIS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1531,7 +2888,7 @@ PyObject *pyLSwriteIIS(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1549,7 +2906,7 @@ PyObject *pyLSwriteIIS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteIUS(PyObject *self, PyObject *args)
+PyObject *pyLSwriteIUS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1557,7 +2914,7 @@ PyObject *pyLSwriteIUS(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1575,7 +2932,7 @@ PyObject *pyLSwriteIUS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadMPIFile(PyObject *self, PyObject *args)
+PyObject *pyLSreadMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1583,7 +2940,7 @@ PyObject *pyLSreadMPIFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1591,6 +2948,7 @@ PyObject *pyLSreadMPIFile(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     errorcode = LSreadMPIFile(pModel,pszFname);
 
@@ -1601,7 +2959,7 @@ PyObject *pyLSreadMPIFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteMPIFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1609,7 +2967,7 @@ PyObject *pyLSwriteMPIFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1627,7 +2985,7 @@ PyObject *pyLSwriteMPIFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteWithSetsAndSC(PyObject *self, PyObject *args)
+PyObject *pyLSwriteWithSetsAndSC(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1636,7 +2994,7 @@ PyObject *pyLSwriteWithSetsAndSC(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszFname,
                                  &nFormat))
@@ -1655,7 +3013,7 @@ PyObject *pyLSwriteWithSetsAndSC(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadBasis(PyObject *self, PyObject *args)
+PyObject *pyLSreadBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1664,7 +3022,7 @@ PyObject *pyLSreadBasis(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszFname,
                                  &nFormat))
@@ -1683,7 +3041,7 @@ PyObject *pyLSreadBasis(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteBasis(PyObject *self, PyObject *args)
+PyObject *pyLSwriteBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1692,7 +3050,7 @@ PyObject *pyLSwriteBasis(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszFname,
                                  &nFormat))
@@ -1711,7 +3069,7 @@ PyObject *pyLSwriteBasis(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadLPFile(PyObject *self, PyObject *args)
+PyObject *pyLSreadLPFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1719,7 +3077,7 @@ PyObject *pyLSreadLPFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -1727,6 +3085,7 @@ PyObject *pyLSreadLPFile(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     errorcode = LSreadLPFile(pModel,pszFname);
 
@@ -1737,7 +3096,7 @@ PyObject *pyLSreadLPFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadLPStream(PyObject *self, PyObject *args)
+PyObject *pyLSreadLPStream(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1746,7 +3105,7 @@ PyObject *pyLSreadLPStream(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszStream,
                                  &nStreamLen))
@@ -1755,6 +3114,7 @@ PyObject *pyLSreadLPStream(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     errorcode = LSreadLPStream(pModel,pszStream,nStreamLen);
 
@@ -1768,7 +3128,7 @@ PyObject *pyLSreadLPStream(PyObject *self, PyObject *args)
 /********************************************************
  * Error Handling Routines (3)                          *
  ********************************************************/
-PyObject *pyLSgetErrorMessage(PyObject *self, PyObject *args)
+PyObject *pyLSgetErrorMessage(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -1779,7 +3139,7 @@ PyObject *pyLSgetErrorMessage(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyMessage = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO",
+    if (!pyParseArgs(args, nargs, "OiO",
                                  &pyEnv,
                                  &nErrorCode,
                                  &pyMessage))
@@ -1797,7 +3157,7 @@ PyObject *pyLSgetErrorMessage(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetVersionInfo(PyObject *self, PyObject *args)
+PyObject *pyLSgetVersionInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     char      *ver_num = NULL, *build_date=NULL;
@@ -1806,7 +3166,7 @@ PyObject *pyLSgetVersionInfo(PyObject *self, PyObject *args)
     PyArrayObject  *pyver_num = NULL;
     PyArrayObject  *pybuild_date = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO",
+    if (!pyParseArgs(args, nargs, "OO",
                                  &pyver_num,
                                  &pybuild_date))
     {
@@ -1824,7 +3184,7 @@ PyObject *pyLSgetVersionInfo(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetFileError(PyObject *self, PyObject *args)
+PyObject *pyLSgetFileError(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1836,7 +3196,7 @@ PyObject *pyLSgetFileError(PyObject *self, PyObject *args)
     PyArrayObject  *pyLinetxt = NULL;
     PyArrayObject  *pyLinenum = NULL;
 
-    if (!PyArg_ParseTuple(args, "OOO",
+    if (!pyParseArgs(args, nargs, "OOO",
                                  &pyModel,
                                  &pyLinenum,
                                  &pyLinetxt))
@@ -1860,7 +3220,7 @@ PyObject *pyLSgetFileError(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetErrorRowIndex(PyObject *self, PyObject *args)
+PyObject *pyLSgetErrorRowIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1870,7 +3230,7 @@ PyObject *pyLSgetErrorRowIndex(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyRow = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO",
+    if (!pyParseArgs(args, nargs, "OO",
                                  &pyModel,
                                  &pyRow))
     {
@@ -1894,7 +3254,7 @@ PyObject *pyLSgetErrorRowIndex(PyObject *self, PyObject *args)
 /***********************************************************
  * Routines for Setting and Retrieving Parameter Values(21)*
  ***********************************************************/
-PyObject *pyLSsetModelParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetModelParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1905,10 +3265,10 @@ PyObject *pyLSsetModelParameter(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA",
                                  &pyModel,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -1927,7 +3287,7 @@ PyObject *pyLSsetModelParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetModelParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetModelParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -1938,10 +3298,10 @@ PyObject *pyLSgetModelParameter(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA*",
                                  &pyModel,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -1960,7 +3320,7 @@ PyObject *pyLSgetModelParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetEnvParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetEnvParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -1971,10 +3331,10 @@ PyObject *pyLSsetEnvParameter(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA",
                                  &pyEnv,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -1993,7 +3353,7 @@ PyObject *pyLSsetEnvParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetEnvParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetEnvParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2004,10 +3364,10 @@ PyObject *pyLSgetEnvParameter(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA*",
                                  &pyEnv,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -2026,7 +3386,7 @@ PyObject *pyLSgetEnvParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetModelDouParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetModelDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2035,7 +3395,7 @@ PyObject *pyLSsetModelDouParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oid",
+    if (!pyParseArgs(args, nargs, "Oid",
                                  &pyModel,
                                  &nParameter,
                                  &dValue))
@@ -2054,7 +3414,7 @@ PyObject *pyLSsetModelDouParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetModelDouParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetModelDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2065,10 +3425,10 @@ PyObject *pyLSgetModelDouParameter(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -2087,7 +3447,7 @@ PyObject *pyLSgetModelDouParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetModelIntParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetModelIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2096,7 +3456,7 @@ PyObject *pyLSsetModelIntParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
                                  &pyModel,
                                  &nParameter,
                                  &nValue))
@@ -2115,7 +3475,7 @@ PyObject *pyLSsetModelIntParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetModelIntParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetModelIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2126,10 +3486,10 @@ PyObject *pyLSgetModelIntParameter(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
                                  &pyModel,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -2148,7 +3508,7 @@ PyObject *pyLSgetModelIntParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetEnvDouParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetEnvDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2157,7 +3517,7 @@ PyObject *pyLSsetEnvDouParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyEnv;
 
-    if (!PyArg_ParseTuple(args, "Oid",
+    if (!pyParseArgs(args, nargs, "Oid",
                                  &pyEnv,
                                  &nParameter,
                                  &dValue))
@@ -2176,7 +3536,7 @@ PyObject *pyLSsetEnvDouParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetEnvDouParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetEnvDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2187,10 +3547,10 @@ PyObject *pyLSgetEnvDouParameter(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyEnv,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -2209,7 +3569,7 @@ PyObject *pyLSgetEnvDouParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetEnvIntParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetEnvIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2218,7 +3578,7 @@ PyObject *pyLSsetEnvIntParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyEnv;
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
                                  &pyEnv,
                                  &nParameter,
                                  &nValue))
@@ -2237,7 +3597,7 @@ PyObject *pyLSsetEnvIntParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetEnvIntParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetEnvIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2248,10 +3608,10 @@ PyObject *pyLSgetEnvIntParameter(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
                                  &pyEnv,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -2270,7 +3630,7 @@ PyObject *pyLSgetEnvIntParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadModelParameter(PyObject *self, PyObject *args)
+PyObject *pyLSreadModelParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2278,7 +3638,7 @@ PyObject *pyLSreadModelParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -2296,7 +3656,7 @@ PyObject *pyLSreadModelParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadEnvParameter(PyObject *self, PyObject *args)
+PyObject *pyLSreadEnvParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2304,7 +3664,7 @@ PyObject *pyLSreadEnvParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyEnv;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyEnv,
                                  &pszFname))
     {
@@ -2322,7 +3682,7 @@ PyObject *pyLSreadEnvParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteModelParameter(PyObject *self, PyObject *args)
+PyObject *pyLSwriteModelParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2330,7 +3690,7 @@ PyObject *pyLSwriteModelParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
     {
@@ -2348,7 +3708,7 @@ PyObject *pyLSwriteModelParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetIntParameterRange(PyObject *self, PyObject *args)
+PyObject *pyLSgetIntParameterRange(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2361,11 +3721,11 @@ PyObject *pyLSgetIntParameterRange(PyObject *self, PyObject *args)
     PyArrayObject  *pyValMIN = NULL;
     PyArrayObject  *pyValMAX = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*",
                                  &pyModel,
                                  &nParameter,
-                                 &PyArray_Type,&pyValMIN,
-                                 &PyArray_Type,&pyValMAX))
+                                 &pyValMIN,
+                                 &pyValMAX))
     {
         return NULL;
     }
@@ -2386,7 +3746,7 @@ PyObject *pyLSgetIntParameterRange(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetDouParameterRange(PyObject *self, PyObject *args)
+PyObject *pyLSgetDouParameterRange(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2399,11 +3759,11 @@ PyObject *pyLSgetDouParameterRange(PyObject *self, PyObject *args)
     PyArrayObject  *pyValMIN = NULL;
     PyArrayObject  *pyValMAX = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiD*D*",
                                  &pyModel,
                                  &nParameter,
-                                 &PyArray_Type,&pyValMIN,
-                                 &PyArray_Type,&pyValMAX))
+                                 &pyValMIN,
+                                 &pyValMAX))
     {
         return NULL;
     }
@@ -2424,7 +3784,7 @@ PyObject *pyLSgetDouParameterRange(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetParamShortDesc(PyObject *self, PyObject *args)
+PyObject *pyLSgetParamShortDesc(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2435,10 +3795,10 @@ PyObject *pyLSgetParamShortDesc(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyDescription = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyEnv,
                                  &nParam,
-                                 &PyArray_Type,&pyDescription))
+                                 &pyDescription))
     {
         return NULL;
     }
@@ -2457,7 +3817,7 @@ PyObject *pyLSgetParamShortDesc(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetParamLongDesc(PyObject *self, PyObject *args)
+PyObject *pyLSgetParamLongDesc(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2468,10 +3828,10 @@ PyObject *pyLSgetParamLongDesc(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyDescription = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyEnv,
                                  &nParam,
-                                 &PyArray_Type,&pyDescription))
+                                 &pyDescription))
     {
         return NULL;
     }
@@ -2490,7 +3850,7 @@ PyObject *pyLSgetParamLongDesc(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetParamMacroName(PyObject *self, PyObject *args)
+PyObject *pyLSgetParamMacroName(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2501,10 +3861,10 @@ PyObject *pyLSgetParamMacroName(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyParam = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyEnv,
                                  &nParam,
-                                 &PyArray_Type,&pyParam))
+                                 &pyParam))
     {
         return NULL;
     }
@@ -2523,7 +3883,7 @@ PyObject *pyLSgetParamMacroName(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetParamMacroID(PyObject *self, PyObject *args)
+PyObject *pyLSgetParamMacroID(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -2536,11 +3896,11 @@ PyObject *pyLSgetParamMacroID(PyObject *self, PyObject *args)
     PyArrayObject  *pyParamType = NULL;
     PyArrayObject  *pyParam = NULL;
 
-    if (!PyArg_ParseTuple(args, "OsO!O!",
+    if (!pyParseArgs(args, nargs, "OsN*N*",
                                  &pyEnv,
                                  &szParam,
-                                 &PyArray_Type,&pyParamType,
-                                 &PyArray_Type,&pyParam))
+                                 &pyParamType,
+                                 &pyParam))
     {
         return NULL;
     }
@@ -2564,7 +3924,7 @@ PyObject *pyLSgetParamMacroID(PyObject *self, PyObject *args)
 /********************************************************
 * Model Loading Routines (10)                           *
 *********************************************************/
-PyObject *pyLSloadLPData(PyObject *self, PyObject *args)
+PyObject *pyLSloadLPData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2583,28 +3943,38 @@ PyObject *pyLSloadLPData(PyObject *self, PyObject *args)
     PyArrayObject  *pynAcols = NULL,*pyAcoef = NULL;
     PyArrayObject  *pyArows = NULL, *pyL = NULL, *pyU = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiidO!O!O!iO!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiiidDDSiXXDXDD",
                                  &pyModel,
                                  &nCons,
                                  &nVars,
                                  &nObjSense,
                                  &dObjConst,
-                                 &PyArray_Type,&pyC,
-                                 &PyArray_Type,&pyB,
-                                 &PyArray_Type,&pyConTypes,
+                                 &pyC,
+                                 &pyB,
+                                 &pyConTypes,
                                  &nAnnz,
-                                 &PyArray_Type,&pyiAcols,
-                                 &PyArray_Type,&pynAcols,
-                                 &PyArray_Type,&pyAcoef,
-                                 &PyArray_Type,&pyArows,
-                                 &PyArray_Type,&pyL,
-                                 &PyArray_Type,&pyU))
+                                 &pyiAcols,
+                                 &pynAcols,
+                                 &pyAcoef,
+                                 &pyArows,
+                                 &pyL,
+                                 &pyU))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 2, pyB, pyConTypes))
+        return NULL;
+    if (!pyArgLen("nVars", nVars, 4, pyC, pynAcols, pyL, pyU))
+        return NULL;
+    if (!pyArgLen("nVars+1", (npy_intp)nVars + 1, 1, pyiAcols))
+        return NULL;
+    if (!pyArgLen("nAnnz", nAnnz, 2, pyAcoef, pyArows))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyC && PyArray_DIMS(pyC) > 0)
         padC = (double *)PyArray_DATA(pyC);
@@ -2648,7 +4018,7 @@ PyObject *pyLSloadLPData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadQCData(PyObject *self, PyObject *args)
+PyObject *pyLSloadQCData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2660,18 +4030,21 @@ PyObject *pyLSloadQCData(PyObject *self, PyObject *args)
     PyArrayObject  *pyQCrows = NULL, *pyQCcols = NULL;
     PyArrayObject  *pyQCcols2 = NULL, *pyQCcoef = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiXXXD",
                                  &pyModel,
                                  &nQCnnz,
-                                 &PyArray_Type,&pyQCrows,
-                                 &PyArray_Type,&pyQCcols,
-                                 &PyArray_Type,&pyQCcols2,
-                                 &PyArray_Type,&pyQCcoef))
+                                 &pyQCrows,
+                                 &pyQCcols,
+                                 &pyQCcols2,
+                                 &pyQCcoef))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nQCnnz", nQCnnz, 4, pyQCrows, pyQCcols, pyQCcols2, pyQCcoef))
+        return NULL;
+
     CHECK_MODEL;
 
      if(pyQCrows && PyArray_DIMS(pyQCrows) > 0)
@@ -2697,7 +4070,7 @@ PyObject *pyLSloadQCData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadConeData(PyObject *self, PyObject *args)
+PyObject *pyLSloadConeData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2711,18 +4084,23 @@ PyObject *pyLSloadConeData(PyObject *self, PyObject *args)
     PyArrayObject  *pyConecols = NULL;
 	PyArrayObject  *pyadConeAlpha;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiSDNN",
                                  &pyModel,
                                  &nCone,
-                                 &PyArray_Type,&pyConeTypes,
-								 &PyArray_Type,&pyadConeAlpha,
-                                 &PyArray_Type,&pyConebegcone,
-                                 &PyArray_Type,&pyConecols))
+                                 &pyConeTypes,
+								 &pyadConeAlpha,
+                                 &pyConebegcone,
+                                 &pyConecols))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCone", nCone, 2, pyConeTypes, pyadConeAlpha))
+        return NULL;
+    if (!pyArgLen("nCone+1", (npy_intp)nCone + 1, 1, pyConebegcone))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyConeTypes && PyArray_DIMS(pyConeTypes) > 0)
@@ -2747,7 +4125,7 @@ PyObject *pyLSloadConeData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadSETSData(PyObject *self, PyObject *args)
+PyObject *pyLSloadSETSData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2759,18 +4137,23 @@ PyObject *pyLSloadSETSData(PyObject *self, PyObject *args)
     PyArrayObject  *pySETStype = NULL, *pyCARDnum = NULL;
     PyArrayObject  *pySETSbegcol = NULL, *pySETScols = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiSNNN",
                                  &pyModel,
                                  &nSETS,
-                                 &PyArray_Type,&pySETStype,
-                                 &PyArray_Type,&pyCARDnum,
-                                 &PyArray_Type,&pySETSbegcol,
-                                 &PyArray_Type,&pySETScols))
+                                 &pySETStype,
+                                 &pyCARDnum,
+                                 &pySETSbegcol,
+                                 &pySETScols))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nSETS", nSETS, 2, pySETStype, pyCARDnum))
+        return NULL;
+    if (!pyArgLen("nSETS+1", (npy_intp)nSETS + 1, 1, pySETSbegcol))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pySETStype && PyArray_DIMS(pySETStype) > 0)
@@ -2796,7 +4179,7 @@ PyObject *pyLSloadSETSData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadSemiContData(PyObject *self, PyObject *args)
+PyObject *pyLSloadSemiContData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2807,17 +4190,20 @@ PyObject *pyLSloadSemiContData(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVars = NULL, *pyL = NULL, *pyU = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiNDD",
                                  &pyModel,
                                  &nSCVars,
-                                 &PyArray_Type,&pyVars,
-                                 &PyArray_Type,&pyL,
-                                 &PyArray_Type,&pyU))
+                                 &pyVars,
+                                 &pyL,
+                                 &pyU))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nSCVars", nSCVars, 3, pyVars, pyL, pyU))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyVars && PyArray_DIMS(pyVars) > 0)
@@ -2840,7 +4226,7 @@ PyObject *pyLSloadSemiContData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadVarType(PyObject *self, PyObject *args)
+PyObject *pyLSloadVarType(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2849,9 +4235,9 @@ PyObject *pyLSloadVarType(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVarTypes = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OS",
                                  &pyModel,
-                                 &PyArray_Type,&pyVarTypes))
+                                 &pyVarTypes))
 
     {
         return NULL;
@@ -2872,7 +4258,7 @@ PyObject *pyLSloadVarType(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadNLPData(PyObject *self, PyObject *args)
+PyObject *pyLSloadNLPData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2886,21 +4272,25 @@ PyObject *pyLSloadNLPData(PyObject *self, PyObject *args)
     PyArrayObject  *pyiNLPcols,*pynNLPcols,*pyNLPcoef,*pyNLProws;
     PyArrayObject  *pyiNLPobj,*pydNLPobj;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!iO!O!",
+    if (!pyParseArgs(args, nargs, "ONNDNiND",
                                  &pyModel,
-                                 &PyArray_Type,&pyiNLPcols,
-                                 &PyArray_Type,&pynNLPcols,
-                                 &PyArray_Type,&pyNLPcoef,
-                                 &PyArray_Type,&pyNLProws,
+                                 &pyiNLPcols,
+                                 &pynNLPcols,
+                                 &pyNLPcoef,
+                                 &pyNLProws,
                                  &nNLPobj,
-                                 &PyArray_Type,&pyiNLPobj,
-                                 &PyArray_Type,&pydNLPobj))
+                                 &pyiNLPobj,
+                                 &pydNLPobj))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nNLPobj", nNLPobj, 2, pyiNLPobj, pydNLPobj))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyiNLPcols && PyArray_DIMS(pyiNLPcols) > 0)
         paiNLPcols = (int *)PyArray_DATA(pyiNLPcols);
@@ -2931,7 +4321,7 @@ PyObject *pyLSloadNLPData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadInstruct(PyObject *self, PyObject *args)
+PyObject *pyLSloadInstruct(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -2952,32 +4342,44 @@ PyObject *pyLSloadInstruct(PyObject *self, PyObject *args)
     PyArrayObject  *pyObjLen =NULL,*pyConBeg =NULL;
     PyArrayObject  *pyConLen =NULL,*pyLB =NULL,*pyUB =NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiiiO!O!O!O!iO!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiiiiNSSNiNDDNNNNDD",
                                  &pyModel,
                                  &nCons,
                                  &nObjs,
                                  &nVars,
                                  &nNumbers,
-                                 &PyArray_Type,&pyObjSense,
-                                 &PyArray_Type,&pyConType,
-                                 &PyArray_Type,&pyVarType,
-                                 &PyArray_Type,&pyInstruct,
+                                 &pyObjSense,
+                                 &pyConType,
+                                 &pyVarType,
+                                 &pyInstruct,
                                  &nInstruct,
-                                 &PyArray_Type,&pyVars,
-                                 &PyArray_Type,&pyNumVal,
-                                 &PyArray_Type,&pyVarVal,
-                                 &PyArray_Type,&pyObjBeg,
-                                 &PyArray_Type,&pyObjLen,
-                                 &PyArray_Type,&pyConBeg,
-                                 &PyArray_Type,&pyConLen,
-                                 &PyArray_Type,&pyLB,
-                                 &PyArray_Type,&pyUB))
+                                 &pyVars,
+                                 &pyNumVal,
+                                 &pyVarVal,
+                                 &pyObjBeg,
+                                 &pyObjLen,
+                                 &pyConBeg,
+                                 &pyConLen,
+                                 &pyLB,
+                                 &pyUB))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 3, pyConType, pyConBeg, pyConLen))
+        return NULL;
+    if (!pyArgLen("nObjs", nObjs, 3, pyObjSense, pyObjBeg, pyObjLen))
+        return NULL;
+    if (!pyArgLen("nVars", nVars, 4, pyVarType, pyVarVal, pyLB, pyUB))
+        return NULL;
+    if (!pyArgLen("nNumbers", nNumbers, 1, pyNumVal))
+        return NULL;
+    if (!pyArgLen("nInstruct", nInstruct, 1, pyInstruct))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyObjSense && PyArray_DIMS(pyObjSense) > 0)
         panObjSense = (int *)PyArray_DATA(pyObjSense);
@@ -3033,7 +4435,7 @@ PyObject *pyLSloadInstruct(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddInstruct(PyObject *self, PyObject *args)
+PyObject *pyLSaddInstruct(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3054,32 +4456,44 @@ PyObject *pyLSaddInstruct(PyObject *self, PyObject *args)
     PyArrayObject  *pyObjLen =NULL,*pyConBeg =NULL;
     PyArrayObject  *pyConLen =NULL,*pyLB =NULL,*pyUB =NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiiiO!O!O!O!iO!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiiiiNSSNiNDDNNNNDD",
                                  &pyModel,
                                  &nCons,
                                  &nObjs,
                                  &nVars,
                                  &nNumbers,
-                                 &PyArray_Type,&pyObjSense,
-                                 &PyArray_Type,&pyConType,
-                                 &PyArray_Type,&pyVarType,
-                                 &PyArray_Type,&pyInstruct,
+                                 &pyObjSense,
+                                 &pyConType,
+                                 &pyVarType,
+                                 &pyInstruct,
                                  &nInstruct,
-                                 &PyArray_Type,&pyCons,
-                                 &PyArray_Type,&pyNumVal,
-                                 &PyArray_Type,&pyVarVal,
-                                 &PyArray_Type,&pyObjBeg,
-                                 &PyArray_Type,&pyObjLen,
-                                 &PyArray_Type,&pyConBeg,
-                                 &PyArray_Type,&pyConLen,
-                                 &PyArray_Type,&pyLB,
-                                 &PyArray_Type,&pyUB))
+                                 &pyCons,
+                                 &pyNumVal,
+                                 &pyVarVal,
+                                 &pyObjBeg,
+                                 &pyObjLen,
+                                 &pyConBeg,
+                                 &pyConLen,
+                                 &pyLB,
+                                 &pyUB))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 3, pyConType, pyConBeg, pyConLen))
+        return NULL;
+    if (!pyArgLen("nObjs", nObjs, 3, pyObjSense, pyObjBeg, pyObjLen))
+        return NULL;
+    if (!pyArgLen("nVars", nVars, 4, pyVarType, pyVarVal, pyLB, pyUB))
+        return NULL;
+    if (!pyArgLen("nNumbers", nNumbers, 1, pyNumVal))
+        return NULL;
+    if (!pyArgLen("nInstruct", nInstruct, 1, pyInstruct))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyObjSense && PyArray_DIMS(pyObjSense) > 0)
         panObjSense = (int *)PyArray_DATA(pyObjSense);
@@ -3137,7 +4551,7 @@ PyObject *pyLSaddInstruct(PyObject *self, PyObject *args)
 /**********************************************************************
  * Solver Initialization Routines (9)                                 *
  **********************************************************************/
-PyObject *pyLSloadBasis(PyObject *self, PyObject *args)
+PyObject *pyLSloadBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3146,10 +4560,10 @@ PyObject *pyLSloadBasis(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCstatus = NULL,*pyRstatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "ONN",
                                  &pyModel,
-                                 &PyArray_Type,&pyCstatus,
-                                 &PyArray_Type,&pyRstatus))
+                                 &pyCstatus,
+                                 &pyRstatus))
 
     {
         return NULL;
@@ -3173,7 +4587,7 @@ PyObject *pyLSloadBasis(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadVarPriorities(PyObject *self, PyObject *args)
+PyObject *pyLSloadVarPriorities(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3182,9 +4596,9 @@ PyObject *pyLSloadVarPriorities(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCprior = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON",
                                  &pyModel,
-                                 &PyArray_Type,&pyCprior))
+                                 &pyCprior))
 
     {
         return NULL;
@@ -3205,7 +4619,7 @@ PyObject *pyLSloadVarPriorities(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadVarPriorities(PyObject *self, PyObject *args)
+PyObject *pyLSreadVarPriorities(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3214,7 +4628,7 @@ PyObject *pyLSreadVarPriorities(PyObject *self, PyObject *args)
     PyObject  *pyModel;
 
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
 
@@ -3234,7 +4648,7 @@ PyObject *pyLSreadVarPriorities(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadVarStartPoint(PyObject *self, PyObject *args)
+PyObject *pyLSloadVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3243,9 +4657,9 @@ PyObject *pyLSloadVarStartPoint(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyPrimal = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OD",
                                  &pyModel,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pyPrimal))
 
     {
         return NULL;
@@ -3266,7 +4680,7 @@ PyObject *pyLSloadVarStartPoint(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadVarStartPointPartial(PyObject *self, PyObject *args)
+PyObject *pyLSloadVarStartPointPartial(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3277,16 +4691,19 @@ PyObject *pyLSloadVarStartPointPartial(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCols = NULL,*pyPrimal = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiND",
                                  &pyModel,
                                  &nCols,
-                                 &PyArray_Type,&pyCols,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pyCols,
+                                 &pyPrimal))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCols", nCols, 2, pyCols, pyPrimal))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyCols && PyArray_DIMS(pyCols) > 0)
@@ -3306,7 +4723,7 @@ PyObject *pyLSloadVarStartPointPartial(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadMIPVarStartPoint(PyObject *self, PyObject *args)
+PyObject *pyLSloadMIPVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3315,9 +4732,9 @@ PyObject *pyLSloadMIPVarStartPoint(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyPrimal = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OD",
                                  &pyModel,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pyPrimal))
 
     {
         return NULL;
@@ -3338,7 +4755,7 @@ PyObject *pyLSloadMIPVarStartPoint(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadMIPVarStartPointPartial(PyObject *self, PyObject *args)
+PyObject *pyLSloadMIPVarStartPointPartial(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3349,16 +4766,19 @@ PyObject *pyLSloadMIPVarStartPointPartial(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCols = NULL,*pyPrimal = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiNN",
                                  &pyModel,
                                  &nCols,
-                                 &PyArray_Type,&pyCols,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pyCols,
+                                 &pyPrimal))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCols", nCols, 2, pyCols, pyPrimal))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyCols && PyArray_DIMS(pyCols) > 0)
@@ -3378,7 +4798,7 @@ PyObject *pyLSloadMIPVarStartPointPartial(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadVarStartPoint(PyObject *self, PyObject *args)
+PyObject *pyLSreadVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3387,7 +4807,7 @@ PyObject *pyLSreadVarStartPoint(PyObject *self, PyObject *args)
     PyObject  *pyModel;
 
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
                                  &pyModel,
                                  &pszFname))
 
@@ -3407,7 +4827,7 @@ PyObject *pyLSreadVarStartPoint(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadBlockStructure(PyObject *self, PyObject *args)
+PyObject *pyLSloadBlockStructure(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3418,11 +4838,11 @@ PyObject *pyLSloadBlockStructure(PyObject *self, PyObject *args)
     PyArrayObject  *pyRblock = NULL,*pyCblock = NULL;
 
 
-    if (!PyArg_ParseTuple(args, "OiO!O!i",
+    if (!pyParseArgs(args, nargs, "OiNNi",
                                  &pyModel,
                                  &nBlock,
-                                 &PyArray_Type,&pyRblock,
-                                 &PyArray_Type,&pyCblock,
+                                 &pyRblock,
+                                 &pyCblock,
                                  &nType))
 
     {
@@ -3452,7 +4872,7 @@ PyObject *pyLSloadBlockStructure(PyObject *self, PyObject *args)
 /**********************************************************************
  * Optimization Routines (6)                                          *
  **********************************************************************/
-PyObject *pyLSoptimize(PyObject *self, PyObject *args)
+PyObject *pyLSoptimize(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3463,10 +4883,10 @@ PyObject *pyLSoptimize(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
                                  &pyModel,
                                  &nMethod,
-                                 &PyArray_Type,&pyStatus))
+                                 &pyStatus))
     {
         return NULL;
     }
@@ -3476,7 +4896,9 @@ PyObject *pyLSoptimize(PyObject *self, PyObject *args)
     if(pyStatus && PyArray_DIMS(pyStatus) > 0)
         pnStatus = (int *)PyArray_GetPtr(pyStatus,index);
 
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSoptimize(pModel,nMethod,pnStatus);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -3485,7 +4907,7 @@ PyObject *pyLSoptimize(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsolveMIP(PyObject *self, PyObject *args)
+PyObject *pyLSsolveMIP(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3495,9 +4917,9 @@ PyObject *pyLSsolveMIP(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyMIPSolStatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pyMIPSolStatus))
+                                 &pyMIPSolStatus))
     {
         return NULL;
     }
@@ -3507,7 +4929,9 @@ PyObject *pyLSsolveMIP(PyObject *self, PyObject *args)
     if(pyMIPSolStatus && PyArray_DIMS(pyMIPSolStatus) > 0)
         pnMIPSolStatus = (int *)PyArray_GetPtr(pyMIPSolStatus,index);
 
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSsolveMIP(pModel,pnMIPSolStatus);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -3516,7 +4940,7 @@ PyObject *pyLSsolveMIP(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsolveGOP(PyObject *self, PyObject *args)
+PyObject *pyLSsolveGOP(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3526,9 +4950,9 @@ PyObject *pyLSsolveGOP(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyGOPSolStatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pyGOPSolStatus))
+                                 &pyGOPSolStatus))
     {
         return NULL;
     }
@@ -3538,7 +4962,9 @@ PyObject *pyLSsolveGOP(PyObject *self, PyObject *args)
     if(pyGOPSolStatus && PyArray_DIMS(pyGOPSolStatus) > 0)
         pnGOPSolStatus = (int *)PyArray_GetPtr(pyGOPSolStatus,index);
 
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSsolveGOP(pModel,pnGOPSolStatus);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -3547,7 +4973,7 @@ PyObject *pyLSsolveGOP(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSoptimizeQP(PyObject *self, PyObject *args)
+PyObject *pyLSoptimizeQP(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3557,9 +4983,9 @@ PyObject *pyLSoptimizeQP(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyQPSolStatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pyQPSolStatus))
+                                 &pyQPSolStatus))
     {
         return NULL;
     }
@@ -3569,7 +4995,9 @@ PyObject *pyLSoptimizeQP(PyObject *self, PyObject *args)
     if(pyQPSolStatus && PyArray_DIMS(pyQPSolStatus) > 0)
         pnQPSolStatus = (int *)PyArray_GetPtr(pyQPSolStatus,index);
 
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSoptimizeQP(pModel,pnQPSolStatus);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -3578,14 +5006,14 @@ PyObject *pyLSoptimizeQP(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLScheckConvexity(PyObject *self, PyObject *args)
+PyObject *pyLScheckConvexity(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
                                  &pyModel))
     {
         return NULL;
@@ -3602,7 +5030,7 @@ PyObject *pyLScheckConvexity(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsolveSBD(PyObject *self, PyObject *args)
+PyObject *pyLSsolveSBD(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3613,12 +5041,12 @@ PyObject *pyLSsolveSBD(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStatus = NULL,*panColStage,*panRowStage;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiNNN*",
                                  &pyModel,
                                  &nStages,
-                                 &PyArray_Type,&panRowStage,
-                                 &PyArray_Type,&panColStage,
-                                 &PyArray_Type,&pyStatus))
+                                 &panRowStage,
+                                 &panColStage,
+                                 &pyStatus))
     {
         return NULL;
     }
@@ -3628,11 +5056,13 @@ PyObject *pyLSsolveSBD(PyObject *self, PyObject *args)
     if(pyStatus && PyArray_DIMS(pyStatus) > 0)
         pnStatus = (int *)PyArray_GetPtr(pyStatus,index);
 
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSsolveSBD(pModel,
                            nStages,
-                           (int *)PyArray_DATA(panRowStage),
-                           (int *)PyArray_DATA(panColStage),
+                           panRowStage ? (int *)PyArray_DATA(panRowStage) : NULL,
+                           panColStage ? (int *)PyArray_DATA(panColStage) : NULL,
                            pnStatus);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -3643,7 +5073,7 @@ PyObject *pyLSsolveSBD(PyObject *self, PyObject *args)
 /**********************************************************************
  * Solution Query Routines (14)                                       *
 **********************************************************************/
-PyObject *pyLSgetInfo(PyObject *self, PyObject *args)
+PyObject *pyLSgetInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel = NULL;
@@ -3654,10 +5084,10 @@ PyObject *pyLSgetInfo(PyObject *self, PyObject *args)
     PyObject       *pyModel = NULL;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA*",
                                  &pyModel,
                                  &nQuery,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -3677,196 +5107,224 @@ PyObject *pyLSgetInfo(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetPrimalSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetPrimalSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padPrimal = NULL;
-    npy_intp  index[1] = {0};
+    int       nVars = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pyPrimal = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyPrimal && PyArray_DIMS(pyPrimal) > 0)
-        padPrimal = (double *)PyArray_GetPtr(pyPrimal,index);
-
-    errorcode = LSgetPrimalSolution(pModel,padPrimal);
-
+    errorcode = pyGetModelDims(pModel,&nVars,NULL);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pyPrimal = pyOutArray(pyOut,nVars,NPY_DOUBLE,"padPrimal");
+    if (!pyPrimal)
+        return NULL;
+
+    errorcode = LSgetPrimalSolution(pModel,(double *)PyArray_DATA(pyPrimal));
+
+    return pyOutResult(pyOut,pyPrimal,errorcode);
 }
 
-PyObject *pyLSgetDualSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetDualSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padDual = NULL;
-    npy_intp  index[1] = {0};
+    int       nCons = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pyDual = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pyDual))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyDual && PyArray_DIMS(pyDual) > 0)
-        padDual = (double *)PyArray_GetPtr(pyDual,index);
-
-    errorcode = LSgetDualSolution(pModel,padDual);
-
+    errorcode = pyGetModelDims(pModel,NULL,&nCons);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pyDual = pyOutArray(pyOut,nCons,NPY_DOUBLE,"padDual");
+    if (!pyDual)
+        return NULL;
+
+    errorcode = LSgetDualSolution(pModel,(double *)PyArray_DATA(pyDual));
+
+    return pyOutResult(pyOut,pyDual,errorcode);
 }
 
-PyObject *pyLSgetReducedCosts(PyObject *self, PyObject *args)
+PyObject *pyLSgetReducedCosts(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padRedcosts = NULL;
-    npy_intp  index[1] = {0};
+    int       nVars = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pyRedcosts = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pyRedcosts))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyRedcosts && PyArray_DIMS(pyRedcosts) > 0)
-        padRedcosts = (double *)PyArray_GetPtr(pyRedcosts,index);
-
-    errorcode = LSgetReducedCosts(pModel,padRedcosts);
-
+    errorcode = pyGetModelDims(pModel,&nVars,NULL);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pyRedcosts = pyOutArray(pyOut,nVars,NPY_DOUBLE,"padRedcosts");
+    if (!pyRedcosts)
+        return NULL;
+
+    errorcode = LSgetReducedCosts(pModel,(double *)PyArray_DATA(pyRedcosts));
+
+    return pyOutResult(pyOut,pyRedcosts,errorcode);
 }
 
-PyObject *pyLSgetReducedCostsCone(PyObject *self, PyObject *args)
+PyObject *pyLSgetReducedCostsCone(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padRedcosts = NULL;
-    npy_intp  index[1] = {0};
+    int       nVars = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pyRedcosts = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pyRedcosts))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyRedcosts && PyArray_DIMS(pyRedcosts) > 0)
-        padRedcosts = (double *)PyArray_GetPtr(pyRedcosts,index);
-
-    errorcode = LSgetReducedCostsCone(pModel,padRedcosts);
-
+    errorcode = pyGetModelDims(pModel,&nVars,NULL);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pyRedcosts = pyOutArray(pyOut,nVars,NPY_DOUBLE,"padRedcosts");
+    if (!pyRedcosts)
+        return NULL;
+
+    errorcode = LSgetReducedCostsCone(pModel,(double *)PyArray_DATA(pyRedcosts));
+
+    return pyOutResult(pyOut,pyRedcosts,errorcode);
 }
 
-PyObject *pyLSgetSlacks(PyObject *self, PyObject *args)
+PyObject *pyLSgetSlacks(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padSlacks = NULL;
-    npy_intp  index[1] = {0};
+    int       nCons = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pySlacks = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pySlacks))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pySlacks && PyArray_DIMS(pySlacks) > 0)
-        padSlacks = (double *)PyArray_GetPtr(pySlacks,index);
-
-    errorcode = LSgetSlacks(pModel,padSlacks);
-
+    errorcode = pyGetModelDims(pModel,NULL,&nCons);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pySlacks = pyOutArray(pyOut,nCons,NPY_DOUBLE,"padSlacks");
+    if (!pySlacks)
+        return NULL;
+
+    errorcode = LSgetSlacks(pModel,(double *)PyArray_DATA(pySlacks));
+
+    return pyOutResult(pyOut,pySlacks,errorcode);
 }
 
-PyObject *pyLSgetBasis(PyObject *self, PyObject *args)
+PyObject *pyLSgetBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    int       *panCstatus = NULL,*panRstatus = NULL;
-    npy_intp  index[1] = {0};
+    int       nVars = 0, nCons = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOutC = NULL, *pyOutR = NULL;
     PyArrayObject  *pyCstatus = NULL,*pyRstatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "O|OO",
                                  &pyModel,
-                                 &PyArray_Type,&pyCstatus,
-                                 &PyArray_Type,&pyRstatus))
+                                 &pyOutC,
+                                 &pyOutR))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyCstatus && PyArray_DIMS(pyCstatus) > 0)
-        panCstatus = (int *)PyArray_GetPtr(pyCstatus,index);
-    if(pyRstatus && PyArray_DIMS(pyRstatus) > 0)
-        panRstatus = (int *)PyArray_GetPtr(pyRstatus,index);
+    errorcode = pyGetModelDims(pModel,&nVars,&nCons);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+
+    pyCstatus = pyOutArray(pyOutC,nVars,NPY_INT,"panCstatus");
+    if (!pyCstatus)
+        return NULL;
+    pyRstatus = pyOutArray(pyOutR,nCons,NPY_INT,"panRstatus");
+    if (!pyRstatus) {
+        Py_DECREF(pyCstatus);
+        return NULL;
+    }
 
-    errorcode = LSgetBasis(pModel,panCstatus,panRstatus);
+    errorcode = LSgetBasis(pModel,
+                           (int *)PyArray_DATA(pyCstatus),
+                           (int *)PyArray_DATA(pyRstatus));
 
     if (errorcode != 0){
+        Py_DECREF(pyCstatus);
+        Py_DECREF(pyRstatus);
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    if (pyOutC && pyOutC != Py_None && pyOutR && pyOutR != Py_None) {
+        Py_DECREF(pyCstatus);
+        Py_DECREF(pyRstatus);
+        return Py_BuildValue("i",errorcode);
+    }
+    return Py_BuildValue("NN",pyCstatus,pyRstatus);
 }
 
-PyObject *pyLSgetSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -3877,10 +5335,10 @@ PyObject *pyLSgetSolution(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVal = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &nWhich,
-                                 &PyArray_Type,&pyVal))
+                                 &pyVal))
     {
         return NULL;
     }
@@ -3899,165 +5357,191 @@ PyObject *pyLSgetSolution(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetMIPPrimalSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetMIPPrimalSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padPrimal = NULL;
-    npy_intp  index[1] = {0};
+    int       nVars = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pyPrimal = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyPrimal && PyArray_DIMS(pyPrimal) > 0)
-        padPrimal = (double *)PyArray_GetPtr(pyPrimal,index);
-
-    errorcode = LSgetMIPPrimalSolution(pModel,padPrimal);
-
+    errorcode = pyGetModelDims(pModel,&nVars,NULL);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pyPrimal = pyOutArray(pyOut,nVars,NPY_DOUBLE,"padPrimal");
+    if (!pyPrimal)
+        return NULL;
+
+    errorcode = LSgetMIPPrimalSolution(pModel,(double *)PyArray_DATA(pyPrimal));
+
+    return pyOutResult(pyOut,pyPrimal,errorcode);
 }
 
-PyObject *pyLSgetMIPDualSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetMIPDualSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padDual = NULL;
-    npy_intp  index[1] = {0};
+    int       nCons = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pyDual = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pyDual))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyDual && PyArray_DIMS(pyDual) > 0)
-        padDual = (double *)PyArray_GetPtr(pyDual,index);
-
-    errorcode = LSgetMIPDualSolution(pModel,padDual);
-
+    errorcode = pyGetModelDims(pModel,NULL,&nCons);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pyDual = pyOutArray(pyOut,nCons,NPY_DOUBLE,"padDual");
+    if (!pyDual)
+        return NULL;
+
+    errorcode = LSgetMIPDualSolution(pModel,(double *)PyArray_DATA(pyDual));
+
+    return pyOutResult(pyOut,pyDual,errorcode);
 }
 
-PyObject *pyLSgetMIPReducedCosts(PyObject *self, PyObject *args)
+PyObject *pyLSgetMIPReducedCosts(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padRedcosts = NULL;
-    npy_intp  index[1] = {0};
+    int       nVars = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pyRedcosts = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pyRedcosts))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyRedcosts && PyArray_DIMS(pyRedcosts) > 0)
-        padRedcosts = (double *)PyArray_GetPtr(pyRedcosts,index);
-
-    errorcode = LSgetMIPReducedCosts(pModel,padRedcosts);
-
+    errorcode = pyGetModelDims(pModel,&nVars,NULL);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pyRedcosts = pyOutArray(pyOut,nVars,NPY_DOUBLE,"padRedcosts");
+    if (!pyRedcosts)
+        return NULL;
+
+    errorcode = LSgetMIPReducedCosts(pModel,(double *)PyArray_DATA(pyRedcosts));
+
+    return pyOutResult(pyOut,pyRedcosts,errorcode);
 }
 
-PyObject *pyLSgetMIPSlacks(PyObject *self, PyObject *args)
+PyObject *pyLSgetMIPSlacks(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    double    *padSlacks = NULL;
-    npy_intp  index[1] = {0};
+    int       nCons = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOut = NULL;
     PyArrayObject  *pySlacks = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "O|O",
                                  &pyModel,
-                                 &PyArray_Type,&pySlacks))
+                                 &pyOut))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pySlacks && PyArray_DIMS(pySlacks) > 0)
-        padSlacks = (double *)PyArray_GetPtr(pySlacks,index);
-
-    errorcode = LSgetMIPSlacks(pModel,padSlacks);
-
+    errorcode = pyGetModelDims(pModel,NULL,&nCons);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pySlacks = pyOutArray(pyOut,nCons,NPY_DOUBLE,"padSlacks");
+    if (!pySlacks)
+        return NULL;
+
+    errorcode = LSgetMIPSlacks(pModel,(double *)PyArray_DATA(pySlacks));
+
+    return pyOutResult(pyOut,pySlacks,errorcode);
 }
 
-PyObject *pyLSgetMIPBasis(PyObject *self, PyObject *args)
+PyObject *pyLSgetMIPBasis(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
-    int       *panCstatus = NULL,*panRstatus = NULL;
-    npy_intp  index[1] = {0};
+    int       nVars = 0, nCons = 0;
 
     PyObject       *pyModel;
+    PyObject       *pyOutC = NULL, *pyOutR = NULL;
     PyArrayObject  *pyCstatus = NULL,*pyRstatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "O|OO",
                                  &pyModel,
-                                 &PyArray_Type,&pyCstatus,
-                                 &PyArray_Type,&pyRstatus))
+                                 &pyOutC,
+                                 &pyOutR))
     {
         return NULL;
     }
 
     CHECK_MODEL;
 
-    if(pyCstatus && PyArray_DIMS(pyCstatus) > 0)
-        panCstatus = (int *)PyArray_GetPtr(pyCstatus,index);
-    if(pyRstatus && PyArray_DIMS(pyRstatus) > 0)
-        panRstatus = (int *)PyArray_GetPtr(pyRstatus,index);
-
-    errorcode = LSgetMIPBasis(pModel,panCstatus,panRstatus);
-
+    errorcode = pyGetModelDims(pModel,&nVars,&nCons);
     if (errorcode != 0){
         ERROR_SET(errorcode);
     }
 
-    return Py_BuildValue("i",errorcode);
+    pyCstatus = pyOutArray(pyOutC,nVars,NPY_INT,"panCstatus");
+    if (!pyCstatus)
+        return NULL;
+    pyRstatus = pyOutArray(pyOutR,nCons,NPY_INT,"panRstatus");
+    if (!pyRstatus) {
+        Py_DECREF(pyCstatus);
+        return NULL;
+    }
+
+    errorcode = LSgetMIPBasis(pModel,
+                           (int *)PyArray_DATA(pyCstatus),
+                           (int *)PyArray_DATA(pyRstatus));
+
+    if (errorcode != 0){
+        Py_DECREF(pyCstatus);
+        Py_DECREF(pyRstatus);
+        ERROR_SET(errorcode);
+    }
+
+    if (pyOutC && pyOutC != Py_None && pyOutR && pyOutR != Py_None) {
+        Py_DECREF(pyCstatus);
+        Py_DECREF(pyRstatus);
+        return Py_BuildValue("i",errorcode);
+    }
+    return Py_BuildValue("NN",pyCstatus,pyRstatus);
 }
 
-PyObject *pyLSgetNextBestMIPSol(PyObject *self, PyObject *args)
+PyObject *pyLSgetNextBestMIPSol(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4067,9 +5551,9 @@ PyObject *pyLSgetNextBestMIPSol(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyIntModStatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pyIntModStatus))
+                                 &pyIntModStatus))
     {
         return NULL;
     }
@@ -4091,7 +5575,7 @@ PyObject *pyLSgetNextBestMIPSol(PyObject *self, PyObject *args)
 /*********************************************************************
  *  Model Query Routines (30)                                        *
  *********************************************************************/
-PyObject *pyLSgetLPData(PyObject *self, PyObject *args)
+PyObject *pyLSgetLPData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4108,19 +5592,19 @@ PyObject *pyLSgetLPData(PyObject *self, PyObject *args)
     PyArrayObject  *pyB = NULL,*pyAcoef = NULL,*pyL = NULL;
     PyArrayObject  *pyU = NULL,*pyConTypes = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*D*D*D*S*YYD*YD*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyObjSense,
-                                 &PyArray_Type,&pyObjConst,
-                                 &PyArray_Type,&pyC,
-                                 &PyArray_Type,&pyB,
-                                 &PyArray_Type,&pyConTypes,
-                                 &PyArray_Type,&pyiAcols,
-                                 &PyArray_Type,&pynAcols,
-                                 &PyArray_Type,&pyAcoef,
-                                 &PyArray_Type,&pyArows,
-                                 &PyArray_Type,&pyL,
-                                 &PyArray_Type,&pyU))
+                                 &pyObjSense,
+                                 &pyObjConst,
+                                 &pyC,
+                                 &pyB,
+                                 &pyConTypes,
+                                 &pyiAcols,
+                                 &pynAcols,
+                                 &pyAcoef,
+                                 &pyArows,
+                                 &pyL,
+                                 &pyU))
 
     {
         return NULL;
@@ -4171,7 +5655,7 @@ PyObject *pyLSgetLPData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetQCData(PyObject *self, PyObject *args)
+PyObject *pyLSgetQCData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4184,12 +5668,12 @@ PyObject *pyLSgetQCData(PyObject *self, PyObject *args)
     PyArrayObject  *pyQCrows = NULL,*pyQCcols1 = NULL,*pyQCcols2 = NULL;
     PyArrayObject  *pyQCcoef = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyQCrows,
-                                 &PyArray_Type,&pyQCcols1,
-                                 &PyArray_Type,&pyQCcols2,
-                                 &PyArray_Type,&pyQCcoef))
+                                 &pyQCrows,
+                                 &pyQCcols1,
+                                 &pyQCcols2,
+                                 &pyQCcoef))
 
     {
         return NULL;
@@ -4220,7 +5704,7 @@ PyObject *pyLSgetQCData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetQCDatai(PyObject *self, PyObject *args)
+PyObject *pyLSgetQCDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4234,13 +5718,13 @@ PyObject *pyLSgetQCDatai(PyObject *self, PyObject *args)
     PyArrayObject  *pyQCnnz = NULL,*pyQCcols1 = NULL,*pyQCcols2 = NULL;
     PyArrayObject  *pyQCcoef = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*D*",
                                  &pyModel,
                                  &iCon,
-                                 &PyArray_Type,&pyQCnnz,
-                                 &PyArray_Type,&pyQCcols1,
-                                 &PyArray_Type,&pyQCcols2,
-                                 &PyArray_Type,&pyQCcoef))
+                                 &pyQCnnz,
+                                 &pyQCcols1,
+                                 &pyQCcols2,
+                                 &pyQCcoef))
 
     {
         return NULL;
@@ -4272,7 +5756,7 @@ PyObject *pyLSgetQCDatai(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetVarType(PyObject *self, PyObject *args)
+PyObject *pyLSgetVarType(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4282,9 +5766,9 @@ PyObject *pyLSgetVarType(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVarTypes = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OS*",
                                  &pyModel,
-                                 &PyArray_Type,&pyVarTypes))
+                                 &pyVarTypes))
 
     {
         return NULL;
@@ -4305,7 +5789,7 @@ PyObject *pyLSgetVarType(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetVarStartPoint(PyObject *self, PyObject *args)
+PyObject *pyLSgetVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4315,9 +5799,9 @@ PyObject *pyLSgetVarStartPoint(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyPrimal = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OD*",
                                  &pyModel,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pyPrimal))
 
     {
         return NULL;
@@ -4338,7 +5822,7 @@ PyObject *pyLSgetVarStartPoint(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetVarStartPointPartial(PyObject *self, PyObject *args)
+PyObject *pyLSgetVarStartPointPartial(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4349,11 +5833,11 @@ PyObject *pyLSgetVarStartPointPartial(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyPrimal = NULL, *pynCols = NULL, *pyiCols = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pynCols,
-                                 &PyArray_Type,&pyiCols,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pynCols,
+                                 &pyiCols,
+                                 &pyPrimal))
 
     {
         return NULL;
@@ -4380,7 +5864,7 @@ PyObject *pyLSgetVarStartPointPartial(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetMIPVarStartPointPartial(PyObject *self, PyObject *args)
+PyObject *pyLSgetMIPVarStartPointPartial(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4391,11 +5875,11 @@ PyObject *pyLSgetMIPVarStartPointPartial(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyPrimal = NULL, *pynCols = NULL, *pyiCols = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*",
                                  &pyModel,
-                                 &PyArray_Type,&pynCols,
-                                 &PyArray_Type,&pyiCols,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pynCols,
+                                 &pyiCols,
+                                 &pyPrimal))
 
     {
         return NULL;
@@ -4422,7 +5906,7 @@ PyObject *pyLSgetMIPVarStartPointPartial(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetMIPVarStartPoint(PyObject *self, PyObject *args)
+PyObject *pyLSgetMIPVarStartPoint(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4432,9 +5916,9 @@ PyObject *pyLSgetMIPVarStartPoint(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyPrimal;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OD*",
                                  &pyModel,
-                                 &PyArray_Type,&pyPrimal))
+                                 &pyPrimal))
 
     {
         return NULL;
@@ -4455,7 +5939,7 @@ PyObject *pyLSgetMIPVarStartPoint(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetSETSData(PyObject *self, PyObject *args)
+PyObject *pyLSgetSETSData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4470,15 +5954,15 @@ PyObject *pyLSgetSETSData(PyObject *self, PyObject *args)
     PyArrayObject  *pyCardnum = NULL,*pyNnz = NULL,*pyBegset = NULL;
     PyArrayObject  *pyVarndx = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*S*N*N*N*N*",
                                  &pyModel,
-                                 &PyArray_Type,&pyNsets,
-                                 &PyArray_Type,&pyNtnz,
-                                 &PyArray_Type,&pySETtype,
-                                 &PyArray_Type,&pyCardnum,
-                                 &PyArray_Type,&pyNnz,
-                                 &PyArray_Type,&pyBegset,
-                                 &PyArray_Type,&pyVarndx))
+                                 &pyNsets,
+                                 &pyNtnz,
+                                 &pySETtype,
+                                 &pyCardnum,
+                                 &pyNnz,
+                                 &pyBegset,
+                                 &pyVarndx))
 
     {
         return NULL;
@@ -4518,7 +6002,7 @@ PyObject *pyLSgetSETSData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetSETSDatai(PyObject *self, PyObject *args)
+PyObject *pyLSgetSETSDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4533,13 +6017,13 @@ PyObject *pyLSgetSETSDatai(PyObject *self, PyObject *args)
     PyArrayObject  *pyCardnum = NULL,*pyNnz = NULL;
     PyArrayObject  *pyVarndx = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiS*N*N*N*",
                                  &pyModel,
                                  &iSet,
-                                 &PyArray_Type,&pySETtype,
-                                 &PyArray_Type,&pyCardnum,
-                                 &PyArray_Type,&pyNnz,
-                                 &PyArray_Type,&pyVarndx))
+                                 &pySETtype,
+                                 &pyCardnum,
+                                 &pyNnz,
+                                 &pyVarndx))
 
     {
         return NULL;
@@ -4571,7 +6055,7 @@ PyObject *pyLSgetSETSDatai(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetSemiContData(PyObject *self, PyObject *args)
+PyObject *pyLSgetSemiContData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4585,12 +6069,12 @@ PyObject *pyLSgetSemiContData(PyObject *self, PyObject *args)
     PyArrayObject  *pyVarndx = NULL;
     PyArrayObject  *pyL = NULL,*pyU = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*D*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyNvar,
-                                 &PyArray_Type,&pyVarndx,
-                                 &PyArray_Type,&pyL,
-                                 &PyArray_Type,&pyU))
+                                 &pyNvar,
+                                 &pyVarndx,
+                                 &pyL,
+                                 &pyU))
 
     {
         return NULL;
@@ -4621,7 +6105,7 @@ PyObject *pyLSgetSemiContData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetLPVariableDataj(PyObject *self, PyObject *args)
+PyObject *pyLSgetLPVariableDataj(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4640,16 +6124,16 @@ PyObject *pyLSgetLPVariableDataj(PyObject *self, PyObject *args)
     PyArrayObject  *pyAnnz = NULL,*pyArows = NULL;
     PyArrayObject  *pyAcoef = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiS*D*D*D*N*N*D*",
                                  &pyModel,
                                  &iVar,
-                                 &PyArray_Type,&pyVartype,
-                                 &PyArray_Type,&pyC,
-                                 &PyArray_Type,&pyL,
-                                 &PyArray_Type,&pyU,
-                                 &PyArray_Type,&pyAnnz,
-                                 &PyArray_Type,&pyArows,
-                                 &PyArray_Type,&pyAcoef))
+                                 &pyVartype,
+                                 &pyC,
+                                 &pyL,
+                                 &pyU,
+                                 &pyAnnz,
+                                 &pyArows,
+                                 &pyAcoef))
 
     {
         return NULL;
@@ -4690,7 +6174,7 @@ PyObject *pyLSgetLPVariableDataj(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetVariableNamej(PyObject *self, PyObject *args)
+PyObject *pyLSgetVariableNamej(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4701,10 +6185,10 @@ PyObject *pyLSgetVariableNamej(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVarName = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyModel,
                                  &iVar,
-                                 &PyArray_Type,&pyVarName))
+                                 &pyVarName))
 
     {
         return NULL;
@@ -4726,7 +6210,7 @@ PyObject *pyLSgetVariableNamej(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetVariableIndex(PyObject *self, PyObject *args)
+PyObject *pyLSgetVariableIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4737,10 +6221,10 @@ PyObject *pyLSgetVariableIndex(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVar = NULL;
 
-    if (!PyArg_ParseTuple(args, "OsO!",
+    if (!pyParseArgs(args, nargs, "OsN*",
                                  &pyModel,
                                  &pszVarName,
-                                 &PyArray_Type,&pyVar))
+                                 &pyVar))
 
     {
         return NULL;
@@ -4762,7 +6246,7 @@ PyObject *pyLSgetVariableIndex(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetConstraintNamei(PyObject *self, PyObject *args)
+PyObject *pyLSgetConstraintNamei(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4773,10 +6257,10 @@ PyObject *pyLSgetConstraintNamei(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyConName = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyModel,
                                  &iCon,
-                                 &PyArray_Type,&pyConName))
+                                 &pyConName))
 
     {
         return NULL;
@@ -4798,7 +6282,7 @@ PyObject *pyLSgetConstraintNamei(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetConstraintIndex(PyObject *self, PyObject *args)
+PyObject *pyLSgetConstraintIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4809,10 +6293,10 @@ PyObject *pyLSgetConstraintIndex(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCon = NULL;
 
-    if (!PyArg_ParseTuple(args, "OsO!",
+    if (!pyParseArgs(args, nargs, "OsN*",
                                  &pyModel,
                                  &pszConName,
-                                 &PyArray_Type,&pyCon))
+                                 &pyCon))
 
     {
         return NULL;
@@ -4834,7 +6318,7 @@ PyObject *pyLSgetConstraintIndex(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetConstraintDatai(PyObject *self, PyObject *args)
+PyObject *pyLSgetConstraintDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4846,12 +6330,12 @@ PyObject *pyLSgetConstraintDatai(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyConType = NULL, *pyIsNlp = NULL, *pyB = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiS*S*D*",
                                  &pyModel,
                                  &iCon,
-                                 &PyArray_Type,&pyConType,
-                                 &PyArray_Type,&pyIsNlp,
-                                 &PyArray_Type,&pyB))
+                                 &pyConType,
+                                 &pyIsNlp,
+                                 &pyB))
 
     {
         return NULL;
@@ -4879,7 +6363,7 @@ PyObject *pyLSgetConstraintDatai(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetLPConstraintDatai(PyObject *self, PyObject *args)
+PyObject *pyLSgetLPConstraintDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4893,14 +6377,14 @@ PyObject *pyLSgetLPConstraintDatai(PyObject *self, PyObject *args)
     PyArrayObject  *pyConType = NULL, *pyAcoef = NULL, *pyB = NULL;
     PyArrayObject  *pyNnz = NULL, *pyVar = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiS*D*N*N*D*",
                                  &pyModel,
                                  &iCon,
-                                 &PyArray_Type,&pyConType,
-                                 &PyArray_Type,&pyB,
-                                 &PyArray_Type,&pyNnz,
-                                 &PyArray_Type,&pyVar,
-                                 &PyArray_Type,&pyAcoef))
+                                 &pyConType,
+                                 &pyB,
+                                 &pyNnz,
+                                 &pyVar,
+                                 &pyAcoef))
 
     {
         return NULL;
@@ -4934,7 +6418,7 @@ PyObject *pyLSgetLPConstraintDatai(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetConeNamei(PyObject *self, PyObject *args)
+PyObject *pyLSgetConeNamei(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4945,10 +6429,10 @@ PyObject *pyLSgetConeNamei(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyConeName = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyModel,
                                  &iCone,
-                                 &PyArray_Type,&pyConeName))
+                                 &pyConeName))
 
     {
         return NULL;
@@ -4970,7 +6454,7 @@ PyObject *pyLSgetConeNamei(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetConeIndex(PyObject *self, PyObject *args)
+PyObject *pyLSgetConeIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -4981,10 +6465,10 @@ PyObject *pyLSgetConeIndex(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCone = NULL;
 
-    if (!PyArg_ParseTuple(args, "OsO!",
+    if (!pyParseArgs(args, nargs, "OsN*",
                                  &pyModel,
                                  &pszConeName,
-                                 &PyArray_Type,&pyCone))
+                                 &pyCone))
 
     {
         return NULL;
@@ -5006,7 +6490,7 @@ PyObject *pyLSgetConeIndex(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetConeDatai(PyObject *self, PyObject *args)
+PyObject *pyLSgetConeDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5019,13 +6503,13 @@ PyObject *pyLSgetConeDatai(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyConeType = NULL, *pyNnz = NULL, *pyCols = NULL, *pydConeAlpha=NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiS*D*N*N*",
                                  &pyModel,
                                  &iCone,
-								 &PyArray_Type,&pyConeType,
-                                 &PyArray_Type,&pydConeAlpha,
-                                 &PyArray_Type,&pyNnz,
-                                 &PyArray_Type,&pyCols))
+								 &pyConeType,
+                                 &pydConeAlpha,
+                                 &pyNnz,
+                                 &pyCols))
 
     {
         return NULL;
@@ -5055,7 +6539,7 @@ PyObject *pyLSgetConeDatai(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNLPData(PyObject *self, PyObject *args)
+PyObject *pyLSgetNLPData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5075,16 +6559,16 @@ PyObject *pyLSgetNLPData(PyObject *self, PyObject *args)
     PyArrayObject  *pydNLPobj = NULL;
     PyArrayObject  *pyNLPConTypes = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*D*N*N*N*D*S*",
                                  &pyModel,
-                                 &PyArray_Type,&pyiNLPcols,
-                                 &PyArray_Type,&pynNLPcols,
-                                 &PyArray_Type,&pyNLPcoef,
-                                 &PyArray_Type,&pyNLProws,
-                                 &PyArray_Type,&pynNLPobj,
-                                 &PyArray_Type,&pyiNLPobj,
-                                 &PyArray_Type,&pydNLPobj,
-                                 &PyArray_Type,&pyNLPConTypes))
+                                 &pyiNLPcols,
+                                 &pynNLPcols,
+                                 &pyNLPcoef,
+                                 &pyNLProws,
+                                 &pynNLPobj,
+                                 &pyiNLPobj,
+                                 &pydNLPobj,
+                                 &pyNLPConTypes))
 
     {
         return NULL;
@@ -5127,7 +6611,7 @@ PyObject *pyLSgetNLPData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNLPConstraintDatai(PyObject *self, PyObject *args)
+PyObject *pyLSgetNLPConstraintDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5139,12 +6623,12 @@ PyObject *pyLSgetNLPConstraintDatai(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyNnz = NULL, *pyNLPcols = NULL, *pyNLPcoef = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*D*",
                                  &pyModel,
                                  &iCon,
-                                 &PyArray_Type,&pyNnz,
-                                 &PyArray_Type,&pyNLPcols,
-                                 &PyArray_Type,&pyNLPcoef))
+                                 &pyNnz,
+                                 &pyNLPcols,
+                                 &pyNLPcoef))
 
     {
         return NULL;
@@ -5172,7 +6656,7 @@ PyObject *pyLSgetNLPConstraintDatai(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNLPVariableDataj(PyObject *self, PyObject *args)
+PyObject *pyLSgetNLPVariableDataj(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5184,12 +6668,12 @@ PyObject *pyLSgetNLPVariableDataj(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyNnz = NULL, *pyNLProws = NULL, *pyNLPcoef = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*D*",
                                  &pyModel,
                                  &iVar,
-                                 &PyArray_Type,&pyNnz,
-                                 &PyArray_Type,&pyNLProws,
-                                 &PyArray_Type,&pyNLPcoef))
+                                 &pyNnz,
+                                 &pyNLProws,
+                                 &pyNLPcoef))
 
     {
         return NULL;
@@ -5217,7 +6701,7 @@ PyObject *pyLSgetNLPVariableDataj(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNLPObjectiveData(PyObject *self, PyObject *args)
+PyObject *pyLSgetNLPObjectiveData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5228,11 +6712,11 @@ PyObject *pyLSgetNLPObjectiveData(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyNLPobjnnz = NULL, *pyiNLPobj = NULL, *pydNLPobj = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyNLPobjnnz,
-                                 &PyArray_Type,&pyiNLPobj,
-                                 &PyArray_Type,&pydNLPobj))
+                                 &pyNLPobjnnz,
+                                 &pyiNLPobj,
+                                 &pydNLPobj))
 
     {
         return NULL;
@@ -5259,7 +6743,7 @@ PyObject *pyLSgetNLPObjectiveData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetDualModel(PyObject *self, PyObject *args)
+PyObject *pyLSgetDualModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5270,7 +6754,7 @@ PyObject *pyLSgetDualModel(PyObject *self, PyObject *args)
     PyObject       *pyDualModel;
 
 
-    if (!PyArg_ParseTuple(args, "OO",
+    if (!pyParseArgs(args, nargs, "OO",
                                  &pyModel,
                                  &pyDualModel))
 
@@ -5288,6 +6772,7 @@ PyObject *pyLSgetDualModel(PyObject *self, PyObject *args)
     }
 
 
+    pyResetModelDims(pDualModel);
     errorcode = LSgetDualModel(pModel,
                                pDualModel);
 
@@ -5298,7 +6783,7 @@ PyObject *pyLSgetDualModel(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetInstruct(PyObject *self, PyObject *args)
+PyObject *pyLSgetInstruct(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5317,20 +6802,20 @@ PyObject *pyLSgetInstruct(PyObject *self, PyObject *args)
     PyArrayObject  *pyObjBeg = NULL, *pyObjLength = NULL, *pyConBeg = NULL;
     PyArrayObject  *pyConLength = NULL, *pyLwrBnd = NULL, *pyUprBnd = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*S*S*N*D*D*N*N*N*N*D*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyObjSense,
-                                 &PyArray_Type,&pyConTyp,
-                                 &PyArray_Type,&pyVarType,
-                                 &PyArray_Type,&pyCode,
-                                 &PyArray_Type,&pyNumVa,
-                                 &PyArray_Type,&pyVarVal,
-                                 &PyArray_Type,&pyObjBeg,
-                                 &PyArray_Type,&pyObjLength,
-                                 &PyArray_Type,&pyConBeg,
-                                 &PyArray_Type,&pyConLength,
-                                 &PyArray_Type,&pyLwrBnd,
-                                 &PyArray_Type,&pyUprBnd))
+                                 &pyObjSense,
+                                 &pyConTyp,
+                                 &pyVarType,
+                                 &pyCode,
+                                 &pyNumVa,
+                                 &pyVarVal,
+                                 &pyObjBeg,
+                                 &pyObjLength,
+                                 &pyConBeg,
+                                 &pyConLength,
+                                 &pyLwrBnd,
+                                 &pyUprBnd))
 
     {
         return NULL;
@@ -5384,7 +6869,7 @@ PyObject *pyLSgetInstruct(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLScalinfeasMIPsolution(PyObject *self, PyObject *args)
+PyObject *pyLScalinfeasMIPsolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5394,11 +6879,11 @@ PyObject *pyLScalinfeasMIPsolution(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyIntPfeas = NULL, *pyConsPfeas = NULL, *pyPrimalMipsol = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!",
+    if (!pyParseArgs(args, nargs, "OD*D*D",
                                  &pyModel,
-                                 &PyArray_Type,&pyIntPfeas,
-                                 &PyArray_Type,&pyConsPfeas,
-                                 &PyArray_Type,&pyPrimalMipsol))
+                                 &pyIntPfeas,
+                                 &pyConsPfeas,
+                                 &pyPrimalMipsol))
 
     {
         return NULL;
@@ -5425,7 +6910,7 @@ PyObject *pyLScalinfeasMIPsolution(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetRoundMIPsolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetRoundMIPsolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5441,13 +6926,13 @@ PyObject *pyLSgetRoundMIPsolution(PyObject *self, PyObject *args)
     PyArrayObject  *pyObjRound = NULL, *pyPfeasRound = NULL;
     PyArrayObject  *pystatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!ii",
+    if (!pyParseArgs(args, nargs, "ODD*D*D*N*ii",
                                  &pyModel,
-                                 &PyArray_Type,&pyPrimal,
-                                 &PyArray_Type,&pyPrimalRound,
-                                 &PyArray_Type,&pyObjRound,
-                                 &PyArray_Type,&pyPfeasRound,
-                                 &PyArray_Type,&pystatus,
+                                 &pyPrimal,
+                                 &pyPrimalRound,
+                                 &pyObjRound,
+                                 &pyPfeasRound,
+                                 &pystatus,
                                  &iUseOpti,
                                  &callerFunc))
 
@@ -5484,7 +6969,7 @@ PyObject *pyLSgetRoundMIPsolution(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetDuplicateColumns(PyObject *self, PyObject *args)
+PyObject *pyLSgetDuplicateColumns(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5496,12 +6981,12 @@ PyObject *pyLSgetDuplicateColumns(PyObject *self, PyObject *args)
     PyArrayObject  *pySets = NULL, *pySetsBeg = NULL;
     PyArrayObject  *pyCols= NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*",
                                  &pyModel,
                                  &nCheckVals,
-                                 &PyArray_Type,&pySets,
-                                 &PyArray_Type,&pySetsBeg,
-                                 &PyArray_Type,&pyCols))
+                                 &pySets,
+                                 &pySetsBeg,
+                                 &pyCols))
 
     {
         return NULL;
@@ -5529,7 +7014,7 @@ PyObject *pyLSgetDuplicateColumns(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetRangeData(PyObject *self, PyObject *args)
+PyObject *pyLSgetRangeData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5539,9 +7024,9 @@ PyObject *pyLSgetRangeData(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyR= NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OD*",
                                  &pyModel,
-                                 &PyArray_Type,&pyR))
+                                 &pyR))
 
     {
         return NULL;
@@ -5565,7 +7050,7 @@ PyObject *pyLSgetRangeData(PyObject *self, PyObject *args)
 /**********************************************************************
  *  Model Modification Routines (26)                                  *
  **********************************************************************/
-PyObject *pyLSaddConstraints(PyObject *self, PyObject *args)
+PyObject *pyLSaddConstraints(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5580,21 +7065,27 @@ PyObject *pyLSaddConstraints(PyObject *self, PyObject *args)
     PyArrayObject  *pyConTypes = NULL, *pyConNames = NULL, *pyArows = NULL;
     PyArrayObject  *pyAcoef = NULL, *pyAcols = NULL, *pyB = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiSAXDXD",
                                  &pyModel,
                                  &nNumaddcons,
-                                 &PyArray_Type,&pyConTypes,
-                                 &PyArray_Type,&pyConNames,
-                                 &PyArray_Type,&pyArows,
-                                 &PyArray_Type,&pyAcoef,
-                                 &PyArray_Type,&pyAcols,
-                                 &PyArray_Type,&pyB))
+                                 &pyConTypes,
+                                 &pyConNames,
+                                 &pyArows,
+                                 &pyAcoef,
+                                 &pyAcols,
+                                 &pyB))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nNumaddcons", nNumaddcons, 2, pyConTypes, pyB))
+        return NULL;
+    if (!pyArgLen("nNumaddcons+1", (npy_intp)nNumaddcons + 1, 1, pyArows))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyConTypes && PyArray_DIMS(pyConTypes) > 0)
         pszConTypes = (char *)PyArray_DATA(pyConTypes);
@@ -5625,7 +7116,7 @@ PyObject *pyLSaddConstraints(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddVariables(PyObject *self, PyObject *args)
+PyObject *pyLSaddVariables(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5641,24 +7132,30 @@ PyObject *pyLSaddVariables(PyObject *self, PyObject *args)
     PyArrayObject  *pynAcols = NULL, *pyAcoef = NULL, *pyArows = NULL;
     PyArrayObject  *pyC = NULL, *pyL = NULL, *pyU = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiSAXXDXDDD",
                                  &pyModel,
                                  &nNumaddvars,
-                                 &PyArray_Type,&pyVarTypes,
-                                 &PyArray_Type,&pyVarNames,
-                                 &PyArray_Type,&pyiAcols,
-                                 &PyArray_Type,&pynAcols,
-                                 &PyArray_Type,&pyAcoef,
-                                 &PyArray_Type,&pyArows,
-                                 &PyArray_Type,&pyC,
-                                 &PyArray_Type,&pyL,
-                                 &PyArray_Type,&pyU))
+                                 &pyVarTypes,
+                                 &pyVarNames,
+                                 &pyiAcols,
+                                 &pynAcols,
+                                 &pyAcoef,
+                                 &pyArows,
+                                 &pyC,
+                                 &pyL,
+                                 &pyU))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nNumaddvars", nNumaddvars, 5, pyVarTypes, pynAcols, pyC, pyL, pyU))
+        return NULL;
+    if (!pyArgLen("nNumaddvars+1", (npy_intp)nNumaddvars + 1, 1, pyiAcols))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyVarTypes && PyArray_DIMS(pyVarTypes) > 0)
         pszVarTypes = (char *)PyArray_DATA(pyVarTypes);
@@ -5698,7 +7195,7 @@ PyObject *pyLSaddVariables(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddCones(PyObject *self, PyObject *args)
+PyObject *pyLSaddCones(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5711,19 +7208,24 @@ PyObject *pyLSaddCones(PyObject *self, PyObject *args)
     PyArrayObject  *pyConeTypes = NULL, *pyConenames = NULL;
     PyArrayObject  *pyConebegcol = NULL, *pyConecols = NULL, *pyadConeAlpha=NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiSDANN",
                                  &pyModel,
                                  &nCone,
-                                 &PyArray_Type,&pyConeTypes,
-								 &PyArray_Type,&pyadConeAlpha,
-                                 &PyArray_Type,&pyConenames,
-                                 &PyArray_Type,&pyConebegcol,
-                                 &PyArray_Type,&pyConecols))
+                                 &pyConeTypes,
+								 &pyadConeAlpha,
+                                 &pyConenames,
+                                 &pyConebegcol,
+                                 &pyConecols))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCone", nCone, 2, pyConeTypes, pyadConeAlpha))
+        return NULL;
+    if (!pyArgLen("nCone+1", (npy_intp)nCone + 1, 1, pyConebegcol))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyConeTypes && PyArray_DIMS(pyConeTypes) > 0)
@@ -5751,7 +7253,7 @@ PyObject *pyLSaddCones(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddSETS(PyObject *self, PyObject *args)
+PyObject *pyLSaddSETS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5764,18 +7266,23 @@ PyObject *pyLSaddSETS(PyObject *self, PyObject *args)
     PyArrayObject  *pySETStype = NULL, *pyCARDnum = NULL;
     PyArrayObject  *pySETSbegcol = NULL, *pySETScols = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiSNNN",
                                  &pyModel,
                                  &nSETS,
-                                 &PyArray_Type,&pySETStype,
-                                 &PyArray_Type,&pyCARDnum,
-                                 &PyArray_Type,&pySETSbegcol,
-                                 &PyArray_Type,&pySETScols))
+                                 &pySETStype,
+                                 &pyCARDnum,
+                                 &pySETSbegcol,
+                                 &pySETScols))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nSETS", nSETS, 2, pySETStype, pyCARDnum))
+        return NULL;
+    if (!pyArgLen("nSETS+1", (npy_intp)nSETS + 1, 1, pySETSbegcol))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pySETStype && PyArray_DIMS(pySETStype) > 0)
@@ -5801,7 +7308,7 @@ PyObject *pyLSaddSETS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddQCterms(PyObject *self, PyObject *args)
+PyObject *pyLSaddQCterms(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5814,18 +7321,21 @@ PyObject *pyLSaddQCterms(PyObject *self, PyObject *args)
     PyArrayObject  *pyQCconndx = NULL, *pyQCvarndx1 = NULL;
     PyArrayObject  *pyQCvarndx2 = NULL, *pyQCcoef = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiNNND",
                                  &pyModel,
                                  &nQCnonzeros,
-                                 &PyArray_Type,&pyQCconndx,
-                                 &PyArray_Type,&pyQCvarndx1,
-                                 &PyArray_Type,&pyQCvarndx2,
-                                 &PyArray_Type,&pyQCcoef))
+                                 &pyQCconndx,
+                                 &pyQCvarndx1,
+                                 &pyQCvarndx2,
+                                 &pyQCcoef))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nQCnonzeros", nQCnonzeros, 4, pyQCconndx, pyQCvarndx1, pyQCvarndx2, pyQCcoef))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyQCconndx && PyArray_DIMS(pyQCconndx) > 0) paiQCconndx = (int *)PyArray_DATA(pyQCconndx);
@@ -5847,7 +7357,7 @@ PyObject *pyLSaddQCterms(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteConstraints(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteConstraints(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5857,16 +7367,20 @@ PyObject *pyLSdeleteConstraints(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCons = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN",
                                  &pyModel,
                                  &nCons,
-                                 &PyArray_Type,&pyCons))
+                                 &pyCons))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 1, pyCons))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyCons && PyArray_DIMS(pyCons) > 0) paiCons = (int *)PyArray_DATA(pyCons);
 
@@ -5881,7 +7395,7 @@ PyObject *pyLSdeleteConstraints(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteCones(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteCones(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5891,15 +7405,18 @@ PyObject *pyLSdeleteCones(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCones = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN",
                                  &pyModel,
                                  &nCones,
-                                 &PyArray_Type,&pyCones))
+                                 &pyCones))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCones", nCones, 1, pyCones))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyCones && PyArray_DIMS(pyCones) > 0) paiCones = (int *)PyArray_DATA(pyCones);
@@ -5915,7 +7432,7 @@ PyObject *pyLSdeleteCones(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteSETS(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteSETS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5925,15 +7442,18 @@ PyObject *pyLSdeleteSETS(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pySETS = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN",
                                  &pyModel,
                                  &nSETS,
-                                 &PyArray_Type,&pySETS))
+                                 &pySETS))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nSETS", nSETS, 1, pySETS))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pySETS && PyArray_DIMS(pySETS) > 0) paiSETS = (int *)PyArray_DATA(pySETS);
@@ -5949,7 +7469,7 @@ PyObject *pyLSdeleteSETS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteSemiContVars(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteSemiContVars(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5959,15 +7479,18 @@ PyObject *pyLSdeleteSemiContVars(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pySCVars = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN",
                                  &pyModel,
                                  &nSCVars,
-                                 &PyArray_Type,&pySCVars))
+                                 &pySCVars))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nSCVars", nSCVars, 1, pySCVars))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pySCVars && PyArray_DIMS(pySCVars) > 0) paiSCVars = (int *)PyArray_DATA(pySCVars);
@@ -5983,7 +7506,7 @@ PyObject *pyLSdeleteSemiContVars(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteVariables(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteVariables(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -5993,16 +7516,20 @@ PyObject *pyLSdeleteVariables(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVars = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN",
                                  &pyModel,
                                  &nVars,
-                                 &PyArray_Type,&pyVars))
+                                 &pyVars))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nVars", nVars, 1, pyVars))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyVars && PyArray_DIMS(pyVars) > 0) paiVars = (int *)PyArray_DATA(pyVars);
 
@@ -6017,7 +7544,7 @@ PyObject *pyLSdeleteVariables(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteQCterms(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteQCterms(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6027,15 +7554,18 @@ PyObject *pyLSdeleteQCterms(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCons = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN",
                                  &pyModel,
                                  &nCons,
-                                 &PyArray_Type,&pyCons))
+                                 &pyCons))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 1, pyCons))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyCons && PyArray_DIMS(pyCons) > 0) paiCons = (int *)PyArray_DATA(pyCons);
@@ -6051,7 +7581,7 @@ PyObject *pyLSdeleteQCterms(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteAj(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteAj(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6061,17 +7591,21 @@ PyObject *pyLSdeleteAj(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyRows = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!",
+    if (!pyParseArgs(args, nargs, "OiiN",
                                  &pyModel,
                                  &iVar1,
                                  &nRows,
-                                 &PyArray_Type,&pyRows))
+                                 &pyRows))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nRows", nRows, 1, pyRows))
+        return NULL;
+
     CHECK_MODEL;
+    pyModelCacheDrop(pModel, "lp");
 
     if(pyRows && PyArray_DIMS(pyRows) > 0) paiRows = (int *)PyArray_DATA(pyRows);
 
@@ -6087,9 +7621,10 @@ PyObject *pyLSdeleteAj(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyLowerBounds(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyLowerBounds(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
+    int       nBuffered;
     pLSmodel  pModel;
     int       nVars;
     int       *paiVars = NULL;
@@ -6098,17 +7633,23 @@ PyObject *pyLSmodifyLowerBounds(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVars = NULL,*pyL = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiND",
                                  &pyModel,
                                  &nVars,
-                                 &PyArray_Type,&pyVars,
-                                 &PyArray_Type,&pyL))
+                                 &pyVars,
+                                 &pyL))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nVars", nVars, 2, pyVars, pyL))
+        return NULL;
+
     CHECK_MODEL;
+    pyModelCacheDrop(pModel, "lp");
+    if ((nBuffered = pyModBatchAdd(pModel, LS_MOD_LB, 0, nVars, pyVars, pyL)) != 0)
+        return nBuffered > 0 ? Py_BuildValue("i",errorcode) : NULL;
 
     if(pyVars && PyArray_DIMS(pyVars) > 0) paiVars = (int *)PyArray_DATA(pyVars);
     if(pyL && PyArray_DIMS(pyL) > 0) padL = (double *)PyArray_DATA(pyL);
@@ -6125,9 +7666,10 @@ PyObject *pyLSmodifyLowerBounds(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyUpperBounds(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyUpperBounds(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
+    int       nBuffered;
     pLSmodel  pModel;
     int       nVars;
     int       *paiVars = NULL;
@@ -6136,17 +7678,23 @@ PyObject *pyLSmodifyUpperBounds(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVars = NULL,*pyU = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiND",
                                  &pyModel,
                                  &nVars,
-                                 &PyArray_Type,&pyVars,
-                                 &PyArray_Type,&pyU))
+                                 &pyVars,
+                                 &pyU))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nVars", nVars, 2, pyVars, pyU))
+        return NULL;
+
     CHECK_MODEL;
+    pyModelCacheDrop(pModel, "lp");
+    if ((nBuffered = pyModBatchAdd(pModel, LS_MOD_UB, 0, nVars, pyVars, pyU)) != 0)
+        return nBuffered > 0 ? Py_BuildValue("i",errorcode) : NULL;
 
     if(pyVars && PyArray_DIMS(pyVars) > 0) paiVars = (int *)PyArray_DATA(pyVars);
     if(pyU && PyArray_DIMS(pyU) > 0) padU = (double *)PyArray_DATA(pyU);
@@ -6163,9 +7711,10 @@ PyObject *pyLSmodifyUpperBounds(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyRHS(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyRHS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
+    int       nBuffered;
     pLSmodel  pModel;
     int       nCons;
     int       *paiCons = NULL;
@@ -6174,17 +7723,23 @@ PyObject *pyLSmodifyRHS(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCons = NULL,*pyB = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiND",
                                  &pyModel,
                                  &nCons,
-                                 &PyArray_Type,&pyCons,
-                                 &PyArray_Type,&pyB))
+                                 &pyCons,
+                                 &pyB))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 2, pyCons, pyB))
+        return NULL;
+
     CHECK_MODEL;
+    pyModelCacheDrop(pModel, "lp");
+    if ((nBuffered = pyModBatchAdd(pModel, LS_MOD_RHS, 0, nCons, pyCons, pyB)) != 0)
+        return nBuffered > 0 ? Py_BuildValue("i",errorcode) : NULL;
 
     if(pyCons && PyArray_DIMS(pyCons) > 0) paiCons = (int *)PyArray_DATA(pyCons);
     if(pyB && PyArray_DIMS(pyB) > 0) padB = (double *)PyArray_DATA(pyB);
@@ -6201,9 +7756,10 @@ PyObject *pyLSmodifyRHS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyObjective(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyObjective(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
+    int       nBuffered;
     pLSmodel  pModel;
     int       nVars;
     int       *paiVars = NULL;
@@ -6212,17 +7768,23 @@ PyObject *pyLSmodifyObjective(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVars = NULL,*pyC = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiND",
                                  &pyModel,
                                  &nVars,
-                                 &PyArray_Type,&pyVars,
-                                 &PyArray_Type,&pyC))
+                                 &pyVars,
+                                 &pyC))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nVars", nVars, 2, pyVars, pyC))
+        return NULL;
+
     CHECK_MODEL;
+    pyModelCacheDrop(pModel, "lp");
+    if ((nBuffered = pyModBatchAdd(pModel, LS_MOD_OBJ, 0, nVars, pyVars, pyC)) != 0)
+        return nBuffered > 0 ? Py_BuildValue("i",errorcode) : NULL;
 
     if(pyVars && PyArray_DIMS(pyVars) > 0) paiVars = (int *)PyArray_DATA(pyVars);
     if(pyC && PyArray_DIMS(pyC) > 0) padC = (double *)PyArray_DATA(pyC);
@@ -6239,15 +7801,16 @@ PyObject *pyLSmodifyObjective(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyObjConstant(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyObjConstant(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
     double    dObjConst;
+    lsModBatch_t *pBatch;
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Od",
                                  &pyModel,
                                  &dObjConst))
 
@@ -6256,6 +7819,12 @@ PyObject *pyLSmodifyObjConstant(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyModelCacheDrop(pModel, "lp");
+    if (pyModBatches && (pBatch = pyModBatchFind(pModel)) != NULL) {
+        pBatch->hasObjConst = 1;
+        pBatch->dObjConst = dObjConst;
+        return Py_BuildValue("i",errorcode);
+    }
 
     errorcode = LSmodifyObjConstant(pModel,
                                     dObjConst);
@@ -6267,9 +7836,10 @@ PyObject *pyLSmodifyObjConstant(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyAj(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyAj(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
+    int       nBuffered;
     pLSmodel  pModel;
     int       iVar1,nRows;
     int       *paiRows = NULL;
@@ -6278,18 +7848,24 @@ PyObject *pyLSmodifyAj(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyRows = NULL, *pyAj = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!O!",
+    if (!pyParseArgs(args, nargs, "OiiND",
                                  &pyModel,
                                  &iVar1,
                                  &nRows,
-                                 &PyArray_Type,&pyRows,
-                                 &PyArray_Type,&pyAj))
+                                 &pyRows,
+                                 &pyAj))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nRows", nRows, 2, pyRows, pyAj))
+        return NULL;
+
     CHECK_MODEL;
+    pyModelCacheDrop(pModel, "lp");
+    if ((nBuffered = pyModBatchAdd(pModel, LS_MOD_AJ, iVar1, nRows, pyRows, pyAj)) != 0)
+        return nBuffered > 0 ? Py_BuildValue("i",errorcode) : NULL;
 
     if(pyRows && PyArray_DIMS(pyRows) > 0) paiRows = (int *)PyArray_DATA(pyRows);
     if(pyAj && PyArray_DIMS(pyAj) > 0) padAj = (double *)PyArray_DATA(pyAj);
@@ -6307,7 +7883,7 @@ PyObject *pyLSmodifyAj(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyCone(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyCone(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6319,17 +7895,20 @@ PyObject *pyLSmodifyCone(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyConeCols = NULL;
 
-    if (!PyArg_ParseTuple(args, "OciiO!d",
+    if (!pyParseArgs(args, nargs, "OciiNd",
                                  &pyModel,
                                  &cConeType,
                                  &iConeNum,
                                  &iConeNnz,
-                                 &PyArray_Type,&pyConeCols,
+                                 &pyConeCols,
 								 &dConeAlpha))
     {
         return NULL;
     }
 
+    if (!pyArgLen("iConeNnz", iConeNnz, 1, pyConeCols))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyConeCols && PyArray_DIMS(pyConeCols) > 0) paiConeCols = (int *)PyArray_DATA(pyConeCols);
@@ -6348,7 +7927,7 @@ PyObject *pyLSmodifyCone(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifySET(PyObject *self, PyObject *args)
+PyObject *pyLSmodifySET(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6359,17 +7938,20 @@ PyObject *pyLSmodifySET(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pySETcols = NULL;
 
-    if (!PyArg_ParseTuple(args, "OciiO!",
+    if (!pyParseArgs(args, nargs, "OciiN",
                                  &pyModel,
                                  &cSETtype,
                                  &iSETnum,
                                  &iSETnnz,
-                                 &PyArray_Type,&pySETcols))
+                                 &pySETcols))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("iSETnnz", iSETnnz, 1, pySETcols))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pySETcols && PyArray_DIMS(pySETcols) > 0) paiSETcols = (int *)PyArray_DATA(pySETcols);
@@ -6387,7 +7969,7 @@ PyObject *pyLSmodifySET(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifySemiContVars(PyObject *self, PyObject *args)
+PyObject *pyLSmodifySemiContVars(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6398,17 +7980,20 @@ PyObject *pyLSmodifySemiContVars(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pySCVars = NULL,*pyL = NULL,*pyU = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiNDD",
                                  &pyModel,
                                  &nSCVars,
-                                 &PyArray_Type,&pySCVars,
-                                 &PyArray_Type,&pyL,
-                                 &PyArray_Type,&pyU))
+                                 &pySCVars,
+                                 &pyL,
+                                 &pyU))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nSCVars", nSCVars, 3, pySCVars, pyL, pyU))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pySCVars && PyArray_DIMS(pySCVars) > 0) paiSCVars = (int *)PyArray_DATA(pySCVars);
@@ -6428,7 +8013,7 @@ PyObject *pyLSmodifySemiContVars(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyConstraintType(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyConstraintType(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6439,17 +8024,21 @@ PyObject *pyLSmodifyConstraintType(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCons = NULL,*pyConTypes = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiNS",
                                  &pyModel,
                                  &nCons,
-                                 &PyArray_Type,&pyCons,
-                                 &PyArray_Type,&pyConTypes))
+                                 &pyCons,
+                                 &pyConTypes))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 2, pyCons, pyConTypes))
+        return NULL;
+
     CHECK_MODEL;
+    pyModelCacheDrop(pModel, "lp");
 
     if(pyCons && PyArray_DIMS(pyCons) > 0)
         paiCons = (int *)PyArray_DATA(pyCons);
@@ -6468,7 +8057,7 @@ PyObject *pyLSmodifyConstraintType(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSmodifyVariableType(PyObject *self, PyObject *args)
+PyObject *pyLSmodifyVariableType(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6479,16 +8068,19 @@ PyObject *pyLSmodifyVariableType(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyVars = NULL,*pyVarTypes = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiNS",
                                  &pyModel,
                                  &nVars,
-                                 &PyArray_Type,&pyVars,
-                                 &PyArray_Type,&pyVarTypes))
+                                 &pyVars,
+                                 &pyVarTypes))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nVars", nVars, 2, pyVars, pyVarTypes))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyVars && PyArray_DIMS(pyVars) > 0)
@@ -6508,7 +8100,7 @@ PyObject *pyLSmodifyVariableType(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddNLPAj(PyObject *self, PyObject *args)
+PyObject *pyLSaddNLPAj(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6519,17 +8111,20 @@ PyObject *pyLSaddNLPAj(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyRows = NULL, *pyAj = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!O!",
+    if (!pyParseArgs(args, nargs, "OiiND",
                                  &pyModel,
                                  &iVar1,
                                  &nRows,
-                                 &PyArray_Type,&pyRows,
-                                 &PyArray_Type,&pyAj))
+                                 &pyRows,
+                                 &pyAj))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nRows", nRows, 2, pyRows, pyAj))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyRows && PyArray_DIMS(pyRows) > 0) paiRows = (int *)PyArray_DATA(pyRows);
@@ -6548,7 +8143,7 @@ PyObject *pyLSaddNLPAj(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddNLPobj(PyObject *self, PyObject *args)
+PyObject *pyLSaddNLPobj(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6559,16 +8154,19 @@ PyObject *pyLSaddNLPobj(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCols = NULL,*pyColj = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiND",
                                  &pyModel,
                                  &nCols,
-                                 &PyArray_Type,&pyCols,
-                                 &PyArray_Type,&pyColj))
+                                 &pyCols,
+                                 &pyColj))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCols", nCols, 2, pyCols, pyColj))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyCols && PyArray_DIMS(pyCols) > 0) paiCols = (int *)PyArray_DATA(pyCols);
@@ -6586,7 +8184,7 @@ PyObject *pyLSaddNLPobj(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdeleteNLPobj(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteNLPobj(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6596,15 +8194,18 @@ PyObject *pyLSdeleteNLPobj(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCols = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN",
                                  &pyModel,
                                  &nCols,
-                                 &PyArray_Type,&pyCols))
+                                 &pyCols))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCols", nCols, 1, pyCols))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyCols && PyArray_DIMS(pyCols) > 0) paiCols = (int *)PyArray_DATA(pyCols);
@@ -6623,7 +8224,7 @@ PyObject *pyLSdeleteNLPobj(PyObject *self, PyObject *args)
 /*********************************************************************
  *   Model & Solution Analysis Routines (8)                         *
  *********************************************************************/
-PyObject *pyLSgetConstraintRanges(PyObject *self, PyObject *args)
+PyObject *pyLSgetConstraintRanges(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6633,10 +8234,10 @@ PyObject *pyLSgetConstraintRanges(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyDec = NULL, *pyInc = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "OD*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyDec,
-                                 &PyArray_Type,&pyInc))
+                                 &pyDec,
+                                 &pyInc))
 
     {
         return NULL;
@@ -6660,7 +8261,7 @@ PyObject *pyLSgetConstraintRanges(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetObjectiveRanges(PyObject *self, PyObject *args)
+PyObject *pyLSgetObjectiveRanges(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6670,10 +8271,10 @@ PyObject *pyLSgetObjectiveRanges(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyDec = NULL, *pyInc = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "OD*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyDec,
-                                 &PyArray_Type,&pyInc))
+                                 &pyDec,
+                                 &pyInc))
 
     {
         return NULL;
@@ -6697,7 +8298,7 @@ PyObject *pyLSgetObjectiveRanges(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetBoundRanges(PyObject *self, PyObject *args)
+PyObject *pyLSgetBoundRanges(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6707,10 +8308,10 @@ PyObject *pyLSgetBoundRanges(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyDec = NULL, *pyInc = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "OD*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyDec,
-                                 &PyArray_Type,&pyInc))
+                                 &pyDec,
+                                 &pyInc))
 
     {
         return NULL;
@@ -6734,7 +8335,7 @@ PyObject *pyLSgetBoundRanges(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetBestBounds(PyObject *self, PyObject *args)
+PyObject *pyLSgetBestBounds(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6744,10 +8345,10 @@ PyObject *pyLSgetBestBounds(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyBestL = NULL, *pyBestU = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "OD*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyBestL,
-                                 &PyArray_Type,&pyBestU))
+                                 &pyBestL,
+                                 &pyBestU))
 
     {
         return NULL;
@@ -6771,7 +8372,7 @@ PyObject *pyLSgetBestBounds(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSfindIIS(PyObject *self, PyObject *args)
+PyObject *pyLSfindIIS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6779,7 +8380,7 @@ PyObject *pyLSfindIIS(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
                                  &pyModel,
                                  &nLevel))
 
@@ -6799,7 +8400,7 @@ PyObject *pyLSfindIIS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSfindIUS(PyObject *self, PyObject *args)
+PyObject *pyLSfindIUS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6807,7 +8408,7 @@ PyObject *pyLSfindIUS(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
                                  &pyModel,
                                  &nLevel))
 
@@ -6827,7 +8428,7 @@ PyObject *pyLSfindIUS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSfindBlockStructure(PyObject *self, PyObject *args)
+PyObject *pyLSfindBlockStructure(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6835,7 +8436,7 @@ PyObject *pyLSfindBlockStructure(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
                                  &pyModel,
                                  &nBlock,
                                  &nType))
@@ -6857,7 +8458,7 @@ PyObject *pyLSfindBlockStructure(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetIIS(PyObject *self, PyObject *args)
+PyObject *pyLSgetIIS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6873,15 +8474,15 @@ PyObject *pyLSgetIIS(PyObject *self, PyObject *args)
     PyArrayObject  *pyIIS_c = NULL, *pyVars = NULL;
     PyArrayObject  *pyBnds = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*N*N*N*",
                                  &pyModel,
-                                 &PyArray_Type,&pySuf_r,
-                                 &PyArray_Type,&pyIIS_r,
-                                 &PyArray_Type,&pyCons,
-                                 &PyArray_Type,&pySuf_c,
-                                 &PyArray_Type,&pyIIS_c,
-                                 &PyArray_Type,&pyVars,
-                                 &PyArray_Type,&pyBnds))
+                                 &pySuf_r,
+                                 &pyIIS_r,
+                                 &pyCons,
+                                 &pySuf_c,
+                                 &pyIIS_c,
+                                 &pyVars,
+                                 &pyBnds))
 
     {
         return NULL;
@@ -6920,7 +8521,7 @@ PyObject *pyLSgetIIS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetIUS(PyObject *self, PyObject *args)
+PyObject *pyLSgetIUS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6932,11 +8533,11 @@ PyObject *pyLSgetIUS(PyObject *self, PyObject *args)
     PyArrayObject  *pySuf = NULL, *pyIUS = NULL;
     PyArrayObject  *pyVars = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*",
                                  &pyModel,
-                                 &PyArray_Type,&pySuf,
-                                 &PyArray_Type,&pyIUS,
-                                 &PyArray_Type,&pyVars))
+                                 &pySuf,
+                                 &pyIUS,
+                                 &pyVars))
 
     {
         return NULL;
@@ -6963,7 +8564,7 @@ PyObject *pyLSgetIUS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetBlockStructure(PyObject *self, PyObject *args)
+PyObject *pyLSgetBlockStructure(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -6975,12 +8576,12 @@ PyObject *pyLSgetBlockStructure(PyObject *self, PyObject *args)
     PyArrayObject  *pyBlock = NULL, *pyRblock = NULL;
     PyArrayObject  *pyCblock = NULL, *pyType = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*",
                                  &pyModel,
-                                 &PyArray_Type,&pyBlock,
-                                 &PyArray_Type,&pyRblock,
-                                 &PyArray_Type,&pyCblock,
-                                 &PyArray_Type,&pyType))
+                                 &pyBlock,
+                                 &pyRblock,
+                                 &pyCblock,
+                                 &pyType))
 
     {
         return NULL;
@@ -7013,7 +8614,7 @@ PyObject *pyLSgetBlockStructure(PyObject *self, PyObject *args)
 /*********************************************************************
  *    Stochastic Programming Interface (73)                          *
  *********************************************************************/
-PyObject *pyLSwriteDeteqMPSFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteDeteqMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7022,7 +8623,7 @@ PyObject *pyLSwriteDeteqMPSFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osii",
+    if (!pyParseArgs(args, nargs, "Osii",
                                  &pyModel,
                                  &pszFilename,
                                  &nFormat,
@@ -7042,7 +8643,7 @@ PyObject *pyLSwriteDeteqMPSFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteDeteqLINDOFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteDeteqLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7051,7 +8652,7 @@ PyObject *pyLSwriteDeteqLINDOFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
                                  &pyModel,
                                  &pszFilename,
                                  &iType))
@@ -7070,7 +8671,7 @@ PyObject *pyLSwriteDeteqLINDOFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteSMPSFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteSMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7079,7 +8680,7 @@ PyObject *pyLSwriteSMPSFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osssi",
+    if (!pyParseArgs(args, nargs, "Osssi",
                                  &pyModel,
                                  &pszCorefile,
                                  &pszTimefile,
@@ -7104,7 +8705,7 @@ PyObject *pyLSwriteSMPSFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadSMPSFile(PyObject *self, PyObject *args)
+PyObject *pyLSreadSMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7113,7 +8714,7 @@ PyObject *pyLSreadSMPSFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osssi",
+    if (!pyParseArgs(args, nargs, "Osssi",
                                  &pyModel,
                                  &pszCorefile,
                                  &pszTimefile,
@@ -7124,6 +8725,7 @@ PyObject *pyLSreadSMPSFile(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     errorcode = LSreadSMPSFile(pModel,
                                pszCorefile,
@@ -7138,7 +8740,7 @@ PyObject *pyLSreadSMPSFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteSMPIFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteSMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7146,7 +8748,7 @@ PyObject *pyLSwriteSMPIFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osss",
+    if (!pyParseArgs(args, nargs, "Osss",
                                  &pyModel,
                                  &pszCorefile,
                                  &pszTimefile,
@@ -7169,7 +8771,7 @@ PyObject *pyLSwriteSMPIFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSreadSMPIFile(PyObject *self, PyObject *args)
+PyObject *pyLSreadSMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7177,7 +8779,7 @@ PyObject *pyLSreadSMPIFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Osss",
+    if (!pyParseArgs(args, nargs, "Osss",
                                  &pyModel,
                                  &pszCorefile,
                                  &pszTimefile,
@@ -7187,6 +8789,7 @@ PyObject *pyLSreadSMPIFile(PyObject *self, PyObject *args)
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     errorcode = LSreadSMPIFile(pModel,
                                pszCorefile,
@@ -7200,7 +8803,7 @@ PyObject *pyLSreadSMPIFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteScenarioSolutionFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteScenarioSolutionFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7209,7 +8812,7 @@ PyObject *pyLSwriteScenarioSolutionFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Ois",
+    if (!pyParseArgs(args, nargs, "Ois",
                                  &pyModel,
                                  &jScenario,
                                  &pszFname))
@@ -7230,7 +8833,7 @@ PyObject *pyLSwriteScenarioSolutionFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteNodeSolutionFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteNodeSolutionFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7239,7 +8842,7 @@ PyObject *pyLSwriteNodeSolutionFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oiis",
+    if (!pyParseArgs(args, nargs, "Oiis",
                                  &pyModel,
                                  &jScenario,
                                  &iStage,
@@ -7262,7 +8865,7 @@ PyObject *pyLSwriteNodeSolutionFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteScenarioMPIFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteScenarioMPIFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7271,7 +8874,7 @@ PyObject *pyLSwriteScenarioMPIFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Ois",
+    if (!pyParseArgs(args, nargs, "Ois",
                                  &pyModel,
                                  &jScenario,
                                  &pszFname))
@@ -7292,7 +8895,7 @@ PyObject *pyLSwriteScenarioMPIFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteScenarioMPSFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteScenarioMPSFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7302,7 +8905,7 @@ PyObject *pyLSwriteScenarioMPSFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oisi",
+    if (!pyParseArgs(args, nargs, "Oisi",
                                  &pyModel,
                                  &jScenario,
                                  &pszFname,
@@ -7325,7 +8928,7 @@ PyObject *pyLSwriteScenarioMPSFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSwriteScenarioLINDOFile(PyObject *self, PyObject *args)
+PyObject *pyLSwriteScenarioLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7334,7 +8937,7 @@ PyObject *pyLSwriteScenarioLINDOFile(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Ois",
+    if (!pyParseArgs(args, nargs, "Ois",
                                  &pyModel,
                                  &jScenario,
                                  &pszFname))
@@ -7355,7 +8958,7 @@ PyObject *pyLSwriteScenarioLINDOFile(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetModelStocDouParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetModelStocDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7364,7 +8967,7 @@ PyObject *pyLSsetModelStocDouParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oid",
+    if (!pyParseArgs(args, nargs, "Oid",
                                  &pyModel,
                                  &iPar,
                                  &dVal))
@@ -7385,7 +8988,7 @@ PyObject *pyLSsetModelStocDouParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetModelStocDouParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetModelStocDouParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7396,10 +8999,10 @@ PyObject *pyLSgetModelStocDouParameter(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &iPar,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -7418,7 +9021,7 @@ PyObject *pyLSgetModelStocDouParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetModelStocIntParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetModelStocIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7427,7 +9030,7 @@ PyObject *pyLSsetModelStocIntParameter(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oid",
+    if (!pyParseArgs(args, nargs, "Oid",
                                  &pyModel,
                                  &iPar,
                                  &iVal))
@@ -7448,7 +9051,7 @@ PyObject *pyLSsetModelStocIntParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetModelStocIntParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetModelStocIntParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7459,10 +9062,10 @@ PyObject *pyLSgetModelStocIntParameter(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
                                  &pyModel,
                                  &iPar,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -7481,7 +9084,7 @@ PyObject *pyLSgetModelStocIntParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenarioIndex(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenarioIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7492,10 +9095,10 @@ PyObject *pyLSgetScenarioIndex(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyIndex = NULL;
 
-    if (!PyArg_ParseTuple(args, "OsO!",
+    if (!pyParseArgs(args, nargs, "OsN*",
                                  &pyModel,
                                  &pszName,
-                                 &PyArray_Type,&pyIndex))
+                                 &pyIndex))
     {
         return NULL;
     }
@@ -7514,7 +9117,7 @@ PyObject *pyLSgetScenarioIndex(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStageIndex(PyObject *self, PyObject *args)
+PyObject *pyLSgetStageIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7525,10 +9128,10 @@ PyObject *pyLSgetStageIndex(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyIndex = NULL;
 
-    if (!PyArg_ParseTuple(args, "OsO!",
+    if (!pyParseArgs(args, nargs, "OsN*",
                                  &pyModel,
                                  &pszName,
-                                 &PyArray_Type,&pyIndex))
+                                 &pyIndex))
     {
         return NULL;
     }
@@ -7547,7 +9150,7 @@ PyObject *pyLSgetStageIndex(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStocParIndex(PyObject *self, PyObject *args)
+PyObject *pyLSgetStocParIndex(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7558,10 +9161,10 @@ PyObject *pyLSgetStocParIndex(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyIndex = NULL;
 
-    if (!PyArg_ParseTuple(args, "OsO!",
+    if (!pyParseArgs(args, nargs, "OsN*",
                                  &pyModel,
                                  &pszName,
-                                 &PyArray_Type,&pyIndex))
+                                 &pyIndex))
     {
         return NULL;
     }
@@ -7580,7 +9183,7 @@ PyObject *pyLSgetStocParIndex(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStocParName(PyObject *self, PyObject *args)
+PyObject *pyLSgetStocParName(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7591,10 +9194,10 @@ PyObject *pyLSgetStocParName(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyName = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyModel,
                                  &nIndex,
-                                 &PyArray_Type,&pyName))
+                                 &pyName))
     {
         return NULL;
     }
@@ -7613,7 +9216,7 @@ PyObject *pyLSgetStocParName(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenarioName(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenarioName(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7624,10 +9227,10 @@ PyObject *pyLSgetScenarioName(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyName = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyModel,
                                  &nIndex,
-                                 &PyArray_Type,&pyName))
+                                 &pyName))
     {
         return NULL;
     }
@@ -7646,7 +9249,7 @@ PyObject *pyLSgetScenarioName(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStageName(PyObject *self, PyObject *args)
+PyObject *pyLSgetStageName(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7657,10 +9260,10 @@ PyObject *pyLSgetStageName(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyName = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS*",
                                  &pyModel,
                                  &nIndex,
-                                 &PyArray_Type,&pyName))
+                                 &pyName))
     {
         return NULL;
     }
@@ -7679,7 +9282,7 @@ PyObject *pyLSgetStageName(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStocInfo(PyObject *self, PyObject *args)
+PyObject *pyLSgetStocInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7690,11 +9293,11 @@ PyObject *pyLSgetStocInfo(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!",
+    if (!pyParseArgs(args, nargs, "OiiA*",
                                  &pyModel,
                                  &nQuery,
                                  &nParam,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -7713,7 +9316,7 @@ PyObject *pyLSgetStocInfo(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStocCCPInfo(PyObject *self, PyObject *args)
+PyObject *pyLSgetStocCCPInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7724,12 +9327,12 @@ PyObject *pyLSgetStocCCPInfo(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiiO!",
+    if (!pyParseArgs(args, nargs, "OiiiA*",
                                  &pyModel,
                                  &nQuery,
                                  &nScenarioIndex,
                                  &nCPPIndex,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -7748,7 +9351,7 @@ PyObject *pyLSgetStocCCPInfo(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadSampleSizes(PyObject *self, PyObject *args)
+PyObject *pyLSloadSampleSizes(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7758,9 +9361,9 @@ PyObject *pyLSloadSampleSizes(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pySampleSize = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OA",
                                  &pyModel,
-                                 &PyArray_Type,&pySampleSize))
+                                 &pySampleSize))
     {
         return NULL;
     }
@@ -7779,7 +9382,7 @@ PyObject *pyLSloadSampleSizes(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadConstraintStages(PyObject *self, PyObject *args)
+PyObject *pyLSloadConstraintStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7789,9 +9392,9 @@ PyObject *pyLSloadConstraintStages(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStage = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OA",
                                  &pyModel,
-                                 &PyArray_Type,&pyStage))
+                                 &pyStage))
     {
         return NULL;
     }
@@ -7810,7 +9413,7 @@ PyObject *pyLSloadConstraintStages(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadVariableStages(PyObject *self, PyObject *args)
+PyObject *pyLSloadVariableStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7820,9 +9423,9 @@ PyObject *pyLSloadVariableStages(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStage = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OA",
                                  &pyModel,
-                                 &PyArray_Type,&pyStage))
+                                 &pyStage))
     {
         return NULL;
     }
@@ -7841,7 +9444,7 @@ PyObject *pyLSloadVariableStages(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadStageData(PyObject *self, PyObject *args)
+PyObject *pyLSloadStageData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7852,11 +9455,11 @@ PyObject *pyLSloadStageData(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyRstage = NULL,*pyCstage = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiNN",
                                  &pyModel,
                                  &numStages,
-                                 &PyArray_Type,&pyRstage,
-                                 &PyArray_Type,&pyCstage))
+                                 &pyRstage,
+                                 &pyCstage))
     {
         return NULL;
     }
@@ -7877,7 +9480,7 @@ PyObject *pyLSloadStageData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadStocParData(PyObject *self, PyObject *args)
+PyObject *pyLSloadStocParData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7888,10 +9491,10 @@ PyObject *pyLSloadStocParData(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pySparStage = NULL,*pySparValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "OND",
                                  &pyModel,
-                                 &PyArray_Type,&pySparStage,
-                                 &PyArray_Type,&pySparValue))
+                                 &pySparStage,
+                                 &pySparValue))
     {
         return NULL;
     }
@@ -7912,7 +9515,7 @@ PyObject *pyLSloadStocParData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetDeteqModel(PyObject *self, PyObject *args)
+PyObject *pyLSgetDeteqModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     pLSmodel  pDeteqModel = NULL;
     pLSmodel  pModel;
@@ -7923,10 +9526,10 @@ PyObject *pyLSgetDeteqModel(PyObject *self, PyObject *args)
     PyObject        *pyModel;
     PyArrayObject   *pyErrorCode = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
                                  &pyModel,
                                  &iDeqType,
-                                 &PyArray_Type,&pyErrorCode))
+                                 &pyErrorCode))
     {
         return NULL;
     }
@@ -7947,7 +9550,7 @@ PyObject *pyLSgetDeteqModel(PyObject *self, PyObject *args)
     return PyNewObjPtr(pDeteqModel);
 }
 
-PyObject *pyLSaggregateStages(PyObject *self, PyObject *args)
+PyObject *pyLSaggregateStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7957,14 +9560,17 @@ PyObject *pyLSaggregateStages(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyScheme = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!i",
+    if (!pyParseArgs(args, nargs, "ONi",
                                  &pyModel,
-                                 &PyArray_Type,&pyScheme,
+                                 &pyScheme,
                                  &nLength))
     {
         return NULL;
     }
 
+    if (!pyArgLen("nLength", nLength, 1, pyScheme))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyScheme && PyArray_DIMS(pyScheme) > 0)
@@ -7979,7 +9585,7 @@ PyObject *pyLSaggregateStages(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStageAggScheme(PyObject *self, PyObject *args)
+PyObject *pyLSgetStageAggScheme(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -7990,10 +9596,10 @@ PyObject *pyLSgetStageAggScheme(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyScheme = NULL, *pyLength = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*",
                                  &pyModel,
-                                 &PyArray_Type,&pyScheme,
-                                 &PyArray_Type,&pyLength))
+                                 &pyScheme,
+                                 &pyLength))
     {
         return NULL;
     }
@@ -8014,7 +9620,7 @@ PyObject *pyLSgetStageAggScheme(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsolveSP(PyObject *self, PyObject *args)
+PyObject *pyLSsolveSP(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8024,9 +9630,9 @@ PyObject *pyLSsolveSP(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pyStatus))
+                                 &pyStatus))
     {
         return NULL;
     }
@@ -8036,7 +9642,9 @@ PyObject *pyLSsolveSP(PyObject *self, PyObject *args)
     if(pyStatus && PyArray_DIMS(pyStatus) > 0)
         pnStatus = (int *)PyArray_GetPtr(pyStatus,index);
 
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSsolveSP(pModel,pnStatus);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -8045,7 +9653,7 @@ PyObject *pyLSsolveSP(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsolveHS(PyObject *self, PyObject *args)
+PyObject *pyLSsolveHS(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8056,10 +9664,10 @@ PyObject *pyLSsolveHS(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
                                  &pyModel,
                                  &nSearchMethod,
-                                 &PyArray_Type,&pyStatus))
+                                 &pyStatus))
     {
         return NULL;
     }
@@ -8069,7 +9677,9 @@ PyObject *pyLSsolveHS(PyObject *self, PyObject *args)
     if(pyStatus && PyArray_DIMS(pyStatus) > 0)
         pnStatus = (int *)PyArray_GetPtr(pyStatus,index);
 
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSsolveHS(pModel,nSearchMethod,pnStatus);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -8078,7 +9688,7 @@ PyObject *pyLSsolveHS(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenarioObjective(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenarioObjective(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8089,10 +9699,10 @@ PyObject *pyLSgetScenarioObjective(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyObj  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyObj))
+                                 &pyObj))
     {
         return NULL;
     }
@@ -8111,7 +9721,7 @@ PyObject *pyLSgetScenarioObjective(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNodePrimalSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetNodePrimalSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8122,11 +9732,11 @@ PyObject *pyLSgetNodePrimalSolution(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyX  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!",
+    if (!pyParseArgs(args, nargs, "OiiD*",
                                  &pyModel,
                                  &jScenario,
                                  &iStage,
-                                 &PyArray_Type,&pyX))
+                                 &pyX))
     {
         return NULL;
     }
@@ -8145,7 +9755,7 @@ PyObject *pyLSgetNodePrimalSolution(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNodeDualSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetNodeDualSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8156,11 +9766,11 @@ PyObject *pyLSgetNodeDualSolution(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyY  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!",
+    if (!pyParseArgs(args, nargs, "OiiD*",
                                  &pyModel,
                                  &jScenario,
                                  &iStage,
-                                 &PyArray_Type,&pyY))
+                                 &pyY))
     {
         return NULL;
     }
@@ -8179,7 +9789,7 @@ PyObject *pyLSgetNodeDualSolution(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNodeReducedCost(PyObject *self, PyObject *args)
+PyObject *pyLSgetNodeReducedCost(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8190,11 +9800,11 @@ PyObject *pyLSgetNodeReducedCost(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyX  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!",
+    if (!pyParseArgs(args, nargs, "OiiD*",
                                  &pyModel,
                                  &jScenario,
                                  &iStage,
-                                 &PyArray_Type,&pyX))
+                                 &pyX))
     {
         return NULL;
     }
@@ -8213,7 +9823,7 @@ PyObject *pyLSgetNodeReducedCost(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNodeSlacks(PyObject *self, PyObject *args)
+PyObject *pyLSgetNodeSlacks(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8224,11 +9834,11 @@ PyObject *pyLSgetNodeSlacks(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyY  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!",
+    if (!pyParseArgs(args, nargs, "OiiD*",
                                  &pyModel,
                                  &jScenario,
                                  &iStage,
-                                 &PyArray_Type,&pyY))
+                                 &pyY))
     {
         return NULL;
     }
@@ -8247,7 +9857,7 @@ PyObject *pyLSgetNodeSlacks(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenarioPrimalSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenarioPrimalSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8260,11 +9870,11 @@ PyObject *pyLSgetScenarioPrimalSolution(PyObject *self, PyObject *args)
     PyArrayObject  *pyX  = NULL;
     PyArrayObject  *pyObj  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiD*D*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyX,
-                                 &PyArray_Type,&pyObj))
+                                 &pyX,
+                                 &pyObj))
     {
         return NULL;
     }
@@ -8285,7 +9895,7 @@ PyObject *pyLSgetScenarioPrimalSolution(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenarioReducedCost(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenarioReducedCost(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8296,10 +9906,10 @@ PyObject *pyLSgetScenarioReducedCost(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyD  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyD))
+                                 &pyD))
     {
         return NULL;
     }
@@ -8318,7 +9928,7 @@ PyObject *pyLSgetScenarioReducedCost(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenarioDualSolution(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenarioDualSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8329,10 +9939,10 @@ PyObject *pyLSgetScenarioDualSolution(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyY  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyY))
+                                 &pyY))
     {
         return NULL;
     }
@@ -8351,7 +9961,7 @@ PyObject *pyLSgetScenarioDualSolution(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenarioSlacks(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenarioSlacks(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8362,10 +9972,10 @@ PyObject *pyLSgetScenarioSlacks(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyS  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyS))
+                                 &pyS))
     {
         return NULL;
     }
@@ -8384,7 +9994,7 @@ PyObject *pyLSgetScenarioSlacks(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetNodeListByScenario(PyObject *self, PyObject *args)
+PyObject *pyLSgetNodeListByScenario(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8395,11 +10005,11 @@ PyObject *pyLSgetNodeListByScenario(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyaiNodes  = NULL,*pynNodes  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyaiNodes,
-                                 &PyArray_Type,&pynNodes))
+                                 &pyaiNodes,
+                                 &pynNodes))
     {
         return NULL;
     }
@@ -8420,7 +10030,7 @@ PyObject *pyLSgetNodeListByScenario(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetProbabilityByScenario(PyObject *self, PyObject *args)
+PyObject *pyLSgetProbabilityByScenario(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8431,10 +10041,10 @@ PyObject *pyLSgetProbabilityByScenario(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyProb  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyProb))
+                                 &pyProb))
     {
         return NULL;
     }
@@ -8453,7 +10063,7 @@ PyObject *pyLSgetProbabilityByScenario(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetProbabilityByNode(PyObject *self, PyObject *args)
+PyObject *pyLSgetProbabilityByNode(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8464,10 +10074,10 @@ PyObject *pyLSgetProbabilityByNode(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyProb  = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pyModel,
                                  &iNode,
-                                 &PyArray_Type,&pyProb))
+                                 &pyProb))
     {
         return NULL;
     }
@@ -8486,7 +10096,7 @@ PyObject *pyLSgetProbabilityByNode(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStocParData(PyObject *self, PyObject *args)
+PyObject *pyLSgetStocParData(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8497,10 +10107,10 @@ PyObject *pyLSgetStocParData(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStages = NULL,*pyVals = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "ON*D*",
                                  &pyModel,
-                                 &PyArray_Type,&pyStages,
-                                 &PyArray_Type,&pyVals))
+                                 &pyStages,
+                                 &pyVals))
     {
         return NULL;
     }
@@ -8521,7 +10131,7 @@ PyObject *pyLSgetStocParData(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddDiscreteBlocks(PyObject *self, PyObject *args)
+PyObject *pyLSaddDiscreteBlocks(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8536,22 +10146,27 @@ PyObject *pyLSaddDiscreteBlocks(PyObject *self, PyObject *args)
     PyArrayObject  *pyRows = NULL, *pyCols = NULL;
     PyArrayObject  *pyStvs = NULL,*pyVals = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!O!O!O!O!O!i",
+    if (!pyParseArgs(args, nargs, "OiiDNNNNDi",
                                  &pyModel,
                                  &iStage,
                                  &nRealzBlock,
-                                 &PyArray_Type,&pyProb,
-                                 &PyArray_Type,&pyStart,
-                                 &PyArray_Type,&pyRows,
-                                 &PyArray_Type,&pyCols,
-                                 &PyArray_Type,&pyStvs,
-                                 &PyArray_Type,&pyVals,
+                                 &pyProb,
+                                 &pyStart,
+                                 &pyRows,
+                                 &pyCols,
+                                 &pyStvs,
+                                 &pyVals,
                                  &nModifyRule))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nRealzBlock", nRealzBlock, 1, pyProb))
+        return NULL;
+    if (!pyArgLen("nRealzBlock+1", (npy_intp)nRealzBlock + 1, 1, pyStart))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyProb && PyArray_DIMS(pyProb) > 0)
@@ -8585,7 +10200,7 @@ PyObject *pyLSaddDiscreteBlocks(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddScenario(PyObject *self, PyObject *args)
+PyObject *pyLSaddScenario(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8601,23 +10216,26 @@ PyObject *pyLSaddScenario(PyObject *self, PyObject *args)
     PyArrayObject  *pyRows = NULL, *pyCols = NULL;
     PyArrayObject  *pyStvs = NULL,*pyVals = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiidiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiiidiNNND",
                                  &pyModel,
                                  &jScenario,
                                  &iParentScen,
                                  &iStage,
                                  &dProb,
                                  &nElems,
-                                 &PyArray_Type,&pyRows,
-                                 &PyArray_Type,&pyCols,
-                                 &PyArray_Type,&pyStvs,
-                                 &PyArray_Type,&pyVals,
+                                 &pyRows,
+                                 &pyCols,
+                                 &pyStvs,
+                                 &pyVals,
                                  &nModifyRule))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nElems", nElems, 4, pyRows, pyCols, pyStvs, pyVals))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyRows && PyArray_DIMS(pyRows) > 0)
@@ -8647,7 +10265,7 @@ PyObject *pyLSaddScenario(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddDiscreteIndep(PyObject *self, PyObject *args)
+PyObject *pyLSaddDiscreteIndep(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8659,20 +10277,23 @@ PyObject *pyLSaddDiscreteIndep(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyProbs = NULL,*pyVals = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiiiO!O!i",
+    if (!pyParseArgs(args, nargs, "OiiiiDDi",
                                  &pyModel,
                                  &iRow,
                                  &jCol,
                                  &iStv,
                                  &nRealizations,
-                                 &PyArray_Type,&pyProbs,
-                                 &PyArray_Type,&pyVals,
+                                 &pyProbs,
+                                 &pyVals,
                                  &nModifyRule))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nRealizations", nRealizations, 2, pyProbs, pyVals))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyProbs && PyArray_DIMS(pyProbs) > 0)
@@ -8696,7 +10317,7 @@ PyObject *pyLSaddDiscreteIndep(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddParamDistIndep(PyObject *self, PyObject *args)
+PyObject *pyLSaddParamDistIndep(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8707,14 +10328,14 @@ PyObject *pyLSaddParamDistIndep(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyParams= NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiiiO!i",
+    if (!pyParseArgs(args, nargs, "OiiiiDi",
                                  &pyModel,
                                  &iRow,
                                  &jCol,
                                  &iStv,
                                  &nDistType,
                                  &nParams,
-                                 &PyArray_Type,&pyParams,
+                                 &pyParams,
                                  &nModifyRule))
 
     {
@@ -8741,7 +10362,7 @@ PyObject *pyLSaddParamDistIndep(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSaddChanceConstraint(PyObject *self, PyObject *args)
+PyObject *pyLSaddChanceConstraint(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8752,11 +10373,11 @@ PyObject *pyLSaddChanceConstraint(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyCons= NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!dd",
+    if (!pyParseArgs(args, nargs, "OiiNdd",
                                  &pyModel,
                                  &iSense,
                                  &nCons,
-                                 &PyArray_Type,&pyCons,
+                                 &pyCons,
                                  &dPrLevel,
                                  &dObjWeight))
 
@@ -8764,6 +10385,9 @@ PyObject *pyLSaddChanceConstraint(PyObject *self, PyObject *args)
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 1, pyCons))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyCons && PyArray_DIMS(pyCons) > 0)
@@ -8783,7 +10407,7 @@ PyObject *pyLSaddChanceConstraint(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetNumStages(PyObject *self, PyObject *args)
+PyObject *pyLSsetNumStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8791,7 +10415,7 @@ PyObject *pyLSsetNumStages(PyObject *self, PyObject *args)
 
     PyObject       *pyModel;
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
                                  &pyModel,
                                  &numStages))
 
@@ -8811,7 +10435,7 @@ PyObject *pyLSsetNumStages(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStocParOutcomes(PyObject *self, PyObject *args)
+PyObject *pyLSgetStocParOutcomes(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8822,11 +10446,11 @@ PyObject *pyLSgetStocParOutcomes(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyValue = NULL, *pyProbs = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiD*D*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyValue,
-                                 &PyArray_Type,&pyProbs))
+                                 &pyValue,
+                                 &pyProbs))
     {
         return NULL;
     }
@@ -8847,7 +10471,7 @@ PyObject *pyLSgetStocParOutcomes(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSloadCorrelationMatrix(PyObject *self, PyObject *args)
+PyObject *pyLSloadCorrelationMatrix(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8858,19 +10482,22 @@ PyObject *pyLSloadCorrelationMatrix(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyQCcols1= NULL,*pyQCcols2= NULL,*pyQCcoef= NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiiiNND",
                                  &pyModel,
                                  &nDim,
                                  &nCorrType,
                                  &nQCnnz,
-                                 &PyArray_Type,&pyQCcols1,
-                                 &PyArray_Type,&pyQCcols2,
-                                 &PyArray_Type,&pyQCcoef))
+                                 &pyQCcols1,
+                                 &pyQCcols2,
+                                 &pyQCcoef))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nQCnnz", nQCnnz, 3, pyQCcols1, pyQCcols2, pyQCcoef))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyQCcols1 && PyArray_DIMS(pyQCcols1) > 0)
@@ -8895,7 +10522,7 @@ PyObject *pyLSloadCorrelationMatrix(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetCorrelationMatrix(PyObject *self, PyObject *args)
+PyObject *pyLSgetCorrelationMatrix(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -8909,14 +10536,14 @@ PyObject *pyLSgetCorrelationMatrix(PyObject *self, PyObject *args)
     PyArrayObject  *pyQCnnz = NULL;
     PyArrayObject  *pyQCcols1= NULL,*pyQCcols2= NULL,*pyQCcoef= NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiiN*N*N*D*",
                                  &pyModel,
                                  &iFlag,
                                  &nCorrType,
-                                 &PyArray_Type,&pyQCnnz,
-                                 &PyArray_Type,&pyQCcols1,
-                                 &PyArray_Type,&pyQCcols2,
-                                 &PyArray_Type,&pyQCcoef))
+                                 &pyQCnnz,
+                                 &pyQCcols1,
+                                 &pyQCcols2,
+                                 &pyQCcoef))
 
     {
         return NULL;
@@ -8948,7 +10575,7 @@ PyObject *pyLSgetCorrelationMatrix(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStocParSample(PyObject *self, PyObject *args)
+PyObject *pyLSgetStocParSample(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     pLSsample pSample = NULL;
     pLSmodel  pModel;
@@ -8959,12 +10586,12 @@ PyObject *pyLSgetStocParSample(PyObject *self, PyObject *args)
     PyObject        *pyModel;
     PyArrayObject   *pyErrorCode = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiiO!",
+    if (!pyParseArgs(args, nargs, "OiiiN*",
                                  &pyModel,
                                  &iStv,
                                  &iRow,
                                  &jCol,
-                                 &PyArray_Type,&pyErrorCode))
+                                 &pyErrorCode))
     {
         return NULL;
     }
@@ -8985,7 +10612,7 @@ PyObject *pyLSgetStocParSample(PyObject *self, PyObject *args)
     return PyNewObjPtr(pSample);
 }
 
-PyObject *pyLSgetDiscreteBlocks(PyObject *self, PyObject *args)
+PyObject *pyLSgetDiscreteBlocks(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9001,14 +10628,14 @@ PyObject *pyLSgetDiscreteBlocks(PyObject *self, PyObject *args)
     PyArrayObject  *pyStage= NULL,*pyRealzBlock= NULL,*pyProbs= NULL;
     PyArrayObject  *pyModifyRule = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*D*N*",
                                  &pyModel,
                                  &iEvent,
-                                 &PyArray_Type,&pyDistType,
-                                 &PyArray_Type,&pyStage,
-                                 &PyArray_Type,&pyRealzBlock,
-                                 &PyArray_Type,&pyProbs,
-                                 &PyArray_Type,&pyModifyRule))
+                                 &pyDistType,
+                                 &pyStage,
+                                 &pyRealzBlock,
+                                 &pyProbs,
+                                 &pyModifyRule))
 
     {
         return NULL;
@@ -9042,7 +10669,7 @@ PyObject *pyLSgetDiscreteBlocks(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetDiscreteBlockOutcomes(PyObject *self, PyObject *args)
+PyObject *pyLSgetDiscreteBlockOutcomes(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9058,15 +10685,15 @@ PyObject *pyLSgetDiscreteBlockOutcomes(PyObject *self, PyObject *args)
     PyArrayObject  *pyArows= NULL,*pyAcols= NULL,*pyStvs= NULL;
     PyArrayObject  *pyVals = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiiN*N*N*N*D*",
                                  &pyModel,
                                  &iEvent,
                                  &iRealz,
-                                 &PyArray_Type,&pyRealz,
-                                 &PyArray_Type,&pyArows,
-                                 &PyArray_Type,&pyAcols,
-                                 &PyArray_Type,&pyStvs,
-                                 &PyArray_Type,&pyVals))
+                                 &pyRealz,
+                                 &pyArows,
+                                 &pyAcols,
+                                 &pyStvs,
+                                 &pyVals))
 
     {
         return NULL;
@@ -9101,7 +10728,7 @@ PyObject *pyLSgetDiscreteBlockOutcomes(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetDiscreteIndep(PyObject *self, PyObject *args)
+PyObject *pyLSgetDiscreteIndep(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9120,18 +10747,18 @@ PyObject *pyLSgetDiscreteIndep(PyObject *self, PyObject *args)
     PyArrayObject  *pyStv = NULL,*pyRealizations = NULL,*pyProbs = NULL;
     PyArrayObject  *pyVals= NULL,*pyModifyRule= NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*N*N*N*D*D*N*",
                                  &pyModel,
                                  &iEvent,
-                                 &PyArray_Type,&pyDistType,
-                                 &PyArray_Type,&pyStage,
-                                 &PyArray_Type,&pyRow,
-                                 &PyArray_Type,&pyCol,
-                                 &PyArray_Type,&pyStv,
-                                 &PyArray_Type,&pyRealizations,
-                                 &PyArray_Type,&pyProbs,
-                                 &PyArray_Type,&pyVals,
-                                 &PyArray_Type,&pyModifyRule))
+                                 &pyDistType,
+                                 &pyStage,
+                                 &pyRow,
+                                 &pyCol,
+                                 &pyStv,
+                                 &pyRealizations,
+                                 &pyProbs,
+                                 &pyVals,
+                                 &pyModifyRule))
 
     {
         return NULL;
@@ -9177,7 +10804,7 @@ PyObject *pyLSgetDiscreteIndep(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetParamDistIndep(PyObject *self, PyObject *args)
+PyObject *pyLSgetParamDistIndep(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9196,17 +10823,17 @@ PyObject *pyLSgetParamDistIndep(PyObject *self, PyObject *args)
     PyArrayObject  *pyStv = NULL,*pynParams = NULL,*pydParams = NULL;
     PyArrayObject  *pyModifyRule= NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*N*N*N*D*N*",
                                  &pyModel,
                                  &iEvent,
-                                 &PyArray_Type,&pyDistType,
-                                 &PyArray_Type,&pyStage,
-                                 &PyArray_Type,&pyRow,
-                                 &PyArray_Type,&pyCol,
-                                 &PyArray_Type,&pyStv,
-                                 &PyArray_Type,&pynParams,
-                                 &PyArray_Type,&pydParams,
-                                 &PyArray_Type,&pyModifyRule))
+                                 &pyDistType,
+                                 &pyStage,
+                                 &pyRow,
+                                 &pyCol,
+                                 &pyStv,
+                                 &pynParams,
+                                 &pydParams,
+                                 &pyModifyRule))
 
     {
         return NULL;
@@ -9249,7 +10876,7 @@ PyObject *pyLSgetParamDistIndep(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenario(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenario(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9269,18 +10896,18 @@ PyObject *pyLSgetScenario(PyObject *self, PyObject *args)
     PyArrayObject  *pyArows = NULL,*pyAcols = NULL,*pyStvs = NULL;
     PyArrayObject  *pyVals = NULL, *pyModifyRule = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*D*N*N*N*N*D*N*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyParentScen,
-                                 &PyArray_Type,&pyBranchStage,
-                                 &PyArray_Type,&pyProb,
-                                 &PyArray_Type,&pyRealz,
-                                 &PyArray_Type,&pyArows,
-                                 &PyArray_Type,&pyAcols,
-                                 &PyArray_Type,&pyStvs,
-                                 &PyArray_Type,&pyVals,
-                                 &PyArray_Type,&pyModifyRule))
+                                 &pyParentScen,
+                                 &pyBranchStage,
+                                 &pyProb,
+                                 &pyRealz,
+                                 &pyArows,
+                                 &pyAcols,
+                                 &pyStvs,
+                                 &pyVals,
+                                 &pyModifyRule))
 
     {
         return NULL;
@@ -9326,7 +10953,7 @@ PyObject *pyLSgetScenario(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetChanceConstraint(PyObject *self, PyObject *args)
+PyObject *pyLSgetChanceConstraint(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9341,14 +10968,14 @@ PyObject *pyLSgetChanceConstraint(PyObject *self, PyObject *args)
     PyArrayObject  *pynCons = NULL,*pyiCons = NULL,*pyProb = NULL;
     PyArrayObject  *pyObjWeight = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*D*D*",
                                  &pyModel,
                                  &iChance,
-                                 &PyArray_Type,&pySense,
-                                 &PyArray_Type,&pynCons,
-                                 &PyArray_Type,&pyiCons,
-                                 &PyArray_Type,&pyProb,
-                                 &PyArray_Type,&pyObjWeight))
+                                 &pySense,
+                                 &pynCons,
+                                 &pyiCons,
+                                 &pyProb,
+                                 &pyObjWeight))
 
     {
         return NULL;
@@ -9382,7 +11009,7 @@ PyObject *pyLSgetChanceConstraint(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetSampleSizes(PyObject *self, PyObject *args)
+PyObject *pyLSgetSampleSizes(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9392,9 +11019,9 @@ PyObject *pyLSgetSampleSizes(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pySampleSize = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pySampleSize))
+                                 &pySampleSize))
 
     {
         return NULL;
@@ -9415,7 +11042,7 @@ PyObject *pyLSgetSampleSizes(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetConstraintStages(PyObject *self, PyObject *args)
+PyObject *pyLSgetConstraintStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9425,9 +11052,9 @@ PyObject *pyLSgetConstraintStages(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStage = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pyStage))
+                                 &pyStage))
 
     {
         return NULL;
@@ -9448,7 +11075,7 @@ PyObject *pyLSgetConstraintStages(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetVariableStages(PyObject *self, PyObject *args)
+PyObject *pyLSgetVariableStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9458,9 +11085,9 @@ PyObject *pyLSgetVariableStages(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStage = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pyStage))
+                                 &pyStage))
 
     {
         return NULL;
@@ -9481,7 +11108,7 @@ PyObject *pyLSgetVariableStages(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetStocRowIndices(PyObject *self, PyObject *args)
+PyObject *pyLSgetStocRowIndices(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9491,9 +11118,9 @@ PyObject *pyLSgetStocRowIndices(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pySrows = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyModel,
-                                 &PyArray_Type,&pySrows))
+                                 &pySrows))
 
     {
         return NULL;
@@ -9514,7 +11141,7 @@ PyObject *pyLSgetStocRowIndices(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetStocParRG(PyObject *self, PyObject *args)
+PyObject *pyLSsetStocParRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSmodel   pModel;
@@ -9525,7 +11152,7 @@ PyObject *pyLSsetStocParRG(PyObject *self, PyObject *args)
     PyObject       *pyRG;
 
 
-    if (!PyArg_ParseTuple(args, "OiiiO",
+    if (!pyParseArgs(args, nargs, "OiiiO",
                                  &pyModel,
                                  &iStv,
                                  &iRow,
@@ -9549,7 +11176,7 @@ PyObject *pyLSsetStocParRG(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetScenarioModel(PyObject *self, PyObject *args)
+PyObject *pyLSgetScenarioModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     pLSmodel  pSmodel = NULL;
     pLSmodel  pModel;
@@ -9560,10 +11187,10 @@ PyObject *pyLSgetScenarioModel(PyObject *self, PyObject *args)
     PyObject        *pyModel;
     PyArrayObject   *pyErrorCode = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
                                  &pyModel,
                                  &jScenario,
-                                 &PyArray_Type,&pyErrorCode))
+                                 &pyErrorCode))
     {
         return NULL;
     }
@@ -9584,14 +11211,14 @@ PyObject *pyLSgetScenarioModel(PyObject *self, PyObject *args)
     return PyNewObjPtr(pSmodel);
 }
 
-PyObject *pyLSfreeStocMemory(PyObject *self, PyObject *args)
+PyObject *pyLSfreeStocMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
 
     PyObject  *pyModel;
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
                                  &pyModel))
     {
         return NULL;
@@ -9604,14 +11231,14 @@ PyObject *pyLSfreeStocMemory(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSfreeStocHashMemory(PyObject *self, PyObject *args)
+PyObject *pyLSfreeStocHashMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
 
     PyObject  *pyModel;
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
                                  &pyModel))
     {
         return NULL;
@@ -9624,7 +11251,7 @@ PyObject *pyLSfreeStocHashMemory(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetModelStocParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetModelStocParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9635,10 +11262,10 @@ PyObject *pyLSgetModelStocParameter(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA*",
                                  &pyModel,
                                  &nQuery,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -9657,7 +11284,7 @@ PyObject *pyLSgetModelStocParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetModelStocParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetModelStocParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
@@ -9668,10 +11295,10 @@ PyObject *pyLSsetModelStocParameter(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA",
                                  &pyModel,
                                  &nQuery,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -9690,7 +11317,7 @@ PyObject *pyLSsetModelStocParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetEnvStocParameter(PyObject *self, PyObject *args)
+PyObject *pyLSsetEnvStocParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -9701,10 +11328,10 @@ PyObject *pyLSsetEnvStocParameter(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA",
                                  &pyEnv,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -9723,7 +11350,7 @@ PyObject *pyLSsetEnvStocParameter(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetEnvStocParameter(PyObject *self, PyObject *args)
+PyObject *pyLSgetEnvStocParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSenv    pEnv;
@@ -9734,10 +11361,10 @@ PyObject *pyLSgetEnvStocParameter(PyObject *self, PyObject *args)
     PyObject       *pyEnv;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA*",
                                  &pyEnv,
                                  &nParameter,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -9759,7 +11386,7 @@ PyObject *pyLSgetEnvStocParameter(PyObject *self, PyObject *args)
 /*********************************************************************
  *    Statistical Calculations Interface (16)                        *
  *********************************************************************/
-PyObject *pyLSsampCreate(PyObject *self, PyObject *args)
+PyObject *pyLSsampCreate(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     pLSsample pSample = NULL;
     pLSenv    pEnv;
@@ -9770,10 +11397,10 @@ PyObject *pyLSsampCreate(PyObject *self, PyObject *args)
     PyObject        *pyEnv;
     PyArrayObject   *pyErrorCode = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
                                  &pyEnv,
                                  &nDistType,
-                                 &PyArray_Type,&pyErrorCode))
+                                 &pyErrorCode))
     {
         return NULL;
     }
@@ -9794,18 +11421,26 @@ PyObject *pyLSsampCreate(PyObject *self, PyObject *args)
     return PyNewObjPtr(pSample);
 }
 
-PyObject *pyLSsampDelete(PyObject *self, PyObject *args)
+PyObject *pyLSsampDelete(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
 
     PyObject  *pySample;
 
-    if (!PyArg_ParseTuple(args, "O", &pySample))
+    if (!pyParseArgs(args, nargs, "O", &pySample))
     {
         return NULL;
     }
 
+    if (pyIsHandle(pySample)) {
+        errorcode = pyHandleClose((pyHandle_t*)pySample);
+        if (errorcode != 0){
+            ERROR_SET(errorcode);
+        }
+        return Py_BuildValue("i",errorcode);
+    }
+
     CHECK_SAMPLE;
 
     errorcode = LSsampDelete(&pSample);
@@ -9817,7 +11452,7 @@ PyObject *pyLSsampDelete(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampSetDistrParam(PyObject *self, PyObject *args)
+PyObject *pyLSsampSetDistrParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -9826,7 +11461,7 @@ PyObject *pyLSsampSetDistrParam(PyObject *self, PyObject *args)
 
     PyObject  *pySample;
 
-    if (!PyArg_ParseTuple(args, "Oid",
+    if (!pyParseArgs(args, nargs, "Oid",
                                  &pySample,
                                  &nIndex,
                                  &dValue))
@@ -9845,7 +11480,7 @@ PyObject *pyLSsampSetDistrParam(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampGetDistrParam(PyObject *self, PyObject *args)
+PyObject *pyLSsampGetDistrParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -9856,10 +11491,10 @@ PyObject *pyLSsampGetDistrParam(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pyValue = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
                                  &pySample,
                                  &nIndex,
-                                 &PyArray_Type,&pyValue))
+                                 &pyValue))
     {
         return NULL;
     }
@@ -9878,7 +11513,7 @@ PyObject *pyLSsampGetDistrParam(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampEvalDistr(PyObject *self, PyObject *args)
+PyObject *pyLSsampEvalDistr(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -9890,11 +11525,11 @@ PyObject *pyLSsampEvalDistr(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OidO!",
+    if (!pyParseArgs(args, nargs, "OidD*",
                                  &pySample,
                                  &nFuncType,
                                  &dXval,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -9913,7 +11548,7 @@ PyObject *pyLSsampEvalDistr(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampEvalDistrLI(PyObject *self, PyObject *args)
+PyObject *pyLSsampEvalDistrLI(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -9925,11 +11560,11 @@ PyObject *pyLSsampEvalDistrLI(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OidO!",
+    if (!pyParseArgs(args, nargs, "OidD*",
                                  &pySample,
                                  &nFuncType,
                                  &dXval,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -9948,7 +11583,7 @@ PyObject *pyLSsampEvalDistrLI(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampEvalUserDistr(PyObject *self, PyObject *args)
+PyObject *pyLSsampEvalUserDistr(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -9961,16 +11596,19 @@ PyObject *pyLSsampEvalUserDistr(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pyXval = NULL, *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!iO!",
+    if (!pyParseArgs(args, nargs, "OiDiD*",
                                  &pySample,
                                  &nFuncType,
-                                 &PyArray_Type,&pyXval,
+                                 &pyXval,
                                  &nDim,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
 
+    if (!pyArgLen("nDim", nDim, 1, pyXval))
+        return NULL;
+
     CHECK_SAMPLE;
 
     if(pyXval && PyArray_DIMS(pyXval) > 0)
@@ -9988,7 +11626,7 @@ PyObject *pyLSsampEvalUserDistr(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampSetRG(PyObject *self, PyObject *args)
+PyObject *pyLSsampSetRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSsample  pSample;
@@ -9996,7 +11634,7 @@ PyObject *pyLSsampSetRG(PyObject *self, PyObject *args)
 
     PyObject   *pySample, *pyRG;
 
-    if (!PyArg_ParseTuple(args, "OO",
+    if (!pyParseArgs(args, nargs, "OO",
                                  &pySample,
                                  &pyRG))
     {
@@ -10015,7 +11653,7 @@ PyObject *pyLSsampSetRG(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampGenerate(PyObject *self, PyObject *args)
+PyObject *pyLSsampGenerate(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -10024,7 +11662,7 @@ PyObject *pyLSsampGenerate(PyObject *self, PyObject *args)
     PyObject       *pySample;
 
 
-    if (!PyArg_ParseTuple(args, "OiI",
+    if (!pyParseArgs(args, nargs, "OiI",
                                  &pySample,
                                  &nMethod,
                                  &nSize))
@@ -10043,7 +11681,7 @@ PyObject *pyLSsampGenerate(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampGetPoints(PyObject *self, PyObject *args)
+PyObject *pyLSsampGetPoints(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -10054,10 +11692,10 @@ PyObject *pyLSsampGetPoints(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pySampSize = NULL, *pyXval = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "ON*D*",
                                  &pySample,
-                                 &PyArray_Type,&pySampSize,
-                                 &PyArray_Type,&pyXval))
+                                 &pySampSize,
+                                 &pyXval))
     {
         return NULL;
     }
@@ -10078,7 +11716,7 @@ PyObject *pyLSsampGetPoints(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampLoadPoints(PyObject *self, PyObject *args)
+PyObject *pyLSsampLoadPoints(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -10088,14 +11726,17 @@ PyObject *pyLSsampLoadPoints(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pyXval = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD",
                                  &pySample,
                                  &nSampSize,
-                                 &PyArray_Type,&pyXval))
+                                 &pyXval))
     {
         return NULL;
     }
 
+    if (!pyArgLen("nSampSize", nSampSize, 1, pyXval))
+        return NULL;
+
     CHECK_SAMPLE;
 
     if(pyXval && PyArray_DIMS(pyXval) > 0)
@@ -10110,7 +11751,7 @@ PyObject *pyLSsampLoadPoints(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampGetCIPoints(PyObject *self, PyObject *args)
+PyObject *pyLSsampGetCIPoints(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -10121,10 +11762,10 @@ PyObject *pyLSsampGetCIPoints(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pySampSize = NULL, *pyXval = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "ON*D*",
                                  &pySample,
-                                 &PyArray_Type,&pySampSize,
-                                 &PyArray_Type,&pyXval))
+                                 &pySampSize,
+                                 &pyXval))
     {
         return NULL;
     }
@@ -10145,7 +11786,7 @@ PyObject *pyLSsampGetCIPoints(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampLoadDiscretePdfTable(PyObject *self, PyObject *args)
+PyObject *pyLSsampLoadDiscretePdfTable(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -10156,15 +11797,18 @@ PyObject *pyLSsampLoadDiscretePdfTable(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pyProb = NULL,*pyVals = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiDD",
                                  &pySample,
                                  &nLen,
-                                 &PyArray_Type,&pyProb,
-                                 &PyArray_Type,&pyVals))
+                                 &pyProb,
+                                 &pyVals))
     {
         return NULL;
     }
 
+    if (!pyArgLen("nLen", nLen, 2, pyProb, pyVals))
+        return NULL;
+
     CHECK_SAMPLE;
 
     if(pyProb && PyArray_DIMS(pyProb) > 0)
@@ -10181,7 +11825,7 @@ PyObject *pyLSsampLoadDiscretePdfTable(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampGetDiscretePdfTable(PyObject *self, PyObject *args)
+PyObject *pyLSsampGetDiscretePdfTable(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -10193,11 +11837,11 @@ PyObject *pyLSsampGetDiscretePdfTable(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pyLen = NULL,*pyProb = NULL,*pyVals = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*D*D*",
                                  &pySample,
-                                 &PyArray_Type,&pyLen,
-                                 &PyArray_Type,&pyProb,
-                                 &PyArray_Type,&pyVals))
+                                 &pyLen,
+                                 &pyProb,
+                                 &pyVals))
     {
         return NULL;
     }
@@ -10220,7 +11864,7 @@ PyObject *pyLSsampGetDiscretePdfTable(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampGetInfo(PyObject *self, PyObject *args)
+PyObject *pyLSsampGetInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -10231,10 +11875,10 @@ PyObject *pyLSsampGetInfo(PyObject *self, PyObject *args)
     PyObject       *pySample;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA*",
                                  &pySample,
                                  &nQuery,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -10253,7 +11897,7 @@ PyObject *pyLSsampGetInfo(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsampAddUserFuncArg(PyObject *self, PyObject *args)
+PyObject *pyLSsampAddUserFuncArg(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int       errorcode = LSERR_NO_ERROR;
     pLSsample pSample;
@@ -10261,7 +11905,7 @@ PyObject *pyLSsampAddUserFuncArg(PyObject *self, PyObject *args)
 
     PyObject  *pySample, *pySampleSource;
 
-    if (!PyArg_ParseTuple(args, "OO",
+    if (!pyParseArgs(args, nargs, "OO",
                                  &pySample,
                                  &pySampleSource))
     {
@@ -10290,7 +11934,7 @@ PyObject *pyLSsampAddUserFuncArg(PyObject *self, PyObject *args)
 /*********************************************************************
  *      Random Number Generation Interface()                         *
  *********************************************************************/
-PyObject *pyLScreateRG(PyObject *self, PyObject *args)
+PyObject *pyLScreateRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     pLSrandGen pRG = NULL;
     pLSenv     pEnv;
@@ -10298,7 +11942,7 @@ PyObject *pyLScreateRG(PyObject *self, PyObject *args)
 
     PyObject  *pyEnv;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "Oi",
                                  &pyEnv,
                                  &nMethod))
     {
@@ -10316,7 +11960,7 @@ PyObject *pyLScreateRG(PyObject *self, PyObject *args)
     return PyNewObjPtr(pRG);
 }
 
-PyObject *pyLScreateRGMT(PyObject *self, PyObject *args)
+PyObject *pyLScreateRGMT(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     pLSrandGen pRG = NULL;
     pLSenv     pEnv;
@@ -10324,7 +11968,7 @@ PyObject *pyLScreateRGMT(PyObject *self, PyObject *args)
 
     PyObject  *pyEnv;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "Oi",
                                  &pyEnv,
                                  &nMethod))
     {
@@ -10342,14 +11986,14 @@ PyObject *pyLScreateRGMT(PyObject *self, PyObject *args)
     return PyNewObjPtr(pRG);
 }
 
-PyObject *pyLSgetDoubleRV(PyObject *self, PyObject *args)
+PyObject *pyLSgetDoubleRV(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     double     dResult;
     pLSrandGen pRG;
 
     PyObject   *pyRG;
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
                                  &pyRG))
     {
         return NULL;
@@ -10362,7 +12006,7 @@ PyObject *pyLSgetDoubleRV(PyObject *self, PyObject *args)
     return Py_BuildValue("d",dResult);
 }
 
-PyObject *pyLSgetInt32RV(PyObject *self, PyObject *args)
+PyObject *pyLSgetInt32RV(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        nResult;
     pLSrandGen pRG;
@@ -10370,7 +12014,7 @@ PyObject *pyLSgetInt32RV(PyObject *self, PyObject *args)
 
     PyObject   *pyRG;
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
                                  &pyRG,
                                  &iLow,
                                  &iHigh))
@@ -10385,7 +12029,7 @@ PyObject *pyLSgetInt32RV(PyObject *self, PyObject *args)
     return Py_BuildValue("i",nResult);
 }
 
-PyObject *pyLSsetRGSeed(PyObject *self, PyObject *args)
+PyObject *pyLSsetRGSeed(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSrandGen pRG;
@@ -10393,7 +12037,7 @@ PyObject *pyLSsetRGSeed(PyObject *self, PyObject *args)
 
     PyObject   *pyRG;
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
                                  &pyRG,
                                  &nSeed))
     {
@@ -10407,19 +12051,24 @@ PyObject *pyLSsetRGSeed(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSdisposeRG(PyObject *self, PyObject *args)
+PyObject *pyLSdisposeRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSrandGen pRG;
 
     PyObject   *pyRG;
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
                                  &pyRG))
     {
         return NULL;
     }
 
+    if (pyIsHandle(pyRG)) {
+        pyHandleClose((pyHandle_t*)pyRG);
+        return Py_BuildValue("i",errorcode);
+    }
+
     CHECK_RG;
 
     LSdisposeRG(&pRG);
@@ -10427,7 +12076,7 @@ PyObject *pyLSdisposeRG(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetDistrParamRG(PyObject *self, PyObject *args)
+PyObject *pyLSsetDistrParamRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSrandGen pRG;
@@ -10436,7 +12085,7 @@ PyObject *pyLSsetDistrParamRG(PyObject *self, PyObject *args)
 
     PyObject   *pyRG;
 
-    if (!PyArg_ParseTuple(args, "Oid",
+    if (!pyParseArgs(args, nargs, "Oid",
                                  &pyRG,
                                  &iParam,
                                  &dParam))
@@ -10455,7 +12104,7 @@ PyObject *pyLSsetDistrParamRG(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsetDistrRG(PyObject *self, PyObject *args)
+PyObject *pyLSsetDistrRG(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSrandGen pRG;
@@ -10463,7 +12112,7 @@ PyObject *pyLSsetDistrRG(PyObject *self, PyObject *args)
 
     PyObject   *pyRG;
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
                                  &pyRG,
                                  &nDistType))
     {
@@ -10481,7 +12130,7 @@ PyObject *pyLSsetDistrRG(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetDistrRV(PyObject *self, PyObject *args)
+PyObject *pyLSgetDistrRV(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSrandGen pRG;
@@ -10491,9 +12140,9 @@ PyObject *pyLSgetDistrRV(PyObject *self, PyObject *args)
     PyObject       *pyRG;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OA*",
                                  &pyRG,
-                                 &PyArray_Type,&pyResult))
+                                 &pyResult))
     {
         return NULL;
     }
@@ -10512,14 +12161,14 @@ PyObject *pyLSgetDistrRV(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetInitSeed(PyObject *self, PyObject *args)
+PyObject *pyLSgetInitSeed(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        nSeed;
     pLSrandGen pRG;
 
     PyObject   *pyRG;
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
                                  &pyRG))
     {
         return NULL;
@@ -10532,7 +12181,7 @@ PyObject *pyLSgetInitSeed(PyObject *self, PyObject *args)
     return Py_BuildValue("i",nSeed);
 }
 
-PyObject *pyLSgetRGNumThreads(PyObject *self, PyObject *args)
+PyObject *pyLSgetRGNumThreads(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSrandGen pRG;
@@ -10542,9 +12191,9 @@ PyObject *pyLSgetRGNumThreads(PyObject *self, PyObject *args)
     PyObject       *pyRG;
     PyArrayObject  *pyThreads = NULL;
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
                                  &pyRG,
-                                 &PyArray_Type,&pyThreads))
+                                 &pyThreads))
     {
         return NULL;
     }
@@ -10563,14 +12212,14 @@ PyObject *pyLSgetRGNumThreads(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSfillRGBuffer(PyObject *self, PyObject *args)
+PyObject *pyLSfillRGBuffer(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSrandGen pRG;
 
     PyObject   *pyRG;
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
                                  &pyRG))
     {
         return NULL;
@@ -10587,7 +12236,7 @@ PyObject *pyLSfillRGBuffer(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSgetHistogram(PyObject *self, PyObject *args)
+PyObject *pyLSgetHistogram(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSmodel   pModel;
@@ -10607,24 +12256,27 @@ PyObject *pyLSgetHistogram(PyObject *self, PyObject *args)
     PyArrayObject  *pyBinHigh = NULL,*pyBinLeftEdge = NULL;
     PyArrayObject  *pyBinRightEdge = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!O!ddO!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiDDddN*N*D*D*D*D*D*",
                                  &pyModel,
                                  &nSampSize,
-                                 &PyArray_Type,&pyVals,
-                                 &PyArray_Type,&pyWeights,
+                                 &pyVals,
+                                 &pyWeights,
                                  &dHistLow,
                                  &dHistHigh,
-                                 &PyArray_Type,&pyBins,
-                                 &PyArray_Type,&pyBinCounts,
-                                 &PyArray_Type,&pyBinProbs,
-                                 &PyArray_Type,&pyBinLow,
-                                 &PyArray_Type,&pyBinHigh,
-                                 &PyArray_Type,&pyBinLeftEdge,
-                                 &PyArray_Type,&pyBinRightEdge))
+                                 &pyBins,
+                                 &pyBinCounts,
+                                 &pyBinProbs,
+                                 &pyBinLow,
+                                 &pyBinHigh,
+                                 &pyBinLeftEdge,
+                                 &pyBinRightEdge))
     {
         return NULL;
     }
 
+    if (!pyArgLen("nSampSize", nSampSize, 2, pyVals, pyWeights))
+        return NULL;
+
     CHECK_MODEL;
 
     if(pyVals && PyArray_DIMS(pyVals) > 0)
@@ -10668,7 +12320,7 @@ PyObject *pyLSgetHistogram(PyObject *self, PyObject *args)
     return Py_BuildValue("i",errorcode);
 }
 
-PyObject *pyLSsolveMipBnp(PyObject *self, PyObject *args)
+PyObject *pyLSsolveMipBnp(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
     int        errorcode = LSERR_NO_ERROR;
     pLSmodel   pModel;
@@ -10680,11 +12332,11 @@ PyObject *pyLSsolveMipBnp(PyObject *self, PyObject *args)
     PyObject       *pyModel;
     PyArrayObject  *pyStatus = NULL;
 
-    if (!PyArg_ParseTuple(args, "OisO!",
+    if (!pyParseArgs(args, nargs, "OisN*",
                                  &pyModel,
                                  &nBlock,
                                  &pszFname,
-                                 &PyArray_Type,&pyStatus))
+                                 &pyStatus))
     {
         return NULL;
     }
@@ -10694,7 +12346,9 @@ PyObject *pyLSsolveMipBnp(PyObject *self, PyObject *args)
     if(pyStatus && PyArray_DIMS(pyStatus) > 0)
         pnStatus = (int *)PyArray_GetPtr(pyStatus,index);
 
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSsolveMipBnp(pModel,nBlock,pszFname,pnStatus);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -10710,18 +12364,16 @@ PyObject *pyLSsolveMipBnp(PyObject *self, PyObject *args)
 * @return int
 * @remark errorcode = lindo.LSwriteMPXFile(pModel,pszFname,mMask)
 */
-PyObject *pyLSwriteMPXFile(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSwriteMPXFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel  pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
         &pyModel, //pModel
         &sbuf[2],  //*pszFname
 
@@ -10731,8 +12383,6 @@ PyObject *pyLSwriteMPXFile(PyObject *self, PyObject *args) {
 
     CHECK_MODEL;
     LSASSERT(errorcode);
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
     errorcode = LSwriteMPXFile(pModel, sbuf[2], ibuf[3]);
 
@@ -10754,23 +12404,22 @@ ErrorReturn:
 * @return int
 * @remark errorcode = lindo.LSreadMPXFile(pModel,pszFname)
 */
-PyObject *pyLSreadMPXFile(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSreadMPXFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyModel, //pModel
         &sbuf[2])) {  //*pszFname
         return NULL;
     }
 
     CHECK_MODEL;
+    pyResetModelDims(pModel);
     LSASSERT(errorcode);
     // Get C pointers
     errorcode = LSreadMPXFile(pModel
@@ -10789,17 +12438,15 @@ ErrorReturn:
 * @return int
 * @remark errorcode = lindo.LSwriteVarPriorities(pModel,pszFname,nMode)
 */
-PyObject *pyLSwriteVarPriorities(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSwriteVarPriorities(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
         &pyModel, //pModel
         &sbuf[2],  //*pszFname
         &ibuf[3])) { //nMode
@@ -10808,8 +12455,6 @@ PyObject *pyLSwriteVarPriorities(PyObject *self, PyObject *args) {
 
     CHECK_MODEL;
     LSASSERT(errorcode);
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -10830,25 +12475,21 @@ ErrorReturn:
 * @return int
 * @remark errorcode = lindo.LSwriteNLSolution(pModel,pszFname)
 */
-PyObject *pyLSwriteNLSolution(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSwriteNLSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyModel, //pModel
         &sbuf[2])) {  //*pszFname
         return NULL;
     }
 
     CHECK_MODEL;  LSASSERT(errorcode);
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -10869,17 +12510,15 @@ ErrorReturn:
 * @return int
 * @remark errorcode = lindo.LSwriteTunerParameters(pEnv,szFile,jInstance,mCriterion)
 */
-PyObject *pyLSwriteTunerParameters(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSwriteTunerParameters(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Osii",
+    if (!pyParseArgs(args, nargs, "Osii",
         &pyEnv, //pEnv
         &sbuf[2],  //*szFile
         &ibuf[3], //jInstance
@@ -10906,17 +12545,15 @@ PyObject *pyLSwriteTunerParameters(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSwriteTunerConfigString(pEnv,szJsonString,szJsonFile)
 */
-PyObject *pyLSwriteTunerConfigString(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSwriteTunerConfigString(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oss",
+    if (!pyParseArgs(args, nargs, "Oss",
         &pyEnv, //pEnv
         &sbuf[2],  //*szJsonString
         &sbuf[3])) {  //*szJsonFile
@@ -10941,17 +12578,15 @@ PyObject *pyLSwriteTunerConfigString(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSwriteParameterAsciiDoc(pEnv,pszFileName)
 */
-PyObject *pyLSwriteParameterAsciiDoc(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSwriteParameterAsciiDoc(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyEnv, //pEnv
         &sbuf[2])) {  //*pszFileName
         return NULL;
@@ -10975,17 +12610,15 @@ PyObject *pyLSwriteParameterAsciiDoc(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSwriteEnvParameter(pEnv,pszFname)
 */
-PyObject *pyLSwriteEnvParameter(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSwriteEnvParameter(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyEnv, //pEnv
         &sbuf[2])) {  //*pszFname
         return NULL;
@@ -11009,17 +12642,15 @@ PyObject *pyLSwriteEnvParameter(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSwriteDualLINDOFile(pModel,pszFname,nObjSense)
 */
-PyObject *pyLSwriteDualLINDOFile(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSwriteDualLINDOFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
         &pyModel, //pModel
         &sbuf[2],  //*pszFname
         &ibuf[3])) { //nObjSense
@@ -11027,8 +12658,6 @@ PyObject *pyLSwriteDualLINDOFile(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -11050,17 +12679,15 @@ PyObject *pyLSwriteDualLINDOFile(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddTunerInstance(pEnv,szFile)
 */
-PyObject *pyLSaddTunerInstance(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddTunerInstance(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyEnv, //pEnv
         &sbuf[2])) {  //*szFile
         return NULL;
@@ -11084,17 +12711,15 @@ PyObject *pyLSaddTunerInstance(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddTunerOption(pEnv,szKey,dValue)
 */
-PyObject *pyLSaddTunerOption(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddTunerOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Osd",
+    if (!pyParseArgs(args, nargs, "Osd",
         &pyEnv, //pEnv
         &sbuf[2],  //*szKey
         &dbuf[3])) { //dValue
@@ -11120,17 +12745,15 @@ PyObject *pyLSaddTunerOption(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddTunerStrOption(pEnv,szKey,szValue)
 */
-PyObject *pyLSaddTunerStrOption(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddTunerStrOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oss",
+    if (!pyParseArgs(args, nargs, "Oss",
         &pyEnv, //pEnv
         &sbuf[2],  //*szKey
         &sbuf[3])) { //szValue
@@ -11156,17 +12779,15 @@ PyObject *pyLSaddTunerStrOption(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddTunerZDynamic(pEnv,iParam)
 */
-PyObject *pyLSaddTunerZDynamic(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddTunerZDynamic(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
         &pyEnv, //pEnv
         &ibuf[2])) { //iParam
         return NULL;
@@ -11190,17 +12811,15 @@ PyObject *pyLSaddTunerZDynamic(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddTunerZStatic(pEnv,jGroupId,iParam,dValue)
 */
-PyObject *pyLSaddTunerZStatic(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddTunerZStatic(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oiid",
+    if (!pyParseArgs(args, nargs, "Oiid",
         &pyEnv, //pEnv
         &ibuf[2], //jGroupId
         &ibuf[3], //iParam
@@ -11228,17 +12847,15 @@ PyObject *pyLSaddTunerZStatic(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSclearTuner(pEnv)
 */
-PyObject *pyLSclearTuner(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSclearTuner(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyEnv)) { //pEnv
         return NULL;
     }
@@ -11263,17 +12880,15 @@ PyObject *pyLSclearTuner(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSdisplayTunerResults(pEnv)
 */
-PyObject *pyLSdisplayTunerResults(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSdisplayTunerResults(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyEnv)) { //pEnv
         return NULL;
     }
@@ -11299,26 +12914,24 @@ PyObject *pyLSdisplayTunerResults(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetTunerConfigString(pEnv,pszJsonString)
 */
-PyObject *pyLSgetTunerConfigString(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetTunerConfigString(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OS*",
         &pyEnv, //pEnv
-        &PyArray_Type,&pyArr[2])) {  //**pszJsonString
+        &pyArr[2])) {  //**pszJsonString
         return NULL;
     }
 
     CHECK_ENV;
 
     if (pyArr[2])
-        svecptr[2] = (char *)PyArray_GetPtr(pyArr[2], index);
+        S_GET_VECPTR(2);
 
     // Get C pointers
     errorcode = LSgetTunerConfigString(pEnv
@@ -11337,27 +12950,25 @@ PyObject *pyLSgetTunerConfigString(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetTunerOption(pEnv,szkey,pdval)
 */
-PyObject *pyLSgetTunerOption(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetTunerOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OsO!",
+    if (!pyParseArgs(args, nargs, "OsD*",
         &pyEnv, //pEnv
         &sbuf[2],  //*szkey
-        &PyArray_Type, &pyArr[3])) {  //*pdval
+        &pyArr[3])) {  //*pdval
         return NULL;
     }
 
     CHECK_ENV;
 
     if (pyArr[3])
-        dvecptr[3] = (double *)PyArray_GetPtr(pyArr[3], index);
+        D_GET_VECPTR(3);
 
     // Get C pointers
     errorcode = LSgetTunerOption(pEnv
@@ -11376,22 +12987,20 @@ PyObject *pyLSgetTunerOption(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetTunerResult(pEnv,szkey,jInstance,kConfig,pdval)
 */
-PyObject *pyLSgetTunerResult(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetTunerResult(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(6);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OsiiO!",
+    if (!pyParseArgs(args, nargs, "OsiiD*",
         &pyEnv, //pEnv
         &sbuf[2],  //*szkey
         &ibuf[3], //jInstance
         &ibuf[4], //kConfig
-        &PyArray_Type, &pyArr[5])) {  //*pdval
+        &pyArr[5])) {  //*pdval
         return NULL;
     }
 
@@ -11418,20 +13027,18 @@ PyObject *pyLSgetTunerResult(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetTunerSpace(pEnv,panParamId,numParam)
 */
-PyObject *pyLSgetTunerSpace(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetTunerSpace(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*",
         &pyEnv, //pEnv
-        &PyArray_Type, &pyArr[2],  //*panParamId
-        &PyArray_Type, &pyArr[3])) {  //*numParam
+        &pyArr[2],  //*panParamId
+        &pyArr[3])) {  //*numParam
         return NULL;
     }
 
@@ -11462,17 +13069,15 @@ PyObject *pyLSgetTunerSpace(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetTunerStrOption(pEnv,szkey,szval)
 */
-PyObject *pyLSgetTunerStrOption(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetTunerStrOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oss",
+    if (!pyParseArgs(args, nargs, "Oss",
         &pyEnv, //pEnv
         &sbuf[2],  //*szkey
         &sbuf[3])) {  //*szval
@@ -11498,17 +13103,15 @@ PyObject *pyLSgetTunerStrOption(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadTunerConfigFile(pEnv,szJsonFile)
 */
-PyObject *pyLSloadTunerConfigFile(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadTunerConfigFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyEnv, //pEnv
         &sbuf[2])) {  //*szJsonFile
         return NULL;
@@ -11532,17 +13135,15 @@ PyObject *pyLSloadTunerConfigFile(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadTunerConfigString(pEnv,szJsonString)
 */
-PyObject *pyLSloadTunerConfigString(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadTunerConfigString(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyEnv, //pEnv
         &sbuf[2])) {  //*szJsonString
         return NULL;
@@ -11566,17 +13167,15 @@ PyObject *pyLSloadTunerConfigString(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSprintTuner(pEnv)
 */
-PyObject *pyLSprintTuner(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSprintTuner(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyEnv)) { //pEnv
         return NULL;
     }
@@ -11602,17 +13201,15 @@ PyObject *pyLSprintTuner(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSresetTuner(pEnv)
 */
-PyObject *pyLSresetTuner(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSresetTuner(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyEnv)) { //pEnv
         return NULL;
     }
@@ -11638,17 +13235,15 @@ PyObject *pyLSresetTuner(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSrunTuner(pEnv)
 */
-PyObject *pyLSrunTuner(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSrunTuner(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyEnv)) { //pEnv
         return NULL;
     }
@@ -11656,7 +13251,9 @@ PyObject *pyLSrunTuner(PyObject *self, PyObject *args) {
     CHECK_ENV;
 
     // Get C pointers
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSrunTuner(pEnv);
+    Py_END_ALLOW_THREADS
 
     if (errorcode != 0){
         ERROR_SET(errorcode);
@@ -11674,17 +13271,15 @@ PyObject *pyLSrunTuner(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSrunTunerFile(pEnv,szJsonFile)
 */
-PyObject *pyLSrunTunerFile(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSrunTunerFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyEnv, //pEnv
         &sbuf[2])) {  //*szJsonFile
         return NULL;
@@ -11693,8 +13288,10 @@ PyObject *pyLSrunTunerFile(PyObject *self, PyObject *args) {
     CHECK_ENV;
 
     // Get C pointers
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSrunTunerFile(pEnv
         , sbuf[2]); //*szJsonFile
+    Py_END_ALLOW_THREADS
 
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
@@ -11708,17 +13305,15 @@ PyObject *pyLSrunTunerFile(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSrunTunerString(pEnv,szJsonString)
 */
-PyObject *pyLSrunTunerString(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSrunTunerString(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyEnv, //pEnv
         &sbuf[2])) {  //*szJsonString
         return NULL;
@@ -11727,8 +13322,10 @@ PyObject *pyLSrunTunerString(PyObject *self, PyObject *args) {
     CHECK_ENV;
 
     // Get C pointers
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSrunTunerString(pEnv
         , sbuf[2]); //*szJsonString
+    Py_END_ALLOW_THREADS
 
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
@@ -11742,17 +13339,15 @@ PyObject *pyLSrunTunerString(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetTunerOption(pEnv,szKey,dval)
 */
-PyObject *pyLSsetTunerOption(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetTunerOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Osd",
+    if (!pyParseArgs(args, nargs, "Osd",
         &pyEnv, //pEnv
         &sbuf[2],  //*szKey
         &dbuf[3])) { //dval
@@ -11778,17 +13373,15 @@ PyObject *pyLSsetTunerOption(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetTunerStrOption(pEnv,szKey,szval)
 */
-PyObject *pyLSsetTunerStrOption(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetTunerStrOption(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oss",
+    if (!pyParseArgs(args, nargs, "Oss",
         &pyEnv, //pEnv
         &sbuf[2],  //*szKey
         &sbuf[3])) {  //*szval
@@ -11815,17 +13408,15 @@ PyObject *pyLSsetTunerStrOption(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddQCShift(pModel,iRow,dShift)
 */
-PyObject *pyLSaddQCShift(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddQCShift(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oid",
+    if (!pyParseArgs(args, nargs, "Oid",
         &pyModel, //pModel
         &ibuf[2], //iRow
         &dbuf[3])) { //dShift
@@ -11833,8 +13424,6 @@ PyObject *pyLSaddQCShift(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -11855,26 +13444,22 @@ PyObject *pyLSaddQCShift(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetQCShift(pModel,iRow,pdShift)
 */
-PyObject *pyLSgetQCShift(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetQCShift(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
         &pyModel, //pModel
         &ibuf[2], //iRow
-        &PyArray_Type, &pyArr[3])) {  //*pdShift
+        &pyArr[3])) {  //*pdShift
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
     D_GET_VECPTR(3);
 
@@ -11895,25 +13480,21 @@ PyObject *pyLSgetQCShift(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSresetQCShift(pModel,iRow)
 */
-PyObject *pyLSresetQCShift(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSresetQCShift(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
         &pyModel, //pModel
         &ibuf[2])) { //iRow
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -11934,25 +13515,22 @@ PyObject *pyLSresetQCShift(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSreadCBFFile(pModel,pszFname)
 */
-PyObject *pyLSreadCBFFile(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSreadCBFFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyModel, //pModel
         &sbuf[2])) {  //*pszFname
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
+    pyResetModelDims(pModel);
 
 
 
@@ -11972,25 +13550,22 @@ PyObject *pyLSreadCBFFile(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSreadNLFile(pModel,pszFname)
 */
-PyObject *pyLSreadNLFile(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSreadNLFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyModel, //pModel
         &sbuf[2])) {  //*pszFname
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
+    pyResetModelDims(pModel);
 
 
 
@@ -12010,25 +13585,22 @@ PyObject *pyLSreadNLFile(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSreadSDPAFile(pModel,pszFname)
 */
-PyObject *pyLSreadSDPAFile(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSreadSDPAFile(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyModel, //pModel
         &sbuf[2])) {  //*pszFname
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
+    pyResetModelDims(pModel);
 
 
 
@@ -12048,13 +13620,11 @@ PyObject *pyLSreadSDPAFile(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsolveFileLP(pModel,szFileNameMPS,szFileNameSol,nNoOfColsEvaluatedPerSet,nNoOfColsSelectedPerSet,nTimeLimitSec,pnSolStatusParam,pnNoOfConsMps)
 */
-PyObject *pyLSsolveFileLP(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsolveFileLP(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
     errorcode = LSERR_NOT_SUPPORTED;
     return Py_BuildValue(osig, errorcode);
 }
@@ -12066,25 +13636,21 @@ PyObject *pyLSsolveFileLP(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetProfilerContext(pModel,mContext)
 */
-PyObject *pyLSgetProfilerContext(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetProfilerContext(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "s";
+    const char *osig = "s";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
         &pyModel, //pModel
         &ibuf[2])) { //mContext
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12104,27 +13670,23 @@ PyObject *pyLSgetProfilerContext(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetProfilerInfo(pModel,mContext,pnCalls,pdElapsedTime)
 */
-PyObject *pyLSgetProfilerInfo(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetProfilerInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiN*D*",
         &pyModel, //pModel
         &ibuf[2], //mContext
-        &PyArray_Type, &pyArr[3],  //*pnCalls
-        &PyArray_Type, &pyArr[4])) {  //*pdElapsedTime
+        &pyArr[3],  //*pnCalls
+        &pyArr[4])) {  //*pdElapsedTime
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
     I_GET_VECPTR(3);
     D_GET_VECPTR(4);
@@ -12147,25 +13709,21 @@ PyObject *pyLSgetProfilerInfo(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddEmptySpacesAcolumns(pModel,paiColnnz)
 */
-PyObject *pyLSaddEmptySpacesAcolumns(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddEmptySpacesAcolumns(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2])) {  //*paiColnnz
+        &pyArr[2])) {  //*paiColnnz
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12188,25 +13746,21 @@ PyObject *pyLSaddEmptySpacesAcolumns(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddEmptySpacesNLPAcolumns(pModel,paiColnnz)
 */
-PyObject *pyLSaddEmptySpacesNLPAcolumns(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddEmptySpacesNLPAcolumns(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2])) {  //*paiColnnz
+        &pyArr[2])) {  //*paiColnnz
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12229,19 +13783,17 @@ PyObject *pyLSaddEmptySpacesNLPAcolumns(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSaddObjPool(pModel,padC,mObjSense,mRank,dRelOptTol)
 */
-PyObject *pyLSaddObjPool(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSaddObjPool(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(6);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!iid",
+    if (!pyParseArgs(args, nargs, "ODiid",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*padC
+        &pyArr[2],  //*padC
         &ibuf[3], //mObjSense
         &ibuf[4], //mRank
         &dbuf[5])) { //dRelOptTol
@@ -12249,8 +13801,6 @@ PyObject *pyLSaddObjPool(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12277,29 +13827,25 @@ PyObject *pyLSaddObjPool(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSapplyLtf(pModel,panNewColIdx,panNewRowIdx,panNewColPos,panNewRowPos,nMode)
 */
-PyObject *pyLSapplyLtf(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSapplyLtf(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(7);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!i",
+    if (!pyParseArgs(args, nargs, "ONNNNi",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*panNewColIdx
-        &PyArray_Type, &pyArr[3],  //*panNewRowIdx
-        &PyArray_Type, &pyArr[4],  //*panNewColPos
-        &PyArray_Type, &pyArr[5],  //*panNewRowPos
+        &pyArr[2],  //*panNewColIdx
+        &pyArr[3],  //*panNewRowIdx
+        &pyArr[4],  //*panNewColPos
+        &pyArr[5],  //*panNewRowPos
         &ibuf[6])) { //nMode
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12335,31 +13881,29 @@ PyObject *pyLSapplyLtf(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSbnbSolve(pModel,pszFname)
 */
-PyObject *pyLSbnbSolve(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSbnbSolve(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyModel, //pModel
         &sbuf[2])) {  //*pszFname
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
     // Get C pointers
+    Py_BEGIN_ALLOW_THREADS
     errorcode = LSbnbSolve(pModel
         , sbuf[2]); //*pszFname
+    Py_END_ALLOW_THREADS
 
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
@@ -12373,24 +13917,20 @@ PyObject *pyLSbnbSolve(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSbuildStringData(pModel)
 */
-PyObject *pyLSbuildStringData(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSbuildStringData(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12413,27 +13953,23 @@ PyObject *pyLSbuildStringData(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LScalcConFunc(pModel,iRow,padPrimal,padSlacks)
 */
-PyObject *pyLScalcConFunc(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLScalcConFunc(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiDD*",
         &pyModel, //pModel
         &ibuf[2], //iRow
-        &PyArray_Type, &pyArr[3],  //*padPrimal
-        &PyArray_Type, &pyArr[4])) {  //*padSlacks
+        &pyArr[3],  //*padPrimal
+        &pyArr[4])) {  //*padSlacks
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12458,29 +13994,28 @@ PyObject *pyLScalcConFunc(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LScalcConGrad(pModel,irow,padPrimal,nParList,paiParList,padParGrad)
 */
-PyObject *pyLScalcConGrad(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLScalcConGrad(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(7);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!iO!O!",
+    if (!pyParseArgs(args, nargs, "OiDiDD*",
         &pyModel, //pModel
         &ibuf[2], //irow
-        &PyArray_Type, &pyArr[3],  //*padPrimal
+        &pyArr[3],  //*padPrimal
         &ibuf[4], //nParList
-        &PyArray_Type, &pyArr[5],  //*paiParList
-        &PyArray_Type, &pyArr[6])) {  //*padParGrad
+        &pyArr[5],  //*paiParList
+        &pyArr[6])) {  //*padParGrad
         return NULL;
     }
 
+    if (!pyArgLen("nParList", ibuf[4], 2, pyArr[5], pyArr[6]))
+        return NULL;
+
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12510,26 +14045,22 @@ PyObject *pyLScalcConGrad(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LScalcObjFunc(pModel,padPrimal,pdObjval)
 */
-PyObject *pyLScalcObjFunc(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLScalcObjFunc(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "ODD*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*padPrimal
-        &PyArray_Type, &pyArr[3])) {  //*pdObjval
+        &pyArr[2],  //*padPrimal
+        &pyArr[3])) {  //*pdObjval
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12553,28 +14084,27 @@ PyObject *pyLScalcObjFunc(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LScalcObjGrad(pModel,padPrimal,nParList,paiParList,padParGrad)
 */
-PyObject *pyLScalcObjGrad(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLScalcObjGrad(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(6);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!iO!O!",
+    if (!pyParseArgs(args, nargs, "ODiND*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*padPrimal
+        &pyArr[2],  //*padPrimal
         &ibuf[3], //nParList
-        &PyArray_Type, &pyArr[4],  //*paiParList
-        &PyArray_Type, &pyArr[5])) {  //*padParGrad
+        &pyArr[4],  //*paiParList
+        &pyArr[5])) {  //*padParGrad
         return NULL;
     }
 
+    if (!pyArgLen("nParList", ibuf[3], 2, pyArr[4], pyArr[5]))
+        return NULL;
+
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12605,27 +14135,26 @@ PyObject *pyLScalcObjGrad(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LScheckQterms(pModel,nCons,paiCons,paiType)
 */
-PyObject *pyLScheckQterms(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLScheckQterms(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiNN*",
         &pyModel, //pModel
         &ibuf[2], //nCons
-        &PyArray_Type, &pyArr[3],  //*paiCons
-        &PyArray_Type, &pyArr[4])) {  //*paiType
+        &pyArr[3],  //*paiCons
+        &pyArr[4])) {  //*paiType
         return NULL;
     }
 
+    if (!pyArgLen("nCons", ibuf[2], 2, pyArr[3], pyArr[4]))
+        return NULL;
+
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12650,28 +14179,24 @@ PyObject *pyLScheckQterms(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSdeduceStages(pModel,nMaxStage,panRowStagse,panColStages,panSparStage)
 */
-PyObject *pyLSdeduceStages(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSdeduceStages(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(6);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*",
         &pyModel, //pModel
         &ibuf[2], //nMaxStage
-        &PyArray_Type, &pyArr[3],  //*panRowStagse
-        &PyArray_Type, &pyArr[4],  //*panColStages
-        &PyArray_Type, &pyArr[5])) {  //*panSparStage
+        &pyArr[3],  //*panRowStagse
+        &pyArr[4],  //*panColStages
+        &pyArr[5])) {  //*panSparStage
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12705,24 +14230,20 @@ PyObject *pyLSdeduceStages(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSdeleteString(pModel)
 */
-PyObject *pyLSdeleteString(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSdeleteString(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12745,24 +14266,20 @@ PyObject *pyLSdeleteString(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSdeleteStringData(pModel)
 */
-PyObject *pyLSdeleteStringData(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSdeleteStringData(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12786,29 +14303,25 @@ PyObject *pyLSdeleteStringData(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSdisplayBlockStructure(pModel,pnBlock,panNewColIdx,panNewRowIdx,panNewColPos,panNewRowPos)
 */
-PyObject *pyLSdisplayBlockStructure(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSdisplayBlockStructure(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(7);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*N*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnBlock
-        &PyArray_Type, &pyArr[3],  //*panNewColIdx
-        &PyArray_Type, &pyArr[4],  //*panNewRowIdx
-        &PyArray_Type, &pyArr[5],  //*panNewColPos
-        &PyArray_Type, &pyArr[6])) {  //*panNewRowPos
+        &pyArr[2],  //*pnBlock
+        &pyArr[3],  //*panNewColIdx
+        &pyArr[4],  //*panNewRowIdx
+        &pyArr[5],  //*panNewColPos
+        &pyArr[6])) {  //*panNewRowPos
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12849,30 +14362,26 @@ PyObject *pyLSdisplayBlockStructure(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSdoBTRAN(pModel,pcYnz,paiY,padY,pcXnz,paiX,padX)
 */
-PyObject *pyLSdoBTRAN(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSdoBTRAN(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ONNDN*N*D*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pcYnz
-        &PyArray_Type, &pyArr[3],  //*paiY
-        &PyArray_Type, &pyArr[4],  //*padY
-        &PyArray_Type, &pyArr[5],  //*pcXnz
-        &PyArray_Type, &pyArr[6],  //*paiX
-        &PyArray_Type, &pyArr[7])) {  //*padX
+        &pyArr[2],  //*pcYnz
+        &pyArr[3],  //*paiY
+        &pyArr[4],  //*padY
+        &pyArr[5],  //*pcXnz
+        &pyArr[6],  //*paiX
+        &pyArr[7])) {  //*padX
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12906,30 +14415,26 @@ PyObject *pyLSdoBTRAN(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSdoFTRAN(pModel,pcYnz,paiY,padY,pcXnz,paiX,padX)
 */
-PyObject *pyLSdoFTRAN(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSdoFTRAN(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ONNDN*N*D*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pcYnz
-        &PyArray_Type, &pyArr[3],  //*paiY
-        &PyArray_Type, &pyArr[4],  //*padY
-        &PyArray_Type, &pyArr[5],  //*pcXnz
-        &PyArray_Type, &pyArr[6],  //*paiX
-        &PyArray_Type, &pyArr[7])) {  //*padX
+        &pyArr[2],  //*pcYnz
+        &pyArr[3],  //*paiY
+        &pyArr[4],  //*padY
+        &pyArr[5],  //*pcXnz
+        &pyArr[6],  //*paiX
+        &pyArr[7])) {  //*padX
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -12963,28 +14468,24 @@ PyObject *pyLSdoFTRAN(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSfindLtf(pModel,panNewColIdx,panNewRowIdx,panNewColPos,panNewRowPos)
 */
-PyObject *pyLSfindLtf(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSfindLtf(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(6);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*panNewColIdx
-        &PyArray_Type, &pyArr[3],  //*panNewRowIdx
-        &PyArray_Type, &pyArr[4],  //*panNewColPos
-        &PyArray_Type, &pyArr[5])) {  //*panNewRowPos
+        &pyArr[2],  //*panNewColIdx
+        &pyArr[3],  //*panNewRowIdx
+        &pyArr[4],  //*panNewColPos
+        &pyArr[5])) {  //*panNewRowPos
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13020,25 +14521,21 @@ PyObject *pyLSfindLtf(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSfindSymmetry(pModel,pnerrorcode)
 */
-PyObject *pyLSfindSymmetry(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSfindSymmetry(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
     void *ptr;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2])) {  //*pnerrorcode
+        &pyArr[2])) {  //*pnerrorcode
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
     if (pyArr[2] && PyArray_DIMS(pyArr[2]) > 0)
         ivecptr[2] = (int *)PyArray_GetPtr(pyArr[2], index);
@@ -13060,24 +14557,20 @@ PyObject *pyLSfindSymmetry(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSfreeGOPSolutionMemory(pModel)
 */
-PyObject *pyLSfreeGOPSolutionMemory(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSfreeGOPSolutionMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13096,24 +14589,20 @@ PyObject *pyLSfreeGOPSolutionMemory(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSfreeHashMemory(pModel)
 */
-PyObject *pyLSfreeHashMemory(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSfreeHashMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13132,24 +14621,20 @@ PyObject *pyLSfreeHashMemory(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSfreeMIPSolutionMemory(pModel)
 */
-PyObject *pyLSfreeMIPSolutionMemory(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSfreeMIPSolutionMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13168,24 +14653,20 @@ PyObject *pyLSfreeMIPSolutionMemory(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSfreeObjPool(pModel)
 */
-PyObject *pyLSfreeObjPool(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSfreeObjPool(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13208,24 +14689,20 @@ PyObject *pyLSfreeObjPool(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSfreeSolutionMemory(pModel)
 */
-PyObject *pyLSfreeSolutionMemory(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSfreeSolutionMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13244,24 +14721,20 @@ PyObject *pyLSfreeSolutionMemory(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSfreeSolverMemory(pModel)
 */
-PyObject *pyLSfreeSolverMemory(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSfreeSolverMemory(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13273,15 +14746,14 @@ PyObject *pyLSfreeSolverMemory(PyObject *self, PyObject *args) {
 
 }
 
-PyObject *pyLSdeleteSymmetry(PyObject *self, PyObject *args)
+PyObject *pyLSdeleteSymmetry(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    DCL_BUF(20);
+    DCL_BUF(1);
     PyObject  *pyObj;
     void *ptr = NULL;
     npy_intp  index[1] = { 0 };
 
-    ZERO_BUF(20);
-    if (!PyArg_ParseTuple(args, "O", &pyObj))
+    if (!pyParseArgs(args, nargs, "O", &pyObj))
     {
         return NULL;
     }
@@ -13305,30 +14777,26 @@ PyObject *pyLSdeleteSymmetry(PyObject *self, PyObject *args)
 * @return int
 * @remark errorcode = lindo.LSgetALLDIFFData(pModel,pinALLDIFF,paiAlldiffDim,paiAlldiffL,paiAlldiffU,paiAlldiffBeg,paiAlldiffVar)
 */
-PyObject *pyLSgetALLDIFFData(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetALLDIFFData(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*N*N*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pinALLDIFF
-        &PyArray_Type, &pyArr[3],  //*paiAlldiffDim
-        &PyArray_Type, &pyArr[4],  //*paiAlldiffL
-        &PyArray_Type, &pyArr[5],  //*paiAlldiffU
-        &PyArray_Type, &pyArr[6],  //*paiAlldiffBeg
-        &PyArray_Type, &pyArr[7])) {  //*paiAlldiffVar
+        &pyArr[2],  //*pinALLDIFF
+        &pyArr[3],  //*paiAlldiffDim
+        &pyArr[4],  //*paiAlldiffL
+        &pyArr[5],  //*paiAlldiffU
+        &pyArr[6],  //*paiAlldiffBeg
+        &pyArr[7])) {  //*paiAlldiffVar
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13372,29 +14840,25 @@ PyObject *pyLSgetALLDIFFData(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetALLDIFFDatai(pModel,iALLDIFF,piAlldiffDim,piAlldiffL,piAlldiffU,paiAlldiffVar)
 */
-PyObject *pyLSgetALLDIFFDatai(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetALLDIFFDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(7);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*N*",
         &pyModel, //pModel
         &ibuf[2], //iALLDIFF
-        &PyArray_Type, &pyArr[3],  //*piAlldiffDim
-        &PyArray_Type, &pyArr[4],  //*piAlldiffL
-        &PyArray_Type, &pyArr[5],  //*piAlldiffU
-        &PyArray_Type, &pyArr[6])) {  //*paiAlldiffVar
+        &pyArr[3],  //*piAlldiffDim
+        &pyArr[4],  //*piAlldiffL
+        &pyArr[5],  //*piAlldiffU
+        &pyArr[6])) {  //*paiAlldiffVar
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13432,36 +14896,32 @@ PyObject *pyLSgetALLDIFFDatai(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetDimensions(pModel,pnVars,pnCons,pnCones,pnAnnz,pnQCnnz,pnConennz,pnNLPnnz,pnNLPobjnnz,pnVarNamelen,pnConNamelen,pnConeNamelen)
 */
-PyObject *pyLSgetDimensions(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetDimensions(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(13);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
     int k;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*N*N*N*N*N*N*N*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnVars
-        &PyArray_Type, &pyArr[3],  //*pnCons
-        &PyArray_Type, &pyArr[4],  //*pnCones
-        &PyArray_Type, &pyArr[5],  //*pnAnnz
-        &PyArray_Type, &pyArr[6],  //*pnQCnnz
-        &PyArray_Type, &pyArr[7],  //*pnConennz
-        &PyArray_Type, &pyArr[8],  //*pnNLPnnz
-        &PyArray_Type, &pyArr[9],  //*pnNLPobjnnz
-        &PyArray_Type, &pyArr[10],  //*pnVarNamelen
-        &PyArray_Type, &pyArr[11],  //*pnConNamelen
-        &PyArray_Type, &pyArr[12])) {  //*pnConeNamelen
+        &pyArr[2],  //*pnVars
+        &pyArr[3],  //*pnCons
+        &pyArr[4],  //*pnCones
+        &pyArr[5],  //*pnAnnz
+        &pyArr[6],  //*pnQCnnz
+        &pyArr[7],  //*pnConennz
+        &pyArr[8],  //*pnNLPnnz
+        &pyArr[9],  //*pnNLPobjnnz
+        &pyArr[10],  //*pnVarNamelen
+        &pyArr[11],  //*pnConNamelen
+        &pyArr[12])) {  //*pnConeNamelen
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
     for (k = 2; k <= 12; k++) {
@@ -13494,29 +14954,25 @@ PyObject *pyLSgetDimensions(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetDualMIPsolution(pModel,padPrimal,padDual,padRedcosts,panCstatus,panRstatus)
 */
-PyObject *pyLSgetDualMIPsolution(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetDualMIPsolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(7);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OD*D*D*N*N*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*padPrimal
-        &PyArray_Type, &pyArr[3],  //*padDual
-        &PyArray_Type, &pyArr[4],  //*padRedcosts
-        &PyArray_Type, &pyArr[5],  //*panCstatus
-        &PyArray_Type, &pyArr[6])) {  //*panRstatus
+        &pyArr[2],  //*padPrimal
+        &pyArr[3],  //*padDual
+        &pyArr[4],  //*padRedcosts
+        &pyArr[5],  //*panCstatus
+        &pyArr[6])) {  //*panRstatus
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13557,26 +15013,22 @@ PyObject *pyLSgetDualMIPsolution(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetGOPVariablePriority(pModel,ndxVar,pnPriority)
 */
-PyObject *pyLSgetGOPVariablePriority(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetGOPVariablePriority(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
         &pyModel, //pModel
         &ibuf[2], //ndxVar
-        &PyArray_Type, &pyArr[3])) {  //*pnPriority
+        &pyArr[3])) {  //*pnPriority
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13599,30 +15051,26 @@ PyObject *pyLSgetGOPVariablePriority(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetHess(pModel,pnHnonzeros,paiHrows,paiHcol1,paiHcol2,padHcoef,padX)
 */
-PyObject *pyLSgetHess(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetHess(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*D*D*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnHnonzeros
-        &PyArray_Type, &pyArr[3],  //*paiHrows
-        &PyArray_Type, &pyArr[4],  //*paiHcol1
-        &PyArray_Type, &pyArr[5],  //*paiHcol2
-        &PyArray_Type, &pyArr[6],  //*padHcoef
-        &PyArray_Type, &pyArr[7])) {  //*padX
+        &pyArr[2],  //*pnHnonzeros
+        &pyArr[3],  //*paiHrows
+        &pyArr[4],  //*paiHcol1
+        &pyArr[5],  //*paiHcol2
+        &pyArr[6],  //*padHcoef
+        &pyArr[7])) {  //*padX
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13666,27 +15114,23 @@ PyObject *pyLSgetHess(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetIISInts(pModel,pnSuf_xnt,pnIIS_xnt,paiVars)
 */
-PyObject *pyLSgetIISInts(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetIISInts(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnSuf_xnt
-        &PyArray_Type, &pyArr[3],  //*pnIIS_xnt
-        &PyArray_Type, &pyArr[4])) {  //*paiVars
+        &pyArr[2],  //*pnSuf_xnt
+        &pyArr[3],  //*pnIIS_xnt
+        &pyArr[4])) {  //*paiVars
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13718,27 +15162,23 @@ PyObject *pyLSgetIISInts(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetIISSETs(pModel,pnSuf_set,pnIIS_set,paiSets)
 */
-PyObject *pyLSgetIISSETs(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetIISSETs(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnSuf_set
-        &PyArray_Type, &pyArr[3],  //*pnIIS_set
-        &PyArray_Type, &pyArr[4])) {  //*paiSets
+        &pyArr[2],  //*pnSuf_set
+        &pyArr[3],  //*pnIIS_set
+        &pyArr[4])) {  //*paiSets
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13770,30 +15210,26 @@ PyObject *pyLSgetIISSETs(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetJac(pModel,pnJnonzeros,pnJobjnnz,paiJrows,paiJcols,padJcoef,padX)
 */
-PyObject *pyLSgetJac(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetJac(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*D*D*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnJnonzeros
-        &PyArray_Type, &pyArr[3],  //*pnJobjnnz
-        &PyArray_Type, &pyArr[4],  //*paiJrows
-        &PyArray_Type, &pyArr[5],  //*paiJcols
-        &PyArray_Type, &pyArr[6],  //*padJcoef
-        &PyArray_Type, &pyArr[7])) {  //*padX
+        &pyArr[2],  //*pnJnonzeros
+        &pyArr[3],  //*pnJobjnnz
+        &pyArr[4],  //*paiJrows
+        &pyArr[5],  //*paiJcols
+        &pyArr[6],  //*padJcoef
+        &pyArr[7])) {  //*padX
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13837,17 +15273,15 @@ PyObject *pyLSgetJac(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetKBestMIPSols(pModel,pszFname,nMaxSols)
 */
-PyObject *pyLSgetKBestMIPSols(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetKBestMIPSols(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
         &pyModel, //pModel
         &sbuf[2],  //*pszFname
         &ibuf[3])) { //nMaxSols
@@ -13855,8 +15289,6 @@ PyObject *pyLSgetKBestMIPSols(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
     // Get C pointers
@@ -13878,37 +15310,33 @@ PyObject *pyLSgetKBestMIPSols(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetLicenseInfo(pModel,pnMaxcons,pnMaxvars,pnMaxintvars,int,pnReserved1,pnDaystoexp,pnDaystotrialexp,pnNlpAllowed,pnUsers,pnBarAllowed,pnRuntime,pnEdulicense,pachText)
 */
-PyObject *pyLSgetLicenseInfo(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetLicenseInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(14);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
     int k = 0;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*N*N*N*N*N*N*N*S*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnMaxcons
-        &PyArray_Type, &pyArr[3],  //*pnMaxvars
-        &PyArray_Type, &pyArr[4],  //*pnMaxintvars
-        &PyArray_Type, &pyArr[5],  //*pnReserved1
-        &PyArray_Type, &pyArr[6],  //*pnDaystoexp
-        &PyArray_Type, &pyArr[7],  //*pnDaystotrialexp
-        &PyArray_Type, &pyArr[8],  //*pnNlpAllowed
-        &PyArray_Type, &pyArr[9],  //*pnUsers
-        &PyArray_Type, &pyArr[10],  //*pnBarAllowed
-        &PyArray_Type, &pyArr[11],  //*pnRuntime
-        &PyArray_Type, &pyArr[12],  //*pnEdulicense
-        &PyArray_Type, &pyArr[13])) {  //*pachText
+        &pyArr[2],  //*pnMaxcons
+        &pyArr[3],  //*pnMaxvars
+        &pyArr[4],  //*pnMaxintvars
+        &pyArr[5],  //*pnReserved1
+        &pyArr[6],  //*pnDaystoexp
+        &pyArr[7],  //*pnDaystotrialexp
+        &pyArr[8],  //*pnNlpAllowed
+        &pyArr[9],  //*pnUsers
+        &pyArr[10],  //*pnBarAllowed
+        &pyArr[11],  //*pnRuntime
+        &pyArr[12],  //*pnEdulicense
+        &pyArr[13])) {  //*pachText
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -13945,24 +15373,20 @@ PyObject *pyLSgetLicenseInfo(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetMasterModel(pModel)
 */
-PyObject *pyLSgetMasterModel(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetMasterModel(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel     pModel = NULL;
     pLSmodel     mModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "O",
+    if (!pyParseArgs(args, nargs, "O",
         &pyModel)) { //pModel
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
     // Get C pointers
     mModel = LSgetMasterModel(pModel); //nil
@@ -13979,7 +15403,7 @@ PyObject *pyLSgetMasterModel(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetMIPCallbackInfo(pModel,nQuery)
 */
-PyObject *pyLSgetMIPCallbackInfo(PyObject *self, PyObject *args) {
+PyObject *pyLSgetMIPCallbackInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel = NULL;
     int       nQuery;
@@ -13989,10 +15413,10 @@ PyObject *pyLSgetMIPCallbackInfo(PyObject *self, PyObject *args) {
     PyObject       *pyModel = NULL;
     PyArrayObject  *pyResult = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiA*",
         &pyModel,
         &nQuery,
-        &PyArray_Type, &pyResult))
+        &pyResult))
     {
         return NULL;
     }
@@ -14020,25 +15444,21 @@ PyObject *pyLSgetMIPCallbackInfo(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetMIPSolutionStatus(pModel,pnStatus)
 */
-PyObject *pyLSgetMIPSolutionStatus(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetMIPSolutionStatus(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2])) {  //*pnStatus
+        &pyArr[2])) {  //*pnStatus
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14060,25 +15480,21 @@ PyObject *pyLSgetMIPSolutionStatus(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetNextBestSol(pModel,pnModStatus)
 */
-PyObject *pyLSgetNextBestSol(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetNextBestSol(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2])) {  //*pnModStatus
+        &pyArr[2])) {  //*pnModStatus
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14099,26 +15515,22 @@ PyObject *pyLSgetNextBestSol(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetNnzData(pModel,mStat,panOutput)
 */
-PyObject *pyLSgetNnzData(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetNnzData(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
         &pyModel, //pModel
         &ibuf[2], //mStat
-        &PyArray_Type, &pyArr[3])) {  //*panOutput
+        &pyArr[3])) {  //*panOutput
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14144,26 +15556,22 @@ PyObject *pyLSgetNnzData(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetObjPoolNumSol(pModel,nObjIndex,pNumSol)
 */
-PyObject *pyLSgetObjPoolNumSol(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetObjPoolNumSol(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN*",
         &pyModel, //pModel
         &ibuf[2], //nObjIndex
-        &PyArray_Type, &pyArr[3])) {  //*pNumSol
+        &pyArr[3])) {  //*pNumSol
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14186,22 +15594,20 @@ PyObject *pyLSgetObjPoolNumSol(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetOrbitInfo(pModel,pnNumGenerators,pnNumOfOrbits,panOrbitBeg,panOrbits)
 */
-PyObject *pyLSgetOrbitInfo(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetOrbitInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(6);
     void     *pSym = NULL;
     PyObject *pySym = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*",
         &pySym, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnNumGenerators
-        &PyArray_Type, &pyArr[3],  //*pnNumOfOrbits
-        &PyArray_Type, &pyArr[4],  //*panOrbitBeg
-        &PyArray_Type, &pyArr[5])) {  //*panOrbits
+        &pyArr[2],  //*pnNumGenerators
+        &pyArr[3],  //*pnNumOfOrbits
+        &pyArr[4],  //*panOrbitBeg
+        &pyArr[5])) {  //*panOrbits
         return NULL;
     }
 
@@ -14231,32 +15637,28 @@ PyObject *pyLSgetOrbitInfo(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetPOSDData(pModel,pinPOSD,paiPOSDdim,paiPOSDnnz,paiPOSDbeg,paiPOSDrowndx,paiPOSDcolndx,paiPOSDvarndx)
 */
-PyObject *pyLSgetPOSDData(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetPOSDData(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(9);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
     int k;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*N*N*N*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pinPOSD
-        &PyArray_Type, &pyArr[3],  //*paiPOSDdim
-        &PyArray_Type, &pyArr[4],  //*paiPOSDnnz
-        &PyArray_Type, &pyArr[5],  //*paiPOSDbeg
-        &PyArray_Type, &pyArr[6],  //*paiPOSDrowndx
-        &PyArray_Type, &pyArr[7],  //*paiPOSDcolndx
-        &PyArray_Type, &pyArr[8])) {  //*paiPOSDvarndx
+        &pyArr[2],  //*pinPOSD
+        &pyArr[3],  //*paiPOSDdim
+        &pyArr[4],  //*paiPOSDnnz
+        &pyArr[5],  //*paiPOSDbeg
+        &pyArr[6],  //*paiPOSDrowndx
+        &pyArr[7],  //*paiPOSDcolndx
+        &pyArr[8])) {  //*paiPOSDvarndx
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14286,31 +15688,27 @@ PyObject *pyLSgetPOSDData(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetPOSDDatai(pModel,iPOSD,piPOSDdim,piPOSDnnz,paiPOSDrowndx,paiPOSDcolndx,paiPOSDvarndx)
 */
-PyObject *pyLSgetPOSDDatai(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetPOSDDatai(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
     int k;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiN*N*N*N*N*",
         &pyModel, //pModel
         &ibuf[2], //iPOSD
-        &PyArray_Type, &pyArr[3],  //*piPOSDdim
-        &PyArray_Type, &pyArr[4],  //*piPOSDnnz
-        &PyArray_Type, &pyArr[5],  //*paiPOSDrowndx
-        &PyArray_Type, &pyArr[6],  //*paiPOSDcolndx
-        &PyArray_Type, &pyArr[7])) {  //*paiPOSDvarndx
+        &pyArr[3],  //*piPOSDdim
+        &pyArr[4],  //*piPOSDnnz
+        &pyArr[5],  //*paiPOSDrowndx
+        &pyArr[6],  //*paiPOSDcolndx
+        &pyArr[7])) {  //*paiPOSDvarndx
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14341,27 +15739,23 @@ PyObject *pyLSgetPOSDDatai(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetProgressInfo(pModel,nLocation,nQuery)
 */
-PyObject *pyLSgetProgressInfo(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetProgressInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiiO!",
+    if (!pyParseArgs(args, nargs, "OiiD*",
         &pyModel, //pModel
         &ibuf[2], //nLocation
         &ibuf[3], //nQuery
-        &PyArray_Type, &pyArr[4])) { //Value
+        &pyArr[4])) { //Value
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
     // Get C pointers
@@ -14383,37 +15777,33 @@ PyObject *pyLSgetProgressInfo(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetSolutionInfo(pModel,pnMethod,pnElapsed,pnSpxiter,pnBariter,pnNlpiter,pnPrimStatus,pnDualStatus,pnBasStatus,pdPobjval,pdDobjval,pdPinfeas,pdDinfeas)
 */
-PyObject *pyLSgetSolutionInfo(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetSolutionInfo(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(14);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
     int k;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!O!O!O!O!O!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "ON*N*N*N*N*N*N*N*D*D*D*D*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pnMethod
-        &PyArray_Type, &pyArr[3],  //*pnElapsed
-        &PyArray_Type, &pyArr[4],  //*pnSpxiter
-        &PyArray_Type, &pyArr[5],  //*pnBariter
-        &PyArray_Type, &pyArr[6],  //*pnNlpiter
-        &PyArray_Type, &pyArr[7],  //*pnPrimStatus
-        &PyArray_Type, &pyArr[8],  //*pnDualStatus
-        &PyArray_Type, &pyArr[9],  //*pnBasStatus
-        &PyArray_Type, &pyArr[10],  //*pdPobjval
-        &PyArray_Type, &pyArr[11],  //*pdDobjval
-        &PyArray_Type, &pyArr[12],  //*pdPinfeas
-        &PyArray_Type, &pyArr[13])) {  //*pdDinfeas
+        &pyArr[2],  //*pnMethod
+        &pyArr[3],  //*pnElapsed
+        &pyArr[4],  //*pnSpxiter
+        &pyArr[5],  //*pnBariter
+        &pyArr[6],  //*pnNlpiter
+        &pyArr[7],  //*pnPrimStatus
+        &pyArr[8],  //*pnDualStatus
+        &pyArr[9],  //*pnBasStatus
+        &pyArr[10],  //*pdPobjval
+        &pyArr[11],  //*pdDobjval
+        &pyArr[12],  //*pdPinfeas
+        &pyArr[13])) {  //*pdDinfeas
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14451,25 +15841,21 @@ PyObject *pyLSgetSolutionInfo(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetSolutionStatus(pModel,nStatus)
 */
-PyObject *pyLSgetSolutionStatus(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetSolutionStatus(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "ON*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2])) {  //*nStatus
+        &pyArr[2])) {  //*nStatus
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14490,20 +15876,18 @@ PyObject *pyLSgetSolutionStatus(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetXSolverLibrary(pEnv,mVendorId,szLibrary)
 */
-PyObject *pyLSgetXSolverLibrary(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetXSolverLibrary(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Ois",
+    if (!pyParseArgs(args, nargs, "OiS*",
         &pyEnv, //pEnv
         &ibuf[2], //mVendorId
-        &PyArray_Type, &pyArr[3])) {  //*szLibrary
+        &pyArr[3])) {  //*szLibrary
         return NULL;
     }
 
@@ -14527,30 +15911,31 @@ PyObject *pyLSgetXSolverLibrary(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadALLDIFFData(pModel,nALLDIFF,paiAlldiffDim,paiAlldiffL,paiAlldiffU,paiAlldiffBeg,paiAlldiffVar)
 */
-PyObject *pyLSloadALLDIFFData(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadALLDIFFData(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiNNNNN",
         &pyModel, //pModel
         &ibuf[2], //nALLDIFF
-        &PyArray_Type, &pyArr[3],  //*paiAlldiffDim
-        &PyArray_Type, &pyArr[4],  //*paiAlldiffL
-        &PyArray_Type, &pyArr[5],  //*paiAlldiffU
-        &PyArray_Type, &pyArr[6],  //*paiAlldiffBeg
-        &PyArray_Type, &pyArr[7])) {  //*paiAlldiffVar
+        &pyArr[3],  //*paiAlldiffDim
+        &pyArr[4],  //*paiAlldiffL
+        &pyArr[5],  //*paiAlldiffU
+        &pyArr[6],  //*paiAlldiffBeg
+        &pyArr[7])) {  //*paiAlldiffVar
         return NULL;
     }
 
+    if (!pyArgLen("nALLDIFF", ibuf[2], 3, pyArr[3], pyArr[4], pyArr[5]))
+        return NULL;
+    if (!pyArgLen("nALLDIFF+1", (npy_intp)ibuf[2] + 1, 1, pyArr[6]))
+        return NULL;
+
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14590,25 +15975,21 @@ PyObject *pyLSloadALLDIFFData(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadGASolution(pModel,nIndex)
 */
-PyObject *pyLSloadGASolution(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadGASolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
         &pyModel, //pModel
         &ibuf[2])) { //nIndex
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14628,26 +16009,22 @@ PyObject *pyLSloadGASolution(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadIISPriorities(pModel,panRprior,panCprior)
 */
-PyObject *pyLSloadIISPriorities(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadIISPriorities(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "ONN",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*panRprior
-        &PyArray_Type, &pyArr[3])) {  //*panCprior
+        &pyArr[2],  //*panRprior
+        &pyArr[3])) {  //*panCprior
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14674,25 +16051,21 @@ PyObject *pyLSloadIISPriorities(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadMultiStartSolution(pModel,nIndex)
 */
-PyObject *pyLSloadMultiStartSolution(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadMultiStartSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
         &pyModel, //pModel
         &ibuf[2])) { //nIndex
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14712,32 +16085,34 @@ PyObject *pyLSloadMultiStartSolution(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadNLPDense(pModel,nCons,nVars,dObjSense,pszConTypes,pszVarTypes,padX0,padL,padU)
 */
-PyObject *pyLSloadNLPDense(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadNLPDense(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(10);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiiissO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiiiSSDDD",
         &pyModel, //pModel
         &ibuf[2], //nCons
         &ibuf[3], //nVars
         &ibuf[4], //dObjSense
-        &PyArray_Type, &pyArr[5],  //*pszConTypes
-        &PyArray_Type, &pyArr[6],  //*pszVarTypes
-        &PyArray_Type, &pyArr[7],  //*padX0
-        &PyArray_Type, &pyArr[8],  //*padL
-        &PyArray_Type, &pyArr[9])) {  //*padU
+        &pyArr[5],  //*pszConTypes
+        &pyArr[6],  //*pszVarTypes
+        &pyArr[7],  //*padX0
+        &pyArr[8],  //*padL
+        &pyArr[9])) {  //*padU
         return NULL;
     }
 
+    if (!pyArgLen("nCons", ibuf[2], 1, pyArr[5]))
+        return NULL;
+    if (!pyArgLen("nVars", ibuf[3], 4, pyArr[6], pyArr[7], pyArr[8], pyArr[9]))
+        return NULL;
+
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
+    pyResetModelDims(pModel);
 
 
 
@@ -14775,30 +16150,31 @@ PyObject *pyLSloadNLPDense(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadPOSDData(pModel,nPOSD,paiPOSDdim,paiPOSDbeg,paiPOSDrowndx,paiPOSDcolndx,paiPOSDvarndx)
 */
-PyObject *pyLSloadPOSDData(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadPOSDData(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "OiNNNNN",
         &pyModel, //pModel
         &ibuf[2], //nPOSD
-        &PyArray_Type, &pyArr[3],  //*paiPOSDdim
-        &PyArray_Type, &pyArr[4],  //*paiPOSDbeg
-        &PyArray_Type, &pyArr[5],  //*paiPOSDrowndx
-        &PyArray_Type, &pyArr[6],  //*paiPOSDcolndx
-        &PyArray_Type, &pyArr[7])) {  //*paiPOSDvarndx
+        &pyArr[3],  //*paiPOSDdim
+        &pyArr[4],  //*paiPOSDbeg
+        &pyArr[5],  //*paiPOSDrowndx
+        &pyArr[6],  //*paiPOSDcolndx
+        &pyArr[7])) {  //*paiPOSDvarndx
         return NULL;
     }
 
+    if (!pyArgLen("nPOSD", ibuf[2], 1, pyArr[3]))
+        return NULL;
+    if (!pyArgLen("nPOSD+1", (npy_intp)ibuf[2] + 1, 1, pyArr[4]))
+        return NULL;
+
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14838,25 +16214,21 @@ PyObject *pyLSloadPOSDData(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadString(pModel,pszString)
 */
-PyObject *pyLSloadString(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadString(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Os",
+    if (!pyParseArgs(args, nargs, "Os",
         &pyModel, //pModel
         &sbuf[2])) {  //*pszString
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14876,26 +16248,22 @@ PyObject *pyLSloadString(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadString(pModel,paszStringData)
 */
-PyObject *pyLSloadStringData(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadStringData(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiS",
         &pyModel, //pModel
         &ibuf[2], //nStrings
-        &PyArray_Type, &pyArr[3])) {  //**paszStringData
+        &pyArr[3])) {  //**paszStringData
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -14919,17 +16287,15 @@ PyObject *pyLSloadStringData(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSreadMPXStream(pModel,pszStream,nStreamLen)
 */
-PyObject *pyLSreadMPXStream(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSreadMPXStream(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Osi",
+    if (!pyParseArgs(args, nargs, "Osi",
         &pyModel, //pModel
         &sbuf[2],  //*pszStream
         &ibuf[3])) { //nStreamLen
@@ -14937,8 +16303,7 @@ PyObject *pyLSreadMPXStream(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
+    pyResetModelDims(pModel);
 
 
 
@@ -14959,17 +16324,15 @@ PyObject *pyLSreadMPXStream(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSloadSolutionAt(pModel,nObjIndex,nSolIndex)
 */
-PyObject *pyLSloadSolutionAt(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSloadSolutionAt(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
         &pyModel, //pModel
         &ibuf[2], //nObjIndex
         &ibuf[3])) { //nSolIndex
@@ -14977,8 +16340,6 @@ PyObject *pyLSloadSolutionAt(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15001,17 +16362,15 @@ PyObject *pyLSloadSolutionAt(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetObjPoolParam(pModel,nObjIndex,mInfo,dValue)
 */
-PyObject *pyLSsetObjPoolParam(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetObjPoolParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oiid",
+    if (!pyParseArgs(args, nargs, "Oiid",
         &pyModel, //pModel
         &ibuf[2], //nObjIndex
         &ibuf[3], //mInfo
@@ -15020,8 +16379,6 @@ PyObject *pyLSsetObjPoolParam(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15044,17 +16401,15 @@ PyObject *pyLSsetObjPoolParam(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetProbAllocSizes(pModel,n_vars_alloc,n_cons_alloc,n_QC_alloc,n_Annz_alloc,n_Qnnz_alloc,n_NLPnnz_alloc)
 */
-PyObject *pyLSsetProbAllocSizes(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetProbAllocSizes(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(8);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oiiiiii",
+    if (!pyParseArgs(args, nargs, "Oiiiiii",
         &pyModel, //pModel
         &ibuf[2], //n_vars_alloc
         &ibuf[3], //n_cons_alloc
@@ -15066,8 +16421,6 @@ PyObject *pyLSsetProbAllocSizes(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15093,17 +16446,15 @@ PyObject *pyLSsetProbAllocSizes(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetProbNameAllocSizes(pModel,n_varname_alloc,n_rowname_alloc)
 */
-PyObject *pyLSsetProbNameAllocSizes(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetProbNameAllocSizes(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
         &pyModel, //pModel
         &ibuf[2], //n_varname_alloc
         &ibuf[3])) { //n_rowname_alloc
@@ -15111,8 +16462,6 @@ PyObject *pyLSsetProbNameAllocSizes(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15134,17 +16483,15 @@ PyObject *pyLSsetProbNameAllocSizes(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetSETSStatei(pModel,iSet,mState)
 */
-PyObject *pyLSsetSETSStatei(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetSETSStatei(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
         &pyModel, //pModel
         &ibuf[2], //iSet
         &ibuf[3])) { //mState
@@ -15152,8 +16499,6 @@ PyObject *pyLSsetSETSStatei(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15175,17 +16520,15 @@ PyObject *pyLSsetSETSStatei(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetXSolverLibrary(pEnv,mVendorId,szLibrary)
 */
-PyObject *pyLSsetXSolverLibrary(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetXSolverLibrary(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSenv     pEnv = NULL;
     PyObject *pyEnv = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Ois",
+    if (!pyParseArgs(args, nargs, "Ois",
         &pyEnv, //pEnv
         &ibuf[2], //mVendorId
         &sbuf[3])) {  //*szLibrary
@@ -15212,17 +16555,15 @@ PyObject *pyLSsetXSolverLibrary(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetConstraintProperty(pModel,ndxCons,nConptype)
 */
-PyObject *pyLSsetConstraintProperty(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetConstraintProperty(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
         &pyModel, //pModel
         &ibuf[2], //ndxCons
         &ibuf[3])) { //nConptype
@@ -15230,8 +16571,6 @@ PyObject *pyLSsetConstraintProperty(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15253,23 +16592,21 @@ PyObject *pyLSsetConstraintProperty(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSregress(pModel,nNdim,nPdim,padU,padX,padB,pdB0,padR,padstats)
 */
-PyObject *pyLSregress(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSregress(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(10);
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "iiO!O!O!O!O!O!",
+    if (!pyParseArgs(args, nargs, "iiDDD*D*D*D*",
         &ibuf[2], //nNdim
         &ibuf[3], //nPdim
-        &PyArray_Type, &pyArr[4],  //*padU
-        &PyArray_Type, &pyArr[5],  //*padX
-        &PyArray_Type, &pyArr[6],  //*padB
-        &PyArray_Type, &pyArr[7],  //*pdB0
-        &PyArray_Type, &pyArr[8],  //*padR
-        &PyArray_Type, &pyArr[9])) {  //*padstats
+        &pyArr[4],  //*padU
+        &pyArr[5],  //*padX
+        &pyArr[6],  //*padB
+        &pyArr[7],  //*pdB0
+        &pyArr[8],  //*padR
+        &pyArr[9])) {  //*padstats
         return NULL;
     }
 
@@ -15320,25 +16657,21 @@ PyObject *pyLSregress(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSremObjPool(pModel,nObjIndex)
 */
-PyObject *pyLSremObjPool(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSremObjPool(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oi",
+    if (!pyParseArgs(args, nargs, "Oi",
         &pyModel, //pModel
         &ibuf[2])) { //nObjIndex
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15361,26 +16694,22 @@ PyObject *pyLSremObjPool(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetMIPSolution(pModel,pdPobjval,padPrimal)
 */
-PyObject *pyLSgetMIPSolution(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetMIPSolution(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!O!",
+    if (!pyParseArgs(args, nargs, "OD*D*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2],  //*pdPobjval
-        &PyArray_Type, &pyArr[3])) {  //*padPrimal
+        &pyArr[2],  //*pdPobjval
+        &pyArr[3])) {  //*padPrimal
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15408,25 +16737,21 @@ PyObject *pyLSgetMIPSolution(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetObjective(pModel,pdObjval)
 */
-PyObject *pyLSgetObjective(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetObjective(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(3);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OO!",
+    if (!pyParseArgs(args, nargs, "OD*",
         &pyModel, //pModel
-        &PyArray_Type, &pyArr[2])) {  //*pdObjval
+        &pyArr[2])) {  //*pdObjval
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15450,17 +16775,15 @@ PyObject *pyLSgetObjective(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetGOPVariablePriority(pModel,ndxVar,nPriority)
 */
-PyObject *pyLSsetGOPVariablePriority(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetGOPVariablePriority(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Oii",
+    if (!pyParseArgs(args, nargs, "Oii",
         &pyModel, //pModel
         &ibuf[2], //ndxVar
         &ibuf[3])) { //nPriority
@@ -15468,8 +16791,6 @@ PyObject *pyLSsetGOPVariablePriority(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15491,26 +16812,22 @@ PyObject *pyLSsetGOPVariablePriority(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetStringValue(pModel,iString,pdValue)
 */
-PyObject *pyLSgetStringValue(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSgetStringValue(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiD*",
         &pyModel, //pModel
         &ibuf[2], //iString
-        &PyArray_Type, &pyArr[3])) {  //*pdValue
+        &pyArr[3])) {  //*pdValue
         return NULL;
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15535,27 +16852,26 @@ PyObject *pyLSgetStringValue(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSrepairQterms(pModel,nCons,paiCons,paiType)
 */
-PyObject *pyLSrepairQterms(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSrepairQterms(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "OiO!O!",
+    if (!pyParseArgs(args, nargs, "OiNN*",
         &pyModel, //pModel
         &ibuf[2], //nCons
-        &PyArray_Type, &pyArr[3],  //*paiCons
-        &PyArray_Type, &pyArr[4])) {  //*paiType
+        &pyArr[3],  //*paiCons
+        &pyArr[4])) {  //*paiType
         return NULL;
     }
 
+    if (!pyArgLen("nCons", ibuf[2], 2, pyArr[3], pyArr[4]))
+        return NULL;
+
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15585,17 +16901,15 @@ PyObject *pyLSrepairQterms(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSsetMIPCCStrategy(pModel,nRunId,szParamFile)
 */
-PyObject *pyLSsetMIPCCStrategy(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetMIPCCStrategy(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(4);
     pLSmodel     pModel = NULL;
     PyObject *pyModel = NULL;
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
+    const char *osig = "i";
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
 
-    if (!PyArg_ParseTuple(args, "Ois",
+    if (!pyParseArgs(args, nargs, "Ois",
         &pyModel, //pModel
         &ibuf[2], //nRunId
         &sbuf[3])) {  //*szParamFile
@@ -15603,8 +16917,6 @@ PyObject *pyLSsetMIPCCStrategy(PyObject *self, PyObject *args) {
     }
 
     CHECK_MODEL;
-    LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-    LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -15639,8 +16951,240 @@ typedef struct pyLindoData_t {
     void *GData;
     void *Hessdc_func;
     void *HDCdata;
+    volatile int interrupt; //nonzero makes relayCallback stop the solver
+    int nFuncBatch;         //Funcalc_func fills all rows of a point at once
+    int nCacheVars;
+    int nCacheRows;
+    int nCacheValid;
+    int isCacheBusy;        //a Funcalc_func call is filling the cache
+    double *padCachePrimal; //point the cached row values belong to
+    double *padCacheVals;   //row values, objective stored last
+    int nVars;              //model dimensions at the last relay call
+    int nCons;
+    PyObject *pyArgs;       //argument tuple reused across relay calls
+    PyObject *pyPrimal;     //views over the solver buffers, rebuilt only
+    PyObject *pyLB;         //when LINDO hands over a different buffer
+    PyObject *pyUB;
+    PyObject *pyFuncVal;
+    PyObject *pyParlist;
+    PyObject *pyPartial;
+    PyObject *pyRowVals;
 } pyLindoData_t;
 
+/*
+* @brief Release a callback context, the callback and user data it holds
+*        and the Python objects it caches
+*/
+static void pyFreeLindoData(pyLindoData_t *pyudata)
+{
+    if (!pyudata)
+        return;
+    Py_XDECREF((PyObject*)pyudata->locFunc);
+    Py_XDECREF((PyObject*)pyudata->locData);
+    Py_XDECREF((PyObject*)pyudata->cbFunc);
+    Py_XDECREF((PyObject*)pyudata->cbData);
+    Py_XDECREF((PyObject*)pyudata->mipFunc);
+    Py_XDECREF((PyObject*)pyudata->mipData);
+    Py_XDECREF((PyObject*)pyudata->Funcalc_func);
+    Py_XDECREF((PyObject*)pyudata->FData);
+    Py_XDECREF((PyObject*)pyudata->Grad_func);
+    Py_XDECREF((PyObject*)pyudata->GData);
+    Py_XDECREF(pyudata->pyArgs);
+    Py_XDECREF(pyudata->pyPrimal);
+    Py_XDECREF(pyudata->pyLB);
+    Py_XDECREF(pyudata->pyUB);
+    Py_XDECREF(pyudata->pyFuncVal);
+    Py_XDECREF(pyudata->pyParlist);
+    Py_XDECREF(pyudata->pyPartial);
+    Py_XDECREF(pyudata->pyRowVals);
+    free(pyudata->padCachePrimal);
+    free(pyudata->padCacheVals);
+    free(pyudata);
+}
+
+/*
+* @brief Free the relay context an LSset* call replaced, or on failure the
+*        new one, which LINDO did not take
+* @param pyOld Context of the callback set before, NULL unless it was ours
+*/
+static void pyReplaceLindoData(int errorcode, pyLindoData_t *pyOld, pyLindoData_t *pyNew)
+{
+    pyFreeLindoData(errorcode == LSERR_NO_ERROR ? pyOld : pyNew);
+}
+
+/*
+* @brief Number of variables of the model a relay is called for
+* @remark Read from the dimension cache on every call: a buffer freed after
+*         a dimension change is often handed out again at the same address,
+*         so the buffer alone does not tell whether the length still holds.
+*/
+static int pyRelayNumVars(pyLindoData_t *pyudata)
+{
+    pyudata->nVars = pyudata->nCons = 0;
+    pyGetModelDims(pyudata->pModel, &pyudata->nVars, &pyudata->nCons);
+    return pyudata->nVars;
+}
+
+/*
+* @brief Borrowed 1-D view over a solver buffer, reusing *ppyView when it
+*        already wraps the same buffer with the same length
+*/
+static PyObject *pyRelayView(PyObject **ppyView, void *data, npy_intp len, int type)
+{
+    PyArrayObject *pyView = (PyArrayObject*)*ppyView;
+    if (pyView && PyArray_DATA(pyView) == data && PyArray_DIM(pyView, 0) == len)
+        return *ppyView;
+    Py_XDECREF(*ppyView);
+    *ppyView = PyArray_SimpleNewFromData(1, &len, type, data);
+    return *ppyView;
+}
+
+/*
+* @brief Argument tuple of nArgs items, reused while nobody else holds it
+*/
+static PyObject *pyRelayArgs(PyObject **ppyArgs, int nArgs)
+{
+    if (*ppyArgs && Py_REFCNT(*ppyArgs) == 1 && PyTuple_GET_SIZE(*ppyArgs) == nArgs)
+        return *ppyArgs;
+    Py_XDECREF(*ppyArgs);
+    *ppyArgs = PyTuple_New(nArgs);
+    return *ppyArgs;
+}
+
+/*
+* @brief Store item (new reference, may be NULL) at position k of a relay tuple
+* @return 0 on success, -1 if item is NULL
+*/
+static int pyRelaySetArg(PyObject *pyArgs, int k, PyObject *item)
+{
+    PyObject *old = PyTuple_GET_ITEM(pyArgs, k);
+    if (!item)
+        return -1;
+    PyTuple_SET_ITEM(pyArgs, k, item);
+    Py_XDECREF(old);
+    return 0;
+}
+
+/*
+* @brief As pyRelaySetArg for a borrowed reference
+*/
+static int pyRelaySetRef(PyObject *pyArgs, int k, PyObject *item)
+{
+    if (!item)
+        return -1;
+    Py_INCREF(item);
+    return pyRelaySetArg(pyArgs, k, item);
+}
+
+/*
+* @brief Resolve a native callback given in place of a Python callable
+* @param[in] pyFunc An int address, an object with an int `address`
+*            attribute (numba cfunc) or a ctypes function pointer
+* @param[out] ppFunc The function address
+* @return 1 if pyFunc is native, 0 if it is not, -1 on error
+* @remark cffi callbacks are passed as int(ffi.cast("uintptr_t", cb)).
+* @remark The setters keep a reference to pyFunc while the callback is set
+*         (pyKeepNativeFunc); the object behind an int address is the
+*         caller's to keep alive.
+*/
+static int pyGetNativeFunc(PyObject *pyFunc, void **ppFunc)
+{
+    PyObject *pyAddr = NULL;
+    int isNative = 0;
+
+    *ppFunc = NULL;
+    if (PyLong_Check(pyFunc)) {
+        pyAddr = pyFunc;
+        Py_INCREF(pyAddr);
+    } else if (PyObject_HasAttrString(pyFunc, "address")) {
+        pyAddr = PyObject_GetAttrString(pyFunc, "address");
+        if (pyAddr && !PyLong_Check(pyAddr))
+            Py_CLEAR(pyAddr);
+    } else if (PyCallable_Check(pyFunc)) {
+        PyObject *ctypes = PyImport_ImportModule("ctypes");
+        PyObject *cfuncptr = ctypes ? PyObject_GetAttrString(ctypes, "_CFuncPtr") : NULL;
+        if (cfuncptr && PyObject_IsInstance(pyFunc, cfuncptr) == 1) {
+            PyObject *voidp = PyObject_GetAttrString(ctypes, "c_void_p");
+            PyObject *ptr = voidp ? PyObject_CallMethod(ctypes, "cast", "OO", pyFunc, voidp) : NULL;
+            if (ptr)
+                pyAddr = PyObject_GetAttrString(ptr, "value");
+            Py_XDECREF(ptr);
+            Py_XDECREF(voidp);
+        }
+        Py_XDECREF(cfuncptr);
+        Py_XDECREF(ctypes);
+    }
+    if (PyErr_Occurred())
+        PyErr_Clear();
+
+    if (pyAddr && PyLong_Check(pyAddr)) {
+        *ppFunc = PyLong_AsVoidPtr(pyAddr);
+        isNative = 1;
+        if (PyErr_Occurred() || *ppFunc == NULL) {
+            if (!PyErr_Occurred())
+                PyErr_SetString(PyExc_ValueError, "NULL callback address");
+            isNative = -1;
+        }
+    }
+    Py_XDECREF(pyAddr);
+
+    return isNative;
+}
+
+/*
+* @brief Resolve the user data pointer handed to a native callback
+* @return 0 on success, -1 (with TypeError set) otherwise
+*/
+static int pyGetNativeData(PyObject *pyData, void **ppData)
+{
+    *ppData = NULL;
+    if (pyData == NULL || pyData == Py_None)
+        return 0;
+    if (PyLong_Check(pyData)) {
+        *ppData = PyLong_AsVoidPtr(pyData);
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    PyErr_SetString(PyExc_TypeError, "Native callbacks take an int address or None as user data");
+    return -1;
+}
+
+/*
+* Objects behind the native callbacks set on a model, keyed by (model
+* pointer, LS_REF_*). LINDO only holds the address, so the ctypes or
+* numba object providing it is kept here until the callback is replaced
+* or the model is deleted. Only accessed with the GIL held.
+*/
+static PyObject *pyNativeFuncs = NULL;  //{(model pointer, nRefFunc): object}
+
+/*
+* @brief Keep pyFunc alive as the native callback nRefFunc of pModel, or
+*        release the one kept before if pyFunc is NULL
+* @remark Called once LINDO took the new callback. Should the table fail
+*         to take pyFunc, its reference is leaked rather than leaving
+*         LINDO with an address that may be freed.
+*/
+static void pyKeepNativeFunc(pLSmodel pModel, int nRefFunc, PyObject *pyFunc)
+{
+    PyObject *pyKey = NULL;
+    PyObject *pyType, *pyValue, *pyTrace;
+    int      nerr = -1;
+
+    if (!pyFunc && (!pyNativeFuncs || !PyDict_GET_SIZE(pyNativeFuncs)))
+        return;
+    PyErr_Fetch(&pyType, &pyValue, &pyTrace);
+    if (pyNativeFuncs || (pyNativeFuncs = PyDict_New()) != NULL)
+        pyKey = Py_BuildValue("(Ni)", PyLong_FromVoidPtr(pModel), nRefFunc);
+    if (pyKey && pyFunc)
+        nerr = PyDict_SetItem(pyNativeFuncs, pyKey, pyFunc);
+    else if (pyKey && PyDict_GetItemWithError(pyNativeFuncs, pyKey))
+        nerr = PyDict_DelItem(pyNativeFuncs, pyKey);
+    if (nerr && pyFunc)
+        Py_INCREF(pyFunc);
+    Py_XDECREF(pyKey);
+    PyErr_Clear();
+    PyErr_Restore(pyType, pyValue, pyTrace);
+}
+
 
 /*
 * @brief LSsetModelLogfunc
@@ -15654,6 +17198,10 @@ void LS_CALLTYPE relayModelLogfunc(pLSmodel pModel, char *line, void *userdata)
     pyLindoData_t *pyudata = (pyLindoData_t*)userdata;
     PyObject *arglist = NULL;
     PyObject *result = NULL;
+    PyGILState_STATE gstate;
+
+    // the solver may call back with the GIL released (or from its own threads)
+    gstate = PyGILState_Ensure();
     if (line)
     {
         // Build up the argument list...
@@ -15666,6 +17214,7 @@ void LS_CALLTYPE relayModelLogfunc(pLSmodel pModel, char *line, void *userdata)
 
     Py_XDECREF(result);
     Py_DECREF(arglist);
+    PyGILState_Release(gstate);
 
     return;
 } /*relayModelLogfunc*/
@@ -15677,19 +17226,17 @@ void LS_CALLTYPE relayModelLogfunc(pLSmodel pModel, char *line, void *userdata)
 * @return int
 * @remark errorcode = lindo.LSsetModelLogfunc(pModel,cbfun,cbdata)
 */
-PyObject *pyLSsetModelLogfunc(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetModelLogfunc(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel  pModel = NULL;
     PyObject *pyModel = NULL;
     PyObject *pyObj[5];
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
-    pyLindoData_t *pyudata=NULL;
+    const char *osig = "i";
+    pyLindoData_t *pyudata = NULL, *pyOld = NULL;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
     memset(pyObj, 0, 5 * sizeof(PyObject*));
-    if (!PyArg_ParseTuple(args, "OOO",
+    if (!pyParseArgs(args, nargs, "OOO",
         &pyModel, //pModel
         &pyObj[2], //locFunc
         &pyObj[3])) {  //locData
@@ -15698,12 +17245,11 @@ PyObject *pyLSsetModelLogfunc(PyObject *self, PyObject *args) {
 
     if (!PyCallable_Check(pyObj[2])) {
         PyErr_SetString(PyExc_TypeError, "Need a callable object!");
+        return NULL;
     }
     CHECK_MODEL;
-    pyudata = (pyLindoData_t*) LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_LOCDATA);
-    if (pyudata) {
-        free(pyudata);
-    }
+    if (LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_LOCFUN) == (void*)relayModelLogfunc)
+        pyOld = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_LOCDATA);
     pyudata = malloc(sizeof(pyLindoData_t));
     memset(pyudata, 0, sizeof(pyLindoData_t));
     if (pyObj[2]) {
@@ -15711,12 +17257,15 @@ PyObject *pyLSsetModelLogfunc(PyObject *self, PyObject *args) {
         pyudata->pyModel = pyModel;
         pyudata->locFunc = pyObj[2];
         pyudata->locData = pyObj[3];
+        Py_XINCREF(pyObj[2]);
+        Py_XINCREF(pyObj[3]);
     }
 
     // Get C pointers
     errorcode = LSsetModelLogfunc(pModel
         , relayModelLogfunc
         , pyudata);
+    pyReplaceLindoData(errorcode, pyOld, pyudata);
 
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
@@ -15736,6 +17285,15 @@ int LS_CALLTYPE relayCallback(pLSmodel pModel, int iLoc, void *userdata)
     pyLindoData_t *pyudata = (pyLindoData_t*)userdata;
     PyObject *arglist = NULL;
     PyObject *result = NULL;
+    PyGILState_STATE gstate;
+
+    // interrupt requests and relays without a Python callback never need the GIL
+    if (pyudata->interrupt)
+        return pyudata->interrupt;
+    if (!pyudata->cbFunc)
+        return 0;
+
+    gstate = PyGILState_Ensure();
     {
         // Build up the argument list...
         arglist = Py_BuildValue("(OiO)", pyudata->pyModel,iLoc, pyudata->cbData);
@@ -15749,6 +17307,7 @@ int LS_CALLTYPE relayCallback(pLSmodel pModel, int iLoc, void *userdata)
 
     Py_XDECREF(result);
     Py_DECREF(arglist);
+    PyGILState_Release(gstate);
 
     return retvalue;
 } /*relayModelLogfunc*/
@@ -15760,46 +17319,46 @@ int LS_CALLTYPE relayCallback(pLSmodel pModel, int iLoc, void *userdata)
 * @return int
 * @remark errorcode = lindo.LSsetCallback(pModel,cbfun,cbdata)
 */
-PyObject *pyLSsetCallback(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetCallback(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSmodel  pModel = NULL;
     PyObject *pyModel = NULL;
     PyObject *pyObj[5];
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
-    pyLindoData_t *pyudata = NULL;
+    const char *osig = "i";
+    pyLindoData_t *pyudata = NULL, *pyOld = NULL;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
     memset(pyObj, 0, 5 * sizeof(PyObject*));
-    if (!PyArg_ParseTuple(args, "OOO",
+    if (!pyParseArgs(args, nargs, "OOO",
         &pyModel, //pModel
         &pyObj[2], //cbFunc
         &pyObj[3])) {  //cbData
         return NULL;
     }
 
-    if (!PyCallable_Check(pyObj[2])) {
+    if (pyObj[2] == Py_None) {
+        pyObj[2] = NULL;
+    } else if (!PyCallable_Check(pyObj[2])) {
         PyErr_SetString(PyExc_TypeError, "Need a callable object!");
+        return NULL;
     }
     CHECK_MODEL;
-    pyudata = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_CBDATA);
-    if (!pyudata) {
-        free(pyudata);
-    }
+    if (LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_CBFUN) == (void*)relayCallback)
+        pyOld = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_CBDATA);
     pyudata = malloc(sizeof(pyLindoData_t));
     memset(pyudata, 0, sizeof(pyLindoData_t));
-    if (pyObj[2]) {
-        pyudata->pModel = pModel;
-        pyudata->pyModel = pyModel;
-        pyudata->cbFunc = pyObj[2];
-        pyudata->cbData = pyObj[3];
-    }
+    pyudata->pModel = pModel;
+    pyudata->pyModel = pyModel;
+    pyudata->cbFunc = pyObj[2];
+    pyudata->cbData = pyObj[3];
+    Py_XINCREF(pyObj[2]);
+    Py_XINCREF(pyObj[3]);
 
     // Get C pointers
     errorcode = LSsetCallback(pModel
         , relayCallback
         , pyudata);
+    pyReplaceLindoData(errorcode, pyOld, pyudata);
 
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
@@ -15807,6 +17366,52 @@ PyObject *pyLSsetCallback(PyObject *self, PyObject *args) {
 }
 
 
+/*
+* @brief Request (or clear) an interrupt of the solver running on pModel
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return int
+* @remark errorcode = lindo.set_interrupt(pModel,nFlag)
+* @remark Installs a callback relay without a Python callback if none is
+*         set yet, also when clearing. LINDO need not pick up a callback
+*         installed while it solves, so call set_interrupt(pModel,0) before
+*         the solve; a later request from any thread then only flips the
+*         flag of the installed relay.
+*/
+PyObject *pySetInterrupt(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    int errorcode = LSERR_NO_ERROR;
+    int nFlag = 1;
+    pLSmodel  pModel = NULL;
+    PyObject *pyModel = NULL;
+    pyLindoData_t *pyudata = NULL;
+
+    if (!pyParseArgs(args, nargs, "O|i",
+        &pyModel, //pModel
+        &nFlag)) {  //nFlag
+        return NULL;
+    }
+
+    CHECK_MODEL;
+    if (LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_CBFUN) == (void*)relayCallback)
+        pyudata = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_CBDATA);
+    if (!pyudata) {
+        pyudata = malloc(sizeof(pyLindoData_t));
+        memset(pyudata, 0, sizeof(pyLindoData_t));
+        pyudata->pModel = pModel;
+        pyudata->pyModel = pyModel;
+        errorcode = LSsetCallback(pModel
+            , relayCallback
+            , pyudata);
+        if (errorcode != 0) {
+            free(pyudata);
+            ERROR_SET(errorcode);
+        }
+    }
+    pyudata->interrupt = nFlag;
+
+    return Py_BuildValue("i", errorcode);
+}
+
 /*
 * @brief relayMIPCallback
 * @param[in,out] pModel
@@ -15817,30 +17422,34 @@ PyObject *pyLSsetCallback(PyObject *self, PyObject *args) {
 int LS_CALLTYPE relayMIPCallback(pLSmodel pModel, void *userdata, double dObjval, double *padPrimal)
 {
     int retvalue = 0;
+    int nVars;
     pyLindoData_t *pyudata = (pyLindoData_t*)userdata;
     PyObject *arglist = NULL;
     PyObject *result = NULL;
-    PyObject *pyPrimal = NULL;
-    {
-        int n_dim=1;
-        npy_intp dim[1] = { 0 };
-        LSgetInfo(pyudata->pModel, LS_IINFO_NUM_VARS, &dim[0]);
-        if (!dim[0]) return 0;
-        pyPrimal = PyArray_SimpleNewFromData(n_dim, dim, NPY_DOUBLE, (char*)padPrimal);
-        // Build up the argument list...
-        if (pyPrimal)
-            arglist = Py_BuildValue("(OOdO)", pyudata->pyModel, pyudata->mipData, dObjval, pyPrimal);
-        // ...for calling the Python cb function
-        if (arglist)
-            result = PyObject_CallObject (pyudata->mipFunc, arglist);
-    } /*if*/
+    PyGILState_STATE gstate;
+
+    gstate = PyGILState_Ensure();
+    nVars = pyRelayNumVars(pyudata);
+    if (!nVars) {
+        PyGILState_Release(gstate);
+        return 0;
+    }
+    // Build up the argument list...
+    arglist = pyRelayArgs(&pyudata->pyArgs, 4);
+    if (arglist && (
+        pyRelaySetRef(arglist, 0, pyudata->pyModel) ||
+        pyRelaySetRef(arglist, 1, pyudata->mipData) ||
+        pyRelaySetArg(arglist, 2, PyFloat_FromDouble(dObjval)) ||
+        pyRelaySetRef(arglist, 3, pyRelayView(&pyudata->pyPrimal, padPrimal, nVars, NPY_DOUBLE))))
+        arglist = NULL;
+    // ...for calling the Python cb function
+    if (arglist)
+        result = PyObject_CallObject (pyudata->mipFunc, arglist);
     if (result && PyLong_Check(result)) {
         retvalue = PyLong_AsLong(result);
     }
-    {
-        Py_XDECREF(result);
-        Py_DECREF(arglist);
-    }
+    Py_XDECREF(result);
+    PyGILState_Release(gstate);
 
     return retvalue;
 } /*relayMIPCallback*/
@@ -15851,33 +17460,48 @@ int LS_CALLTYPE relayMIPCallback(pLSmodel pModel, void *userdata, double dObjval
 * @param[in,out] args Pointer to args
 * @return int
 * @remark errorcode = lindo.LSsetMIPCallback(pModel,cbfun,cbdata)
+* @remark cbfun may also be a native MIP_callback_t (see pyGetNativeFunc),
+*         which LINDO then calls directly without entering the interpreter.
 */
-PyObject *pyLSsetMIPCallback(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetMIPCallback(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
+    void *pNativeFunc = NULL, *pNativeData = NULL;
+    int isNative = 0;
     pLSmodel  pModel = NULL;
     PyObject *pyModel = NULL;
     PyObject *pyObj[5];
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
-    pyLindoData_t *pyudata = NULL;
+    const char *osig = "i";
+    pyLindoData_t *pyudata = NULL, *pyOld = NULL;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
     memset(pyObj, 0, 5 * sizeof(PyObject*));
-    if (!PyArg_ParseTuple(args, "OOO",
+    if (!pyParseArgs(args, nargs, "OOO",
         &pyModel, //pModel
         &pyObj[2], //mipFunc
         &pyObj[3])) {  //mipData
         return NULL;
     }
 
-    if (!PyCallable_Check(pyObj[2])) {
+    isNative = pyGetNativeFunc(pyObj[2], &pNativeFunc);
+    if (isNative < 0)
+        return NULL;
+    if (!isNative && !PyCallable_Check(pyObj[2])) {
         PyErr_SetString(PyExc_TypeError, "Need a callable object!");
+        return NULL;
     }
     CHECK_MODEL;
-    pyudata = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_MIPDATA);
-    if (pyudata) {
-        free(pyudata);
+    if (LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_MIPFUN) == (void*)relayMIPCallback)
+        pyOld = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_MIPDATA);
+    if (isNative) {
+        if (pyGetNativeData(pyObj[3], &pNativeData) < 0)
+            return NULL;
+        errorcode = LSsetMIPCallback(pModel
+            , (MIP_callback_t)pNativeFunc
+            , pNativeData);
+        pyReplaceLindoData(errorcode, pyOld, NULL);
+        if (errorcode == LSERR_NO_ERROR)
+            pyKeepNativeFunc(pModel, LS_REF_MIPFUN, pyObj[2]);
+        return Py_BuildValue(osig, errorcode);
     }
     pyudata = malloc(sizeof(pyLindoData_t));
     memset(pyudata, 0, sizeof(pyLindoData_t));
@@ -15886,49 +17510,157 @@ PyObject *pyLSsetMIPCallback(PyObject *self, PyObject *args) {
         pyudata->pyModel = pyModel;
         pyudata->mipFunc = pyObj[2];
         pyudata->mipData = pyObj[3];
+        Py_XINCREF(pyObj[2]);
+        Py_XINCREF(pyObj[3]);
     }
 
     // Get C pointers
     errorcode = LSsetMIPCallback(pModel
         , relayMIPCallback
         , pyudata);
+    pyReplaceLindoData(errorcode, pyOld, pyudata);
+    if (errorcode == LSERR_NO_ERROR)
+        pyKeepNativeFunc(pModel, LS_REF_MIPFUN, NULL);
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
 
 }
 
+/*
+* @brief Answer a Funcalc request from the all-rows cache
+* @remark Calls Funcalc_func(pModel,FData,padPrimal,padRowVals) only when
+*         padPrimal differs from the cached point. padRowVals has nCons+1
+*         entries, the objective being the last one (padRowVals[-1]).
+* @remark The cache is filled and read with the GIL held. A request that
+*         arrives while the callback is filling it, from another solver
+*         thread or because the callback released the GIL, evaluates its
+*         point into a buffer of its own and leaves the cache alone.
+*/
+static int relayFuncalcBatch(pyLindoData_t *pyudata,
+    int nRow, double *padPrimal, double *pdFuncVal)
+{
+    int nerr = 0;
+    int nVars, nCons, isShared;
+    double *padVals;
+    PyObject *arglist = NULL;
+    PyObject *result = NULL;
+
+    nVars = pyRelayNumVars(pyudata);
+    nCons = pyudata->nCons;
+    if (!nVars) return 0;
+
+    isShared = !pyudata->isCacheBusy;
+    if (isShared) {
+        if (nVars != pyudata->nCacheVars || nCons != pyudata->nCacheRows) {
+            free(pyudata->padCachePrimal);
+            free(pyudata->padCacheVals);
+            pyudata->padCachePrimal = malloc(nVars * sizeof(double));
+            pyudata->padCacheVals = calloc(nCons + 1, sizeof(double));
+            pyudata->nCacheVars = nVars;
+            pyudata->nCacheRows = nCons;
+            pyudata->nCacheValid = 0;
+            if (!pyudata->padCachePrimal || !pyudata->padCacheVals) {
+                pyudata->nCacheVars = pyudata->nCacheRows = 0;
+                return LSERR_OUT_OF_MEMORY;
+            }
+        }
+        if (pyudata->nCacheValid &&
+            memcmp(pyudata->padCachePrimal, padPrimal, nVars * sizeof(double)) == 0) {
+            *pdFuncVal = pyudata->padCacheVals[nRow < 0 ? nCons : nRow];
+            return 0;
+        }
+        pyudata->nCacheValid = 0;
+        pyudata->isCacheBusy = 1;
+        padVals = pyudata->padCacheVals;
+        // Build up the argument list...
+        arglist = pyRelayArgs(&pyudata->pyArgs, 4);
+        if (arglist && (
+            pyRelaySetRef(arglist, 0, pyudata->pyModel) ||
+            pyRelaySetRef(arglist, 1, pyudata->FData) ||
+            pyRelaySetRef(arglist, 2, pyRelayView(&pyudata->pyPrimal, padPrimal, nVars, NPY_DOUBLE)) ||
+            pyRelaySetRef(arglist, 3, pyRelayView(&pyudata->pyRowVals, padVals, nCons + 1, NPY_DOUBLE))))
+            arglist = NULL;
+        Py_XINCREF(arglist);    //released below like a private tuple
+    } else {
+        npy_intp nLen[2] = { nVars, nCons + 1 };
+        padVals = calloc(nCons + 1, sizeof(double));
+        if (!padVals)
+            return LSERR_OUT_OF_MEMORY;
+        arglist = Py_BuildValue("(OONN)", pyudata->pyModel, pyudata->FData,
+            PyArray_SimpleNewFromData(1, &nLen[0], NPY_DOUBLE, padPrimal),
+            PyArray_SimpleNewFromData(1, &nLen[1], NPY_DOUBLE, padVals));
+    }
+    // ...for calling the Python cb function
+    if (arglist)
+        result = PyObject_CallObject(pyudata->Funcalc_func, arglist);
+    Py_XDECREF(arglist);
+    if (!result) {
+        PyErr_Print();
+        nerr = 1;
+    } else if (PyLong_Check(result)) {
+        nerr = PyLong_AsLong(result);
+    }
+    Py_XDECREF(result);
+
+    if (!nerr)
+        *pdFuncVal = padVals[nRow < 0 ? nCons : nRow];
+    if (isShared) {
+        if (!nerr) {
+            memcpy(pyudata->padCachePrimal, padPrimal, nVars * sizeof(double));
+            pyudata->nCacheValid = 1;
+        }
+        pyudata->isCacheBusy = 0;
+    } else
+        free(padVals);
+
+    return nerr;
+} /*relayFuncalcBatch*/
+
 int    LS_CALLTYPE relayFuncalc(pLSmodel pModel, void    *userdata,
     int      nRow, double  *padPrimal,
     int      nJDiff, double  dXJBase,
     double   *pdFuncVal, void  *pReserved)
 {
     int nerr = 0;
+    int nVars;
     pyLindoData_t *pyudata = (pyLindoData_t*)userdata;
     PyObject *arglist = NULL;
     PyObject *result = NULL;
     PyObject *pyPrimal = NULL;
-    PyObject *pyFuncVal = NULL;
-    {
-        int n_dim = 1;
-        npy_intp dim[2] = { 0, 1 };
-        LSgetInfo(pyudata->pModel, LS_IINFO_NUM_VARS, &dim[0]);
-        if (!dim[0]) return 0;
-        pyPrimal = PyArray_SimpleNewFromData(n_dim, dim, NPY_DOUBLE, (char*)padPrimal);
-        pyFuncVal = PyArray_SimpleNewFromData(n_dim, &dim[1], NPY_DOUBLE, (char*)pdFuncVal);
-        // Build up the argument list...
-        if (pyPrimal)
-            arglist = Py_BuildValue("(OOiOidOO)", pyudata->pyModel, pyudata->FData, nRow, pyPrimal, nJDiff, dXJBase, pyFuncVal, pyPrimal);
-        // ...for calling the Python cb function
-        if (arglist)
-            result = PyObject_CallObject (pyudata->Funcalc_func, arglist);
-    } /*if*/
+    PyGILState_STATE gstate;
+
+    gstate = PyGILState_Ensure();
+    if (pyudata->nFuncBatch) {
+        nerr = relayFuncalcBatch(pyudata, nRow, padPrimal, pdFuncVal);
+        PyGILState_Release(gstate);
+        return nerr;
+    }
+    nVars = pyRelayNumVars(pyudata);
+    if (!nVars) {
+        PyGILState_Release(gstate);
+        return 0;
+    }
+    pyPrimal = pyRelayView(&pyudata->pyPrimal, padPrimal, nVars, NPY_DOUBLE);
+    // Build up the argument list...
+    arglist = pyRelayArgs(&pyudata->pyArgs, 8);
+    if (arglist && (
+        pyRelaySetRef(arglist, 0, pyudata->pyModel) ||
+        pyRelaySetRef(arglist, 1, pyudata->FData) ||
+        pyRelaySetArg(arglist, 2, PyLong_FromLong(nRow)) ||
+        pyRelaySetRef(arglist, 3, pyPrimal) ||
+        pyRelaySetArg(arglist, 4, PyLong_FromLong(nJDiff)) ||
+        pyRelaySetArg(arglist, 5, PyFloat_FromDouble(dXJBase)) ||
+        pyRelaySetRef(arglist, 6, pyRelayView(&pyudata->pyFuncVal, pdFuncVal, 1, NPY_DOUBLE)) ||
+        pyRelaySetRef(arglist, 7, pyPrimal)))
+        arglist = NULL;
+    // ...for calling the Python cb function
+    if (arglist)
+        result = PyObject_CallObject (pyudata->Funcalc_func, arglist);
     if (result && PyLong_Check(result)) {
         nerr = PyLong_AsLong(result);
     }
-    {
-        Py_XDECREF(result);
-        Py_DECREF(arglist);
-    }
+    Py_XDECREF(result);
+    PyGILState_Release(gstate);
 
     return nerr;
 } /*Funcalc8*/
@@ -15938,34 +17670,52 @@ int    LS_CALLTYPE relayFuncalc(pLSmodel pModel, void    *userdata,
   * @param[in,out] self Pointer to self
   * @param[in,out] args Pointer to args
   * @return int
-  * @remark errorcode = lindo.LSsetFuncalc(pModel,funcalc8,cbdata)
+  * @remark errorcode = lindo.LSsetFuncalc(pModel,funcalc8,cbdata[,nBatch])
+  * @remark With nBatch=1, funcalc8(pModel,cbdata,padPrimal,padRowVals) fills
+  *         all nCons+1 row values (objective last) of a point in one call;
+  *         per-row requests for the same point are answered from a cache.
+  * @remark funcalc8 may also be a native Funcalc_type (see pyGetNativeFunc).
   */
-PyObject *pyLSsetFuncalc(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetFuncalc(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(5);
+    void *pNativeFunc = NULL, *pNativeData = NULL;
+    int isNative = 0;
     pLSmodel  pModel = NULL;
     PyObject *pyModel = NULL;
     PyObject *pyObj[5];
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
-    pyLindoData_t *pyudata = NULL;
+    const char *osig = "i";
+    pyLindoData_t *pyudata = NULL, *pyOld = NULL;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
     memset(pyObj, 0, 5 * sizeof(PyObject*));
-    if (!PyArg_ParseTuple(args, "OOO",
+    if (!pyParseArgs(args, nargs, "OOO|i",
         &pyModel, //pModel
         &pyObj[2], //Funcalc_func
-        &pyObj[3])) {  //FData
+        &pyObj[3], //FData
+        &ibuf[4])) {  //nBatch
         return NULL;
     }
 
-    if (!PyCallable_Check(pyObj[2])) {
+    isNative = pyGetNativeFunc(pyObj[2], &pNativeFunc);
+    if (isNative < 0)
+        return NULL;
+    if (!isNative && !PyCallable_Check(pyObj[2])) {
         PyErr_SetString(PyExc_TypeError, "Need a callable object!");
+        return NULL;
     }
     CHECK_MODEL;
-    pyudata = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_FDATA);
-    if (pyudata) {
-        free(pyudata);
+    if (LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_FUNCALC) == (void*)relayFuncalc)
+        pyOld = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_FDATA);
+    if (isNative) {
+        if (pyGetNativeData(pyObj[3], &pNativeData) < 0)
+            return NULL;
+        errorcode = LSsetFuncalc(pModel
+            , (Funcalc_type)pNativeFunc
+            , pNativeData);
+        pyReplaceLindoData(errorcode, pyOld, NULL);
+        if (errorcode == LSERR_NO_ERROR)
+            pyKeepNativeFunc(pModel, LS_REF_FUNCALC, pyObj[2]);
+        return Py_BuildValue(osig, errorcode);
     }
     pyudata = malloc(sizeof(pyLindoData_t));
     memset(pyudata, 0, sizeof(pyLindoData_t));
@@ -15974,12 +17724,18 @@ PyObject *pyLSsetFuncalc(PyObject *self, PyObject *args) {
         pyudata->pyModel = pyModel;
         pyudata->Funcalc_func = pyObj[2];
         pyudata->FData = pyObj[3];
+        Py_XINCREF(pyObj[2]);
+        Py_XINCREF(pyObj[3]);
+        pyudata->nFuncBatch = ibuf[4];
     }
 
     // Get C pointers
     errorcode = LSsetFuncalc(pModel
         , relayFuncalc
         , pyudata);
+    pyReplaceLindoData(errorcode, pyOld, pyudata);
+    if (errorcode == LSERR_NO_ERROR)
+        pyKeepNativeFunc(pModel, LS_REF_FUNCALC, NULL);
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
 
@@ -15992,39 +17748,40 @@ int    LS_CALLTYPE relayGradcalc(pLSmodel pModel, void *userdata,
     int *parlist, double *partial)
 {
     int nerr = 0;
+    int nVars;
     pyLindoData_t *pyudata = (pyLindoData_t*)userdata;
     PyObject *arglist = NULL;
     PyObject *result = NULL;
-    PyObject *pyPrimal = NULL;
-    PyObject *pyLB = NULL;
-    PyObject *pyUB = NULL;
-    PyObject *pyPartial = NULL;
-    PyObject *pyParlist = NULL;
-    {
-        int n_dim = 1;
-        npy_intp dim[2] = { 0, 0 };
-        LSgetInfo(pyudata->pModel, LS_IINFO_NUM_VARS, &dim[0]);
-        if (!dim[0]) return 0;
-        pyPrimal = PyArray_SimpleNewFromData(n_dim, dim, NPY_DOUBLE, (char*)padPrimal);
-        pyLB = PyArray_SimpleNewFromData(n_dim, dim, NPY_DOUBLE, (char*)lb);
-        pyUB = PyArray_SimpleNewFromData(n_dim, dim, NPY_DOUBLE, (char*)ub);
-        dim[1] = nNPar;
-        pyPartial = PyArray_SimpleNewFromData(n_dim, &dim[1], NPY_DOUBLE, (char*)partial);
-        pyParlist = PyArray_SimpleNewFromData(n_dim, &dim[1], NPY_INT32, (char*)parlist);
-        // Build up the argument list...
-        if (pyPrimal)
-            arglist = Py_BuildValue("(OOiOOOiiOO)", pyudata->pyModel, pyudata->GData, nRow, pyPrimal, pyLB, pyUB, nNewPnt, nNPar, pyParlist, pyPartial);
-        // ...for calling the Python cb function
-        if (arglist)
-            result = PyObject_CallObject (pyudata->Grad_func, arglist);
-    } /*if*/
+    PyGILState_STATE gstate;
+
+    gstate = PyGILState_Ensure();
+    nVars = pyRelayNumVars(pyudata);
+    if (!nVars) {
+        PyGILState_Release(gstate);
+        return 0;
+    }
+    // Build up the argument list...
+    arglist = pyRelayArgs(&pyudata->pyArgs, 10);
+    if (arglist && (
+        pyRelaySetRef(arglist, 0, pyudata->pyModel) ||
+        pyRelaySetRef(arglist, 1, pyudata->GData) ||
+        pyRelaySetArg(arglist, 2, PyLong_FromLong(nRow)) ||
+        pyRelaySetRef(arglist, 3, pyRelayView(&pyudata->pyPrimal, padPrimal, nVars, NPY_DOUBLE)) ||
+        pyRelaySetRef(arglist, 4, pyRelayView(&pyudata->pyLB, lb, nVars, NPY_DOUBLE)) ||
+        pyRelaySetRef(arglist, 5, pyRelayView(&pyudata->pyUB, ub, nVars, NPY_DOUBLE)) ||
+        pyRelaySetArg(arglist, 6, PyLong_FromLong(nNewPnt)) ||
+        pyRelaySetArg(arglist, 7, PyLong_FromLong(nNPar)) ||
+        pyRelaySetRef(arglist, 8, pyRelayView(&pyudata->pyParlist, parlist, nNPar, NPY_INT32)) ||
+        pyRelaySetRef(arglist, 9, pyRelayView(&pyudata->pyPartial, partial, nNPar, NPY_DOUBLE))))
+        arglist = NULL;
+    // ...for calling the Python cb function
+    if (arglist)
+        result = PyObject_CallObject (pyudata->Grad_func, arglist);
     if (result && PyLong_Check(result)) {
         nerr = PyLong_AsLong(result);
     }
-    {
-        Py_XDECREF(result);
-        Py_DECREF(arglist);
-    }
+    Py_XDECREF(result);
+    PyGILState_Release(gstate);
 
     return nerr;
 }
@@ -16034,35 +17791,52 @@ int    LS_CALLTYPE relayGradcalc(pLSmodel pModel, void *userdata,
 * @param[in,out] args Pointer to args
 * @return int
 * @remark errorcode = lindo.LSsetGradcalc(pModel,gradCalc,cbdata,nLenUseGrad,pnUseGrad)
+* @remark gradCalc may also be a native Gradcalc_type (see pyGetNativeFunc).
 */
-PyObject *pyLSsetGradcalc(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetGradcalc(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(6);
+    void *pNativeFunc = NULL, *pNativeData = NULL;
+    int isNative = 0;
     pLSmodel  pModel = NULL;
     PyObject *pyModel = NULL;
     PyObject *pyObj[5];
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
-    pyLindoData_t *pyudata = NULL;
+    const char *osig = "i";
+    pyLindoData_t *pyudata = NULL, *pyOld = NULL;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
     memset(pyObj, 0, 5 * sizeof(PyObject*));
-    if (!PyArg_ParseTuple(args, "OOO",
+    if (!pyParseArgs(args, nargs, "OOO|iN",
         &pyModel, //pModel
         &pyObj[2], //Grad_func
         &pyObj[3], //GData
         &ibuf[4],
-        &PyArray_Type, &pyArr[5])) {
+        &pyArr[5])) {
         return NULL;
     }
 
-    if (!PyCallable_Check(pyObj[2])) {
+    isNative = pyGetNativeFunc(pyObj[2], &pNativeFunc);
+    if (isNative < 0)
+        return NULL;
+    if (!isNative && !PyCallable_Check(pyObj[2])) {
         PyErr_SetString(PyExc_TypeError, "Need a callable object!");
+        return NULL;
     }
     CHECK_MODEL;
-    pyudata = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_GDATA);
-    if (pyudata) {
-        free(pyudata);
+    if (LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_GRADCALC) == (void*)relayGradcalc)
+        pyOld = (pyLindoData_t*)LSgetObjHandle(pModel, LS_PTR_MODEL, LS_REF_GDATA);
+    if (isNative) {
+        if (pyGetNativeData(pyObj[3], &pNativeData) < 0)
+            return NULL;
+        I_GET_VECPTR(5);
+        errorcode = LSsetGradcalc(pModel
+            , (Gradcalc_type)pNativeFunc
+            , pNativeData
+            , ibuf[4]
+            , ivecptr[5]);
+        pyReplaceLindoData(errorcode, pyOld, NULL);
+        if (errorcode == LSERR_NO_ERROR)
+            pyKeepNativeFunc(pModel, LS_REF_GRADCALC, pyObj[2]);
+        return Py_BuildValue(osig, errorcode);
     }
     pyudata = malloc(sizeof(pyLindoData_t));
     memset(pyudata, 0, sizeof(pyLindoData_t));
@@ -16071,6 +17845,8 @@ PyObject *pyLSsetGradcalc(PyObject *self, PyObject *args) {
         pyudata->pyModel = pyModel;
         pyudata->Grad_func = pyObj[2];
         pyudata->GData = pyObj[3];
+        Py_XINCREF(pyObj[2]);
+        Py_XINCREF(pyObj[3]);
     }
 
     // Get C pointers
@@ -16081,6 +17857,9 @@ PyObject *pyLSsetGradcalc(PyObject *self, PyObject *args) {
         , pyudata
         , ibuf[4]
         , ivecptr[5]);
+    pyReplaceLindoData(errorcode, pyOld, pyudata);
+    if (errorcode == LSERR_NO_ERROR)
+        pyKeepNativeFunc(pModel, LS_REF_GRADCALC, NULL);
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
 
@@ -16098,6 +17877,10 @@ void LS_CALLTYPE relayEnvLogfunc(pLSenv pEnv, char *line, void *userdata)
     pyLindoData_t *pyudata = (pyLindoData_t*)userdata;
     PyObject *arglist = NULL;
     PyObject *result = NULL;
+    PyGILState_STATE gstate;
+
+    // the solver may call back with the GIL released (or from its own threads)
+    gstate = PyGILState_Ensure();
     if (line)
     {
         // Build up the argument list...
@@ -16110,6 +17893,7 @@ void LS_CALLTYPE relayEnvLogfunc(pLSenv pEnv, char *line, void *userdata)
 
     Py_XDECREF(result);
     Py_DECREF(arglist);
+    PyGILState_Release(gstate);
 
     return;
 } /*relayEnvLogfunc*/
@@ -16121,19 +17905,17 @@ void LS_CALLTYPE relayEnvLogfunc(pLSenv pEnv, char *line, void *userdata)
   * @return int
   * @remark errorcode = lindo.LSsetEnvLogfunc(pEnv,cbfun,cbdata)
   */
-PyObject *pyLSsetEnvLogfunc(PyObject *self, PyObject *args) {
-    DCL_BUF(20);
+PyObject *pyLSsetEnvLogfunc(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+    DCL_BUF(1);
     pLSenv  pEnv = NULL;
     PyObject *pyEnv = NULL;
     PyObject *pyObj[5];
     npy_intp  index[1] = { 0 };
-    char osig[255] = "i";
-    pyLindoData_t *pyudata = NULL;
+    const char *osig = "i";
+    pyLindoData_t *pyudata = NULL, *pyOld = NULL;
 
-    // zero-out temp vectors
-    ZERO_BUF(20);
     memset(pyObj, 0, 5 * sizeof(PyObject*));
-    if (!PyArg_ParseTuple(args, "OOO",
+    if (!pyParseArgs(args, nargs, "OOO",
         &pyEnv, //pEnv
         &pyObj[2], //locFunc
         &pyObj[3])) {  //locData
@@ -16142,12 +17924,11 @@ PyObject *pyLSsetEnvLogfunc(PyObject *self, PyObject *args) {
 
     if (!PyCallable_Check(pyObj[2])) {
         PyErr_SetString(PyExc_TypeError, "Need a callable object!");
+        return NULL;
     }
     CHECK_ENV;
-    pyudata = (pyLindoData_t*)LSgetObjHandle(pEnv, LS_PTR_ENV, LS_REF_LOCDATA);
-    if (pyudata) {
-        free(pyudata);
-    }
+    if (LSgetObjHandle(pEnv, LS_PTR_ENV, LS_REF_LOCFUN) == (void*)relayEnvLogfunc)
+        pyOld = (pyLindoData_t*)LSgetObjHandle(pEnv, LS_PTR_ENV, LS_REF_LOCDATA);
     pyudata = malloc(sizeof(pyLindoData_t));
     memset(pyudata, 0, sizeof(pyLindoData_t));
     if (pyObj[2]) {
@@ -16155,18 +17936,55 @@ PyObject *pyLSsetEnvLogfunc(PyObject *self, PyObject *args) {
         pyudata->pyEnv = pyEnv;
         pyudata->locFunc = pyObj[2];
         pyudata->locData = pyObj[3];
+        Py_XINCREF(pyObj[2]);
+        Py_XINCREF(pyObj[3]);
     }
 
     // Get C pointers
     errorcode = LSsetEnvLogfunc(pEnv
         , relayEnvLogfunc
         , pyudata);
+    pyReplaceLindoData(errorcode, pyOld, pyudata);
 
     //ErrorReturn:
     return Py_BuildValue(osig, errorcode);
 
 }
 
+/*
+* @brief Release the context of a callback set on pObj through pRelay
+* @remark The user data of native callbacks is owned by the caller and kept.
+*/
+static void pyReleaseLindoData(void *pObj, int nObjType, int nRefFunc, int nRefData, void *pRelay)
+{
+    if (LSgetObjHandle(pObj, nObjType, nRefFunc) == pRelay)
+        pyFreeLindoData((pyLindoData_t*)LSgetObjHandle(pObj, nObjType, nRefData));
+}
+
+/*
+* @brief Release the callback contexts of a model about to be deleted, and
+*        the objects behind its native callbacks
+*/
+static void pyReleaseModelData(pLSmodel pModel)
+{
+    pyReleaseLindoData(pModel, LS_PTR_MODEL, LS_REF_LOCFUN, LS_REF_LOCDATA, (void*)relayModelLogfunc);
+    pyReleaseLindoData(pModel, LS_PTR_MODEL, LS_REF_CBFUN, LS_REF_CBDATA, (void*)relayCallback);
+    pyReleaseLindoData(pModel, LS_PTR_MODEL, LS_REF_MIPFUN, LS_REF_MIPDATA, (void*)relayMIPCallback);
+    pyReleaseLindoData(pModel, LS_PTR_MODEL, LS_REF_FUNCALC, LS_REF_FDATA, (void*)relayFuncalc);
+    pyReleaseLindoData(pModel, LS_PTR_MODEL, LS_REF_GRADCALC, LS_REF_GDATA, (void*)relayGradcalc);
+    pyKeepNativeFunc(pModel, LS_REF_MIPFUN, NULL);
+    pyKeepNativeFunc(pModel, LS_REF_FUNCALC, NULL);
+    pyKeepNativeFunc(pModel, LS_REF_GRADCALC, NULL);
+}
+
+/*
+* @brief Release the callback context of an environment about to be deleted
+*/
+static void pyReleaseEnvData(pLSenv pEnv)
+{
+    pyReleaseLindoData(pEnv, LS_PTR_ENV, LS_REF_LOCFUN, LS_REF_LOCDATA, (void*)relayEnvLogfunc);
+}
+
 /*
 * @brief LSgetObjPoolParam
 * @param[in,out] self Pointer to self
@@ -16174,27 +17992,23 @@ PyObject *pyLSsetEnvLogfunc(PyObject *self, PyObject *args) {
 * @return int
 * @remark errorcode = lindo.LSgetObjPoolParam(pModel,nObjIndex,mParam,pdValue)
 */
-PyObject *pyLSgetObjPoolParam(PyObject *self, PyObject *args) {
-  DCL_BUF(20);
+PyObject *pyLSgetObjPoolParam(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {
+  DCL_BUF(5);
   pLSmodel     pModel = NULL;
   PyObject *pyModel = NULL;
   npy_intp  index[1] = { 0 };
-  char osig[255] = "i";
+  const char *osig = "i";
 
-  // zero-out temp vectors
-  ZERO_BUF(20);
 
-  if (!PyArg_ParseTuple(args, "OiiO!",
+  if (!pyParseArgs(args, nargs, "OiiD*",
     &pyModel, //pModel
     &ibuf[2], //nObjIndex
     &ibuf[3], //mParam
-    &PyArray_Type, &pyArr[4])) {  //*pdValue
+    &pyArr[4])) {  //*pdValue
     return NULL;
   }
 
   CHECK_MODEL;
-  LSgetInfo(pModel, LS_IINFO_NUM_VARS, &n);
-  LSgetInfo(pModel, LS_IINFO_NUM_CONS, &m);
 
 
 
@@ -16226,7 +18040,7 @@ PyObject *pyLSgetObjPoolParam(PyObject *self, PyObject *args) {
  * @return Error code.
  *
  */
-PyObject *pyLSloadIndData(PyObject *self, PyObject *args){
+PyObject *pyLSloadIndData(PyObject *self, PyObject *const *args, Py_ssize_t nargs){
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
     int       nIndicRows;
@@ -16236,19 +18050,23 @@ PyObject *pyLSloadIndData(PyObject *self, PyObject *args){
     PyArrayObject  *pyIndicRows,*pyIndicCols,*pyIndicVals;
 
 
-    if (!PyArg_ParseTuple(args, "OiO!O!O!",
+    if (!pyParseArgs(args, nargs, "OiNNN",
                                  &pyModel,
                                  &nIndicRows,
-                                 &PyArray_Type,&pyIndicRows,
-                                 &PyArray_Type,&pyIndicCols,
-                                 &PyArray_Type,&pyIndicVals
+                                 &pyIndicRows,
+                                 &pyIndicCols,
+                                 &pyIndicVals
                            ))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nIndicRows", nIndicRows, 3, pyIndicRows, pyIndicCols, pyIndicVals))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyIndicRows && PyArray_DIMS(pyIndicRows) > 0)
         paiIndicRows = (int *)PyArray_DATA(pyIndicRows);
@@ -16280,7 +18098,7 @@ PyObject *pyLSloadIndData(PyObject *self, PyObject *args){
   * @return Error code.
   * @remark None
   */
-PyObject *pyLSdeleteIndConstraints(PyObject *self, PyObject *args){
+PyObject *pyLSdeleteIndConstraints(PyObject *self, PyObject *const *args, Py_ssize_t nargs){
     int       errorcode = LSERR_NO_ERROR;
     pLSmodel  pModel;
     int       nCons;
@@ -16289,16 +18107,20 @@ PyObject *pyLSdeleteIndConstraints(PyObject *self, PyObject *args){
     PyObject       *pyModel;
     PyArrayObject  *pyCons = NULL;
 
-    if (!PyArg_ParseTuple(args, "OiO!",
+    if (!pyParseArgs(args, nargs, "OiN",
                                  &pyModel,
                                  &nCons,
-                                 &PyArray_Type,&pyCons))
+                                 &pyCons))
 
     {
         return NULL;
     }
 
+    if (!pyArgLen("nCons", nCons, 1, pyCons))
+        return NULL;
+
     CHECK_MODEL;
+    pyResetModelDims(pModel);
 
     if(pyCons && PyArray_DIMS(pyCons) > 0) paiCons = (int *)PyArray_DATA(pyCons);
 
@@ -16313,3 +18135,2192 @@ PyObject *pyLSdeleteIndConstraints(PyObject *self, PyObject *args){
     return Py_BuildValue("i",errorcode);
 }
 
+
+/*********************************************************************
+ *      Batch Solve Interface                                        *
+ *********************************************************************/
+typedef struct lsBatchJob_t {
+    pLSmodel pModel;
+    int      nVars;
+    int      errorcode;
+    int      status;
+    double   objval;
+    double   walltime;
+    double   *padPrimal;
+} lsBatchJob_t;
+
+typedef struct lsBatchPool_t {
+    lsBatchJob_t *jobs;
+    int          nJobs;
+    int          nNext;
+    int          nMethod;
+    ls_mutex_t   lock;
+} lsBatchPool_t;
+
+/*
+ * Solve a single job. MIP models (with binary or general integer
+ * variables) go through LSsolveMIP, everything else through LSoptimize.
+ */
+static void lsSolveBatchJob(lsBatchJob_t *job, int nMethod)
+{
+    int nInt = 0, nBin = 0;
+    double t0 = lsWallTime();
+
+    job->status = LS_STATUS_UNKNOWN;
+    job->objval = NAN;
+    job->errorcode = LSgetInfo(job->pModel, LS_IINFO_NUM_INT, &nInt);
+    if (!job->errorcode)
+        job->errorcode = LSgetInfo(job->pModel, LS_IINFO_NUM_BIN, &nBin);
+    if (job->errorcode)
+        goto Done;
+
+    if (nInt + nBin > 0) {
+        job->errorcode = LSsolveMIP(job->pModel, &job->status);
+        if (!job->errorcode)
+            job->errorcode = LSgetInfo(job->pModel, LS_DINFO_MIP_OBJ, &job->objval);
+        if (!job->errorcode && job->nVars > 0)
+            job->errorcode = LSgetMIPPrimalSolution(job->pModel, job->padPrimal);
+    } else {
+        job->errorcode = LSoptimize(job->pModel, nMethod, &job->status);
+        if (!job->errorcode)
+            job->errorcode = LSgetInfo(job->pModel, LS_DINFO_POBJ, &job->objval);
+        if (!job->errorcode && job->nVars > 0)
+            job->errorcode = LSgetPrimalSolution(job->pModel, job->padPrimal);
+    }
+
+Done:
+    job->walltime = lsWallTime() - t0;
+}
+
+static LS_THREAD_RETURN lsSolveBatchWorker(void *arg)
+{
+    lsBatchPool_t *pool = (lsBatchPool_t*)arg;
+    int k;
+
+    for (;;) {
+        LS_MUTEX_LOCK(&pool->lock);
+        k = pool->nNext++;
+        LS_MUTEX_UNLOCK(&pool->lock);
+        if (k >= pool->nJobs)
+            break;
+        lsSolveBatchJob(&pool->jobs[k], pool->nMethod);
+    }
+    return 0;
+}
+
+static int lsComparePtr(const void *a, const void *b)
+{
+    const char *pa = *(const char **)a, *pb = *(const char **)b;
+    return (pa > pb) - (pa < pb);
+}
+
+/*
+* @brief Solve a batch of independent models on a native thread pool
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return dict
+* @remark res = lindo.solve_batch(models,method,nthreads)
+*/
+PyObject *pySolveBatch(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"models", "method", "nthreads", NULL};
+    int           errorcode = LSERR_NO_ERROR;
+    int           nMethod = LS_METHOD_FREE, nThreads = 1;
+    int           nJobs = 0, nMaxVars = 0, nStarted = 0, i, k;
+    npy_intp      dims[2];
+    lsBatchJob_t  *jobs = NULL;
+    lsBatchPool_t pool;
+    ls_thread_t   *threads = NULL;
+    void          **sorted = NULL;
+
+    PyObject      *pyModels = NULL, *pySeq = NULL, *pyResult = NULL;
+    PyArrayObject *pyErrorCode = NULL, *pyStatus = NULL, *pyObjval = NULL;
+    PyArrayObject *pyWalltime = NULL, *pyPrimal = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|ii", kwlist,
+                                     &pyModels,
+                                     &nMethod,
+                                     &nThreads))
+    {
+        return NULL;
+    }
+
+    pySeq = PySequence_Fast(pyModels, "models must be a sequence of model objects");
+    if (!pySeq)
+        return NULL;
+    nJobs = (int)PySequence_Fast_GET_SIZE(pySeq);
+
+    jobs = (lsBatchJob_t*)calloc(nJobs > 0 ? nJobs : 1, sizeof(lsBatchJob_t));
+    sorted = (void**)calloc(nJobs > 0 ? nJobs : 1, sizeof(void*));
+    if (!jobs || !sorted) {
+        PyErr_NoMemory();
+        goto ErrorReturn;
+    }
+
+    for (k = 0; k < nJobs; k++) {
+        pLSmodel pModel = PyGetObjPtr(PySequence_Fast_GET_ITEM(pySeq, k));
+        if (pModel == NULL) {
+            errorcode = LSERR_ILLEGAL_NULL_POINTER;
+            PyErr_Clear();
+            PyErr_Format(PyExc_TypeError, "models[%d] is not a valid model object", k);
+            goto ErrorReturn;
+        }
+        if (pyModBatchCheck("solve_batch", PySequence_Fast_GET_ITEM(pySeq, k)) < 0)
+            goto ErrorReturn;
+        jobs[k].pModel = pModel;
+        sorted[k] = pModel;
+        errorcode = LSgetInfo(pModel, LS_IINFO_NUM_VARS, &jobs[k].nVars);
+        if (errorcode) {
+            char errStr[] = "Failed to query model dimensions";
+            Py_DECREF(pySeq);
+            free(jobs);
+            free(sorted);
+            LINDO_EXCEPTION(errorcode, errStr);
+        }
+        if (jobs[k].nVars > nMaxVars)
+            nMaxVars = jobs[k].nVars;
+    }
+
+    // the same model cannot be solved by two workers at once
+    qsort(sorted, nJobs, sizeof(void*), lsComparePtr);
+    for (k = 1; k < nJobs; k++) {
+        if (sorted[k] == sorted[k - 1]) {
+            PyErr_SetString(PyExc_ValueError, "models must not contain the same model twice");
+            goto ErrorReturn;
+        }
+    }
+
+    dims[0] = nJobs;
+    dims[1] = nMaxVars;
+    pyErrorCode = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_INT32);
+    pyStatus = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_INT32);
+    pyObjval = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    pyWalltime = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    pyPrimal = (PyArrayObject*)PyArray_SimpleNew(2, dims, NPY_DOUBLE);
+    if (!pyErrorCode || !pyStatus || !pyObjval || !pyWalltime || !pyPrimal)
+        goto ErrorReturn;
+
+    for (k = 0; k < nJobs; k++) {
+        double *row = (double*)PyArray_GETPTR2(pyPrimal, k, 0);
+        for (i = 0; i < nMaxVars; i++)
+            row[i] = NAN;
+        jobs[k].padPrimal = row;
+    }
+
+    if (nThreads < 1)
+        nThreads = 1;
+    if (nThreads > nJobs)
+        nThreads = nJobs;
+
+    pool.jobs = jobs;
+    pool.nJobs = nJobs;
+    pool.nNext = 0;
+    pool.nMethod = nMethod;
+    LS_MUTEX_INIT(&pool.lock);
+
+    Py_BEGIN_ALLOW_THREADS
+    if (nThreads > 1)
+        threads = (ls_thread_t*)calloc(nThreads - 1, sizeof(ls_thread_t));
+    if (threads) {
+        for (nStarted = 0; nStarted < nThreads - 1; nStarted++) {
+            if (LS_THREAD_CREATE(&threads[nStarted], lsSolveBatchWorker, &pool) != 0)
+                break;
+        }
+    }
+    // the calling thread works the queue as well
+    lsSolveBatchWorker(&pool);
+    for (k = 0; k < nStarted; k++)
+        LS_THREAD_JOIN(threads[k]);
+    free(threads);
+    Py_END_ALLOW_THREADS
+
+    LS_MUTEX_DESTROY(&pool.lock);
+
+    for (k = 0; k < nJobs; k++) {
+        *(int*)PyArray_GETPTR1(pyErrorCode, k) = jobs[k].errorcode;
+        *(int*)PyArray_GETPTR1(pyStatus, k) = jobs[k].status;
+        *(double*)PyArray_GETPTR1(pyObjval, k) = jobs[k].objval;
+        *(double*)PyArray_GETPTR1(pyWalltime, k) = jobs[k].walltime;
+    }
+
+    pyResult = Py_BuildValue("{sNsNsNsNsN}",
+                             "errorcode", pyErrorCode,
+                             "status", pyStatus,
+                             "objective", pyObjval,
+                             "primal", pyPrimal,
+                             "walltime", pyWalltime);
+    pyErrorCode = pyStatus = pyObjval = pyPrimal = pyWalltime = NULL;
+
+ErrorReturn:
+    Py_XDECREF(pyErrorCode);
+    Py_XDECREF(pyStatus);
+    Py_XDECREF(pyObjval);
+    Py_XDECREF(pyWalltime);
+    Py_XDECREF(pyPrimal);
+    Py_XDECREF(pySeq);
+    free(jobs);
+    free(sorted);
+    return pyResult;
+}
+
+/*
+* Solution vectors get_solution can return, in the order they are laid out
+* in the shared buffer (doubles first so every view stays aligned)
+*/
+enum {
+    LS_SOL_PRIMAL,
+    LS_SOL_DUAL,
+    LS_SOL_SLACKS,
+    LS_SOL_REDCOSTS,
+    LS_SOL_BASIS,
+    LS_SOL_NFIELDS
+};
+
+static const char *lsSolutionFields[LS_SOL_NFIELDS] = {
+    "primal", "dual", "slacks", "redcosts", "basis"
+};
+
+/*
+* @brief 1-D view of len items of the given type at byte offset of pyBuf
+* @return New reference, or NULL with an exception set
+*/
+static PyObject *pyBufferView(PyArrayObject *pyBuf, npy_intp offset, npy_intp len, int type)
+{
+    PyObject *pyView = PyArray_New(&PyArray_Type, 1, &len, type, NULL,
+                                   PyArray_BYTES(pyBuf) + offset, type == NPY_STRING ? 1 : 0,
+                                   NPY_ARRAY_CARRAY, NULL);
+    if (!pyView)
+        return NULL;
+    Py_INCREF(pyBuf);
+    if (PyArray_SetBaseObject((PyArrayObject*)pyView, (PyObject*)pyBuf) < 0) {
+        Py_DECREF(pyView);
+        return NULL;
+    }
+    return pyView;
+}
+
+/*
+* @brief Fetch status, objective and solution vectors of a model in one call
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return dict
+* @remark sol = lindo.get_solution(pModel,kind,fields)
+*/
+PyObject *pyGetSolution(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"model", "kind", "fields", NULL};
+    int           errorcode = LSERR_NO_ERROR;
+    int           nVars = 0, nCons = 0, nStatus = 0, k, f;
+    int           want[LS_SOL_NFIELDS] = {0};
+    int           iStatus, iObj;
+    double        dObj = 0.0;
+    const char    *szKind = "lp";
+    char          *pBytes;
+    npy_intp      nBytes, offset[LS_SOL_NFIELDS + 1] = {0};
+    pLSmodel      pModel;
+
+    PyObject      *pyModel = NULL, *pyFields = NULL, *pySeq = NULL, *pyResult = NULL;
+    PyObject      *pyView = NULL;
+    PyArrayObject *pyBuf = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|sO", kwlist,
+                                     &pyModel,
+                                     &szKind,
+                                     &pyFields))
+    {
+        return NULL;
+    }
+
+    CHECK_MODEL;
+
+    if (!strcmp(szKind, "lp")) {
+        iStatus = LS_IINFO_MODEL_STATUS;
+        iObj = LS_DINFO_POBJ;
+    } else if (!strcmp(szKind, "mip")) {
+        iStatus = LS_IINFO_MIP_STATUS;
+        iObj = LS_DINFO_MIP_OBJ;
+    } else if (!strcmp(szKind, "gop")) {
+        iStatus = LS_IINFO_GOP_STATUS;
+        iObj = LS_DINFO_GOP_OBJ;
+    } else {
+        PyErr_Format(PyExc_ValueError, "kind must be 'lp', 'mip' or 'gop', not '%s'", szKind);
+        return NULL;
+    }
+
+    if (!pyFields || pyFields == Py_None) {
+        for (f = 0; f < LS_SOL_BASIS; f++)
+            want[f] = 1;
+    } else {
+        if (PyUnicode_Check(pyFields))
+            pySeq = PyTuple_Pack(1, pyFields);
+        else
+            pySeq = PySequence_Fast(pyFields, "fields must be a field name or a sequence of them");
+        if (!pySeq)
+            return NULL;
+        for (k = 0; k < PySequence_Fast_GET_SIZE(pySeq); k++) {
+            const char *szField = PyUnicode_AsUTF8(PySequence_Fast_GET_ITEM(pySeq, k));
+            if (!szField)
+                goto ErrorReturn;
+            for (f = 0; f < LS_SOL_NFIELDS; f++)
+                if (!strcmp(szField, lsSolutionFields[f]))
+                    break;
+            if (f == LS_SOL_NFIELDS) {
+                PyErr_Format(PyExc_ValueError,
+                    "unknown field '%s', expected primal, dual, slacks, redcosts or basis", szField);
+                goto ErrorReturn;
+            }
+            want[f] = 1;
+        }
+    }
+
+    errorcode = pyGetModelDims(pModel, &nVars, &nCons);
+    if (!errorcode)
+        errorcode = LSgetInfo(pModel, iStatus, &nStatus);
+    if (!errorcode)
+        errorcode = LSgetInfo(pModel, iObj, &dObj);
+    if (errorcode)
+        goto LindoError;
+
+    // one buffer, every requested vector a view into it
+    offset[LS_SOL_DUAL] = offset[LS_SOL_PRIMAL] + (want[LS_SOL_PRIMAL] ? nVars : 0) * sizeof(double);
+    offset[LS_SOL_SLACKS] = offset[LS_SOL_DUAL] + (want[LS_SOL_DUAL] ? nCons : 0) * sizeof(double);
+    offset[LS_SOL_REDCOSTS] = offset[LS_SOL_SLACKS] + (want[LS_SOL_SLACKS] ? nCons : 0) * sizeof(double);
+    offset[LS_SOL_BASIS] = offset[LS_SOL_REDCOSTS] + (want[LS_SOL_REDCOSTS] ? nVars : 0) * sizeof(double);
+    offset[LS_SOL_NFIELDS] = offset[LS_SOL_BASIS] + (want[LS_SOL_BASIS] ? nVars + nCons : 0) * sizeof(int);
+    nBytes = offset[LS_SOL_NFIELDS];
+    pyBuf = (PyArrayObject*)PyArray_SimpleNew(1, &nBytes, NPY_UINT8);
+    if (!pyBuf)
+        goto ErrorReturn;
+    pBytes = PyArray_BYTES(pyBuf);
+
+    if (!strcmp(szKind, "mip")) {
+        if (want[LS_SOL_PRIMAL] && !errorcode)
+            errorcode = LSgetMIPPrimalSolution(pModel, (double*)(pBytes + offset[LS_SOL_PRIMAL]));
+        if (want[LS_SOL_DUAL] && !errorcode)
+            errorcode = LSgetMIPDualSolution(pModel, (double*)(pBytes + offset[LS_SOL_DUAL]));
+        if (want[LS_SOL_SLACKS] && !errorcode)
+            errorcode = LSgetMIPSlacks(pModel, (double*)(pBytes + offset[LS_SOL_SLACKS]));
+        if (want[LS_SOL_REDCOSTS] && !errorcode)
+            errorcode = LSgetMIPReducedCosts(pModel, (double*)(pBytes + offset[LS_SOL_REDCOSTS]));
+        if (want[LS_SOL_BASIS] && !errorcode)
+            errorcode = LSgetMIPBasis(pModel, (int*)(pBytes + offset[LS_SOL_BASIS]),
+                                      (int*)(pBytes + offset[LS_SOL_BASIS]) + nVars);
+    } else {
+        // GOP solutions are reported through the continuous queries
+        if (want[LS_SOL_PRIMAL] && !errorcode)
+            errorcode = LSgetPrimalSolution(pModel, (double*)(pBytes + offset[LS_SOL_PRIMAL]));
+        if (want[LS_SOL_DUAL] && !errorcode)
+            errorcode = LSgetDualSolution(pModel, (double*)(pBytes + offset[LS_SOL_DUAL]));
+        if (want[LS_SOL_SLACKS] && !errorcode)
+            errorcode = LSgetSlacks(pModel, (double*)(pBytes + offset[LS_SOL_SLACKS]));
+        if (want[LS_SOL_REDCOSTS] && !errorcode)
+            errorcode = LSgetReducedCosts(pModel, (double*)(pBytes + offset[LS_SOL_REDCOSTS]));
+        if (want[LS_SOL_BASIS] && !errorcode)
+            errorcode = LSgetBasis(pModel, (int*)(pBytes + offset[LS_SOL_BASIS]),
+                                   (int*)(pBytes + offset[LS_SOL_BASIS]) + nVars);
+    }
+    if (errorcode)
+        goto LindoError;
+
+    pyResult = Py_BuildValue("{sisd}", "status", nStatus, "objective", dObj);
+    if (!pyResult)
+        goto ErrorReturn;
+    for (f = 0; f < LS_SOL_NFIELDS; f++) {
+        if (!want[f])
+            continue;
+        if (f == LS_SOL_BASIS) {
+            pyView = pyBufferView(pyBuf, offset[f], nVars, NPY_INT);
+            if (!pyView || PyDict_SetItemString(pyResult, "cstatus", pyView) < 0)
+                goto ErrorReturn;
+            Py_DECREF(pyView);
+            pyView = pyBufferView(pyBuf, offset[f] + nVars * sizeof(int), nCons, NPY_INT);
+            if (!pyView || PyDict_SetItemString(pyResult, "rstatus", pyView) < 0)
+                goto ErrorReturn;
+        } else {
+            pyView = pyBufferView(pyBuf, offset[f], f == LS_SOL_DUAL || f == LS_SOL_SLACKS ? nCons : nVars, NPY_DOUBLE);
+            if (!pyView || PyDict_SetItemString(pyResult, lsSolutionFields[f], pyView) < 0)
+                goto ErrorReturn;
+        }
+        Py_CLEAR(pyView);
+    }
+    Py_DECREF(pyBuf);
+    Py_XDECREF(pySeq);
+    return pyResult;
+
+LindoError:
+    Py_XDECREF(pyBuf);
+    Py_XDECREF(pySeq);
+    ERROR_SET(errorcode);
+
+ErrorReturn:
+    Py_XDECREF(pyView);
+    Py_XDECREF(pyResult);
+    Py_XDECREF(pyBuf);
+    Py_XDECREF(pySeq);
+    return NULL;
+}
+
+/*
+* @brief Contiguous int32 contents of a 1-D integer array of len entries
+* @param[out] ppnBuf Set to a malloc'd copy the caller frees when the array
+*             had to be narrowed or gathered, NULL when its data is used as is
+* @return NULL with an exception set on failure
+*/
+static int *pyIntVector(PyObject *pyObj, npy_intp len, const char *name, int **ppnBuf)
+{
+    PyArrayObject *pyArr;
+    npy_intp      k;
+    int           *panBuf;
+
+    *ppnBuf = NULL;
+    if (!PyArray_Check(pyObj) || !PyArray_ISINTEGER((PyArrayObject*)pyObj)
+        || PyArray_NDIM((PyArrayObject*)pyObj) != 1) {
+        PyErr_Format(PyExc_TypeError, "%s must be a 1-D integer array", name);
+        return NULL;
+    }
+    pyArr = (PyArrayObject*)pyObj;
+    if (PyArray_DIM(pyArr, 0) != len) {
+        PyErr_Format(PyExc_ValueError, "%s must have %zd entries, got %zd",
+            name, (Py_ssize_t)len, (Py_ssize_t)PyArray_DIM(pyArr, 0));
+        return NULL;
+    }
+    if (PyArray_TYPE(pyArr) == NPY_INT && PyArray_ISCARRAY_RO(pyArr))
+        return (int*)PyArray_DATA(pyArr);
+    if (!PyArray_ISNOTSWAPPED(pyArr) || !PyArray_ISALIGNED(pyArr)) {
+        PyErr_Format(PyExc_TypeError, "%s must be aligned and in native byte order", name);
+        return NULL;
+    }
+
+    panBuf = (int*)malloc((len > 0 ? len : 1) * sizeof(int));
+    if (!panBuf) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    k = pyNarrowIndex(pyArr, len, panBuf);
+    if (k != -1) {
+        free(panBuf);
+        if (k == -2)
+            PyErr_Format(PyExc_TypeError, "%s has an unsupported integer type", name);
+        else
+            PyErr_Format(PyExc_OverflowError, "%s[%zd] does not fit in a 32-bit index", name, (Py_ssize_t)k);
+        return NULL;
+    }
+    pyCountArrayCopy();
+    *ppnBuf = panBuf;
+    return panBuf;
+}
+
+/*
+* @brief Contiguous float64 contents of a 1-D array of len entries
+* @remark *ppyHold receives the array to release afterwards; it is pyObj
+*         itself unless a conversion was needed
+* @return NULL with an exception set on failure
+*/
+static double *pyDoubleVector(PyObject *pyObj, npy_intp len, const char *name, PyObject **ppyHold)
+{
+    PyArrayObject *pyArr;
+
+    *ppyHold = NULL;
+    pyArr = (PyArrayObject*)PyArray_FROMANY(pyObj, NPY_DOUBLE, 1, 1, NPY_ARRAY_IN_ARRAY);
+    if (!pyArr)
+        return NULL;
+    if (PyArray_DIM(pyArr, 0) != len) {
+        PyErr_Format(PyExc_ValueError, "%s must have %zd entries, got %zd",
+            name, (Py_ssize_t)len, (Py_ssize_t)PyArray_DIM(pyArr, 0));
+        Py_DECREF(pyArr);
+        return NULL;
+    }
+    if ((PyObject*)pyArr != pyObj)
+        pyCountArrayCopy();
+    *ppyHold = (PyObject*)pyArr;
+    return (double*)PyArray_DATA(pyArr);
+}
+
+/*
+* @brief Check a compressed-column matrix of m rows and n columns
+* @return 1 if canonical (rows strictly increasing in every column), 0 if
+*         valid but with unsorted or duplicate rows, -1 with ValueError set
+*/
+static int lsCheckCSC(int m, int n, npy_intp nnz, const int *panBegCol, const int *paiRow)
+{
+    npy_intp k;
+    int      j, isCanonical = 1;
+
+    if (panBegCol[0] != 0 || panBegCol[n] > nnz) {
+        PyErr_SetString(PyExc_ValueError, "A.indptr does not match A.data");
+        return -1;
+    }
+    for (j = 0; j < n; j++) {
+        if (panBegCol[j + 1] < panBegCol[j]) {
+            PyErr_SetString(PyExc_ValueError, "A.indptr is not monotonic");
+            return -1;
+        }
+    }
+    for (j = 0; j < n; j++) {
+        for (k = panBegCol[j]; k < panBegCol[j + 1]; k++) {
+            if (paiRow[k] < 0 || paiRow[k] >= m) {
+                PyErr_SetString(PyExc_ValueError, "A has an index out of range");
+                return -1;
+            }
+            if (k > panBegCol[j] && paiRow[k] <= paiRow[k - 1])
+                isCanonical = 0;
+        }
+    }
+    return isCanonical;
+}
+
+/*
+* @brief Compressed-column copy of a CSR (pnRowPtr given) or COO
+*        (paiRow given) matrix, duplicate entries summed
+* @param[out] panBegCol n+1 column starts
+* @param[out] paiRowX,padA row indices and values, nnz entries each
+* @return Number of nonzeros kept, -1 for an index out of range, -2 when
+*         out of memory
+*/
+static npy_intp lsBuildCSC(int m, int n, npy_intp nnz,
+    const int *pnRowPtr, const int *paiRow, const int *paiCol, const double *padVal,
+    int *panBegCol, int *paiRowX, double *padA)
+{
+    npy_intp k, p, q, nKept;
+    int      i, j, r, *panNext, *panLast;
+
+    panNext = (int*)calloc((size_t)n + 1, sizeof(int));
+    panLast = (int*)malloc(((size_t)m + 1) * sizeof(int));
+    if (!panNext || !panLast) {
+        free(panNext);
+        free(panLast);
+        return -2;
+    }
+
+    for (k = 0; k < nnz; k++) {
+        if (paiCol[k] < 0 || paiCol[k] >= n || (paiRow && (paiRow[k] < 0 || paiRow[k] >= m)))
+            goto OutOfRange;
+        panNext[paiCol[k] + 1]++;
+    }
+    if (pnRowPtr && (pnRowPtr[0] != 0 || pnRowPtr[m] != nnz))
+        goto OutOfRange;
+    for (j = 0; j < n; j++)
+        panNext[j + 1] += panNext[j];
+    memcpy(panBegCol, panNext, ((size_t)n + 1) * sizeof(int));
+
+    // scatter rows into their columns, keeping the input order
+    if (pnRowPtr) {
+        for (i = 0; i < m; i++) {
+            if (pnRowPtr[i + 1] < pnRowPtr[i] || pnRowPtr[i + 1] > nnz)
+                goto OutOfRange;
+            for (k = pnRowPtr[i]; k < pnRowPtr[i + 1]; k++) {
+                p = panNext[paiCol[k]]++;
+                paiRowX[p] = i;
+                padA[p] = padVal[k];
+            }
+        }
+    } else {
+        for (k = 0; k < nnz; k++) {
+            p = panNext[paiCol[k]]++;
+            paiRowX[p] = paiRow[k];
+            padA[p] = padVal[k];
+        }
+    }
+
+    // sum duplicates in place
+    for (i = 0; i < m; i++)
+        panLast[i] = -1;
+    nKept = 0;
+    for (j = 0, p = panBegCol[0]; j < n; j++) {
+        q = panBegCol[j + 1];
+        panBegCol[j] = (int)nKept;
+        for (; p < q; p++) {
+            r = paiRowX[p];
+            if (panLast[r] >= panBegCol[j]) {
+                padA[panLast[r]] += padA[p];
+            } else {
+                panLast[r] = (int)nKept;
+                paiRowX[nKept] = r;
+                padA[nKept] = padA[p];
+                nKept++;
+            }
+        }
+    }
+    panBegCol[n] = (int)nKept;
+
+    free(panNext);
+    free(panLast);
+    return nKept;
+
+OutOfRange:
+    free(panNext);
+    free(panLast);
+    return -1;
+}
+
+/*
+* @brief Load an LP from a scipy.sparse constraint matrix
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return int
+* @remark errorcode = lindo.load_lp(pModel,A,c,b,contypes,lb,ub,sense,objconst)
+*/
+PyObject *pyLoadLP(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"model", "A", "c", "b", "contypes", "lb", "ub", "sense", "objconst", NULL};
+    int           errorcode = LSERR_NO_ERROR;
+    int           nCons = 0, nVars = 0, nObjSense = LS_MIN;
+    int           isCSC = 0, isCSR = 0, isCanonical = 0;
+    double        dObjConst = 0.0;
+    double        *padC, *padB, *padL = NULL, *padU = NULL, *padVal, *padA;
+    int           *panBegCol, *paiRowX, *paiRow = NULL, *paiCol = NULL, *pnRowPtr = NULL;
+    int           *panBuf[6] = {NULL, NULL, NULL, NULL, NULL, NULL};
+    double        *padBuf[2] = {NULL, NULL};
+    char          *pszConTypes = NULL;
+    Py_ssize_t    nLen;
+    npy_intp      nnz;
+    const char    *szFormat;
+    int           k;
+    pLSmodel      pModel;
+
+    PyObject      *pyModel = NULL, *pyA = NULL, *pyC = NULL, *pyB = NULL, *pyConTypes = NULL;
+    PyObject      *pyL = Py_None, *pyU = Py_None;
+    PyObject      *pyFormat = NULL, *pyShape = NULL;
+    PyObject      *pyPtr = NULL, *pyInd = NULL, *pyData = NULL;
+    PyObject      *pyHold[6] = {NULL, NULL, NULL, NULL, NULL, NULL};
+    PyObject      *pyResult = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOOOO|OOid", kwlist,
+                                     &pyModel,
+                                     &pyA,
+                                     &pyC,
+                                     &pyB,
+                                     &pyConTypes,
+                                     &pyL,
+                                     &pyU,
+                                     &nObjSense,
+                                     &dObjConst))
+    {
+        return NULL;
+    }
+
+    CHECK_MODEL;
+
+    pyFormat = PyObject_GetAttrString(pyA, "format");
+    pyShape = pyFormat ? PyObject_GetAttrString(pyA, "shape") : NULL;
+    if (!pyShape || !PyUnicode_Check(pyFormat)
+        || !PyArg_ParseTuple(pyShape, "ii", &nCons, &nVars)) {
+        PyErr_Clear();
+        PyErr_SetString(PyExc_TypeError, "A must be a scipy.sparse matrix or array");
+        goto ErrorReturn;
+    }
+    szFormat = PyUnicode_AsUTF8(pyFormat);
+    isCSC = !strcmp(szFormat, "csc");
+    isCSR = !strcmp(szFormat, "csr");
+    if (!isCSC && !isCSR && strcmp(szFormat, "coo")) {
+        PyErr_Format(PyExc_TypeError, "A must be in csc, csr or coo format, not %s", szFormat);
+        goto ErrorReturn;
+    }
+
+    padC = pyDoubleVector(pyC, nVars, "c", &pyHold[0]);
+    padB = padC ? pyDoubleVector(pyB, nCons, "b", &pyHold[1]) : NULL;
+    if (!padB)
+        goto ErrorReturn;
+    if (pyL != Py_None && !(padL = pyDoubleVector(pyL, nVars, "lb", &pyHold[2])))
+        goto ErrorReturn;
+    if (pyU != Py_None && !(padU = pyDoubleVector(pyU, nVars, "ub", &pyHold[3])))
+        goto ErrorReturn;
+
+    if (PyUnicode_Check(pyConTypes)) {
+        pszConTypes = (char*)PyUnicode_AsUTF8AndSize(pyConTypes, &nLen);
+    } else if (PyBytes_Check(pyConTypes)) {
+        pszConTypes = PyBytes_AS_STRING(pyConTypes);
+        nLen = PyBytes_GET_SIZE(pyConTypes);
+    } else {
+        PyArray_Descr *descr = NULL;
+        PyObject *pyS1 = PyUnicode_FromString("S1");
+        if (!pyS1 || !PyArray_DescrConverter(pyS1, &descr)) {
+            Py_XDECREF(pyS1);
+            goto ErrorReturn;
+        }
+        Py_DECREF(pyS1);
+        pyHold[4] = PyArray_FromAny(pyConTypes, descr, 1, 1, NPY_ARRAY_IN_ARRAY, NULL);
+        if (!pyHold[4])
+            goto ErrorReturn;
+        pszConTypes = PyArray_BYTES((PyArrayObject*)pyHold[4]);
+        nLen = PyArray_DIM((PyArrayObject*)pyHold[4], 0);
+    }
+    if (!pszConTypes)
+        goto ErrorReturn;
+    if (nLen != nCons) {
+        PyErr_Format(PyExc_ValueError, "contypes must have %d entries, got %zd", nCons, nLen);
+        goto ErrorReturn;
+    }
+
+    pyData = PyObject_GetAttrString(pyA, "data");
+    pyPtr = PyObject_GetAttrString(pyA, isCSC || isCSR ? "indptr" : "row");
+    pyInd = PyObject_GetAttrString(pyA, isCSC || isCSR ? "indices" : "col");
+    if (!pyData || !pyPtr || !pyInd)
+        goto ErrorReturn;
+    if (!PyArray_Check(pyData) || PyArray_NDIM((PyArrayObject*)pyData) != 1) {
+        PyErr_SetString(PyExc_TypeError, "A.data must be a 1-D array");
+        goto ErrorReturn;
+    }
+    nnz = PyArray_DIM((PyArrayObject*)pyData, 0);
+    if (nnz > INT_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "A has more nonzeros than a 32-bit index can address");
+        goto ErrorReturn;
+    }
+    padVal = pyDoubleVector(pyData, nnz, "A.data", &pyHold[5]);
+    if (!padVal)
+        goto ErrorReturn;
+
+    if (isCSC) {
+        // passed straight through when already int32, otherwise narrowed once
+        panBegCol = pyIntVector(pyPtr, (npy_intp)nVars + 1, "A.indptr", &panBuf[0]);
+        paiRowX = panBegCol ? pyIntVector(pyInd, nnz, "A.indices", &panBuf[1]) : NULL;
+        if (!paiRowX)
+            goto ErrorReturn;
+        // has_canonical_format may be stale, the check is one pass anyway
+        isCanonical = lsCheckCSC(nCons, nVars, nnz, panBegCol, paiRowX);
+        if (isCanonical < 0)
+            goto ErrorReturn;
+        padA = padVal;
+    } else if (isCSR) {
+        pnRowPtr = pyIntVector(pyPtr, (npy_intp)nCons + 1, "A.indptr", &panBuf[0]);
+        paiCol = pnRowPtr ? pyIntVector(pyInd, nnz, "A.indices", &panBuf[1]) : NULL;
+        if (!paiCol)
+            goto ErrorReturn;
+    } else {
+        paiRow = pyIntVector(pyPtr, nnz, "A.row", &panBuf[0]);
+        paiCol = paiRow ? pyIntVector(pyInd, nnz, "A.col", &panBuf[1]) : NULL;
+        if (!paiCol)
+            goto ErrorReturn;
+    }
+
+    if (!isCSR && !isCanonical) {
+        /* COO, or CSC with unsorted or duplicate rows: build the rows of A
+           first (the columns of its transpose), duplicates summed, so that
+           every format reaches LINDO in the same canonical form */
+        panBuf[2] = (int*)malloc(((size_t)nCons + 1) * sizeof(int));
+        panBuf[3] = (int*)malloc((nnz > 0 ? nnz : 1) * sizeof(int));
+        padBuf[0] = (double*)malloc((nnz > 0 ? nnz : 1) * sizeof(double));
+        if (!panBuf[2] || !panBuf[3] || !padBuf[0]) {
+            PyErr_NoMemory();
+            goto ErrorReturn;
+        }
+        if (isCSC)
+            nnz = lsBuildCSC(nVars, nCons, panBegCol[nVars], panBegCol, NULL, paiRowX, padVal,
+                             panBuf[2], panBuf[3], padBuf[0]);
+        else
+            nnz = lsBuildCSC(nVars, nCons, nnz, NULL, paiCol, paiRow, padVal,
+                             panBuf[2], panBuf[3], padBuf[0]);
+        if (nnz == -2) {
+            PyErr_NoMemory();
+            goto ErrorReturn;
+        } else if (nnz < 0) {
+            PyErr_SetString(PyExc_ValueError, "A has an index out of range");
+            goto ErrorReturn;
+        }
+        pnRowPtr = panBuf[2];
+        paiCol = panBuf[3];
+        padVal = padBuf[0];
+        paiRow = NULL;
+    }
+
+    if (!isCanonical) {
+        panBuf[4] = (int*)malloc(((size_t)nVars + 1) * sizeof(int));
+        panBuf[5] = (int*)malloc((nnz > 0 ? nnz : 1) * sizeof(int));
+        padBuf[1] = (double*)malloc((nnz > 0 ? nnz : 1) * sizeof(double));
+        if (!panBuf[4] || !panBuf[5] || !padBuf[1]) {
+            PyErr_NoMemory();
+            goto ErrorReturn;
+        }
+        panBegCol = panBuf[4];
+        paiRowX = panBuf[5];
+        padA = padBuf[1];
+        nnz = lsBuildCSC(nCons, nVars, nnz, pnRowPtr, NULL, paiCol, padVal,
+                         panBegCol, paiRowX, padA);
+        if (nnz == -2) {
+            PyErr_NoMemory();
+            goto ErrorReturn;
+        } else if (nnz < 0) {
+            PyErr_SetString(PyExc_ValueError, "A has an index out of range");
+            goto ErrorReturn;
+        }
+    }
+
+    pyResetModelDims(pModel);
+    errorcode = LSloadLPData(pModel,
+                             nCons,
+                             nVars,
+                             nObjSense,
+                             dObjConst,
+                             padC,
+                             padB,
+                             pszConTypes,
+                             panBegCol[nVars],
+                             panBegCol,
+                             NULL,
+                             padA,
+                             paiRowX,
+                             padL,
+                             padU);
+
+    if (errorcode == 0)
+        pyResult = Py_BuildValue("i", errorcode);
+
+ErrorReturn:
+    Py_XDECREF(pyFormat);
+    Py_XDECREF(pyShape);
+    Py_XDECREF(pyPtr);
+    Py_XDECREF(pyInd);
+    Py_XDECREF(pyData);
+    for (k = 0; k < 6; k++)
+        Py_XDECREF(pyHold[k]);
+    for (k = 0; k < 6; k++)
+        free(panBuf[k]);
+    free(padBuf[0]);
+    free(padBuf[1]);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    return pyResult;
+}
+
+/*
+* @brief Read the LP data of a model in one call
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return dict with the keyword arguments of lindo.load_lp
+* @remark d = lindo.get_lp(pModel,raw)
+*/
+PyObject *pyGetLP(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char   *kwlist[] = {"model", "raw", NULL};
+    int           errorcode = LSERR_NO_ERROR;
+    int           nVars = 0, nCons = 0, nNonz = 0, nObjSense = LS_MIN, isRaw = 0;
+    int           j, nKept;
+    int           *panBeg, *panLen, *paiRow;
+    double        dObjConst = 0.0, *padCoef;
+    char          *pBytes;
+    npy_intp      nBytes, nNz, offC, offB, offL, offU, offBeg, offLen, offTypes;
+    pLSmodel      pModel;
+
+    PyObject      *pyModel = NULL, *pyResult = NULL, *pyView = NULL;
+    PyObject      *pyData = NULL, *pyInd = NULL, *pyPtr = NULL, *pyA = NULL, *pySparse;
+    PyArrayObject *pyBuf = NULL, *pyCoef = NULL, *pyRow = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|p", kwlist, &pyModel, &isRaw))
+        return NULL;
+
+    CHECK_MODEL;
+
+    errorcode = pyGetModelDims(pModel, &nVars, &nCons);
+    if (!errorcode)
+        errorcode = LSgetInfo(pModel, LS_IINFO_NUM_NONZ, &nNonz);
+    if (errorcode)
+        goto LindoError;
+
+    // the vectors share one buffer; data and indices get their own, as
+    // scipy copies index arrays that are small views of a larger buffer
+    offC = 0;
+    offB = offC + (npy_intp)nVars * sizeof(double);
+    offL = offB + (npy_intp)nCons * sizeof(double);
+    offU = offL + (npy_intp)nVars * sizeof(double);
+    offBeg = offU + (npy_intp)nVars * sizeof(double);
+    offLen = offBeg + ((npy_intp)nVars + 1) * sizeof(int);
+    offTypes = offLen + (npy_intp)nVars * sizeof(int);
+    nBytes = offTypes + nCons + 1;
+    nNz = nNonz;
+    pyBuf = (PyArrayObject*)PyArray_SimpleNew(1, &nBytes, NPY_UINT8);
+    pyCoef = (PyArrayObject*)PyArray_SimpleNew(1, &nNz, NPY_DOUBLE);
+    pyRow = (PyArrayObject*)PyArray_SimpleNew(1, &nNz, NPY_INT);
+    if (!pyBuf || !pyCoef || !pyRow)
+        goto ErrorReturn;
+    pBytes = PyArray_BYTES(pyBuf);
+    panBeg = (int*)(pBytes + offBeg);
+    panLen = (int*)(pBytes + offLen);
+    paiRow = (int*)PyArray_DATA(pyRow);
+    padCoef = (double*)PyArray_DATA(pyCoef);
+
+    errorcode = LSgetLPData(pModel, &nObjSense, &dObjConst,
+                            (double*)(pBytes + offC),
+                            (double*)(pBytes + offB),
+                            pBytes + offTypes,
+                            panBeg, panLen, padCoef, paiRow,
+                            (double*)(pBytes + offL),
+                            (double*)(pBytes + offU));
+    if (errorcode)
+        goto LindoError;
+
+    // columns may leave room after their entries, close the gaps
+    for (j = nKept = 0; j < nVars; j++) {
+        if (panBeg[j] != nKept) {
+            memmove(paiRow + nKept, paiRow + panBeg[j], panLen[j] * sizeof(int));
+            memmove(padCoef + nKept, padCoef + panBeg[j], panLen[j] * sizeof(double));
+        }
+        panBeg[j] = nKept;
+        nKept += panLen[j];
+    }
+    panBeg[nVars] = nKept;
+
+    if (!(pyData = pyBufferView(pyCoef, 0, nKept, NPY_DOUBLE)) ||
+        !(pyInd = pyBufferView(pyRow, 0, nKept, NPY_INT)) ||
+        !(pyPtr = pyBufferView(pyBuf, offBeg, (npy_intp)nVars + 1, NPY_INT)))
+        goto ErrorReturn;
+
+    pySparse = isRaw ? NULL : PyImport_ImportModule("scipy.sparse");
+    if (pySparse) {
+        // copy=False is the default, the matrix keeps our buffer
+        pyA = PyObject_CallMethod(pySparse, "csc_matrix", "(OOO)(ii)",
+                                  pyData, pyInd, pyPtr, nCons, nVars);
+        Py_DECREF(pySparse);
+    } else if (!isRaw && !PyErr_ExceptionMatches(PyExc_ImportError)) {
+        goto ErrorReturn;
+    } else {
+        // without scipy, the (data, indices, indptr) triplet
+        PyErr_Clear();
+        pyA = PyTuple_Pack(3, pyData, pyInd, pyPtr);
+    }
+    if (!pyA)
+        goto ErrorReturn;
+
+    pyResult = Py_BuildValue("{sOsisd}", "A", pyA, "sense", nObjSense, "objconst", dObjConst);
+    if (!pyResult)
+        goto ErrorReturn;
+#define LS_SET_VIEW(key, off, len, type) \
+    if (!(pyView = pyBufferView(pyBuf, off, len, type)) || \
+        PyDict_SetItemString(pyResult, key, pyView) < 0) \
+        goto ErrorReturn; \
+    Py_CLEAR(pyView);
+    LS_SET_VIEW("c", offC, nVars, NPY_DOUBLE);
+    LS_SET_VIEW("b", offB, nCons, NPY_DOUBLE);
+    LS_SET_VIEW("contypes", offTypes, nCons, NPY_STRING);
+    LS_SET_VIEW("lb", offL, nVars, NPY_DOUBLE);
+    LS_SET_VIEW("ub", offU, nVars, NPY_DOUBLE);
+#undef LS_SET_VIEW
+
+    Py_DECREF(pyA);
+    Py_DECREF(pyData);
+    Py_DECREF(pyInd);
+    Py_DECREF(pyPtr);
+    Py_DECREF(pyBuf);
+    Py_DECREF(pyCoef);
+    Py_DECREF(pyRow);
+    return pyResult;
+
+LindoError:
+    Py_XDECREF(pyBuf);
+    Py_XDECREF(pyCoef);
+    Py_XDECREF(pyRow);
+    ERROR_SET(errorcode);
+
+ErrorReturn:
+    Py_XDECREF(pyView);
+    Py_XDECREF(pyResult);
+    Py_XDECREF(pyA);
+    Py_XDECREF(pyData);
+    Py_XDECREF(pyInd);
+    Py_XDECREF(pyPtr);
+    Py_XDECREF(pyBuf);
+    Py_XDECREF(pyCoef);
+    Py_XDECREF(pyRow);
+    return NULL;
+}
+
+/*
+* @brief Open a batch of modifications on a model
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return int, the nesting depth of the batch
+* @remark depth = lindo.batch_begin(pModel)
+*/
+PyObject *pyBatchBegin(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char  *kwlist[] = {"model", NULL};
+    int          errorcode = LSERR_NO_ERROR;
+    pLSmodel     pModel;
+    lsModBatch_t *pBatch;
+
+    PyObject     *pyModel;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O", kwlist, &pyModel))
+        return NULL;
+
+    CHECK_MODEL;
+
+    pBatch = pyModBatchFind(pModel);
+    if (!pBatch) {
+        pBatch = (lsModBatch_t*)calloc(1, sizeof(lsModBatch_t));
+        if (!pBatch)
+            return PyErr_NoMemory();
+        pBatch->pModel = pModel;
+        pBatch->next = pyModBatches;
+        pyModBatches = pBatch;
+    }
+    return Py_BuildValue("i", ++pBatch->nDepth);
+}
+
+/*
+* @brief Close a batch of modifications, applying or discarding it
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return int, the number of LINDO calls issued
+* @remark nCalls = lindo.batch_end(pModel,commit)
+*/
+PyObject *pyBatchEnd(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char  *kwlist[] = {"model", "commit", NULL};
+    int          errorcode = LSERR_NO_ERROR;
+    int          isCommit = 1, nCalls = 0;
+    pLSmodel     pModel;
+    lsModBatch_t *pBatch;
+
+    PyObject     *pyModel;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|p", kwlist, &pyModel, &isCommit))
+        return NULL;
+
+    CHECK_MODEL;
+
+    pBatch = pyModBatchFind(pModel);
+    if (!pBatch) {
+        PyErr_SetString(PyExc_RuntimeError, "batch_end() without batch_begin()");
+        return NULL;
+    }
+    // nested batches are part of the outermost one
+    if (--pBatch->nDepth > 0)
+        return Py_BuildValue("i", 0);
+
+    if (isCommit)
+        errorcode = pyModBatchApply(pBatch, &nCalls);
+    pyModBatchDrop(pModel);
+    if (!isCommit || errorcode)
+        pyModelCacheDrop(pModel, "lp");
+
+    if (errorcode == -1)
+        return PyErr_NoMemory();
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    return Py_BuildValue("i", nCalls);
+}
+
+/*
+* @brief The Python cache of a model, created on first use
+* @return Borrowed reference, or NULL with an exception set
+*/
+static PyObject *pyGetModelCache(pLSmodel pModel)
+{
+    PyObject *pyKey, *pyCache;
+
+    if (!pyModelCaches && !(pyModelCaches = PyDict_New()))
+        return NULL;
+    pyKey = PyLong_FromVoidPtr(pModel);
+    if (!pyKey)
+        return NULL;
+    pyCache = PyDict_GetItemWithError(pyModelCaches, pyKey);
+    if (!pyCache && !PyErr_Occurred() && (pyCache = PyDict_New()) != NULL) {
+        // the table holds the only reference
+        if (PyDict_SetItem(pyModelCaches, pyKey, pyCache) < 0) {
+            Py_DECREF(pyCache);
+            pyCache = NULL;
+        } else {
+            Py_DECREF(pyCache);
+        }
+    }
+    Py_DECREF(pyKey);
+    return pyCache;
+}
+
+/*
+* @brief The Python cache of a model
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return dict
+* @remark d = lindo.model_cache(pModel)
+*/
+PyObject *pyModelCache(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"model", NULL};
+    int         errorcode = LSERR_NO_ERROR;
+    pLSmodel    pModel;
+    PyObject    *pyCache;
+
+    PyObject    *pyModel;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O", kwlist, &pyModel))
+        return NULL;
+
+    CHECK_MODEL;
+
+    pyCache = pyGetModelCache(pModel);
+    Py_XINCREF(pyCache);
+    return pyCache;
+}
+
+/*********************************************************************
+ *      Bulk Names                                                   *
+ *********************************************************************/
+/*
+* @brief Parse a kind argument, 'var' or 'con'
+* @return 1 for variables, 0 for constraints, -1 with an exception set
+*/
+static int pyNameKind(const char *szKind)
+{
+    if (!strcmp(szKind, "var"))
+        return 1;
+    if (!strcmp(szKind, "con"))
+        return 0;
+    PyErr_Format(PyExc_ValueError, "kind must be 'var' or 'con', not '%s'", szKind);
+    return -1;
+}
+
+/*
+* @brief Null-terminated copies of a list of names
+* @param[in] pyNames Sequence of str or bytes, or a 1-D bytes ('S') array
+* @param[in] nNames Required number of names
+* @param[out] ppaszNames Pointer array into *ppachBuf, free both
+* @return 0, or -1 with an exception set
+*/
+static int pyNameList(PyObject *pyNames, int nNames, const char *szArg,
+                      char ***ppaszNames, char **ppachBuf)
+{
+    Py_ssize_t k, n, nItem, nTotal = 0;
+    const char *pszItem;
+    char       **pasz = NULL, *pach = NULL;
+    PyObject   *pySeq = NULL;
+
+    *ppaszNames = NULL;
+    *ppachBuf = NULL;
+    if (PyArray_Check(pyNames) && PyArray_TYPE((PyArrayObject*)pyNames) == NPY_STRING) {
+        PyArrayObject *pyArr = (PyArrayObject*)pyNames;
+        if (PyArray_NDIM(pyArr) != 1 || PyArray_DIM(pyArr, 0) != nNames) {
+            PyErr_Format(PyExc_ValueError, "%s must hold %d names", szArg, nNames);
+            return -1;
+        }
+        nItem = PyArray_ITEMSIZE(pyArr);
+        pasz = (char**)malloc((nNames + 1) * sizeof(char*));
+        pach = (char*)malloc((size_t)nNames * (nItem + 1) + 1);
+        if (!pasz || !pach)
+            goto NoMemory;
+        for (k = 0; k < nNames; k++) {
+            pasz[k] = pach + k * (nItem + 1);
+            memcpy(pasz[k], PyArray_GETPTR1(pyArr, k), nItem);
+            pasz[k][nItem] = '\0';
+        }
+    } else {
+        pySeq = PySequence_Fast(pyNames, "names must be a sequence of str or bytes");
+        if (!pySeq)
+            return -1;
+        n = PySequence_Fast_GET_SIZE(pySeq);
+        if (n != nNames) {
+            PyErr_Format(PyExc_ValueError, "%s must hold %d names, not %zd", szArg, nNames, n);
+            Py_DECREF(pySeq);
+            return -1;
+        }
+        // sizes first, then a single buffer
+        for (k = 0; k < n; k++) {
+            PyObject *pyItem = PySequence_Fast_GET_ITEM(pySeq, k);
+            if (PyUnicode_Check(pyItem)) {
+                if (!PyUnicode_AsUTF8AndSize(pyItem, &nItem))
+                    goto Error;
+            } else if (PyBytes_Check(pyItem)) {
+                nItem = PyBytes_GET_SIZE(pyItem);
+            } else {
+                PyErr_Format(PyExc_TypeError, "%s[%zd] must be str or bytes, not %.200s",
+                             szArg, k, Py_TYPE(pyItem)->tp_name);
+                goto Error;
+            }
+            nTotal += nItem + 1;
+        }
+        pasz = (char**)malloc((n + 1) * sizeof(char*));
+        pach = (char*)malloc(nTotal + 1);
+        if (!pasz || !pach)
+            goto NoMemory;
+        for (nTotal = k = 0; k < n; k++) {
+            PyObject *pyItem = PySequence_Fast_GET_ITEM(pySeq, k);
+            if (PyUnicode_Check(pyItem)) {
+                pszItem = PyUnicode_AsUTF8AndSize(pyItem, &nItem);
+            } else {
+                pszItem = PyBytes_AS_STRING(pyItem);
+                nItem = PyBytes_GET_SIZE(pyItem);
+            }
+            pasz[k] = pach + nTotal;
+            memcpy(pasz[k], pszItem, nItem);
+            pasz[k][nItem] = '\0';
+            nTotal += nItem + 1;
+        }
+        Py_DECREF(pySeq);
+    }
+    pasz[nNames] = NULL;
+    *ppaszNames = pasz;
+    *ppachBuf = pach;
+    return 0;
+
+NoMemory:
+    PyErr_NoMemory();
+Error:
+    Py_XDECREF(pySeq);
+    free(pasz);
+    free(pach);
+    return -1;
+}
+
+/*
+* @brief Load variable and constraint names in one call
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return int
+* @remark errorcode = lindo.load_names(pModel,varnames,connames)
+*/
+PyObject *pyLoadNames(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"model", "varnames", "connames", NULL};
+    int         errorcode = LSERR_NO_ERROR;
+    int         nVars, nCons;
+    pLSmodel    pModel;
+    char        **paszVars = NULL, **paszCons = NULL;
+    char        *pachVars = NULL, *pachCons = NULL;
+
+    PyObject    *pyModel, *pyVars = Py_None, *pyCons = Py_None;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OO", kwlist, &pyModel, &pyVars, &pyCons))
+        return NULL;
+
+    CHECK_MODEL;
+
+    errorcode = pyGetModelDims(pModel, &nVars, &nCons);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    if ((pyVars != Py_None && pyNameList(pyVars, nVars, "varnames", &paszVars, &pachVars) < 0) ||
+        (pyCons != Py_None && pyNameList(pyCons, nCons, "connames", &paszCons, &pachCons) < 0)) {
+        free(paszVars);
+        free(pachVars);
+        return NULL;
+    }
+
+    errorcode = LSloadNameData(pModel, NULL, NULL, NULL, NULL, NULL, paszCons, paszVars, NULL);
+    if (paszVars)
+        pyModelCacheDrop(pModel, "varnames");
+    if (paszCons)
+        pyModelCacheDrop(pModel, "connames");
+
+    free(paszVars);
+    free(pachVars);
+    free(paszCons);
+    free(pachCons);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    return Py_BuildValue("i", errorcode);
+}
+
+/*
+* @brief All variable or constraint names of a model
+* @param[out] ppaszNames Pointer array into *ppachBuf, free both
+* @return LINDO error code, or -1 when out of memory
+*/
+static int pyFetchNames(pLSmodel pModel, int isVar, int *pnNames, char ***ppaszNames, char **ppachBuf)
+{
+    int  errorcode, nVars, nCons, nLen = 0, nNames;
+    char **pasz, *pach;
+
+    *ppaszNames = NULL;
+    *ppachBuf = NULL;
+    errorcode = pyGetModelDims(pModel, &nVars, &nCons);
+    if (!errorcode)
+        errorcode = LSgetInfo(pModel, isVar ? LS_IINFO_LEN_VARNAMES : LS_IINFO_LEN_CONNAMES, &nLen);
+    if (errorcode)
+        return errorcode;
+    nNames = isVar ? nVars : nCons;
+    // room for a terminator per name whether or not nLen counts them
+    pasz = (char**)malloc(((size_t)nNames + 1) * sizeof(char*));
+    pach = (char*)malloc((size_t)nLen + nNames + 1);
+    if (!pasz || !pach) {
+        free(pasz);
+        free(pach);
+        return -1;
+    }
+    if (isVar)
+        errorcode = LSgetNameData(pModel, NULL, NULL, NULL, NULL, NULL,
+                                  NULL, NULL, pasz, pach, NULL, NULL);
+    else
+        errorcode = LSgetNameData(pModel, NULL, NULL, NULL, NULL, NULL,
+                                  pasz, pach, NULL, NULL, NULL, NULL);
+    if (errorcode) {
+        free(pasz);
+        free(pach);
+        return errorcode;
+    }
+    *pnNames = nNames;
+    *ppaszNames = pasz;
+    *ppachBuf = pach;
+    return LSERR_NO_ERROR;
+}
+
+/*
+* @brief All variable or constraint names as one bytes array
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return numpy.ndarray of dtype S<longest name>
+* @remark names = lindo.get_names(pModel,kind)
+*/
+PyObject *pyGetNames(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char   *kwlist[] = {"model", "kind", NULL};
+    int           errorcode = LSERR_NO_ERROR;
+    int           isVar, nNames = 0, k;
+    size_t        nWidth = 1, nLen;
+    npy_intp      dims[1];
+    const char    *szKind = "var";
+    pLSmodel      pModel;
+    char          **pasz, *pach;
+    PyArrayObject *pyResult;
+
+    PyObject      *pyModel;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|s", kwlist, &pyModel, &szKind))
+        return NULL;
+
+    CHECK_MODEL;
+
+    if ((isVar = pyNameKind(szKind)) < 0)
+        return NULL;
+    errorcode = pyFetchNames(pModel, isVar, &nNames, &pasz, &pach);
+    if (errorcode == -1)
+        return PyErr_NoMemory();
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+
+    for (k = 0; k < nNames; k++)
+        if ((nLen = strlen(pasz[k])) > nWidth)
+            nWidth = nLen;
+    dims[0] = nNames;
+    pyResult = (PyArrayObject*)PyArray_New(&PyArray_Type, 1, dims, NPY_STRING, NULL, NULL,
+                                           (int)nWidth, 0, NULL);
+    if (pyResult) {
+        char *pDst = PyArray_BYTES(pyResult);
+        memset(pDst, 0, (size_t)nNames * nWidth);
+        for (k = 0; k < nNames; k++)
+            memcpy(pDst + (size_t)k * nWidth, pasz[k], strlen(pasz[k]));
+    }
+    free(pasz);
+    free(pach);
+    return (PyObject*)pyResult;
+}
+
+/*
+* @brief Name to index dict of the variables or constraints of a model
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return dict
+* @remark d = lindo.name_index(pModel,kind)
+*/
+PyObject *pyNameIndex(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"model", "kind", NULL};
+    int         errorcode = LSERR_NO_ERROR;
+    int         isVar, nNames = 0, k;
+    const char  *szKind = "var";
+    pLSmodel    pModel;
+    char        **pasz, *pach;
+    PyObject    *pyCache, *pyIndex;
+
+    PyObject    *pyModel;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|s", kwlist, &pyModel, &szKind))
+        return NULL;
+
+    CHECK_MODEL;
+
+    if ((isVar = pyNameKind(szKind)) < 0)
+        return NULL;
+    if (!(pyCache = pyGetModelCache(pModel)))
+        return NULL;
+    pyIndex = PyDict_GetItemString(pyCache, isVar ? "varnames" : "connames");
+    if (pyIndex) {
+        Py_INCREF(pyIndex);
+        return pyIndex;
+    }
+
+    errorcode = pyFetchNames(pModel, isVar, &nNames, &pasz, &pach);
+    if (errorcode == -1)
+        return PyErr_NoMemory();
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+
+    pyIndex = PyDict_New();
+    for (k = 0; pyIndex && k < nNames; k++) {
+        PyObject *pyName = PyUnicode_DecodeUTF8(pasz[k], strlen(pasz[k]), "surrogateescape");
+        PyObject *pyPos = pyName ? PyLong_FromLong(k) : NULL;
+        if (!pyPos || PyDict_SetItem(pyIndex, pyName, pyPos) < 0)
+            Py_CLEAR(pyIndex);
+        Py_XDECREF(pyName);
+        Py_XDECREF(pyPos);
+    }
+    free(pasz);
+    free(pach);
+    if (pyIndex && PyDict_SetItemString(pyCache, isVar ? "varnames" : "connames", pyIndex) < 0)
+        Py_CLEAR(pyIndex);
+    return pyIndex;
+}
+
+/*********************************************************************
+ *      Bulk Row and Column Data                                     *
+ *********************************************************************/
+/*
+* @brief Rows or columns of a model as compressed sparse buffers
+* @remark Shared by get_rows and get_cols; one LINDO call per item in a
+*         native loop, names with one LSgetNameData call
+*/
+static PyObject *pyGetSlices(PyObject *args, PyObject *kwds, int isRow)
+{
+    static char   *kwlist[] = {"model", "index", "names", NULL};
+    int           errorcode = LSERR_NO_ERROR;
+    int           nVars = 0, nCons = 0, nItems, nMaxLen, nLen = 0, isNames = 0, nNames = 0;
+    int           *paiBuf = NULL, *panPtr;
+    double        *padBuf = NULL, *padCoef;
+    size_t        nUsed = 0, nCap = 0, nWidth = 1;
+    npy_intp      k, n, dims[1];
+    const npy_intp *paiIndex = NULL;
+    char          *pachType, **paszNames = NULL, *pachNames = NULL;
+    double        *padC = NULL, *padL = NULL, *padU = NULL;
+    pLSmodel      pModel;
+
+    PyObject      *pyModel, *pyIndex = Py_None, *pyResult = NULL;
+    PyArrayObject *pyIdx = NULL, *pyPtr = NULL, *pyInd = NULL, *pyData = NULL;
+    PyArrayObject *pyType = NULL, *pyC = NULL, *pyL = NULL, *pyU = NULL, *pyNames = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|Op", kwlist, &pyModel, &pyIndex, &isNames))
+        return NULL;
+
+    CHECK_MODEL;
+
+    errorcode = pyGetModelDims(pModel, &nVars, &nCons);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    nItems = isRow ? nCons : nVars;
+    nMaxLen = isRow ? nVars : nCons;
+
+    if (pyIndex == Py_None) {
+        n = nItems;
+    } else {
+        PyArrayObject *pyArr = (PyArrayObject*)PyArray_FROM_O(pyIndex);
+        if (!pyArr)
+            return NULL;
+        if (PyArray_NDIM(pyArr) != 1 || (!PyArray_ISINTEGER(pyArr) && PyArray_SIZE(pyArr))) {
+            PyErr_SetString(PyExc_TypeError, "index must be a 1-D integer array");
+            Py_DECREF(pyArr);
+            return NULL;
+        }
+        pyIdx = (PyArrayObject*)PyArray_FROM_OTF((PyObject*)pyArr, NPY_INTP, NPY_ARRAY_IN_ARRAY | NPY_ARRAY_FORCECAST);
+        Py_DECREF(pyArr);
+        if (!pyIdx)
+            return NULL;
+        n = PyArray_DIM(pyIdx, 0);
+        paiIndex = (const npy_intp*)PyArray_DATA(pyIdx);
+        for (k = 0; k < n; k++) {
+            if (paiIndex[k] < 0 || paiIndex[k] >= nItems) {
+                PyErr_Format(PyExc_IndexError, "index %zd is out of range for %d %s",
+                             (Py_ssize_t)paiIndex[k], nItems, isRow ? "rows" : "columns");
+                goto ErrorReturn;
+            }
+        }
+    }
+
+    dims[0] = n + 1;
+    pyPtr = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_INT);
+    dims[0] = n;
+    pyType = (PyArrayObject*)PyArray_New(&PyArray_Type, 1, dims, NPY_STRING, NULL, NULL, 1, 0, NULL);
+    pyC = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    if (!isRow) {
+        pyL = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+        pyU = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    }
+    if (!pyPtr || !pyType || !pyC || (!isRow && (!pyL || !pyU)))
+        goto ErrorReturn;
+    panPtr = (int*)PyArray_DATA(pyPtr);
+    pachType = PyArray_BYTES(pyType);
+    padC = (double*)PyArray_DATA(pyC);
+    if (!isRow) {
+        padL = (double*)PyArray_DATA(pyL);
+        padU = (double*)PyArray_DATA(pyU);
+    }
+
+    panPtr[0] = 0;
+    for (k = 0; k < n; k++) {
+        int iItem = paiIndex ? (int)paiIndex[k] : (int)k;
+        // room for the longest possible row or column
+        if (nUsed + nMaxLen > nCap) {
+            size_t nNew = nCap ? 2 * nCap : 1024;
+            int    *pai;
+            double *pad;
+            while (nNew < nUsed + nMaxLen)
+                nNew *= 2;
+            pai = (int*)realloc(paiBuf, nNew * sizeof(int));
+            if (pai)
+                paiBuf = pai;
+            pad = (double*)realloc(padBuf, nNew * sizeof(double));
+            if (pad)
+                padBuf = pad;
+            if (!pai || !pad) {
+                PyErr_NoMemory();
+                goto ErrorReturn;
+            }
+            nCap = nNew;
+        }
+        if (isRow)
+            errorcode = LSgetLPConstraintDatai(pModel, iItem, pachType + k, padC + k,
+                                               &nLen, paiBuf + nUsed, padBuf + nUsed);
+        else
+            errorcode = LSgetLPVariableDataj(pModel, iItem, pachType + k, padC + k,
+                                             padL + k, padU + k,
+                                             &nLen, paiBuf + nUsed, padBuf + nUsed);
+        if (errorcode)
+            goto ErrorReturn;
+        nUsed += nLen;
+        if (nUsed > INT_MAX) {
+            PyErr_SetString(PyExc_OverflowError, "more than 2**31-1 nonzeros requested");
+            goto ErrorReturn;
+        }
+        panPtr[k + 1] = (int)nUsed;
+    }
+
+    dims[0] = (npy_intp)nUsed;
+    pyInd = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_INT);
+    pyData = (PyArrayObject*)PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    if (!pyInd || !pyData)
+        goto ErrorReturn;
+    if (nUsed) {
+        memcpy(PyArray_DATA(pyInd), paiBuf, nUsed * sizeof(int));
+        memcpy(PyArray_DATA(pyData), padBuf, nUsed * sizeof(double));
+    }
+
+    if (isNames) {
+        errorcode = pyFetchNames(pModel, !isRow, &nNames, &paszNames, &pachNames);
+        if (errorcode == -1) {
+            errorcode = LSERR_NO_ERROR;
+            PyErr_NoMemory();
+            goto ErrorReturn;
+        }
+        if (errorcode)
+            goto ErrorReturn;
+        for (k = 0; k < n; k++) {
+            size_t nName = strlen(paszNames[paiIndex ? paiIndex[k] : k]);
+            if (nName > nWidth)
+                nWidth = nName;
+        }
+        dims[0] = n;
+        pyNames = (PyArrayObject*)PyArray_New(&PyArray_Type, 1, dims, NPY_STRING, NULL, NULL,
+                                              (int)nWidth, 0, NULL);
+        if (!pyNames)
+            goto ErrorReturn;
+        memset(PyArray_BYTES(pyNames), 0, (size_t)n * nWidth);
+        for (k = 0; k < n; k++) {
+            const char *pszName = paszNames[paiIndex ? paiIndex[k] : k];
+            memcpy(PyArray_BYTES(pyNames) + k * nWidth, pszName, strlen(pszName));
+        }
+    }
+
+    if (isRow)
+        pyResult = Py_BuildValue("{sOsOsOsOsO}", "indptr", pyPtr, "indices", pyInd,
+                                 "data", pyData, "contypes", pyType, "b", pyC);
+    else
+        pyResult = Py_BuildValue("{sOsOsOsOsOsOsO}", "indptr", pyPtr, "indices", pyInd,
+                                 "data", pyData, "vartypes", pyType, "c", pyC,
+                                 "lb", pyL, "ub", pyU);
+    if (pyResult && pyNames && PyDict_SetItemString(pyResult, "names", (PyObject*)pyNames) < 0)
+        Py_CLEAR(pyResult);
+
+ErrorReturn:
+    free(paiBuf);
+    free(padBuf);
+    free(paszNames);
+    free(pachNames);
+    Py_XDECREF(pyIdx);
+    Py_XDECREF(pyPtr);
+    Py_XDECREF(pyInd);
+    Py_XDECREF(pyData);
+    Py_XDECREF(pyType);
+    Py_XDECREF(pyC);
+    Py_XDECREF(pyL);
+    Py_XDECREF(pyU);
+    Py_XDECREF(pyNames);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    return pyResult;
+}
+
+/*
+* @brief Constraint data of a set of rows
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return dict
+* @remark d = lindo.get_rows(pModel,index,names)
+*/
+PyObject *pyGetRows(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    return pyGetSlices(args, kwds, 1);
+}
+
+/*
+* @brief Variable data of a set of columns
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return dict
+* @remark d = lindo.get_cols(pModel,index,names)
+*/
+PyObject *pyGetCols(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    return pyGetSlices(args, kwds, 0);
+}
+
+/*********************************************************************
+ *      Owning Handle Types                                          *
+ *********************************************************************/
+static int pyIsHandle(PyObject *pyObj)
+{
+    if (PyCapsule_CheckExact(pyObj))
+        return 0;
+    return PyObject_TypeCheck(pyObj, &pyModelType) ||
+           PyObject_TypeCheck(pyObj, &pyEnvType) ||
+           PyObject_TypeCheck(pyObj, &pySampleType) ||
+           PyObject_TypeCheck(pyObj, &pyRandGenType);
+}
+
+/*
+* @brief Delete the native object of a handle, releasing what the binding
+*        attached to it
+*/
+static int pyHandleDelete(pyHandle_t *pyHandle)
+{
+    int  errorcode = LSERR_NO_ERROR;
+    void *pHandle = pyHandle->pHandle;
+
+    if (!pHandle)
+        return errorcode;
+    pyHandle->pHandle = NULL;
+    switch (pyHandle->nType) {
+    case LS_PTR_MODEL:
+        pyResetModelDims((pLSmodel)pHandle);
+        pyModBatchDrop((pLSmodel)pHandle);
+        pyReleaseModelData((pLSmodel)pHandle);
+        errorcode = LSdeleteModel((pLSmodel*)&pHandle);
+        break;
+    case LS_PTR_ENV:
+        pyReleaseEnvData((pLSenv)pHandle);
+        errorcode = LSdeleteEnv((pLSenv*)&pHandle);
+        break;
+    case LS_PTR_SAMPLE:
+        errorcode = LSsampDelete((pLSsample*)&pHandle);
+        break;
+    case LS_PTR_RG:
+        LSdisposeRG((pLSrandGen*)&pHandle);
+        break;
+    }
+    return errorcode;
+}
+
+/*
+* @brief Close a handle and release its Env
+* @remark An Env closed while models, samples or generators created in it
+*         are open is deleted when the last of them is closed.
+*/
+static int pyHandleClose(pyHandle_t *pyHandle)
+{
+    int        errorcode = LSERR_NO_ERROR, nParentError;
+    pyHandle_t *pyParent = pyHandle->pyParent;
+
+    if (pyHandle->isClosed)
+        return errorcode;
+    pyHandle->isClosed = 1;
+    if (pyHandle->nChildren == 0)
+        errorcode = pyHandleDelete(pyHandle);
+    if (pyParent) {
+        pyHandle->pyParent = NULL;
+        if (--pyParent->nChildren == 0 && pyParent->isClosed) {
+            nParentError = pyHandleDelete(pyParent);
+            if (errorcode == LSERR_NO_ERROR)
+                errorcode = nParentError;
+        }
+        Py_DECREF(pyParent);
+    }
+    return errorcode;
+}
+
+/*
+* @brief Store a newly created native object in its handle
+*/
+static PyObject *pyHandleAttach(pyHandle_t *pyHandle, void *pHandle, int nType, PyObject *pyEnv)
+{
+    pyHandle->pHandle = pHandle;
+    pyHandle->nType = nType;
+    if (pyEnv && pyIsHandle(pyEnv)) {
+        Py_INCREF(pyEnv);
+        pyHandle->pyParent = (pyHandle_t*)pyEnv;
+        pyHandle->pyParent->nChildren++;
+    }
+    return (PyObject*)pyHandle;
+}
+
+/*
+* @brief Native environment behind the env argument of a constructor
+*/
+static pLSenv pyHandleEnv(PyObject *pyEnv)
+{
+    pLSenv pEnv;
+
+    if (pyIsHandle(pyEnv) && ((pyHandle_t*)pyEnv)->nType != LS_PTR_ENV) {
+        PyErr_SetString(PyExc_TypeError, "env must be a lindo.Env");
+        return NULL;
+    }
+    pEnv = PyGetObjPtr(pyEnv);
+    if (pEnv == NULL && !PyErr_Occurred()) {
+        char err[256];
+        snprintf(err, 256, "%d => %s", LSERR_ILLEGAL_NULL_POINTER, "Illegal NULL pointer");
+        PyErr_SetObject(LINDO_Exception, Py_BuildValue("(si)", err, LSERR_ILLEGAL_NULL_POINTER));
+    }
+    return pEnv;
+}
+
+static void pyHandleDealloc(pyHandle_t *pyHandle)
+{
+    PyObject *pyType, *pyValue, *pyTrace;
+
+    PyErr_Fetch(&pyType, &pyValue, &pyTrace);
+    pyHandleClose(pyHandle);
+    PyErr_Restore(pyType, pyValue, pyTrace);
+    Py_TYPE(pyHandle)->tp_free((PyObject*)pyHandle);
+}
+
+/*
+* @brief Env(key)
+* @remark key is the license key as str, bytes or the character array
+*         filled by pyLSloadLicenseString.
+*/
+static PyObject *pyEnvNew(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"key", NULL};
+    int         nErrorCode = LSERR_NO_ERROR;
+    const char  *pszKey = NULL;
+    pLSenv      pEnv;
+    PyObject    *pyKey, *pyHandle;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O", kwlist, &pyKey))
+        return NULL;
+    if (PyArray_Check(pyKey) && PyArray_TYPE((PyArrayObject*)pyKey) == NPY_STRING)
+        pszKey = PyArray_BYTES((PyArrayObject*)pyKey);
+    else if (PyBytes_Check(pyKey))
+        pszKey = PyBytes_AS_STRING(pyKey);
+    else if (PyUnicode_Check(pyKey))
+        pszKey = PyUnicode_AsUTF8(pyKey);
+    else
+        PyErr_SetString(PyExc_TypeError, "key must be str, bytes or a character array");
+    if (!pszKey)
+        return NULL;
+
+    pyHandle = type->tp_alloc(type, 0);
+    if (!pyHandle)
+        return NULL;
+    pEnv = LScreateEnv(&nErrorCode, (char*)pszKey);
+    if (nErrorCode) {
+        Py_DECREF(pyHandle);
+        LINDO_EXCEPTION(nErrorCode, "Failed to load license key");
+    }
+    return pyHandleAttach((pyHandle_t*)pyHandle, pEnv, LS_PTR_ENV, NULL);
+}
+
+/*
+* @brief Model(env)
+*/
+static PyObject *pyModelNew(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"env", NULL};
+    int         nErrorCode = LSERR_NO_ERROR;
+    pLSenv      pEnv;
+    pLSmodel    pModel;
+    PyObject    *pyEnv, *pyHandle;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O", kwlist, &pyEnv))
+        return NULL;
+    if ((pEnv = pyHandleEnv(pyEnv)) == NULL)
+        return NULL;
+
+    pyHandle = type->tp_alloc(type, 0);
+    if (!pyHandle)
+        return NULL;
+    pModel = LScreateModel(pEnv, &nErrorCode);
+    if (nErrorCode) {
+        Py_DECREF(pyHandle);
+        LINDO_EXCEPTION(nErrorCode, "Failed to create model");
+    }
+    pyHandleAttach((pyHandle_t*)pyHandle, pModel, LS_PTR_MODEL, pyEnv);
+    // the address may belong to a model freed along with its environment
+    pyResetModelDims(pModel);
+    pyModBatchDrop(pModel);
+
+    nErrorCode = LSsetModelLogfunc(pModel, (printLOG_t)pyPrintLog, NULL);
+    if (nErrorCode) {
+        Py_DECREF(pyHandle);
+        LINDO_EXCEPTION(nErrorCode, "Failed to set print log");
+    }
+    return pyHandle;
+}
+
+/*
+* @brief Sample(env, nDistType)
+*/
+static PyObject *pySampleNew(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"env", "dist_type", NULL};
+    int         nErrorCode = LSERR_NO_ERROR, nDistType;
+    pLSenv      pEnv;
+    pLSsample   pSample;
+    PyObject    *pyEnv, *pyHandle;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "Oi", kwlist, &pyEnv, &nDistType))
+        return NULL;
+    if ((pEnv = pyHandleEnv(pyEnv)) == NULL)
+        return NULL;
+
+    pyHandle = type->tp_alloc(type, 0);
+    if (!pyHandle)
+        return NULL;
+    pSample = LSsampCreate(pEnv, nDistType, &nErrorCode);
+    if (nErrorCode) {
+        Py_DECREF(pyHandle);
+        LINDO_EXCEPTION(nErrorCode, "Failed to create sample");
+    }
+    return pyHandleAttach((pyHandle_t*)pyHandle, pSample, LS_PTR_SAMPLE, pyEnv);
+}
+
+/*
+* @brief RandGen(env, nMethod, mt=False)
+* @remark mt=True creates the generator with LScreateRGMT.
+*/
+static PyObject *pyRandGenNew(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"env", "method", "mt", NULL};
+    int         nMethod, isMT = 0;
+    pLSenv      pEnv;
+    pLSrandGen  pRG;
+    PyObject    *pyEnv, *pyHandle;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "Oi|p", kwlist, &pyEnv, &nMethod, &isMT))
+        return NULL;
+    if ((pEnv = pyHandleEnv(pyEnv)) == NULL)
+        return NULL;
+
+    pyHandle = type->tp_alloc(type, 0);
+    if (!pyHandle)
+        return NULL;
+    pRG = isMT ? LScreateRGMT(pEnv, nMethod) : LScreateRG(pEnv, nMethod);
+    if (pRG == NULL) {
+        Py_DECREF(pyHandle);
+        LINDO_EXCEPTION(LSERR_ILLEGAL_NULL_POINTER, "Failed to create random generator");
+    }
+    return pyHandleAttach((pyHandle_t*)pyHandle, pRG, LS_PTR_RG, pyEnv);
+}
+
+static PyObject *pyHandleCloseMethod(pyHandle_t *pyHandle, PyObject *unused)
+{
+    int errorcode = pyHandleClose(pyHandle);
+
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    return Py_BuildValue("i",errorcode);
+}
+
+static PyObject *pyHandleEnter(pyHandle_t *pyHandle, PyObject *unused)
+{
+    Py_INCREF(pyHandle);
+    return (PyObject*)pyHandle;
+}
+
+static PyObject *pyHandleExit(pyHandle_t *pyHandle, PyObject *args)
+{
+    int errorcode = pyHandleClose(pyHandle);
+
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    Py_RETURN_FALSE;
+}
+
+static PyObject *pyHandleClosed(pyHandle_t *pyHandle, void *closure)
+{
+    return PyBool_FromLong(pyHandle->isClosed);
+}
+
+static PyObject *pyHandleRepr(pyHandle_t *pyHandle)
+{
+    return PyUnicode_FromFormat("<%s object at %p%s>", Py_TYPE(pyHandle)->tp_name,
+                                (void*)pyHandle, pyHandle->isClosed ? " (closed)" : "");
+}
+
+static PyMethodDef pyHandleMethods[] = {
+    {"close", (PyCFunction)pyHandleCloseMethod, METH_NOARGS,
+     "close() -> int\n\n"
+     "Delete the native object now. Closing twice is a no-op; the object\n"
+     "is also closed when it is garbage collected."},
+    {"__enter__", (PyCFunction)pyHandleEnter, METH_NOARGS, NULL},
+    {"__exit__", (PyCFunction)pyHandleExit, METH_VARARGS, NULL},
+    {NULL, NULL, 0, NULL}
+};
+
+static PyGetSetDef pyHandleGetSet[] = {
+    {"closed", (getter)pyHandleClosed, NULL, "True once close() was called", NULL},
+    {NULL, NULL, NULL, NULL, NULL}
+};
+
+#define PY_HANDLE_TYPE(name, newfunc, doc) {\
+    PyVarObject_HEAD_INIT(NULL, 0)\
+    .tp_name = "lindo." name,\
+    .tp_basicsize = sizeof(pyHandle_t),\
+    .tp_dealloc = (destructor)pyHandleDealloc,\
+    .tp_repr = (reprfunc)pyHandleRepr,\
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,\
+    .tp_doc = doc,\
+    .tp_methods = pyHandleMethods,\
+    .tp_getset = pyHandleGetSet,\
+    .tp_new = newfunc,\
+}
+
+static PyTypeObject pyEnvType = PY_HANDLE_TYPE("Env", pyEnvNew,
+    "Env(key)\n\n"
+    "LINDO environment created with the license key (str, bytes or the\n"
+    "array filled by pyLSloadLicenseString). Accepted wherever a pEnv is.\n"
+    "Deleted when closed or collected, but not before the models, samples\n"
+    "and generators created in it.");
+
+static PyTypeObject pyModelType = PY_HANDLE_TYPE("Model", pyModelNew,
+    "Model(env)\n\n"
+    "LINDO model created in env. Accepted wherever a pModel is. Deleting\n"
+    "it also releases the callback contexts set on it.");
+
+static PyTypeObject pySampleType = PY_HANDLE_TYPE("Sample", pySampleNew,
+    "Sample(env, dist_type)\n\n"
+    "LINDO sample created with LSsampCreate. Accepted wherever a pSample is.");
+
+static PyTypeObject pyRandGenType = PY_HANDLE_TYPE("RandGen", pyRandGenNew,
+    "RandGen(env, method, mt=False)\n\n"
+    "LINDO random generator created with LScreateRG (LScreateRGMT if mt).\n"
+    "Accepted wherever a pRG is.");
+
+/*
+* @brief Add Env, Model, Sample and RandGen to the module
+*/
+static int pyAddHandleTypes(PyObject *module)
+{
+    static struct { const char *szName; PyTypeObject *pyType; } aTypes[] = {
+        {"Env", &pyEnvType},
+        {"Model", &pyModelType},
+        {"Sample", &pySampleType},
+        {"RandGen", &pyRandGenType},
+    };
+    size_t k;
+
+    for (k = 0; k < sizeof(aTypes) / sizeof(aTypes[0]); k++) {
+        if (PyType_Ready(aTypes[k].pyType) < 0)
+            return -1;
+        Py_INCREF(aTypes[k].pyType);
+        if (PyModule_AddObject(module, aTypes[k].szName, (PyObject*)aTypes[k].pyType) < 0) {
+            Py_DECREF(aTypes[k].pyType);
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/*********************************************************************
+ *      Environment Parameter Snapshots                              *
+ *********************************************************************/
+/*
+* @brief Contiguous array of the given type built from a parameter list
+*/
+static PyArrayObject *pyParamArray(PyObject *pyObj, int nType, const char *szName)
+{
+    PyArrayObject *pyArr = (PyArrayObject*)PyArray_FROM_OTF(pyObj, nType, NPY_ARRAY_IN_ARRAY | NPY_ARRAY_FORCECAST);
+
+    if (pyArr && PyArray_NDIM(pyArr) != 1) {
+        PyErr_Format(PyExc_ValueError, "%s must be 1-D", szName);
+        Py_CLEAR(pyArr);
+    }
+    return pyArr;
+}
+
+/*
+* @brief Values of a set of environment parameters
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return tuple
+* @remark ivalues, dvalues = lindo.get_env_params(pEnv,iparams,dparams)
+*/
+PyObject *pyGetEnvParams(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char   *kwlist[] = {"env", "iparams", "dparams", NULL};
+    int           errorcode = LSERR_NO_ERROR;
+    int           *paiParam, *paiValue, *paiDParam;
+    double        *padValue;
+    npy_intp      k;
+    pLSenv        pEnv;
+
+    PyObject      *pyEnv, *pyIParams, *pyDParams, *pyResult = NULL;
+    PyArrayObject *pyIP = NULL, *pyDP = NULL, *pyIV = NULL, *pyDV = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOO", kwlist, &pyEnv, &pyIParams, &pyDParams))
+        return NULL;
+
+    CHECK_ENV;
+
+    pyIP = pyParamArray(pyIParams, NPY_INT, "iparams");
+    pyDP = pyParamArray(pyDParams, NPY_INT, "dparams");
+    if (!pyIP || !pyDP)
+        goto ErrorReturn;
+    pyIV = (PyArrayObject*)PyArray_SimpleNew(1, PyArray_DIMS(pyIP), NPY_INT);
+    pyDV = (PyArrayObject*)PyArray_SimpleNew(1, PyArray_DIMS(pyDP), NPY_DOUBLE);
+    if (!pyIV || !pyDV)
+        goto ErrorReturn;
+
+    paiParam = (int*)PyArray_DATA(pyIP);
+    paiValue = (int*)PyArray_DATA(pyIV);
+    for (k = 0; k < PyArray_DIM(pyIP, 0); k++)
+        LSASSERT(LSgetEnvIntParameter(pEnv, paiParam[k], &paiValue[k]));
+    paiDParam = (int*)PyArray_DATA(pyDP);
+    padValue = (double*)PyArray_DATA(pyDV);
+    for (k = 0; k < PyArray_DIM(pyDP, 0); k++)
+        LSASSERT(LSgetEnvDouParameter(pEnv, paiDParam[k], &padValue[k]));
+
+    pyResult = Py_BuildValue("(OO)", pyIV, pyDV);
+
+ErrorReturn:
+    Py_XDECREF(pyIP);
+    Py_XDECREF(pyDP);
+    Py_XDECREF(pyIV);
+    Py_XDECREF(pyDV);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    return pyResult;
+}
+
+/*
+* @brief Restore a set of environment parameters
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return int
+* @remark nSet = lindo.set_env_params(pEnv,iparams,ivalues,dparams,dvalues)
+*/
+PyObject *pySetEnvParams(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char   *kwlist[] = {"env", "iparams", "ivalues", "dparams", "dvalues", NULL};
+    int           errorcode = LSERR_NO_ERROR, nValue, nSet = 0;
+    int           *paiParam, *paiValue;
+    double        dValue, *padValue;
+    npy_intp      k;
+    pLSenv        pEnv;
+
+    PyObject      *pyEnv, *pyObj[4];
+    PyArrayObject *pyIP = NULL, *pyDP = NULL, *pyIV = NULL, *pyDV = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOOOO", kwlist, &pyEnv,
+                                     &pyObj[0], &pyObj[1], &pyObj[2], &pyObj[3]))
+        return NULL;
+
+    CHECK_ENV;
+
+    pyIP = pyParamArray(pyObj[0], NPY_INT, "iparams");
+    pyIV = pyParamArray(pyObj[1], NPY_INT, "ivalues");
+    pyDP = pyParamArray(pyObj[2], NPY_INT, "dparams");
+    pyDV = pyParamArray(pyObj[3], NPY_DOUBLE, "dvalues");
+    if (!pyIP || !pyIV || !pyDP || !pyDV)
+        goto ErrorReturn;
+    if (PyArray_DIM(pyIP, 0) != PyArray_DIM(pyIV, 0) || PyArray_DIM(pyDP, 0) != PyArray_DIM(pyDV, 0)) {
+        PyErr_SetString(PyExc_ValueError, "each parameter needs one value");
+        goto ErrorReturn;
+    }
+
+    paiParam = (int*)PyArray_DATA(pyIP);
+    paiValue = (int*)PyArray_DATA(pyIV);
+    for (k = 0; k < PyArray_DIM(pyIP, 0); k++) {
+        LSASSERT(LSgetEnvIntParameter(pEnv, paiParam[k], &nValue));
+        if (nValue != paiValue[k]) {
+            LSASSERT(LSsetEnvIntParameter(pEnv, paiParam[k], paiValue[k]));
+            nSet++;
+        }
+    }
+    paiParam = (int*)PyArray_DATA(pyDP);
+    padValue = (double*)PyArray_DATA(pyDV);
+    for (k = 0; k < PyArray_DIM(pyDP, 0); k++) {
+        LSASSERT(LSgetEnvDouParameter(pEnv, paiParam[k], &dValue));
+        if (dValue != padValue[k]) {
+            LSASSERT(LSsetEnvDouParameter(pEnv, paiParam[k], padValue[k]));
+            nSet++;
+        }
+    }
+
+ErrorReturn:
+    Py_XDECREF(pyIP);
+    Py_XDECREF(pyDP);
+    Py_XDECREF(pyIV);
+    Py_XDECREF(pyDV);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    if (PyErr_Occurred())
+        return NULL;
+    return Py_BuildValue("i",nSet);
+}
+
+/*********************************************************************
+ *      Model Reset                                                  *
+ *********************************************************************/
+/*
+* @brief Empty a model for reuse
+* @param[in,out] self Pointer to self
+* @param[in,out] args Pointer to args
+* @return int
+* @remark errorcode = lindo.reset_model(pModel)
+* @remark Pending batched modifications are discarded.
+*/
+PyObject *pyResetModel(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"model", NULL};
+    int         errorcode = LSERR_NO_ERROR;
+    int         nVars = 0, nCons = 0, k, n, *paiIndex = NULL;
+    pLSmodel    pModel;
+
+    PyObject    *pyModel;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O", kwlist, &pyModel))
+        return NULL;
+
+    CHECK_MODEL;
+    pyModBatchDrop(pModel);
+
+    LSASSERT(pyGetModelDims(pModel, &nVars, &nCons));
+    n = nVars > nCons ? nVars : nCons;
+    if (n > 0) {
+        paiIndex = (int*)malloc(n * sizeof(int));
+        if (!paiIndex)
+            return PyErr_NoMemory();
+        for (k = 0; k < n; k++)
+            paiIndex[k] = k;
+    }
+    if (nCons > 0)
+        LSASSERT(LSdeleteConstraints(pModel, nCons, paiIndex));
+    if (nVars > 0)
+        LSASSERT(LSdeleteVariables(pModel, nVars, paiIndex));
+    LSASSERT(LSmodifyObjConstant(pModel, 0.0));
+
+ErrorReturn:
+    free(paiIndex);
+    pyResetModelDims(pModel);
+    if (errorcode != 0){
+        ERROR_SET(errorcode);
+    }
+    return Py_BuildValue("i",errorcode);
+}
@@ -1,6 +1,7 @@
 from .LSconst import *
 from .lindo import *
 import numpy as N
+from contextlib import contextmanager
 
 def geterrormessage(pEnv, errorcode):    
     errormessage = N.array('', dtype='S256')
@@ -35,4 +36,29 @@ def getversion(pEnv):
         print("LINDO API Version ", version, builton)
     verstr = "LINDO API Version %d.%d.%d, Arch %d" % (
         pnMajor[0], pnMinor[0], pnRevis[0], pnArchId[0])
-    return verstr
\ No newline at end of file
+    return verstr
+
+
+@contextmanager
+def batch_update(pModel):
+    """
+    Buffer the pyLSmodify* calls made on pModel inside the block and apply
+    them on exit, merged per index and with one LINDO call per kind. If the
+    block raises, the buffered modifications are discarded. Other calls on
+    pModel, such as solves, queries, loads or deleting rows and columns,
+    raise RuntimeError inside the block; model parameters can still be
+    read and set. Deleting pModel or emptying it with reset_model() is
+    allowed and discards the batch, so leaving the block afterwards raises
+    RuntimeError from batch_end().
+
+        with lindo.batch_update(pModel):
+            for j, u in changes:
+                lindo.pyLSmodifyUpperBounds(pModel, 1, N.array([j], dtype=N.int32), N.array([u]))
+    """
+    batch_begin(pModel)
+    try:
+        yield pModel
+    except BaseException:
+        batch_end(pModel, False)
+        raise
+    batch_end(pModel)
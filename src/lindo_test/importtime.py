@@ -0,0 +1,82 @@
+"""
+    importtime.py
+
+    Import-time benchmark of the lindo package.
+
+    Runs `python -X importtime -c "import lindo"` in fresh interpreters and
+    sums the best self time of lindo's own Python modules. numpy is not
+    counted, nor is the extension lindo.lindo: its self time is mostly the
+    dynamic linking of the LINDO shared library, which depends on the disk
+    cache and machine load, so it is reported but not budgeted. Fails when
+    the sum exceeds the budget or when a module meant to load on first use
+    was imported.
+
+        python -m lindo_test.importtime --budget 20 --repeat 5
+"""
+import argparse
+import subprocess
+import sys
+
+# only loaded through lindo.__getattr__
+LAZY = ('asyncio', 'lindo.aio', 'lindo.model', 'lindo.delta', 'lindo.pool')
+# self time dominated by loading liblindo
+EXTENSION = 'lindo.lindo'
+
+
+def measure(repeat=5):
+    """Best self time in microseconds of every module imported by `import lindo`."""
+    best = {}
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import lindo'],
+                              capture_output=True, text=True)
+        out = proc.stderr
+        if proc.returncode:
+            raise RuntimeError("import lindo failed: " + out.strip().splitlines()[-1])
+        for line in out.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            fields = line[len('import time:'):].split('|')
+            if not fields[0].strip().isdigit():
+                continue
+            name = fields[2].strip()
+            best[name] = min(best.get(name, int(fields[0])), int(fields[0]))
+    return best
+
+
+def check(repeat=5):
+    """
+    check(repeat=5) -> (ms, eager, times)
+
+    Milliseconds spent in lindo's own Python modules (the extension is
+    left out), the lazy modules that were imported anyway, and the
+    per-module self times, the extension included.
+    """
+    times = measure(repeat)
+    own = {name: t for name, t in times.items() if name == 'lindo' or name.startswith('lindo.')}
+    eager = [name for name in LAZY if name in times]
+    ms = sum(t for name, t in own.items() if name != EXTENSION) / 1000.0
+    return ms, eager, own
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument('--budget', type=float, default=20.0, help="milliseconds allowed for lindo's own modules")
+    parser.add_argument('--repeat', type=int, default=5, help="interpreters started, best time kept")
+    args = parser.parse_args(argv)
+
+    ms, eager, own = check(args.repeat)
+    for name, t in sorted(own.items(), key=lambda item: -item[1]):
+        print("%8.2f ms  %s%s" % (t / 1000.0, name, " (not budgeted)" if name == EXTENSION else ""))
+    print("%8.2f ms  total (budget %.2f ms)" % (ms, args.budget))
+    failed = False
+    if ms > args.budget:
+        print("import lindo is over budget")
+        failed = True
+    if eager:
+        print("imported eagerly: %s" % ", ".join(eager))
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
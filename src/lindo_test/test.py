@@ -23,4 +23,244 @@ def test_pyLindo_version():
         if(e.args[1] == lindo.LSERR_NO_VALID_LICENSE):
             print(f"{e.args[1]} => Unable to load license at {licPath}")
         else:
-            print(e.args[0])
\ No newline at end of file
+            print(e.args[0])
+
+
+def test_lazy_imports():
+
+    from .importtime import check
+
+    # wall-clock budgets are left to python -m lindo_test.importtime
+    _, eager, _ = check(repeat=1)
+    assert not eager, f"imported eagerly by import lindo: {eager}"
+
+
+def _eval_code(code, numval, x):
+    """Value of a postfix instruction list at the point x."""
+    import numpy as np
+    import lindo
+
+    unary = {lindo.EP_NEGATE: np.negative, lindo.EP_ABS: np.abs,
+             lindo.EP_SQR: np.square, lindo.EP_SQRT: np.sqrt,
+             lindo.EP_SIN: np.sin, lindo.EP_COS: np.cos, lindo.EP_TAN: np.tan,
+             lindo.EP_EXP: np.exp, lindo.EP_LN: np.log, lindo.EP_LOG: np.log10}
+    binary = {lindo.EP_PLUS: np.add, lindo.EP_MINUS: np.subtract,
+              lindo.EP_MULTIPLY: np.multiply, lindo.EP_DIVIDE: np.divide,
+              lindo.EP_POWER: np.power}
+    reduce = {lindo.EP_SUM: np.sum, lindo.EP_MAX: np.max, lindo.EP_MIN: np.min}
+    stack, k = [], 0
+    while k < len(code):
+        op = code[k]
+        if op == lindo.EP_PUSH_VAR:
+            stack.append(x[code[k + 1]])
+            k += 2
+        elif op == lindo.EP_PUSH_NUM:
+            stack.append(numval[code[k + 1]])
+            k += 2
+        elif op in reduce:
+            n = code[k + 1]
+            args = stack[-n:]
+            del stack[-n:]
+            stack.append(reduce[op](args))
+            k += 2
+        elif op in binary:
+            b = stack.pop()
+            stack.append(binary[op](stack.pop(), b))
+            k += 1
+        else:
+            stack.append(unary[op](stack.pop()))
+            k += 1
+    assert len(stack) == 1
+    return stack[0]
+
+
+def test_instruct_to_arrays():
+
+    import numpy as np
+    import lindo
+    from lindo.model import InstructModel, sin, cos, exp, log, sqrt, maximum, minimum
+
+    m = InstructModel()
+    x = m.add_vars(4, lb=0.5, ub=2.0, x0=1.0)
+    y = m.add_vars((2, 3), lb=1.0, ub=3.0, vtype='I')
+    c = np.array([1.5, -2.0, 0.25])
+    families = [
+        (x[:-1] * exp(x[1:]) <= 5.0, lambda x, y: x[:-1] * np.exp(x[1:]) - 5.0),
+        ((sin(y) * c).sum(axis=1) >= -1.0, lambda x, y: (np.sin(y) * c).sum(axis=1) + 1.0),
+        (maximum(y, 2.0) - minimum(x[:3], y) == 0.0,
+         lambda x, y: np.maximum(y, 2.0) - np.minimum(x[:3], y)),
+        (log(x) / sqrt(x + 1.0) + cos(x) ** 3 <= 2.0,
+         lambda x, y: np.log(x) / np.sqrt(x + 1.0) + np.cos(x) ** 3 - 2.0),
+        (x[:3] @ y.T <= 4.0, lambda x, y: x[:3] @ y.T - 4.0),
+    ]
+    for con, _ in families:
+        m.add_constraints(con)
+    m.minimize((sin(x) ** 2 + x).sum() + (y * y).sum())
+
+    d = m.to_arrays()
+    assert (d['nVars'], d['nObjs']) == (10, 1)
+    assert d['nCons'] == 3 + 2 + 6 + 4 + 2
+    assert d['vtype'].tolist() == [b'C'] * 4 + [b'I'] * 6
+    assert d['ctype'].tolist() == [b'L'] * 3 + [b'G'] * 2 + [b'E'] * 6 + [b'L'] * 6
+    assert np.array_equal(d['lwrbnd'], [0.5] * 4 + [1.0] * 6)
+    assert np.array_equal(d['varval'], [1.0] * 4 + [0.0] * 6)
+    assert d['objsense'].tolist() == [lindo.LS_MIN]
+
+    # the numbers are deduplicated and every operand is in range
+    code, numval = d['code'], d['numval']
+    assert d['lsize'] == len(code) and d['nNumbers'] == len(numval)
+    assert np.array_equal(numval, np.unique(numval))
+    assert code.dtype == np.int32 and code.min() >= 0
+
+    # the objective and constraints tile the code without gaps
+    begs = np.concatenate((d['objs_beg'], d['cons_beg']))
+    lens = np.concatenate((d['objs_length'], d['cons_length']))
+    assert begs[0] == 0 and np.array_equal(begs[1:], np.cumsum(lens)[:-1])
+    assert begs[-1] + lens[-1] == len(code)
+
+    rng = np.random.default_rng(7)
+    pt = rng.uniform(0.5, 2.0, size=10)
+    xv, yv = x.value(pt), y.value(pt)
+    obj = _eval_code(code[begs[0]:begs[0] + lens[0]], numval, pt)
+    assert np.isclose(obj, (np.sin(xv) ** 2 + xv).sum() + (yv * yv).sum())
+    for con, f in families:
+        want = f(xv, yv).ravel()
+        got = [_eval_code(code[b:b + n], numval, pt)
+               for b, n in zip(d['cons_beg'][con.index().ravel()],
+                               d['cons_length'][con.index().ravel()])]
+        assert np.allclose(got, want)
+
+
+def test_instruct_shared_nodes():
+
+    import numpy as np
+    from lindo.model import InstructModel, exp
+
+    m = InstructModel()
+    x = m.add_vars(3)
+    assert exp(x) * 2.0 is exp(x) * 2.0
+    assert x + 0.0 is x and x * 1.0 is x and x ** 1.0 is x
+    assert x[0].shape == () and (x.sum() + 1.0).shape == ()
+    m.add_constraints(exp(x) * 2.0 <= 2.0)
+    m.add_constraints(exp(x) * 2.0 >= -2.0)
+    d = m.to_arrays()
+    # 2.0 and -2.0 each appear once, each row reads x[i] only
+    assert np.array_equal(d['numval'], [-2.0, 2.0])
+    assert np.array_equal(d['cons_length'], np.full(6, d['cons_length'][0]))
+    assert np.array_equal(d['cons_beg'], d['cons_length'][0] * np.arange(6))
+    assert d['objs_beg'].size == 0 and d['objsense'].size == 0
+
+
+def _dense(e, nVars):
+    """Coefficient matrix (one row per entry of e) and constant of e."""
+    import numpy as np
+
+    A = np.zeros((e.size, nVars))
+    np.add.at(A, (e.rows, e.cols), e.coefs)
+    return A, e.const.ravel()
+
+
+def test_linexpr_ops():
+
+    import numpy as np
+    from lindo.model import Model, dot
+
+    m = Model()
+    x = m.add_vars((3, 4))
+    y = m.add_vars(4)
+    n = m.nVars
+    X = np.eye(n)[:12].reshape(3, 4, n)
+    Y = np.eye(n)[12:]
+
+    def check(e, want, const=0.0):
+        want = np.asarray(want)
+        assert e.shape == want.shape[:-1]
+        A, b = _dense(e, n)
+        assert np.allclose(A, want.reshape(-1, n))
+        assert np.allclose(b, np.broadcast_to(const, e.shape).ravel())
+
+    # indexing, reshaping and transposing
+    check(x[1], X[1])
+    check(x[:, ::2], X[:, ::2])
+    check(x[[2, 0], 1:3], X[[2, 0], 1:3])
+    check(x[x.index() % 3 == 0], X[x.index() % 3 == 0])
+    check(x.T, X.transpose(1, 0, 2))
+    check(x.reshape(2, 6)[1], X.reshape(2, 6, n)[1])
+    check((x + 1.0)[2, 3], X[2, 3], 1.0)
+
+    # broadcasting against constants and other expressions
+    c = np.arange(4.0)
+    check(x + y, X + Y)
+    check(x[:, :1] - y, X[:, :1] - Y)
+    check(x * c, X * c[:, None])
+    check(c[:, None] * x.T, X.transpose(1, 0, 2) * c[:, None, None])
+    check(2.0 - y / 4.0, -Y / 4.0, 2.0)
+    check(x + c, X, np.broadcast_to(c, (3, 4)))
+
+    # reductions
+    check(x.sum(), X.sum(axis=(0, 1)))
+    check(x.sum(axis=0), X.sum(axis=0))
+    check(x.sum(axis=1), X.sum(axis=1))
+    check(x.sum(axis=-1), X.sum(axis=1))
+    check((x + c).sum(axis=0), X.sum(axis=0), 3 * c)
+
+    # matrix products
+    A = np.array([[1.0, 0.0, -2.0], [0.0, 3.0, 0.0]])
+    check(A @ x[:, 0], A @ X[:, 0])
+    check(dot(A, x[:, 0] + 1.0), A @ X[:, 0], A.sum(axis=1))
+    check(c @ y, c @ Y)
+    check(y @ c, c @ Y)
+    check(x[0] @ A.T[[0, 1, 2, 0]], A.T[[0, 1, 2, 0]].T @ X[0])
+
+    for bad in (lambda: x * y, lambda: x @ y, lambda: bool(y)):
+        try:
+            bad()
+        except TypeError:
+            pass
+        else:
+            assert False, "expected TypeError"
+
+
+def test_model_to_arrays():
+
+    import numpy as np
+    import lindo
+    from lindo.model import Model
+
+    supply = np.array([20.0, 30.0])
+    demand = np.array([10.0, 25.0, 15.0])
+    cost = np.array([[4.0, 6.0, 9.0], [5.0, 3.0, 8.0]])
+    m = Model()
+    x = m.add_vars((2, 3), ub=np.array([100.0, 50.0, 25.0]))
+    z = m.add_vars(lb=-5.0, vtype='I')
+    rows = m.add_constraints(x.sum(axis=1) <= supply)
+    cols = m.add_constraints(x.sum(axis=0) >= demand)
+    fix = m.add_constraints(z + x[0, 0] - x[0, 0] + 2.0 == 3.0 * z - 1.0)
+    m.maximize(-(cost * x).sum() + z + 7.0)
+
+    d = m.to_arrays()
+    assert d['A'].shape == (6, 7)
+    A = np.zeros(d['A'].shape)
+    np.add.at(A, (d['A'].row, d['A'].col), d['A'].data)
+    want = np.zeros((6, 7))
+    want[0, :3] = want[1, 3:6] = 1.0
+    want[2:5, :6] = np.hstack((np.eye(3), np.eye(3)))
+    want[5, 6] = -2.0
+    assert np.array_equal(A, want)
+    assert np.array_equal(d['b'], np.concatenate((supply, demand, [-3.0])))
+    assert d['contypes'].tolist() == [b'L', b'L', b'G', b'G', b'G', b'E']
+    assert np.array_equal(d['c'], np.append(-cost.ravel(), 1.0))
+    assert np.array_equal(d['lb'], [0.0] * 6 + [-5.0])
+    assert np.array_equal(d['ub'], [100.0, 50.0, 25.0] * 2 + [lindo.LS_INFINITY])
+    assert d['sense'] == lindo.LS_MAX and d['objconst'] == 7.0
+    assert m.vartypes().tolist() == [b'C'] * 6 + [b'I']
+    assert rows.index().tolist() == [0, 1] and fix.index() == 5
+    assert np.array_equal(cols.value(np.arange(6.0)), [2.0, 3.0, 4.0])
+
+    other = Model().add_vars(10)
+    try:
+        m.add_constraints(other.sum() <= 1.0)
+    except ValueError:
+        pass
+    else:
+        assert False, "expected ValueError"